@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+Lập lá số hàng loạt trên nhiều tiến trình.
+
+    python -m lasotuvi.Batch input.jsonl [--out output.jsonl] [--workers 4]
+                             [--chunk 500]
+
+Mỗi bản ghi đầu vào (một dòng JSONL hoặc một dòng CSV có tiêu đề) gồm các
+trường ngay, thang, nam, gio (chi giờ sinh 1 - 12), gioiTinh (1/-1, nam/nu,
+male/female) và tùy chọn ten, duongLich (mặc định true), timeZone (mặc định
+7). Kết quả là một dòng JSON cho mỗi bản ghi, đúng thứ tự đầu vào:
+{"input": ..., "laSo": ...} hoặc {"input": ..., "loi": "..."}.
+"""
+import argparse
+import collections
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from lasotuvi.App import lapDiaBan
+from lasotuvi.DiaBan import diaBan
+from lasotuvi.NgaySinh import NgaySinh
+from lasotuvi.ThienBan import lapThienBan
+from lasotuvi.XuatLaSo import laSoDict
+
+# Tiến độ sau mỗi khối: số lá số đã xong, số lỗi, số giây, lá số mỗi giây
+TienDo = collections.namedtuple(
+    "TienDo", ["soLaSo", "soLoi", "thoiGian", "laSoMoiGiay"])
+
+_GIOI_TINH = {"1": 1, "nam": 1, "male": 1, "m": 1,
+              "-1": -1, "nu": -1, "nữ": -1, "female": -1, "f": -1}
+_DUNG = {"1", "true", "yes", "duong", "dương"}
+
+
+def chuanHoaBanGhi(banGhi):
+    """Đổi một bản ghi (dict, giá trị có thể là chuỗi như khi đọc CSV) về
+    tham số của lapDiaBan/lapThienBan.
+
+    Returns:
+        tuple: (nn, tt, nnnn, gioSinh, gioiTinh, ten, duongLich, timeZone)
+
+    Raises:
+        Exception: bản ghi thiếu trường hoặc sai giá trị
+    """
+    try:
+        gioiTinh = _GIOI_TINH[str(banGhi["gioiTinh"]).strip().lower()]
+        duongLich = banGhi.get("duongLich", True)
+        if not isinstance(duongLich, bool):
+            duongLich = str(duongLich).strip().lower() in _DUNG
+        timeZone = float(banGhi.get("timeZone") or 7)
+        if timeZone == int(timeZone):
+            timeZone = int(timeZone)
+        return (int(banGhi["ngay"]), int(banGhi["thang"]), int(banGhi["nam"]),
+                int(banGhi["gio"]), gioiTinh, banGhi.get("ten") or "",
+                duongLich, timeZone)
+    except (KeyError, TypeError, ValueError) as e:
+        raise Exception("Bản ghi không hợp lệ (%s): %r" % (e, banGhi))
+
+
+def lapLaSo(banGhi):
+    """Lập và xuất lá số của một bản ghi.
+
+    Returns:
+        dict: {"laSo": laSoDict(...)} hoặc {"loi": thông báo lỗi}
+    """
+    try:
+        nn, tt, nnnn, gioSinh, gioiTinh, ten, duongLich, timeZone = \
+            chuanHoaBanGhi(banGhi)
+        ngaySinh = NgaySinh(nn, tt, nnnn, gioSinh, gioiTinh, duongLich,
+                            timeZone)
+        db = lapDiaBan(diaBan, ngaySinh)
+        tb = lapThienBan(ngaySinh, ten=ten, diaBan=db)
+        return {"laSo": laSoDict(db, tb)}
+    except Exception as e:
+        return {"loi": str(e)}
+
+
+def _lapKhoi(khoi):
+    return [lapLaSo(banGhi) for banGhi in khoi]
+
+
+def lapLaSoHangLoat(banGhi, soTienTrinh=None, kichThuocKhoi=500,
+                    soKhoiToiDa=None, baoCao=None):
+    """Lập lá số cho một dãy bản ghi, chia khối cho ProcessPoolExecutor.
+
+    Kết quả được trả về dần (generator) theo đúng thứ tự đầu vào. Chỉ có tối
+    đa soKhoiToiDa khối đang chạy hoặc chờ trả về, nên bộ nhớ không phụ
+    thuộc vào số bản ghi.
+
+    Args:
+        banGhi (iterable): các bản ghi dạng dict, xem chuanHoaBanGhi
+        soTienTrinh (int, optional): số tiến trình; 0 là chạy ngay trong
+            tiến trình hiện tại
+        kichThuocKhoi (int): số bản ghi mỗi khối
+        soKhoiToiDa (int, optional): số khối tối đa đang xử lý, mặc định gấp
+            đôi số tiến trình
+        baoCao (callable, optional): gọi với TienDo sau mỗi khối
+
+    Yields:
+        tuple: (bản ghi, {"laSo": ...} hoặc {"loi": ...})
+    """
+    batDau = time.time()
+    dem = {"soLaSo": 0, "soLoi": 0}
+    banGhi = iter(banGhi)
+    khoiTiepTheo = iter(lambda: list(itertools.islice(banGhi, kichThuocKhoi)),
+                        [])
+
+    def xong(khoi, ketQua):
+        dem["soLaSo"] += len(khoi)
+        dem["soLoi"] += sum(1 for kq in ketQua if "loi" in kq)
+        if baoCao is not None:
+            thoiGian = time.time() - batDau
+            baoCao(TienDo(dem["soLaSo"], dem["soLoi"], thoiGian,
+                          dem["soLaSo"] / thoiGian if thoiGian else 0.))
+        return zip(khoi, ketQua)
+
+    if soTienTrinh == 0:
+        for khoi in khoiTiepTheo:
+            for cap in xong(khoi, _lapKhoi(khoi)):
+                yield cap
+        return
+
+    soTienTrinh = soTienTrinh or os.cpu_count() or 1
+    soKhoiToiDa = soKhoiToiDa or 2 * soTienTrinh
+    with ProcessPoolExecutor(soTienTrinh) as pool:
+        dangChay = collections.deque()
+        for khoi in itertools.islice(khoiTiepTheo, soKhoiToiDa):
+            dangChay.append((khoi, pool.submit(_lapKhoi, khoi)))
+        while dangChay:
+            khoi, tuongLai = dangChay.popleft()
+            ketQua = tuongLai.result()
+            for khoiMoi in itertools.islice(khoiTiepTheo, 1):
+                dangChay.append((khoiMoi, pool.submit(_lapKhoi, khoiMoi)))
+            for cap in xong(khoi, ketQua):
+                yield cap
+
+
+def docBanGhi(path):
+    """Đọc bản ghi từ file JSONL hoặc CSV (theo đuôi file), '-' là stdin."""
+    f = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        if path.lower().endswith(".csv"):
+            for dong in csv.DictReader(f):
+                yield dong
+        else:
+            for dong in f:
+                if dong.strip():
+                    yield json.loads(dong)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("input", help="file JSONL/CSV, '-' là stdin")
+    parser.add_argument("--out", default="-")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    def baoCao(tienDo):
+        sys.stderr.write("\r%d lá số, %d lỗi, %.1fs, %.0f lá số/giây" % (
+            tienDo.soLaSo, tienDo.soLoi, tienDo.thoiGian, tienDo.laSoMoiGiay))
+
+    out = sys.stdout if args.out == "-" else \
+        open(args.out, "w", encoding="utf-8")
+    try:
+        for banGhi, ketQua in lapLaSoHangLoat(
+                docBanGhi(args.input), args.workers, args.chunk,
+                baoCao=baoCao):
+            ketQua = dict({"input": banGhi}, **ketQua)
+            out.write(json.dumps(ketQua, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    sys.stderr.write("\n")
+
+
+if __name__ == "__main__":
+    main()
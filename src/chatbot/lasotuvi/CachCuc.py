@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+Tìm cách cục trên lá số đã an sao.
+
+Mỗi cách cục (CachCuc) là một danh sách điều kiện (DieuKien) trên các sao
+ở cung Mệnh, ở tam phương tứ chính của Mệnh (Mệnh, hai cung tam hợp +4, +8
+và cung xung chiếu +6), ở hai cung giáp Mệnh, hoặc về đặc tính sáng (Miếu,
+Vượng, Đắc) của sao. Mỗi điều kiện được dịch một lần thành bitmask saoID, và
+mỗi lá số chỉ cần gộp saoBits của vài cung thành vài số nguyên: mọi cách cục
+được kiểm tra bằng phép AND và đếm bit.
+
+timCachCuc(diaBan) nhận một địa bàn đã an sao và trả về danh sách các
+CachCuc thỏa mãn (mỗi cách cục có ten, tinhChat), theo thứ tự trong
+danhSachCachCuc.
+
+Cách cục cần các sao SAO_CACH_CUC (thuộc các nhóm NHOM_CACH_CUC); lá số rút
+gọn lapDiaBan(..., nhomSao=SAO_CACH_CUC) đủ để tìm mọi cách cục, lá số thiếu
+sao nào thì các cách cục dùng sao đó không được tìm thấy.
+"""
+import functools
+from collections import namedtuple
+
+from lasotuvi.AmDuong import dichCung
+from lasotuvi.DiaBan import bangSaoCung
+from lasotuvi.LuatAnSao import CAC_NHOM, cacLuatAnSao
+from lasotuvi.Sao import (saoCuMon, saoDaLa, saoDiaKhong, saoDiaKiep,
+                          saoHoaKhoa, saoHoaLoc, saoHoaQuyen, saoHoaTinh,
+                          saoHuuBat, saoKinhDuong, saoLiemTrinh,
+                          saoLinhTinh, saoLocTon, saoPhaQuan, saoTaPhu,
+                          saoThaiAm, saoThaiDuong, saoThamLang, saoThatSat,
+                          saoThienCo, saoThienDong, saoThienLuong,
+                          saoThienMa, saoThienPhu, saoThienTuong, saoTuVi,
+                          saoVanKhuc, saoVanXuong, saoVuKhuc)
+
+# Vùng xét của điều kiện
+MENH = "menh"
+TAM_PHUONG = "tamPhuong"
+SANG = "sang"
+GIAP = "giap"
+_CAC_VUNG = (MENH, TAM_PHUONG, SANG)
+
+# Đặc tính được coi là sáng
+DAC_TINH_SANG = frozenset(("M", "V", "Đ"))
+
+# Điều kiện: có ít nhất soToiThieu sao trong cacSao ở vùng (None là đủ cả,
+# 0 là không có sao nào); với GIAP, hai sao ở hai cung giáp Mệnh
+DieuKien = namedtuple("DieuKien", ["vung", "cacSao", "soToiThieu"])
+CachCuc = namedtuple("CachCuc", ["ten", "tinhChat", "cacDieuKien"])
+
+
+def taiMenh(*cacSao, **kwargs):
+    return DieuKien(MENH, cacSao, kwargs.get("it"))
+
+
+def tamPhuong(*cacSao, **kwargs):
+    return DieuKien(TAM_PHUONG, cacSao, kwargs.get("it"))
+
+
+def khongCo(vung, *cacSao):
+    return DieuKien(vung, cacSao, 0)
+
+
+def sang(*cacSao):
+    return DieuKien(SANG, cacSao, None)
+
+
+def giap(sao1, sao2):
+    return DieuKien(GIAP, (sao1, sao2), None)
+
+
+def cachCuc(ten, tinhChat, *cacDieuKien):
+    return CachCuc(ten, tinhChat, cacDieuKien)
+
+
+chinhTinh = (saoTuVi, saoLiemTrinh, saoThienDong, saoVuKhuc, saoThaiDuong,
+             saoThienCo, saoThienPhu, saoThaiAm, saoThamLang, saoCuMon,
+             saoThienTuong, saoThienLuong, saoThatSat, saoPhaQuan)
+
+danhSachCachCuc = (
+    cachCuc("Tử Phủ Vũ Tướng", "cát",
+            tamPhuong(saoTuVi, saoThienPhu, saoVuKhuc, saoThienTuong)),
+    cachCuc("Cơ Nguyệt Đồng Lương", "cát",
+            tamPhuong(saoThienCo, saoThaiAm, saoThienDong, saoThienLuong)),
+    cachCuc("Sát Phá Tham", "cát",
+            tamPhuong(saoThatSat, saoPhaQuan, saoThamLang),
+            sang(saoThatSat, saoPhaQuan, saoThamLang)),
+    cachCuc("Nhật Nguyệt tịnh minh", "cát",
+            tamPhuong(saoThaiDuong, saoThaiAm),
+            sang(saoThaiDuong, saoThaiAm)),
+    cachCuc("Tử Phủ đồng cung", "cát", taiMenh(saoTuVi, saoThienPhu)),
+    cachCuc("Tam Hóa liên châu", "cát",
+            tamPhuong(saoHoaLoc, saoHoaQuyen, saoHoaKhoa)),
+    cachCuc("Song Lộc", "cát", tamPhuong(saoLocTon, saoHoaLoc)),
+    cachCuc("Lộc Mã giao trì", "cát",
+            tamPhuong(saoThienMa), tamPhuong(saoLocTon, saoHoaLoc, it=1)),
+    cachCuc("Tả Hữu giáp Mệnh", "cát", giap(saoTaPhu, saoHuuBat)),
+    cachCuc("Xương Khúc giáp Mệnh", "cát", giap(saoVanXuong, saoVanKhuc)),
+    cachCuc("Tham Hỏa tương phùng", "cát",
+            taiMenh(saoThamLang), taiMenh(saoHoaTinh, saoLinhTinh, it=1)),
+    cachCuc("Kình Đà giáp Mệnh", "hung", giap(saoKinhDuong, saoDaLa)),
+    cachCuc("Không Kiếp giáp Mệnh", "hung", giap(saoDiaKhong, saoDiaKiep)),
+    cachCuc("Mệnh vô chính diệu", "bình", khongCo(MENH, *chinhTinh)),
+)
+
+# Bitmask saoID các sao sáng tại từng cung
+_SAO_SANG = (0,) + tuple(
+    sum(1 << saoID for saoID, hang in enumerate(bangSaoCung)
+        if hang is not None and hang[cungSo].saoDacTinh in DAC_TINH_SANG)
+    for cungSo in range(1, 13))
+
+
+def _mask(cacSao):
+    return sum(1 << sao.saoID for sao in set(cacSao))
+
+
+@functools.lru_cache(maxsize=None)
+def _bienDich(cachCuc):
+    # Mỗi điều kiện thành (chỉ số vùng, mask, số tối thiểu) hoặc
+    # (None, mask sao 1, mask sao 2) với GIAP
+    kiemTra = []
+    for dieuKien in cachCuc.cacDieuKien:
+        if dieuKien.vung == GIAP:
+            kiemTra.append((None,) + tuple(
+                1 << sao.saoID for sao in dieuKien.cacSao))
+            continue
+        mask = _mask(dieuKien.cacSao)
+        soToiThieu = dieuKien.soToiThieu
+        if soToiThieu is None:
+            soToiThieu = bin(mask).count("1")
+        kiemTra.append((_CAC_VUNG.index(dieuKien.vung), mask, soToiThieu))
+    return tuple(kiemTra)
+
+
+def _thoaMan(kiemTra, vung, trai, phai):
+    for chiSo, a, b in kiemTra:
+        if chiSo is None:
+            # a, b là bit của hai sao, mỗi sao ở một bên cung Mệnh
+            if not (trai & a and phai & b or trai & b and phai & a):
+                return False
+        elif b == 0:
+            if vung[chiSo] & a:
+                return False
+        elif bin(vung[chiSo] & a).count("1") < b:
+            return False
+    return True
+
+
+def timCachCuc(diaBan, cacCachCuc=danhSachCachCuc):
+    """Các cách cục có trên lá số.
+
+    Args:
+        diaBan (diaBan): địa bàn đã an sao
+        cacCachCuc (iterable, optional): các CachCuc cần xét, mặc định
+            danhSachCachCuc
+
+    Returns:
+        list: các CachCuc thỏa mãn, theo thứ tự trong cacCachCuc
+    """
+    saoBits = diaBan.saoBits
+    cungMenh = diaBan.cungMenh
+    tamPhuongBits = 0
+    for khoang in (0, 4, 8, 6):
+        tamPhuongBits |= saoBits[dichCung(cungMenh, khoang)]
+    sangBits = 0
+    for cungSo in range(1, 13):
+        sangBits |= saoBits[cungSo] & _SAO_SANG[cungSo]
+    vung = (saoBits[cungMenh], tamPhuongBits, sangBits)
+    trai = saoBits[dichCung(cungMenh, -1)]
+    phai = saoBits[dichCung(cungMenh, 1)]
+    if cacCachCuc is danhSachCachCuc:
+        daDich = _danhSachDaDich
+    else:
+        daDich = [(cachCuc, _bienDich(cachCuc)) for cachCuc in cacCachCuc]
+    return [cachCuc for cachCuc, kiemTra in daDich
+            if _thoaMan(kiemTra, vung, trai, phai)]
+
+
+def cacSaoCachCuc(cacCachCuc=danhSachCachCuc):
+    """Các sao mà cacCachCuc xét đến."""
+    cacSao = []
+    for cachCuc in cacCachCuc:
+        for dieuKien in cachCuc.cacDieuKien:
+            cacSao.extend(sao for sao in dieuKien.cacSao
+                          if sao not in cacSao)
+    return tuple(cacSao)
+
+
+def cacNhomCachCuc(cacCachCuc=danhSachCachCuc):
+    """Các nhóm sao (LuatAnSao.CAC_NHOM) cần an để tìm cacCachCuc."""
+    cacSao = set(cacSaoCachCuc(cacCachCuc))
+    return tuple(nhom for nhom in CAC_NHOM
+                 if any(sao in cacSao for l in cacLuatAnSao
+                        if l.nhom == nhom for sao in l.cacSao))
+
+
+_danhSachDaDich = tuple((cachCuc, _bienDich(cachCuc))
+                        for cachCuc in danhSachCachCuc)
+
+SAO_CACH_CUC = cacSaoCachCuc()
+NHOM_CACH_CUC = cacNhomCachCuc()
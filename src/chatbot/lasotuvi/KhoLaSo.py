@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+"""
+Kho lá số tính sẵn cho toàn bộ không gian đầu vào của lapDiaBan.
+
+    python -m lasotuvi.KhoLaSo [--out lasotuvi/laso.bin] [--workers 4]
+                               [--kiem-tra 5000] [--khong-ghi]
+
+Địa bàn chỉ phụ thuộc vào vị trí năm âm lịch trong vòng 60 năm, tháng âm
+lịch, ngày âm lịch, giờ sinh và giới tính: 60 * 12 * 30 * 12 * 2 = 518400 lá
+số. Mỗi lá số được ghi thành một bản ghi cố định RECORD.size byte:
+
+- vị trí cung (1 - 12, 0 là không có) của từng saoID, mỗi sao nửa byte,
+- bitset các cung Tuần, Triệt,
+- số cục, chiều đại hạn, cung khởi tiểu hạn (cung Tý) và chiều tiểu hạn.
+
+File được mmap khi import (nếu có) và tra bằng traLaSoAmLich; không có file
+hoặc ngày âm lịch nằm ngoài 1 - 30 thì traLaSoAmLich trả về None và người
+gọi tự lập lá số như cũ. --kiem-tra so một mẫu ngẫu nhiên của file với
+lapDiaBan (kiemTraKhoLaSo) và thoát với mã lỗi nếu có lá số sai lệch.
+
+Chỉ số của lá số trong kho cũng là mã lá số ngắn 4 ký tự (maLaSo,
+giaiMaLaSo, laSoTheoMa) để chia sẻ hoặc tra lại lá số.
+"""
+import argparse
+import mmap
+import os
+import random
+import struct
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+from lasotuvi.AmDuong import dichCung
+from lasotuvi.App import cacheDiaBan, lapDiaBan
+from lasotuvi.DiaBan import diaBan
+from lasotuvi.LucThapHoaGiap import lucThapHoaGiap, traCuc, viTriNam
+from lasotuvi.Sao import danhMucSao
+
+KHO_MAGIC = b"LASOTV01"
+# magic, kích thước bản ghi, số bản ghi, saoID lớn nhất
+KHO_HEADER = struct.Struct("<8sHIH16x")
+SO_SAO = max(danhMucSao)
+SO_BYTE_SAO = (SO_SAO + 1) // 2
+# Nửa byte cho mỗi saoID 1..SO_SAO, bitset Tuần, bitset Triệt, số cục và
+# chiều đại hạn, cung Tý tiểu hạn và chiều tiểu hạn
+RECORD = struct.Struct("<%dsHHBB" % SO_BYTE_SAO)
+SO_LA_SO = 60 * 12 * 30 * 12 * 2
+KHO_PATH = os.environ.get(
+    "LASOTUVI_CHART_STORE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "laso.bin"))
+
+
+def chiSoLaSo(viTri, thangAm, ngayAm, gioSinh, gioiTinh):
+    """Số thứ tự của lá số trong kho.
+
+    Args:
+        viTri (int): vị trí năm âm lịch trong vòng 60 năm (viTriNam)
+        thangAm (int): tháng âm lịch (1 - 12)
+        ngayAm (int): ngày âm lịch (1 - 30)
+        gioSinh (int): chi giờ sinh (1 - 12)
+        gioiTinh (int): 1 nam, -1 nữ
+
+    Returns:
+        int: 0 đến SO_LA_SO - 1
+    """
+    return (((viTri * 12 + thangAm - 1) * 30 + ngayAm - 1) * 12 +
+            gioSinh - 1) * 2 + (0 if gioiTinh == 1 else 1)
+
+
+def giaTriChiSo(chiSo):
+    """Ngược lại của chiSoLaSo.
+
+    Returns:
+        tuple: (viTri, thangAm, ngayAm, gioSinh, gioiTinh)
+    """
+    chiSo, gioiTinh = divmod(chiSo, 2)
+    chiSo, gioSinh = divmod(chiSo, 12)
+    chiSo, ngayAm = divmod(chiSo, 30)
+    viTri, thangAm = divmod(chiSo, 12)
+    return viTri, thangAm + 1, ngayAm + 1, gioSinh + 1, \
+        1 if gioiTinh == 0 else -1
+
+
+def maHoaDiaBan(db):
+    """Mã hóa địa bàn đã lập thành một bản ghi RECORD.size byte."""
+    viTriSao = bytearray(SO_BYTE_SAO)
+    for cungSo in range(1, 13):
+        bits = db.saoBits[cungSo]
+        while bits:
+            thap = bits & -bits
+            saoID = thap.bit_length() - 1
+            viTriSao[(saoID - 1) // 2] |= \
+                cungSo << (4 if saoID % 2 == 0 else 0)
+            bits ^= thap
+    cucSo = db.daiHanCung[db.cungMenh]
+    # Đại hạn tăng theo chiều thuận (1) hoặc nghịch (-1) tính từ cung Mệnh
+    chieuDaiHan = 1 if db.daiHanCung[dichCung(db.cungMenh, 1)] == \
+        cucSo + 10 else -1
+    cungTy = db.tieuHanCung.index(0, 1)
+    chieuTieuHan = 1 if db.tieuHanCung[dichCung(cungTy, 1)] == 1 else -1
+    return RECORD.pack(
+        bytes(viTriSao), db.tuanBits, db.trietBits,
+        cucSo | (chieuDaiHan == -1) << 7,
+        cungTy | (chieuTieuHan == -1) << 7)
+
+
+# Bit của saoID lẻ (nửa byte thấp) và chẵn (nửa byte cao) theo vị trí byte
+_BIT_SAO_LE = tuple(1 << 2 * i + 1 for i in range(SO_BYTE_SAO))
+_BIT_SAO_CHAN = tuple(1 << 2 * i + 2 for i in range(SO_BYTE_SAO))
+
+
+def giaiMaDiaBan(banGhi, thangAm, gioSinh):
+    """Dựng lại địa bàn từ bản ghi của maHoaDiaBan."""
+    viTriSao, tuanBits, trietBits, daiHan, tieuHan = RECORD.unpack(banGhi)
+    db = diaBan(thangAm, gioSinh)
+    saoBits = db.saoBits
+    for b, bitLe, bitChan in zip(viTriSao, _BIT_SAO_LE, _BIT_SAO_CHAN):
+        if b & 15:
+            saoBits[b & 15] |= bitLe
+        if b >> 4:
+            saoBits[b >> 4] |= bitChan
+    db.tuanBits, db.trietBits = tuanBits, trietBits
+    db.nhapDaiHan(daiHan & 15, -1 if daiHan >> 7 else 1)
+    # Cung Tý của tiểu hạn đã biết, không cần dịch theo chi năm (chiNam = 1)
+    db.nhapTieuHan(tieuHan & 15, -1 if tieuHan >> 7 else 1, 1)
+    return db
+
+
+class LaSo(object):
+    """Lá số tra từ kho: địa bàn cùng các thông tin theo năm sinh và Cục.
+
+    Các thuộc tính canNamTen, chiNamTen, banMenh, menh, menhChu, thanChu,
+    tenCuc, hanhCuc đọc như của lapThienBan.
+    """
+    __slots__ = ("diaBan", "nam", "cuc", "gioiTinh")
+
+    def __init__(self, diaBan, nam, cuc, gioiTinh):
+        self.diaBan = diaBan
+        self.nam = nam
+        self.cuc = cuc
+        self.gioiTinh = gioiTinh
+
+    canNamTen = property(lambda self: self.nam.canNamTen)
+    chiNamTen = property(lambda self: self.nam.chiNamTen)
+    banMenh = property(lambda self: self.nam.banMenh)
+    menh = property(lambda self: self.nam.menh)
+    menhChu = property(lambda self: self.nam.menhChu)
+    thanChu = property(lambda self: self.nam.thanChu)
+    tenCuc = property(lambda self: self.cuc.tenCuc)
+    hanhCuc = property(lambda self: self.cuc.hanhCuc)
+
+
+class KhoLaSo(object):
+    """File kho lá số, mở chỉ đọc bằng mmap."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < KHO_HEADER.size:
+            self._mm.close()
+            raise ValueError("Không đọc được kho lá số %s" % path)
+        magic, kichThuoc, self.soLaSo, soSao = \
+            KHO_HEADER.unpack_from(self._mm)
+        if magic != KHO_MAGIC or kichThuoc != RECORD.size or \
+                soSao != SO_SAO or self.soLaSo != SO_LA_SO or \
+                len(self._mm) < KHO_HEADER.size + SO_LA_SO * RECORD.size:
+            self._mm.close()
+            raise ValueError("Không đọc được kho lá số %s" % path)
+
+    def banGhi(self, chiSo):
+        dau = KHO_HEADER.size + chiSo * RECORD.size
+        return self._mm[dau:dau + RECORD.size]
+
+    def laSo(self, ngayAm, thangAm, namAm, gioSinh, gioiTinh):
+        """Lá số theo ngày âm lịch, hoặc None nếu nằm ngoài kho."""
+        if not (1 <= ngayAm <= 30 and 1 <= thangAm <= 12 and
+                1 <= gioSinh <= 12):
+            return None
+        viTri = viTriNam(namAm)
+        db = giaiMaDiaBan(
+            self.banGhi(chiSoLaSo(viTri, thangAm, ngayAm, gioSinh, gioiTinh)),
+            thangAm, gioSinh)
+        return LaSo(db, lucThapHoaGiap[viTri], traCuc(namAm, db.cungMenh),
+                    1 if gioiTinh == 1 else -1)
+
+    def close(self):
+        self._mm.close()
+
+
+_kho = None
+
+
+def moKhoLaSo(path=KHO_PATH):
+    """Dùng file kho lá số tại path cho traLaSoAmLich."""
+    global _kho
+    kho = KhoLaSo(path)
+    dongKhoLaSo()
+    _kho = kho
+    return kho
+
+
+def dongKhoLaSo():
+    global _kho
+    if _kho is not None:
+        _kho.close()
+        _kho = None
+
+
+def khoDangMo():
+    return _kho is not None
+
+
+def traLaSoAmLich(ngayAm, thangAm, namAm, gioSinh, gioiTinh):
+    """Tra lá số theo ngày sinh âm lịch, giờ sinh và giới tính.
+
+    Returns:
+        LaSo: hoặc None nếu chưa mở kho hay ngày nằm ngoài kho
+    """
+    if _kho is None:
+        return None
+    return _kho.laSo(ngayAm, thangAm, namAm, gioSinh, gioiTinh)
+
+
+# Mã lá số: chiSoLaSo viết bằng base32 Crockford (không có I, L, O, U),
+# SO_KY_TU_MA ký tự vì SO_LA_SO < 32 ** 4
+BANG_MA = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+SO_KY_TU_MA = 4
+
+
+def maLaSo(ngayAm, thangAm, namAm, gioSinh, gioiTinh):
+    """Mã ngắn của lá số (bộ luật mặc định), ví dụ "1NYR".
+
+    Hai ngày sinh cùng mã thì cùng lá số; giaiMaLaSo đổi ngược lại.
+
+    Raises:
+        Exception: ngày âm lịch, giờ sinh hoặc giới tính nằm ngoài kho
+    """
+    if not (1 <= ngayAm <= 30 and 1 <= thangAm <= 12 and
+            1 <= gioSinh <= 12 and gioiTinh in (1, -1)):
+        raise Exception("Không có mã cho lá số này.")
+    chiSo = chiSoLaSo(viTriNam(namAm), thangAm, ngayAm, gioSinh, gioiTinh)
+    ma = ""
+    for _ in range(SO_KY_TU_MA):
+        chiSo, du = divmod(chiSo, 32)
+        ma = BANG_MA[du] + ma
+    return ma
+
+
+def giaiMaLaSo(ma):
+    """Ngược lại của maLaSo.
+
+    Returns:
+        tuple: (ngayAm, thangAm, namAm, gioSinh, gioiTinh), namAm là năm
+        cùng can chi trong vòng 1984 - 2043
+
+    Raises:
+        Exception: mã không hợp lệ
+    """
+    ma = str(ma).strip().upper()
+    if len(ma) != SO_KY_TU_MA or any(kyTu not in BANG_MA for kyTu in ma):
+        raise Exception("Mã lá số không hợp lệ: %s" % ma)
+    chiSo = 0
+    for kyTu in ma:
+        chiSo = chiSo * 32 + BANG_MA.index(kyTu)
+    if chiSo >= SO_LA_SO:
+        raise Exception("Mã lá số không hợp lệ: %s" % ma)
+    viTri, thangAm, ngayAm, gioSinh, gioiTinh = giaTriChiSo(chiSo)
+    return ngayAm, thangAm, 1984 + viTri, gioSinh, gioiTinh
+
+
+def laSoTheoMa(ma):
+    """Lá số (LaSo) của một mã: tra kho nếu đã mở, không thì lập lá số."""
+    ngayAm, thangAm, namAm, gioSinh, gioiTinh = giaiMaLaSo(ma)
+    laSo = traLaSoAmLich(ngayAm, thangAm, namAm, gioSinh, gioiTinh)
+    if laSo is None:
+        db = lapDiaBan(diaBan, ngayAm, thangAm, namAm, gioSinh, gioiTinh,
+                       False)
+        laSo = LaSo(db, lucThapHoaGiap[viTriNam(namAm)],
+                    traCuc(namAm, db.cungMenh), gioiTinh)
+    return laSo
+
+
+if os.path.exists(KHO_PATH):
+    try:
+        moKhoLaSo(KHO_PATH)
+    except (OSError, ValueError) as e:
+        # Không mở được thì lập lá số như khi không có kho
+        warnings.warn(str(e), RuntimeWarning)
+
+
+def _lapKhoi(viTri):
+    # Lập, mã hóa và kiểm tra lại các lá số của một năm trong vòng 60 năm.
+    # Mỗi lá số chỉ lập một lần nên không cần cache trong tiến trình con.
+    cacheDiaBan.disable()
+    namAm = 1984 + viTri
+    dau = chiSoLaSo(viTri, 1, 1, 1, 1)
+    khoi = bytearray()
+    for chiSo in range(dau, dau + SO_LA_SO // 60):
+        _, thangAm, ngayAm, gioSinh, gioiTinh = giaTriChiSo(chiSo)
+        db = lapDiaBan(diaBan, ngayAm, thangAm, namAm, gioSinh, gioiTinh,
+                       False, 7)
+        banGhi = maHoaDiaBan(db)
+        if giaiMaDiaBan(banGhi, thangAm, gioSinh) != db:
+            raise Exception("Sai lệch khi mã hóa lá số %s" % (
+                giaTriChiSo(chiSo),))
+        khoi += banGhi
+    return bytes(khoi)
+
+
+def ghiKhoLaSo(path, soTienTrinh=None, baoCao=None):
+    """Lập toàn bộ lá số bằng nhiều tiến trình và ghi vào path.
+
+    Returns:
+        int: số lá số đã ghi
+    """
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f, ProcessPoolExecutor(soTienTrinh) as pool:
+        f.write(KHO_HEADER.pack(KHO_MAGIC, RECORD.size, SO_LA_SO, SO_SAO))
+        for viTri, khoi in enumerate(pool.map(_lapKhoi, range(60))):
+            f.write(khoi)
+            if baoCao is not None:
+                baoCao(viTri + 1, 60)
+    os.replace(tmp, path)
+    return SO_LA_SO
+
+
+def kiemTraKhoLaSo(path, soMau=5000, seed=None):
+    """So soMau lá số ngẫu nhiên của file kho (cùng lá số đầu và cuối) với
+    lapDiaBan, mỗi lá số ở một năm ngẫu nhiên trong ba vòng 60 năm quanh
+    1984.
+
+    Returns:
+        list: (ngayAm, thangAm, namAm, gioSinh, gioiTinh) của các lá số sai
+        lệch, rỗng nếu khớp hết
+
+    Raises:
+        ValueError: file không đọc được (sai header hoặc thiếu bản ghi)
+    """
+    rng = random.Random(seed)
+    cacChiSo = [0, SO_LA_SO - 1] + [rng.randrange(SO_LA_SO)
+                                    for _ in range(soMau)]
+    kho = KhoLaSo(path)
+    saiLech = []
+    try:
+        for chiSo in cacChiSo:
+            viTri, thangAm, ngayAm, gioSinh, gioiTinh = giaTriChiSo(chiSo)
+            namAm = 1924 + viTri + 60 * rng.randrange(3)
+            ngaySinh = (ngayAm, thangAm, namAm, gioSinh, gioiTinh)
+            try:
+                dbKho = kho.laSo(*ngaySinh).diaBan
+            except (IndexError, ValueError):
+                # Bản ghi hỏng có thể không giải mã được
+                dbKho = None
+            if dbKho != lapDiaBan(diaBan, *(ngaySinh + (False, 7))):
+                saiLech.append(ngaySinh)
+    finally:
+        kho.close()
+    return saiLech
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--out", default=KHO_PATH)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--kiem-tra", type=int, default=0, metavar="SO_MAU",
+                        help="so SO_MAU lá số ngẫu nhiên với lapDiaBan")
+    parser.add_argument("--khong-ghi", action="store_true",
+                        help="không lập lại, chỉ kiểm tra file --out")
+    args = parser.parse_args(argv)
+
+    batDau = time.time()
+
+    def baoCao(xong, tong):
+        sys.stderr.write("\r%d/%d năm, %.0fs" % (xong, tong,
+                                                  time.time() - batDau))
+
+    if not args.khong_ghi:
+        soLaSo = ghiKhoLaSo(args.out, args.workers, baoCao)
+        sys.stderr.write("\n")
+        print("Đã ghi %s: %d lá số, %.1f MB, %.0fs" % (
+            args.out, soLaSo, os.path.getsize(args.out) / 1e6,
+            time.time() - batDau))
+    if args.kiem_tra:
+        saiLech = kiemTraKhoLaSo(args.out, args.kiem_tra)
+        if saiLech:
+            sys.exit("Kho lá số %s sai lệch %d/%d lá số, ví dụ %s" % (
+                args.out, len(saiLech), args.kiem_tra + 2, saiLech[0]))
+        print("Đã kiểm tra %s: %d lá số khớp lapDiaBan" % (
+            args.out, args.kiem_tra + 2))
+
+
+if __name__ == "__main__":
+    main()
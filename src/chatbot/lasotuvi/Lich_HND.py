@@ -4,7 +4,26 @@ Astronomical algorithms
 from the book "Astronomical Algorithms" by Jean Meeus, 1998
 """
 
+import collections
+import functools
 import math
+import mmap
+import os
+import struct
+import sys
+import warnings
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from lasotuvi import LichData
+except ImportError:
+    LichData = None
+
+from lasotuvi.LRUCache import LRUCache, kichThuocTuMoiTruong
 
 
 def jdFromDate(dd, mm, yy):
@@ -127,6 +146,22 @@ After that, return 1, 2, 3 ...'''
         SunLongitude(dayNumber - 0.5 - timeZone / 24.) / math.pi * 6)
 
 
+def apparentSunLongitude(jd):
+    '''def apparentSunLongitude(jd): Apparent longitude of the sun in degrees
+    [0, 360) at the instant jd (days since 1/1/4713 BC noon UTC), using the
+    same series as getSunLongitude.'''
+    T = (jd - 2451545.0) / 36525.
+    T2 = T**2
+    dr = math.pi / 180.
+    M = 357.52910 + 35999.05030*T - 0.0001559*T2 - 0.00000048*T*T2
+    L0 = 280.46645 + 36000.76983*T + 0.0003032*T2
+    DL = (1.914600 - 0.004817*T - 0.000014*T2)*math.sin(dr*M)
+    DL = DL + (0.019993 - 0.000101*T)*math.sin(dr*2*M) + 0.000290*math.sin(dr*3*M)
+    omega = 125.04 - 1934.136 * T
+    L = L0 + DL - 0.00569 - 0.00478 * math.sin(omega * dr)
+    return L % 360.
+
+
 def getSunLongitude(jdn, timeZone):
     T = (jdn - 2451545.5 - timeZone/24.) / 36525.
     T2 = T**2
@@ -143,51 +178,246 @@ def getSunLongitude(jdn, timeZone):
     return int(L/math.pi*6)
 
 
-def getNewMoonDay(k, timeZone):
-    '''def getNewMoonDay(k, timeZone): Compute the day of the k-th new moon
-    in the given time zone. The time zone if the time difference between local
-    time and UTC: 7.0 for UTC+7:00.'''
+def _newMoonDay(k, timeZone):
+    # Meeus formula, used outside the precomputed range (and by LichGen)
     return int(NewMoon(k) + 0.5 + timeZone / 24.)
 
 
-def getLunarMonth11(yy, timeZone):
-    '''def getLunarMonth11(yy, timeZone):  Find the day that starts the luner month
-    11of the given year for the given time zone.'''
+# Số năm (theo từng múi giờ) được nhớ lại cho tháng 11 và tháng nhuận khi
+# phải tính bằng công thức (ngoài bảng LichData hoặc khác múi giờ)
+LUNAR_CACHE_SIZE = kichThuocTuMoiTruong("LASOTUVI_LUNAR_CACHE_SIZE", 512)
+
+
+@functools.lru_cache(maxsize=LUNAR_CACHE_SIZE)
+def _lunarMonth11(yy, timeZone):
     # off = jdFromDate(31, 12, yy) \
     #            - 2415021.076998695
     off = jdFromDate(31, 12, yy) - 2415021.
     k = int(off / 29.530588853)
-    nm = getNewMoonDay(k, timeZone)
+    nm = _newMoonDay(k, timeZone)
     sunLong = getSunLongitude(nm, timeZone)
     # sun longitude at local midnight
     if (sunLong >= 9):
-        nm = getNewMoonDay(k - 1, timeZone)
+        nm = _newMoonDay(k - 1, timeZone)
     return nm
 
-# print getLunarMonth11(1992, 7)
-def getLeapMonthOffset(a11, timeZone):
-    '''def getLeapMonthOffset(a11, timeZone): Find the index of the leap month
-    after the month starting on the day a11.'''
+
+@functools.lru_cache(maxsize=LUNAR_CACHE_SIZE)
+def _leapMonthOffset(a11, timeZone):
+    # a11 là ngày bắt đầu tháng 11 nên mỗi khóa ứng với một năm âm lịch
     k = int((a11 - 2415021.076998695) / 29.530588853 + 0.5)
     last = 0
     i = 1  # start with month following lunar month 11
     arc = getSunLongitude(
-        getNewMoonDay(k + i, timeZone), timeZone)
+        _newMoonDay(k + i, timeZone), timeZone)
     while True:
         last = arc
         i += 1
         arc = getSunLongitude(
-            getNewMoonDay(k + i, timeZone),
+            _newMoonDay(k + i, timeZone),
             timeZone)
         if not (arc != last and i < 14):
             break
     return i - 1
 
 
+def lunarCacheInfo():
+    '''def lunarCacheInfo(): Hit/miss counters of the per-(year, timeZone)
+    caches behind getLunarMonth11 and getLeapMonthOffset.'''
+    return {
+        "getLunarMonth11": _lunarMonth11.cache_info()._asdict(),
+        "getLeapMonthOffset": _leapMonthOffset.cache_info()._asdict(),
+    }
+
+
+def clearLunarCache():
+    _lunarMonth11.cache_clear()
+    _leapMonthOffset.cache_clear()
+
+
+# Bảng sóc, tháng 11 và tháng nhuận của một múi giờ
+BangLich = collections.namedtuple("BangLich", [
+    "timeZone", "newMoonK0", "newMoonDays", "year0", "month11Days",
+    "leapMonthOffsets", "leapMonthOffsetByA11"])
+
+
+def _kOfDay(jd):
+    return int((jd - 2415021.076998695) / 29.530588853 + 0.5)
+
+
+def tinhBangLich(yearMin, yearMax, timeZone):
+    '''def tinhBangLich(yearMin, yearMax, timeZone): Compute the new moons,
+    month-11 starts and leap month offsets of the years yearMin..yearMax
+    with the Meeus formulas. Returns a BangLich.'''
+    month11 = tuple(_lunarMonth11.__wrapped__(yy, timeZone)
+                    for yy in range(yearMin, yearMax + 1))
+    leapOffsets = tuple(_leapMonthOffset.__wrapped__(a11, timeZone)
+                        for a11 in month11)
+    # getLeapMonthOffset dò tối đa 14 tháng sau tháng 11
+    kMin = _kOfDay(month11[0]) - 1
+    kMax = _kOfDay(month11[-1]) + 15
+    newMoons = tuple(_newMoonDay(k, timeZone) for k in range(kMin, kMax + 1))
+    return BangLich(timeZone, kMin, newMoons, yearMin, month11, leapOffsets,
+                    dict(zip(month11, leapOffsets)))
+
+
+# Múi giờ của LichData được tính sẵn (LichGen) và luôn được giữ; các múi giờ
+# khác được tính cho cùng khoảng năm ở lần dùng đầu tiên rồi giữ trong
+# cacheBangLich. Múi giờ là số thực tùy ý nên cache có giới hạn: đặt
+# LASOTUVI_ZONE_CACHE_SIZE để đổi, 0 để luôn tính bằng công thức.
+_zoneTables = {}
+if LichData is not None:
+    _zoneYears = (LichData.YEAR_MIN, LichData.YEAR_MAX)
+    _zoneTables[LichData.TIME_ZONE] = BangLich(
+        LichData.TIME_ZONE, LichData.NEW_MOON_K_MIN, LichData.NEW_MOON_DAYS,
+        LichData.YEAR_MIN, LichData.MONTH11_DAYS,
+        LichData.LEAP_MONTH_OFFSETS,
+        dict(zip(LichData.MONTH11_DAYS, LichData.LEAP_MONTH_OFFSETS)))
+else:
+    _zoneYears = (1899, 2101)
+cacheBangLich = LRUCache(kichThuocTuMoiTruong("LASOTUVI_ZONE_CACHE_SIZE", 8))
+
+
+def bangLich(timeZone):
+    '''def bangLich(timeZone): The BangLich of the time zone, computed on
+    first use (on every call when cacheBangLich is disabled).'''
+    bang = _zoneTable(timeZone)
+    if bang is None:
+        bang = tinhBangLich(*_zoneYears, timeZone=timeZone)
+    return bang
+
+
+def _zoneTable(timeZone):
+    # BangLich của múi giờ, hoặc None nếu cache bị tắt
+    bang = _zoneTables.get(timeZone) or cacheBangLich.get(timeZone)
+    if bang is None and cacheBangLich.enabled:
+        bang = tinhBangLich(*_zoneYears, timeZone=timeZone)
+        cacheBangLich.put(timeZone, bang)
+    return bang
+
+
+def getNewMoonDay(k, timeZone):
+    '''def getNewMoonDay(k, timeZone): Compute the day of the k-th new moon
+    in the given time zone. The time zone if the time difference between local
+    time and UTC: 7.0 for UTC+7:00.'''
+    bang = _zoneTable(timeZone)
+    if bang is not None:
+        i = k - bang.newMoonK0
+        if 0 <= i < len(bang.newMoonDays):
+            return bang.newMoonDays[i]
+    return _newMoonDay(k, timeZone)
+
+
+def getLunarMonth11(yy, timeZone):
+    '''def getLunarMonth11(yy, timeZone):  Find the day that starts the luner month
+    11of the given year for the given time zone.'''
+    bang = _zoneTable(timeZone)
+    if bang is not None:
+        i = yy - bang.year0
+        if 0 <= i < len(bang.month11Days):
+            return bang.month11Days[i]
+    return _lunarMonth11(yy, timeZone)
+
+# print getLunarMonth11(1992, 7)
+def getLeapMonthOffset(a11, timeZone):
+    '''def getLeapMonthOffset(a11, timeZone): Find the index of the leap month
+    after the month starting on the day a11.'''
+    bang = _zoneTable(timeZone)
+    if bang is not None and a11 in bang.leapMonthOffsetByA11:
+        return bang.leapMonthOffsetByA11[a11]
+    return _leapMonthOffset(a11, timeZone)
+
+# Lịch âm tính sẵn theo từng ngày (xem LichGen --bin), mở bằng mmap để các
+# process/container dùng chung trang bộ nhớ. Mỗi ngày Julius là một uint32:
+# ngày (5 bit) | tháng (4 bit) | nhuận (1 bit) | năm - yearBase (phần còn lại)
+CALENDAR_MAGIC = b"AMLICH01"
+CALENDAR_HEADER = struct.Struct("<8shhII12x")
+CALENDAR_PATH = os.environ.get(
+    "LASOTUVI_CALENDAR_FILE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "amlich.bin"))
+
+
+def packLunarDate(lunarDay, lunarMonth, lunarYear, lunarLeap, yearBase):
+    return lunarDay | lunarMonth << 5 | lunarLeap << 9 \
+        | (lunarYear - yearBase) << 10
+
+
+class CalendarFile(object):
+    """Read-only view of a day-indexed lunar calendar file."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < CALENDAR_HEADER.size:
+            self._mm.close()
+            raise ValueError("Không đọc được file lịch %s" % path)
+        magic, tzMinutes, self.yearBase, self.jdStart, self.count = \
+            CALENDAR_HEADER.unpack_from(self._mm)
+        if magic != CALENDAR_MAGIC or sys.byteorder != "little" or \
+                len(self._mm) < CALENDAR_HEADER.size + 4 * self.count:
+            self._mm.close()
+            raise ValueError("Không đọc được file lịch %s" % path)
+        self.timeZone = tzMinutes / 60.
+        start = CALENDAR_HEADER.size
+        self.records = memoryview(self._mm)[
+            start:start + 4 * self.count].cast("I")
+
+    def lookup(self, dayNumber):
+        """[lunarDay, lunarMonth, lunarYear, lunarLeap] of the Julian day,
+        or None if the day is outside the file."""
+        i = dayNumber - self.jdStart
+        if i < 0 or i >= self.count:
+            return None
+        rec = self.records[i]
+        return [rec & 31, rec >> 5 & 15, (rec >> 10) + self.yearBase,
+                rec >> 9 & 1]
+
+    def close(self):
+        self.records.release()
+        self._mm.close()
+
+
+# File lịch đang mở, theo múi giờ
+_calendarFiles = {}
+
+
+def openCalendarFile(path=CALENDAR_PATH):
+    '''def openCalendarFile(path): Use the calendar file at path for S2L in
+    its time zone. Returns the opened CalendarFile.'''
+    calendar = CalendarFile(path)
+    closeCalendarFile(calendar.timeZone)
+    _calendarFiles[calendar.timeZone] = calendar
+    return calendar
+
+
+def closeCalendarFile(timeZone=None):
+    '''def closeCalendarFile(timeZone = None): Close the calendar file of
+    the time zone, or all of them.'''
+    zones = list(_calendarFiles) if timeZone is None else [timeZone]
+    for tz in zones:
+        calendar = _calendarFiles.pop(tz, None)
+        if calendar is not None:
+            calendar.close()
+
+
+if os.path.exists(CALENDAR_PATH):
+    try:
+        openCalendarFile(CALENDAR_PATH)
+    except (OSError, ValueError) as e:
+        # Không mở được thì dùng bảng LichData / công thức như khi không có
+        # file lịch
+        warnings.warn(str(e), RuntimeWarning)
+
+
 def S2L(dd, mm, yy, timeZone=7):
     '''def S2L(dd, mm, yy, timeZone = 7): Convert solar date dd/mm/yyyy to
     the corresponding lunar date.'''
     dayNumber = jdFromDate(dd, mm, yy)
+    calendar = _calendarFiles.get(timeZone)
+    if calendar is not None:
+        lunarDate = calendar.lookup(dayNumber)
+        if lunarDate is not None:
+            return lunarDate
     k = int((dayNumber - 2415021.076998695) / 29.530588853)
     monthStart = getNewMoonDay(k + 1, timeZone)
     if (monthStart > dayNumber):
@@ -248,3 +478,253 @@ def L2S(lunarD, lunarM, lunarY, lunarLeap, tZ=7):
             off += 1
     monthStart = getNewMoonDay(k + off, tZ)
     return jdToDate(monthStart + lunarD - 1)
+
+
+def iterLunarDates(start, end, timeZone=7):
+    '''def iterLunarDates(start, end, timeZone = 7): Iterate over the solar
+    dates start..end ([dd, mm, yyyy], both included) and yield
+    ([dd, mm, yyyy], [lunarDay, lunarMonth, lunarYear, lunarLeap],
+    [canNgay, chiNgay]) for each day.
+
+    S2L is only called on the first day and when a new lunar month starts;
+    the other days are stepped by one.'''
+    jd = jdFromDate(*start)
+    jdEnd = jdFromDate(*end)
+    dd, mm, yy = jdToDate(jd)
+    canNgay = (jd + 9) % 10 + 1
+    chiNgay = (jd + 1) % 12 + 1
+    nextMonthStart = jd
+    while jd <= jdEnd:
+        if jd >= nextMonthStart:
+            lunarDay, lunarMonth, lunarYear, lunarLeap = \
+                S2L(dd, mm, yy, timeZone)
+            k = int((jd - lunarDay + 1 - 2415021.076998695) / 29.530588853
+                    + 0.5)
+            nextMonthStart = getNewMoonDay(k + 1, timeZone)
+        else:
+            lunarDay += 1
+        yield [dd, mm, yy], [lunarDay, lunarMonth, lunarYear, lunarLeap], \
+            [canNgay, chiNgay]
+        jd += 1
+        dd += 1
+        if dd > 28:
+            # Cuối tháng dương lịch: tính lại ngày tháng từ số ngày Julius
+            dd, mm, yy = jdToDate(jd)
+        canNgay = canNgay % 10 + 1
+        chiNgay = chiNgay % 12 + 1
+
+
+# Các hàm *_batch (và lunarMonthStarts) đổi lịch cho cả mảng NumPy một lúc,
+# dùng offline cho thống kê hoặc tính sẵn: numpy không có trong gói Lambda
+# (xem requirements.txt), thiếu numpy thì chúng báo ImportError.
+def _asIntArrays(*args):
+    if np is None:
+        raise ImportError("Các hàm *_batch cần thư viện numpy.")
+    return np.broadcast_arrays(*[np.asarray(a, dtype=np.int64)
+                                 for a in args])
+
+
+def _scalarFallback(func, mask, columns, results, timeZone):
+    # Các phần tử nằm ngoài bảng tính sẵn: tính lại từng ngày bằng hàm gốc
+    for i in np.flatnonzero(mask):
+        row = func(*[int(c.flat[i]) for c in columns], timeZone)
+        for out, value in zip(results, row):
+            out.flat[i] = value
+
+
+def jdFromDate_batch(dd, mm, yy):
+    """Vectorized jdFromDate (Gregorian dates only) for NumPy arrays."""
+    dd, mm, yy = _asIntArrays(dd, mm, yy)
+    a = (14 - mm) // 12
+    y = yy + 4800 - a
+    m = mm + 12 * a - 3
+    return dd + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 \
+        + y // 400 - 32045
+
+
+def jdToDate_batch(jd):
+    """Vectorized jdToDate (Gregorian dates only) for NumPy arrays.
+    Returns the tuple (day, month, year) of arrays."""
+    jd, = _asIntArrays(jd)
+    a = jd + 32044
+    b = (4 * a + 3) // 146097
+    c = a - (b * 146097) // 4
+    d = (4 * c + 3) // 1461
+    e = c - (1461 * d) // 4
+    m = (5 * e + 2) // 153
+    day = e - (153 * m + 2) // 5 + 1
+    month = m + 3 - 12 * (m // 10)
+    year = b * 100 + d - 4800 + m // 10
+    return day, month, year
+
+
+def S2L_batch(dd, mm, yy, timeZone=7):
+    """def S2L_batch(dd, mm, yy, timeZone = 7): Convert arrays of solar dates
+    to lunar dates. Returns the tuple (lunarDay, lunarMonth, lunarYear,
+    lunarLeap) of NumPy arrays, identical to calling S2L element by element.
+
+    Dates covered by the time zone's BangLich are converted with array
+    lookups; the others, or every date when the zone's table is not kept
+    (cacheBangLich disabled), fall back to the scalar S2L."""
+    dd, mm, yy = _asIntArrays(dd, mm, yy)
+    lunarDay = np.zeros(dd.shape, dtype=np.int64)
+    lunarMonth = np.zeros(dd.shape, dtype=np.int64)
+    lunarYear = np.zeros(dd.shape, dtype=np.int64)
+    lunarLeap = np.zeros(dd.shape, dtype=np.int64)
+    results = (lunarDay, lunarMonth, lunarYear, lunarLeap)
+    # Cùng đường get/put với S2L: cache tắt thì không lập bảng
+    bang = _zoneTable(timeZone)
+    if bang is None:
+        inTable = np.zeros(dd.shape, dtype=bool)
+    else:
+        inTable = (yy > bang.year0) & \
+            (yy < bang.year0 + len(bang.month11Days) - 1)
+    _scalarFallback(S2L, ~inTable, (dd, mm, yy), results, timeZone)
+    if not inTable.any():
+        return results
+
+    newMoons = np.asarray(bang.newMoonDays, dtype=np.int64)
+    month11 = np.asarray(bang.month11Days, dtype=np.int64)
+    leapOffsets = np.asarray(bang.leapMonthOffsets, dtype=np.int64)
+    yy = yy[inTable]
+    dayNumber = jdFromDate_batch(dd[inTable], mm[inTable], yy)
+    k = np.trunc((dayNumber - 2415021.076998695) / 29.530588853) \
+        .astype(np.int64) - bang.newMoonK0
+    monthStart = newMoons[k + 1]
+    monthStart = np.where(monthStart > dayNumber, newMoons[k], monthStart)
+
+    y = yy - bang.year0
+    truocThang11 = month11[y] >= monthStart
+    # a11/b11: tháng 11 âm lịch trước và sau ngày cần đổi
+    ia11 = np.where(truocThang11, y - 1, y)
+    a11 = month11[ia11]
+    b11 = month11[ia11 + 1]
+    lYear = np.where(truocThang11, yy, yy + 1)
+    diff = np.trunc((monthStart - a11) / 29.).astype(np.int64)
+
+    leapMonthDiff = leapOffsets[ia11]
+    namNhuan = (b11 - a11) > 365
+    sauThangNhuan = namNhuan & (diff >= leapMonthDiff)
+    lMonth = np.where(sauThangNhuan, diff + 10, diff + 11)
+    lLeap = (namNhuan & (diff == leapMonthDiff)).astype(np.int64)
+    lMonth = np.where(lMonth > 12, lMonth - 12, lMonth)
+    lYear = lYear - ((lMonth >= 11) & (diff < 4))
+
+    lunarDay[inTable] = dayNumber - monthStart + 1
+    lunarMonth[inTable] = lMonth
+    lunarYear[inTable] = lYear
+    lunarLeap[inTable] = lLeap
+    return results
+
+
+def L2S_batch(lunarD, lunarM, lunarY, lunarLeap, tZ=7):
+    """def L2S_batch(lunarD, lunarM, lunarY, lunarLeap, tZ = 7): Convert arrays
+    of lunar dates to solar dates. Returns the tuple (day, month, year) of
+    NumPy arrays; invalid leap months give 0/0/0 as in L2S. Like S2L_batch,
+    dates outside the zone's BangLich (all of them when cacheBangLich is
+    disabled) fall back to the scalar L2S."""
+    lunarD, lunarM, lunarY, lunarLeap = \
+        _asIntArrays(lunarD, lunarM, lunarY, lunarLeap)
+    day = np.zeros(lunarD.shape, dtype=np.int64)
+    month = np.zeros(lunarD.shape, dtype=np.int64)
+    year = np.zeros(lunarD.shape, dtype=np.int64)
+    results = (day, month, year)
+    bang = _zoneTable(tZ)
+    if bang is None:
+        inTable = np.zeros(lunarD.shape, dtype=bool)
+    else:
+        inTable = (lunarY > bang.year0) & \
+            (lunarY < bang.year0 + len(bang.month11Days) - 1)
+    _scalarFallback(L2S, ~inTable, (lunarD, lunarM, lunarY, lunarLeap),
+                    results, tZ)
+    if not inTable.any():
+        return results
+
+    newMoons = np.asarray(bang.newMoonDays, dtype=np.int64)
+    month11 = np.asarray(bang.month11Days, dtype=np.int64)
+    leapOffsets = np.asarray(bang.leapMonthOffsets, dtype=np.int64)
+    lunarD, lunarM, lunarLeap = \
+        lunarD[inTable], lunarM[inTable], lunarLeap[inTable]
+    ia11 = lunarY[inTable] - bang.year0 - (lunarM < 11)
+    a11 = month11[ia11]
+    b11 = month11[ia11 + 1]
+    k = np.trunc(0.5 + (a11 - 2415021.076998695) / 29.530588853) \
+        .astype(np.int64) - bang.newMoonK0
+    off = lunarM - 11
+    off = np.where(off < 0, off + 12, off)
+
+    namNhuan = (b11 - a11) > 365
+    leapOff = leapOffsets[ia11]
+    leapM = leapOff - 2
+    leapM = np.where(leapM < 0, leapM + 12, leapM)
+    khongHopLe = namNhuan & (lunarLeap != 0) & (lunarM != leapM)
+    off = off + (namNhuan & ((lunarLeap != 0) | (off >= leapOff)))
+
+    monthStart = newMoons[k + off]
+    d, m, y = jdToDate_batch(monthStart + lunarD - 1)
+    day[inTable] = np.where(khongHopLe, 0, d)
+    month[inTable] = np.where(khongHopLe, 0, m)
+    year[inTable] = np.where(khongHopLe, 0, y)
+    return results
+
+
+# Ngày bắt đầu và số ngày của các tháng âm lịch thường (không nhuận), theo
+# múi giờ: (năm âm lịch đầu tiên, mảng [năm][tháng 1..12] ngày Julius bắt đầu,
+# mảng [năm][tháng 1..12] số ngày của tháng)
+_monthStartTables = {}
+
+
+def lunarMonthStarts(timeZone=7):
+    '''def lunarMonthStarts(timeZone = 7): Start day (Julian day number) and
+    length of every regular lunar month covered by the time zone's
+    BangLich. Returns (firstLunarYear, starts, lengths); starts[i][m - 1]
+    is lunar month m of year firstLunarYear + i. The arrays are built from
+    the zone's BangLich (bangLich, even when cacheBangLich is disabled) and
+    kept per time zone.'''
+    table = _monthStartTables.get(timeZone)
+    if table is None:
+        _asIntArrays()
+        bang = bangLich(timeZone)
+        firstYear = bang.year0 + 1
+        years = np.arange(firstYear, bang.year0 + len(bang.month11Days) - 1)
+        yy, mm = np.meshgrid(years, np.arange(1, 13), indexing="ij")
+        starts = jdFromDate_batch(*L2S_batch(1, mm, yy, 0, timeZone))
+        k = np.trunc((starts - 2415021.076998695) / 29.530588853 + 0.5) \
+            .astype(np.int64) - bang.newMoonK0
+        newMoons = np.asarray(bang.newMoonDays, dtype=np.int64)
+        table = _monthStartTables[timeZone] = \
+            (firstYear, starts, newMoons[k + 1] - starts)
+    return table
+
+
+def nextAnniversary_batch(lunarDays, lunarMonths, dd, mm, yy, timeZone=7):
+    '''def nextAnniversary_batch(lunarDays, lunarMonths, dd, mm, yy,
+    timeZone = 7): For each lunar (day, month), find the first solar date on
+    or after dd/mm/yy that falls on it (ngày giỗ, sinh nhật âm lịch).
+    Returns the tuple (day, month, year) of NumPy arrays.
+
+    - Anniversaries are kept in the regular month: a leap month never hosts
+      one, even for dates that were originally in a leap month.
+    - Day 30 in a 29-day month falls on day 29, the last day of the month.
+    - Dates whose next occurrence is outside the precomputed years give
+      0/0/0, as L2S does for invalid input.'''
+    lunarDays, lunarMonths, dd, mm, yy = \
+        _asIntArrays(lunarDays, lunarMonths, dd, mm, yy)
+    firstYear, starts, lengths = lunarMonthStarts(timeZone)
+    fromDay = jdFromDate_batch(dd, mm, yy)
+    lunarYear = S2L_batch(dd, mm, yy, timeZone)[2]
+
+    day = np.zeros(fromDay.shape, dtype=np.int64)
+    month = np.zeros(fromDay.shape, dtype=np.int64)
+    year = np.zeros(fromDay.shape, dtype=np.int64)
+    y = lunarYear - firstYear
+    m = lunarMonths - 1
+    ok = (y >= 0) & (y + 1 < len(starts)) & (m >= 0) & (m < 12) & \
+        (lunarDays >= 1) & (lunarDays <= 30)
+    y, m, d, fromDay = y[ok], m[ok], lunarDays[ok], fromDay[ok]
+
+    thisYear = starts[y, m] + np.minimum(d, lengths[y, m]) - 1
+    nextYear = starts[y + 1, m] + np.minimum(d, lengths[y + 1, m]) - 1
+    jd = np.where(thisYear >= fromDay, thisYear, nextYear)
+    day[ok], month[ok], year[ok] = jdToDate_batch(jd)
+    return day, month, year
@@ -0,0 +1,663 @@
+# -*- coding: utf-8 -*-
+"""
+Luật an sao dưới dạng dữ liệu.
+
+Mỗi luật (LuatSao) cho biết vị trí của một hoặc vài sao: cung gốc, các
+khoảng dịch (có thể nhân với chiều âm dương nam nữ), bảng tra theo can, chi
+năm hoặc số cục, hoặc vị trí của một sao đã an trước đó. BoLuatAnSao dịch
+danh sách luật một lần thành hàm Python tuần tự (anSao cho một lá số với số
+nguyên, anSaoMang cho mảng NumPy nhiều lá số); App.lapDiaBan và
+DiaBanMang.lapDiaBanMang dùng chung một bộ luật.
+
+Các luật theo trường phái được bật/tắt bằng tùy chọn của BoLuatAnSao, ví dụ
+BoLuatAnSao(luuHaThienTru=False) không an Lưu Hà, Thiên Trù. Luật được chia
+theo nhóm sao (CAC_NHOM); boLuat.theoNhom("chinhTinh") chỉ tính các luật
+của nhóm đó và các luật mà chúng phụ thuộc, dùng cho lá số rút gọn;
+theoNhom cũng nhận từng sao (Sao) thay cho cả nhóm.
+"""
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from lasotuvi.AmDuong import (_timHoaLinh, bangCoThan, bangHoaLinh,
+                              bangPhaToai, bangThienMa, bangTrangSinh,
+                              bangTriet, bangTuVi, khoiCungHoaLinh, khoiViet,
+                              maTranLuuHa, maTranThienTru, thienCan,
+                              thienPhuc, thienQuan, timTuVi)
+from lasotuvi.Sao import (Sao, saoAnQuang, saoBachHo, saoBacSy, saoBatToa,
+                          saoBenh, saoBenhPhu, saoCoThan, saoCuMon,
+                          saoDaiHao, saoDaLa, saoDaoHoa, saoDauQuan,
+                          saoDeVuong, saoDiaGiai, saoDiaKhong, saoDiaKiep,
+                          saoDiaVong, saoDieuKhach, saoDuong, saoDuongPhu,
+                          saoGiaiThan, saoHoaCai, saoHoaKhoa, saoHoaKy,
+                          saoHoaLoc, saoHoaQuyen, saoHoaTinh, saoHongLoan,
+                          saoHuuBat, saoHyThan, saoKiepSat, saoKinhDuong,
+                          saoLamQuan, saoLiemTrinh, saoLinhTinh, saoLocTon,
+                          saoLongDuc, saoLongTri, saoLucSi, saoLuuHa, saoMo,
+                          saoMocDuc, saoNguyetDuc, saoPhaQuan, saoPhaToai,
+                          saoPhiLiem, saoPhongCao, saoPhucBinh, saoPhucDuc,
+                          saoPhuongCac, saoQuanDoi, saoQuanPhu2, saoQuanPhu3,
+                          saoQuaTu, saoQuocAn, saoSuy, saoTamThai, saoTangMon,
+                          saoTaPhu, saoTauThu, saoThai, saoThaiAm,
+                          saoThaiDuong, saoThaiPhu, saoThaiTue, saoThamLang,
+                          saoThanhLong, saoThatSat, saoThienCo, saoThienDong,
+                          saoThienDuc, saoThienGiai, saoThienHinh,
+                          saoThienHu, saoThienHy, saoThienKhoc, saoThienKhoi,
+                          saoThienKhong, saoThienLa, saoThienLuong,
+                          saoThienMa, saoThienPhu, saoThienPhuc,
+                          saoThienQuan, saoThienQuy, saoThienRieu,
+                          saoThienSu, saoThienTai, saoThienTho,
+                          saoThienThuong, saoThienTru, saoThienTuong,
+                          saoThienViet, saoThienY, saoThieuAm, saoThieuDuong,
+                          saoTieuHao, saoTrangSinh, saoTrucPhu, saoTu,
+                          saoTuePha, saoTuongQuan, saoTuPhu, saoTuVi,
+                          saoTuyet, saoVanKhuc, saoVanTinh, saoVanXuong,
+                          saoVuKhuc)
+
+# Các biến đầu vào của hàm an sao, theo thứ tự tham số
+CAC_BIEN = ("nn", "tt", "gioSinh", "gioiTinh", "canNam", "chiNam",
+            "amDuongNamNu", "cucSo", "cungMenh", "cungThan")
+
+# Biểu thức vị trí
+# Biến đầu vào, một trong CAC_BIEN
+Bien = namedtuple("Bien", ["ten"])
+# Vị trí của sao (hoặc tên kết quả) đã an ở luật trước
+ViTri = namedtuple("ViTri", ["ten"])
+# dichCung(goc, *cacKhoang)
+Dich = namedtuple("Dich", ["goc", "cacKhoang"])
+# heSo * bieuThuc
+Nhan = namedtuple("Nhan", ["heSo", "bieuThuc"])
+# bieuThuc % soChia
+Du = namedtuple("Du", ["bieuThuc", "soChia"])
+# bang[chiSo[0]][chiSo[1]]...; ô None hoặc chỉ số ngoài bảng thì gọi
+# ngoaiBang(*chiSo) (nếu có)
+Tra = namedtuple("Tra", ["bang", "chiSo", "ngoaiBang"])
+# cacLuaChon[chiSo]
+Chon = namedtuple("Chon", ["cacLuaChon", "chiSo"])
+
+# Luật an sao: các sao (hoặc một tên kết quả như "tuan1") cùng ở vị trí
+# viTri; tuyChon = (tên tùy chọn, giá trị) nếu luật chỉ dùng cho một trường
+# phái; nhom là tên nhóm sao (CAC_NHOM)
+LuatSao = namedtuple("LuatSao", ["cacSao", "viTri", "tuyChon", "nhom"])
+
+
+def dich(goc, *cacKhoang):
+    return Dich(goc, cacKhoang)
+
+
+def tra(bang, *chiSo, **kwargs):
+    return Tra(bang, chiSo, kwargs.get("ngoaiBang"))
+
+
+def luat(viTri, *cacSao, **kwargs):
+    return LuatSao(cacSao, viTri, kwargs.get("tuyChon"), kwargs.get("nhom"))
+
+
+nn, tt, gioSinh = Bien("nn"), Bien("tt"), Bien("gioSinh")
+canNam, chiNam = Bien("canNam"), Bien("chiNam")
+amDuongNamNu, cucSo = Bien("amDuongNamNu"), Bien("cucSo")
+cungMenh, cungThan = Bien("cungMenh"), Bien("cungThan")
+
+
+def _timHoaLinhNgoaiBang(chieu, chiNam, gioSinh, thuTu):
+    # chieu là amDuongNamNu % 3: 1 thuận, 2 nghịch
+    return _timHoaLinh(khoiCungHoaLinh[chiNam], gioSinh,
+                       1 if chieu == 1 else -1)[thuTu]
+
+
+# bangHoaLinh theo amDuongNamNu % 3
+bangHoaLinhTheoChieu = (None, bangHoaLinh[1], bangHoaLinh[-1])
+
+# Tứ Hóa (Lộc, Quyền, Khoa, Kỵ) theo can năm
+# An theo 10 câu của cụ Thiên Lương trong cuốn Số tử vi dưới mắt khoa học
+bangTuHoa = (
+    None,
+    (saoLiemTrinh, saoPhaQuan, saoVuKhuc, saoThaiDuong),
+    (saoThienCo, saoThienLuong, saoTuVi, saoThaiAm),
+    (saoThienDong, saoThienCo, saoVanXuong, saoLiemTrinh),
+    (saoThaiAm, saoThienDong, saoThienCo, saoCuMon),
+    (saoThamLang, saoThaiAm, saoHuuBat, saoThienCo),
+    (saoVuKhuc, saoThamLang, saoThienLuong, saoVanKhuc),
+    (saoThaiDuong, saoVuKhuc, saoThienDong, saoThaiAm),
+    (saoCuMon, saoThaiDuong, saoVanKhuc, saoVanXuong),
+    (saoThienLuong, saoTuVi, saoThienPhu, saoVuKhuc),
+    (saoPhaQuan, saoCuMon, saoThaiAm, saoThamLang),
+)
+
+
+def _tuHoa(thuTu):
+    # Vị trí sao được hóa: chọn trong các sao có thể được hóa theo can năm
+    ungVien = []
+    for hang in bangTuHoa[1:]:
+        if hang[thuTu] not in ungVien:
+            ungVien.append(hang[thuTu])
+    bang = (None,) + tuple(ungVien.index(hang[thuTu])
+                           for hang in bangTuHoa[1:])
+    return Chon(tuple(ViTri(sao) for sao in ungVien), tra(bang, canNam))
+
+
+def _nhom(ten, *cacLuat):
+    return tuple(l._replace(nhom=ten) for l in cacLuat)
+
+
+cacLuatAnSao = _nhom(
+    "chinhTinh",
+    # Tử vi tinh hệ
+    luat(tra(bangTuVi, cucSo, nn, ngoaiBang=timTuVi), saoTuVi),
+    luat(dich(ViTri(saoTuVi), 4), saoLiemTrinh),
+    luat(dich(ViTri(saoTuVi), 7), saoThienDong),
+    luat(dich(ViTri(saoTuVi), 8), saoVuKhuc),
+    luat(dich(ViTri(saoTuVi), 9), saoThaiDuong),
+    luat(dich(ViTri(saoTuVi), 11), saoThienCo),
+
+    # Thiên phủ tinh hệ
+    luat(dich(3, 3, Nhan(-1, ViTri(saoTuVi))), saoThienPhu),
+    *(luat(dich(ViTri(saoThienPhu), khoangDich), sao)
+      for khoangDich, sao in ((1, saoThaiAm), (2, saoThamLang),
+                              (3, saoCuMon), (4, saoThienTuong),
+                              (5, saoThienLuong), (6, saoThatSat),
+                              (10, saoPhaQuan)))
+) + _nhom(
+    "vongLocTon",
+    # Lộc tồn ở cung của can năm sinh, Bác sỹ cùng cung
+    luat(tra(tuple(can["vitriDiaBan"] for can in thienCan), canNam),
+         saoLocTon, saoBacSy),
+    *(luat(dich(ViTri(saoLocTon), Nhan(i, amDuongNamNu)), sao)
+      for i, sao in enumerate((saoLucSi, saoThanhLong, saoTieuHao,
+                               saoTuongQuan, saoTauThu, saoPhiLiem,
+                               saoHyThan, saoBenhPhu, saoDaiHao, saoPhucBinh,
+                               saoQuanPhu2), 1)),
+    # Kình dương - Đà la
+    luat(dich(ViTri(saoLocTon), -1), saoDaLa),
+    luat(dich(ViTri(saoLocTon), 1), saoKinhDuong),
+) + _nhom(
+    "vongThaiTue",
+    *(luat(dich(chiNam, i), *cacSao)
+      for i, cacSao in enumerate((
+          (saoThaiTue,), (saoThieuDuong, saoThienKhong), (saoTangMon,),
+          (saoThieuAm,), (saoQuanPhu3,), (saoTuPhu, saoNguyetDuc),
+          (saoTuePha,), (saoLongDuc,), (saoBachHo,),
+          (saoPhucDuc, saoThienDuc), (saoDieuKhach,), (saoTrucPhu,))))
+) + _nhom(
+    "vongTrangSinh",
+    # Dương nam, Âm nữ theo chiều thuận, Âm nam Dương nữ theo chiều nghịch
+    luat(tra(bangTrangSinh, cucSo), saoTrangSinh),
+    *(luat(dich(ViTri(saoTrangSinh), Nhan(i, amDuongNamNu)), sao)
+      for i, sao in ((1, saoMocDuc), (2, saoQuanDoi), (3, saoLamQuan),
+                     (4, saoDeVuong), (5, saoSuy), (6, saoBenh), (7, saoTu),
+                     (8, saoMo), (9, saoTuyet), (-1, saoThai),
+                     (-2, saoDuong)))
+) + _nhom(
+    "satTinh",
+    # Không - Kiếp: khởi giờ Tý ở cung Hợi, đếm thuận đến giờ sinh được cung
+    # Địa kiếp
+    luat(dich(11, gioSinh), saoDiaKiep),
+    luat(dich(12, 12, Nhan(-1, ViTri(saoDiaKiep))), saoDiaKhong),
+
+    luat(tra(bangHoaLinhTheoChieu, Du(amDuongNamNu, 3), chiNam, gioSinh, 0,
+             ngoaiBang=_timHoaLinhNgoaiBang), saoHoaTinh),
+    luat(tra(bangHoaLinhTheoChieu, Du(amDuongNamNu, 3), chiNam, gioSinh, 1,
+             ngoaiBang=_timHoaLinhNgoaiBang), saoLinhTinh),
+) + _nhom(
+    "phuTinh",
+    luat(dich(5, chiNam, -1), saoLongTri),
+    luat(dich(2, 2, Nhan(-1, ViTri(saoLongTri))), saoPhuongCac, saoGiaiThan),
+
+    luat(dich(5, tt, -1), saoTaPhu),
+    luat(dich(2, 2, Nhan(-1, ViTri(saoTaPhu))), saoHuuBat),
+
+    luat(dich(5, gioSinh, -1), saoVanKhuc),
+    luat(dich(2, 2, Nhan(-1, ViTri(saoVanKhuc))), saoVanXuong),
+
+    luat(dich(5, tt, nn, -2), saoTamThai),
+    luat(dich(2, 2, Nhan(-1, ViTri(saoTamThai))), saoBatToa),
+
+    # Ân Quang - Thiên Quý
+    # Ân Quang: xem Văn Xương ở cung nào, kể cung ấy là mồng một, đếm thuận
+    # đến ngày sinh, lùi lại một cung. Thiên Quý đối với Ân Quang qua trục
+    # Sửu Mùi.
+    luat(dich(ViTri(saoVanXuong), nn, -2), saoAnQuang,
+         tuyChon=("anQuang", "xuongKhuc")),
+    # Theo cụ Vu Thiên: lấy cung Thìn làm mồng 1 đếm thuận đến ngày sinh,
+    # lui lại một cung làm giờ Tý đếm thuận đến giờ sinh
+    luat(dich(5, nn, gioSinh, -3), saoAnQuang,
+         tuyChon=("anQuang", "vuThien")),
+    luat(dich(2, 2, Nhan(-1, ViTri(saoAnQuang))), saoThienQuy),
+
+    luat(tra(khoiViet, canNam), saoThienKhoi),
+    luat(dich(5, 5, Nhan(-1, ViTri(saoThienKhoi))), saoThienViet),
+
+    luat(dich(7, chiNam, -1), saoThienHu),
+    luat(dich(7, Nhan(-1, chiNam), 1), saoThienKhoc),
+
+    luat(dich(cungMenh, chiNam, -1), saoThienTai),
+    luat(dich(cungThan, chiNam, -1), saoThienTho),
+
+    luat(dich(4, Nhan(-1, chiNam), 1), saoHongLoan),
+    luat(dich(ViTri(saoHongLoan), 6), saoThienHy),
+
+    # Thiên Quan - Thiên Phúc
+    luat(tra(thienQuan, canNam), saoThienQuan),
+    luat(tra(thienPhuc, canNam), saoThienPhuc),
+
+    luat(dich(10, tt, -1), saoThienHinh),
+    luat(dich(ViTri(saoThienHinh), 4), saoThienRieu, saoThienY),
+
+    luat(tra(bangCoThan, chiNam), saoCoThan),
+    luat(dich(ViTri(saoCoThan), -4), saoQuaTu),
+
+    # Văn tinh, Đường phù, Quốc ấn tính từ Kình dương (vòng Lộc tồn)
+    luat(dich(ViTri(saoKinhDuong), 2), saoVanTinh),
+    luat(dich(ViTri(saoVanTinh), 2), saoDuongPhu),
+    luat(dich(ViTri(saoDuongPhu), 3), saoQuocAn),
+
+    # Thai phụ - Phong Cáo
+    luat(dich(ViTri(saoVanKhuc), 2), saoThaiPhu),
+    luat(dich(ViTri(saoVanKhuc), -2), saoPhongCao),
+
+    # Thiên giải - Địa giải
+    # Theo cụ Thiên Lương: lấy cung Thân làm tháng Giêng, đếm thuận nhưng
+    # nhảy cung là Thiên giải
+    luat(dich(9, Nhan(2, tt), -2), saoThienGiai),
+    luat(dich(ViTri(saoTaPhu), 3), saoDiaGiai),
+
+    # Thiên la - Địa võng, Thiên thương - Thiên sứ (cung Nô bộc, Tật ách)
+    luat(5, saoThienLa),
+    luat(11, saoDiaVong),
+    luat(dich(cungMenh, 5), saoThienThuong),
+    luat(dich(cungMenh, 7), saoThienSu),
+
+    # Vòng Thiên mã
+    luat(tra(bangThienMa, Du(chiNam, 4)), saoThienMa),
+    luat(dich(ViTri(saoThienMa), 2), saoHoaCai),
+    luat(dich(ViTri(saoThienMa), 3), saoKiepSat),
+    luat(dich(ViTri(saoKiepSat), 4), saoDaoHoa),
+
+    luat(tra(bangPhaToai, Du(chiNam, 3)), saoPhaToai),
+
+    # Đẩu quân
+    luat(dich(chiNam, Nhan(-1, tt), gioSinh), saoDauQuan),
+) + _nhom(
+    "tuHoa",
+    # Vị trí của chính tinh hoặc Xương, Khúc, Tả, Hữu được hóa
+    luat(_tuHoa(0), saoHoaLoc),
+    luat(_tuHoa(1), saoHoaQuyen),
+    luat(_tuHoa(2), saoHoaKhoa),
+    luat(_tuHoa(3), saoHoaKy),
+) + _nhom(
+    "luuHaThienTru",
+    # Sách cụ Thiên Lương không đề cập đến 2 sao này
+    luat(tra(maTranLuuHa, canNam), saoLuuHa,
+         tuyChon=("luuHaThienTru", True)),
+    luat(tra(maTranThienTru, canNam), saoThienTru,
+         tuyChon=("luuHaThienTru", True)),
+) + _nhom(
+    "tuanTriet",
+    luat(dich(chiNam, 10, Nhan(-1, canNam), 1), "tuan1"),
+    luat(dich(ViTri("tuan1"), 1), "tuan2"),
+    luat(tra(bangTriet, canNam, 0), "triet1"),
+    luat(tra(bangTriet, canNam, 1), "triet2"),
+)
+
+# Các nhóm sao, theo thứ tự trong cacLuatAnSao
+CAC_NHOM = tuple(sorted(set(l.nhom for l in cacLuatAnSao),
+                        key=[l.nhom for l in cacLuatAnSao].index))
+
+# Tùy chọn mặc định của BoLuatAnSao
+TUY_CHON_MAC_DINH = {
+    "luuHaThienTru": True,
+    "anQuang": "xuongKhuc",
+}
+
+
+def _mangBang(bang):
+    # Bảng lồng nhau (tuple, có ô None) thành mảng numpy, ô None là 0
+    def hinh(x):
+        if not isinstance(x, (tuple, list)):
+            return ()
+        con = [hinh(y) for y in x]
+        soChieu = max(len(h) for h in con)
+        return (len(x),) + tuple(
+            max(h[i] if i < len(h) else 0 for h in con)
+            for i in range(soChieu))
+
+    mang = np.zeros(hinh(bang), dtype=np.int64)
+
+    def dien(x, viTri):
+        if isinstance(x, (tuple, list)):
+            for i, y in enumerate(x):
+                dien(y, viTri + (i,))
+        elif x is not None:
+            mang[viTri] = x
+    dien(bang, ())
+    return mang
+
+
+def _traMang(bang, ngoaiBang, *chiSo):
+    # Tra bảng trên mảng; dòng có chỉ số ngoài bảng hoặc trúng ô trống (0)
+    # thì tính lại bằng ngoaiBang
+    chiSo = np.broadcast_arrays(*[np.asarray(c) for c in chiSo])
+    trongBang = np.ones(chiSo[0].shape, dtype=bool)
+    for c, kichThuoc in zip(chiSo, bang.shape):
+        trongBang &= (c >= 0) & (c < kichThuoc)
+    ketQua = bang[tuple(np.where(trongBang, c, 0) for c in chiSo)]
+    for i in np.flatnonzero(ketQua == 0):
+        ketQua[i] = ngoaiBang(*[int(c[i]) for c in chiSo])
+    return ketQua
+
+
+def _tuyenTinh(hangSo, cacBien, cacHam, vongCung):
+    # Hàm tính hangSo + tổng heSo * v[o] + tổng heSo * ham(v), đưa về cung
+    # 1 - 12 nếu vongCung; các trường hợp hay gặp được viết riêng cho nhanh
+    if vongCung:
+        hangSo -= 1
+    if not cacHam and len(cacBien) <= 2:
+        if not cacBien:
+            giaTri = hangSo % 12 + 1 if vongCung else hangSo
+            return lambda v: giaTri
+        if len(cacBien) == 1:
+            (h, o), = cacBien
+            if vongCung and h == 1:
+                return lambda v: (v[o] + hangSo) % 12 + 1
+            if vongCung:
+                return lambda v: (h * v[o] + hangSo) % 12 + 1
+            return lambda v: h * v[o] + hangSo
+        (h1, o1), (h2, o2) = cacBien
+        if vongCung and h1 == h2 == 1:
+            return lambda v: (v[o1] + v[o2] + hangSo) % 12 + 1
+        if vongCung:
+            return lambda v: (h1 * v[o1] + h2 * v[o2] + hangSo) % 12 + 1
+
+    def tinh(v):
+        tong = hangSo
+        for h, o in cacBien:
+            tong = tong + h * v[o]
+        for h, ham in cacHam:
+            tong = tong + h * ham(v)
+        return tong % 12 + 1 if vongCung else tong
+    return tinh
+
+
+class _BienDich(object):
+    # Dịch danh sách luật thành dãy bước (hàm, các saoID). Mỗi biểu thức
+    # thành một closure nhận list v: các biến theo thứ tự CAC_BIEN rồi vị trí
+    # của từng luật đã tính, theo thứ tự luật. mang=True: v là các mảng numpy
+
+    def __init__(self, mang):
+        self.mang = mang
+        self.oBien = {ten: i for i, ten in enumerate(CAC_BIEN)}
+        self.oViTri = {}
+        self.buoc = []
+        self.ketQua = []
+
+    def o(self, bt):
+        # Ô của Bien/ViTri trong v
+        if isinstance(bt, Bien):
+            if bt.ten not in self.oBien:
+                raise Exception("Biến %r không có trong CAC_BIEN" % bt.ten)
+            return self.oBien[bt.ten]
+        if bt.ten not in self.oViTri:
+            raise Exception("Luật dùng vị trí của %r khi chưa an" % (bt.ten,))
+        return self.oViTri[bt.ten]
+
+    def tuyenTinh(self, bt):
+        # bt dưới dạng (hằng số, [(hệ số, ô)], [(hệ số, hàm)])
+        if isinstance(bt, int):
+            return bt, [], []
+        if isinstance(bt, (Bien, ViTri)):
+            return 0, [(1, self.o(bt))], []
+        if isinstance(bt, Nhan):
+            hangSo, cacBien, cacHam = self.tuyenTinh(bt.bieuThuc)
+            return (bt.heSo * hangSo, [(bt.heSo * h, o) for h, o in cacBien],
+                    [(bt.heSo * h, ham) for h, ham in cacHam])
+        return 0, [], [(1, self.bieuThuc(bt))]
+
+    def bieuThuc(self, bt):
+        if isinstance(bt, (int, Bien, ViTri, Nhan)):
+            return _tuyenTinh(*self.tuyenTinh(bt), vongCung=False)
+        if isinstance(bt, Dich):
+            hangSo, heSo, cacHam = 0, {}, []
+            for x in (bt.goc,) + bt.cacKhoang:
+                k, cacBien, ham = self.tuyenTinh(x)
+                hangSo += k
+                for h, o in cacBien:
+                    heSo[o] = heSo.get(o, 0) + h
+                cacHam += ham
+            cacBien = [(h, o) for o, h in heSo.items() if h]
+            return _tuyenTinh(hangSo, cacBien, cacHam, vongCung=True)
+        if isinstance(bt, Du):
+            soChia = bt.soChia
+            if isinstance(bt.bieuThuc, (Bien, ViTri)):
+                o = self.o(bt.bieuThuc)
+                return lambda v: v[o] % soChia
+            ham = self.bieuThuc(bt.bieuThuc)
+            return lambda v: ham(v) % soChia
+        if isinstance(bt, Chon):
+            return self.chon(bt)
+        if isinstance(bt, Tra):
+            return self.tra(bt)
+        raise Exception("Không dịch được biểu thức %r" % (bt,))
+
+    def chon(self, bt):
+        chiSo = self.bieuThuc(bt.chiSo)
+        if self.mang:
+            cacLuaChon = [self.bieuThuc(x) for x in bt.cacLuaChon]
+            return lambda v: np.choose(chiSo(v),
+                                       [ham(v) for ham in cacLuaChon])
+        if all(isinstance(x, ViTri) for x in bt.cacLuaChon):
+            cacO = tuple(self.o(x) for x in bt.cacLuaChon)
+            return lambda v: v[cacO[chiSo(v)]]
+        cacLuaChon = tuple(self.bieuThuc(x) for x in bt.cacLuaChon)
+        return lambda v: cacLuaChon[chiSo(v)](v)
+
+    def tra(self, bt):
+        cacChiSo = tuple(self.bieuThuc(c) for c in bt.chiSo)
+        ngoaiBang = bt.ngoaiBang
+        if self.mang:
+            bang = _mangBang(bt.bang)
+            if ngoaiBang is None:
+                return lambda v: bang[tuple(c(v) for c in cacChiSo)]
+            return lambda v: _traMang(bang, ngoaiBang,
+                                      *[c(v) for c in cacChiSo])
+        bang = bt.bang
+        if ngoaiBang is None and len(cacChiSo) == 1:
+            if isinstance(bt.chiSo[0], (Bien, ViTri)):
+                o = self.o(bt.chiSo[0])
+                return lambda v: bang[v[o]]
+            chiSo, = cacChiSo
+            return lambda v: bang[chiSo(v)]
+
+        def tinh(v):
+            chiSo = [c(v) for c in cacChiSo]
+            giaTri = bang
+            try:
+                for c in chiSo:
+                    giaTri = giaTri[c]
+            except (IndexError, TypeError):
+                if ngoaiBang is None:
+                    raise
+                giaTri = None
+            # Ô None hoặc chỉ số ngoài bảng: gọi ngoaiBang
+            if giaTri is None and ngoaiBang is not None:
+                giaTri = ngoaiBang(*chiSo)
+            return giaTri
+        return tinh
+
+    def luat(self, luat, dichAn):
+        # Sao (hoặc kết quả) không có trong dichAn chỉ được tính vì luật
+        # khác cần vị trí của nó
+        tinh = self.bieuThuc(luat.viTri)
+        cacSaoID = []
+        for dich in luat.cacSao:
+            if dich in self.oViTri:
+                raise Exception("%r được an hai lần" % (dich,))
+            self.oViTri[dich] = len(CAC_BIEN) + len(self.buoc)
+            if dich not in dichAn:
+                continue
+            if isinstance(dich, Sao):
+                cacSaoID.append(dich.saoID)
+            else:
+                self.ketQua.append((dich, self.oViTri[dich]))
+        if self.mang:
+            self.buoc.append((tinh, tuple(cacSaoID)))
+        else:
+            self.buoc.append((tinh, sum(1 << saoID for saoID in cacSaoID)))
+
+    def ham(self, cacLuat, tenHam, dichAn):
+        for l in cacLuat:
+            self.luat(l, dichAn)
+        buoc = tuple(self.buoc)
+        ketQua = tuple(self.ketQua)
+        soBien = len(CAC_BIEN)
+
+        if self.mang:
+            def ham(*thamSo):
+                v = list(thamSo[:soBien])
+                viTriSao = thamSo[soBien]
+                for tinh, cacSaoID in buoc:
+                    viTri = tinh(v)
+                    v.append(viTri)
+                    for saoID in cacSaoID:
+                        viTriSao[:, saoID] = viTri
+                return {ten: v[o] for ten, o in ketQua}
+        else:
+            def ham(*thamSo):
+                v = list(thamSo[:soBien])
+                saoBits = thamSo[soBien]
+                them = v.append
+                for tinh, bits in buoc:
+                    viTri = tinh(v)
+                    them(viTri)
+                    if bits:
+                        saoBits[viTri] |= bits
+                return {ten: v[o] for ten, o in ketQua}
+        ham.__name__ = tenHam
+        return ham
+
+
+def _viTriCan(bt):
+    # Tên các sao (hoặc kết quả) mà biểu thức cần vị trí
+    if isinstance(bt, ViTri):
+        return {bt.ten}
+    if isinstance(bt, Dich):
+        cacBt = (bt.goc,) + bt.cacKhoang
+    elif isinstance(bt, (Nhan, Du)):
+        cacBt = (bt.bieuThuc,)
+    elif isinstance(bt, Chon):
+        cacBt = bt.cacLuaChon + (bt.chiSo,)
+    elif isinstance(bt, Tra):
+        cacBt = bt.chiSo
+    else:
+        return set()
+    return set().union(*[_viTriCan(x) for x in cacBt])
+
+
+class BoLuatAnSao(object):
+    """Bộ luật an sao đã chọn tùy chọn trường phái, dịch sẵn thành hàm.
+
+    Args:
+        cacLuat (tuple, optional): danh sách LuatSao, mặc định cacLuatAnSao
+        nhom (iterable, optional): chỉ an các nhóm sao (tên trong CAC_NHOM)
+            và các sao (Sao) này, mặc định an tất cả; xem theoNhom
+        **tuyChon: ghi đè TUY_CHON_MAC_DINH, ví dụ luuHaThienTru=False,
+            anQuang="vuThien"
+
+    anSao(nn, tt, gioSinh, gioiTinh, canNam, chiNam, amDuongNamNu, cucSo,
+    cungMenh, cungThan, saoBits) an sao của một lá số vào saoBits (list 13
+    bitset của diaBan); anSaoMang(..., viTriSao) an cho mảng nhiều lá số
+    vào ma trận (N x saoID). Cả hai trả về dict các kết quả có tên (tuan1,
+    tuan2, triet1, triet2) của các nhóm được an.
+    """
+
+    def __init__(self, cacLuat=None, nhom=None, **tuyChon):
+        for ten in tuyChon:
+            if ten not in TUY_CHON_MAC_DINH:
+                raise Exception("Không có tùy chọn an sao %r" % ten)
+        self.cacLuat = cacLuatAnSao if cacLuat is None else tuple(cacLuat)
+        self.tuyChon = dict(TUY_CHON_MAC_DINH, **tuyChon)
+        luatDung = tuple(
+            l for l in self.cacLuat
+            if l.tuyChon is None or self.tuyChon[l.tuyChon[0]] == l.tuyChon[1])
+        if nhom is not None:
+            nhom = frozenset(nhom)
+            khongCo = nhom - set(l.nhom for l in self.cacLuat) - \
+                set(d for l in self.cacLuat for d in l.cacSao)
+            if khongCo:
+                raise Exception("Không có nhóm sao %s" %
+                                ", ".join(sorted(map(str, khongCo))))
+        self.nhom = nhom
+        # Luật của nhóm được chọn an mọi sao của luật; luật khác chỉ an các
+        # sao được chọn riêng
+        self.dichAn = frozenset(
+            d for l in luatDung for d in l.cacSao
+            if nhom is None or l.nhom in nhom or d in nhom)
+        self.luatAn = tuple(l for l in luatDung
+                            if any(d in self.dichAn for d in l.cacSao))
+        # Thêm các luật mà luật được an cần đến (kể cả gián tiếp)
+        luatTheoDich = {d: l for l in luatDung for d in l.cacSao}
+        can = set(self.luatAn)
+        conLai = list(self.luatAn)
+        while conLai:
+            for ten in _viTriCan(conLai.pop().viTri):
+                l = luatTheoDich.get(ten)
+                if l is not None and l not in can:
+                    can.add(l)
+                    conLai.append(l)
+        self.luatDung = tuple(l for l in luatDung if l in can)
+        self._khoa = (self.cacLuat, tuple(sorted(self.tuyChon.items())), nhom)
+        self._hash = hash(self._khoa[1:])
+        self._theoNhom = {}
+        self.anSao = _BienDich(False).ham(self.luatDung, "anSao",
+                                          self.dichAn)
+        self._anSaoMang = None
+
+    def theoNhom(self, *cacNhom):
+        """Bộ luật chỉ an các nhóm sao cacNhom (cùng tùy chọn), chỉ tính
+        thêm các sao mà các nhóm đó cần. Ví dụ theoNhom("chinhTinh", "tuHoa")
+        tính cả Văn xương, Văn khúc, Tả phù, Hữu bật nhưng chỉ an chính tinh
+        và Tứ Hóa. cacNhom có thể gồm cả sao (Sao): theoNhom("chinhTinh",
+        saoLocTon) an chính tinh và Lộc tồn, không an Bác sỹ cùng luật.
+        """
+        khoa = frozenset(cacNhom)
+        if khoa not in self._theoNhom:
+            self._theoNhom[khoa] = BoLuatAnSao(self.cacLuat, khoa,
+                                               **self.tuyChon)
+        return self._theoNhom[khoa]
+
+    @property
+    def anSaoMang(self):
+        if self._anSaoMang is None:
+            if np is None:
+                raise ImportError("anSaoMang cần thư viện numpy.")
+            self._anSaoMang = _BienDich(True).ham(self.luatDung, "anSaoMang",
+                                                  self.dichAn)
+        return self._anSaoMang
+
+    @property
+    def cacSao(self):
+        """Các sao được an theo bộ luật này."""
+        return tuple(sao for l in self.luatAn for sao in l.cacSao
+                     if isinstance(sao, Sao) and sao in self.dichAn)
+
+    def __eq__(self, other):
+        if not isinstance(other, BoLuatAnSao):
+            return NotImplemented
+        return self._khoa == other._khoa
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        thamSo = ["%s=%r" % item for item in sorted(self.tuyChon.items())]
+        if self.nhom is not None:
+            # Tên nhóm trước, sao theo saoID
+            thamSo.insert(0, "nhom=%r" % sorted(
+                self.nhom, key=lambda x: (isinstance(x, Sao),
+                                          getattr(x, "saoID", x))))
+        return "BoLuatAnSao(%s)" % ", ".join(thamSo)
+
+
+boLuatMacDinh = BoLuatAnSao()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Ngày giờ sinh đã quy đổi một lần cho cả lá số.
+
+lapDiaBan và lapThienBan đều cần ngày âm lịch, lapThienBan còn cần số ngày
+Julius và can chi của năm, tháng, ngày, giờ. NgaySinh đổi lịch đúng một lần
+(S2L với ngày dương lịch, L2S với ngày âm lịch) và giữ các giá trị đó; truyền
+cùng một NgaySinh cho lapDiaBan và lapThienBan thay cho nn, tt, nnnn, ...:
+
+    ns = NgaySinh(15, 6, 1990, 5, 1)
+    db = lapDiaBan(diaBan, ns)
+    tb = lapThienBan(ns, ten="...", diaBan=db)
+"""
+from lasotuvi.AmDuong import ngayThangNam
+from lasotuvi.Lich_HND import L2S, jdFromDate
+from lasotuvi.LucThapHoaGiap import namCanChi
+
+
+class NgaySinh(object):
+    """Ngày giờ sinh và các giá trị lịch suy ra từ đó.
+
+    Args:
+        nn, tt, nnnn (int): ngày, tháng, năm sinh
+        gioSinh (int): chi giờ sinh, 1 (Tý) đến 12 (Hợi)
+        gioiTinh (int): 1 nam, -1 nữ
+        duongLich (bool, optional): True nếu nn, tt, nnnn là dương lịch
+        timeZone (int, optional): múi giờ nơi sinh
+        thangNhuan (int, optional): tháng nhuận, chỉ dùng với ngày âm lịch
+
+    Raises:
+        Exception: ngày tháng không hợp lệ (như ngayThangNam)
+    """
+    __slots__ = ("ngayDuong", "thangDuong", "namDuong", "ngayAm", "thangAm",
+                 "namAm", "thangNhuan", "gioSinh", "gioiTinh", "duongLich",
+                 "timeZone", "jd", "canNgay", "chiNgay", "canThang",
+                 "canGio", "nam")
+
+    def __init__(self, nn, tt, nnnn, gioSinh, gioiTinh, duongLich=True,
+                 timeZone=7, thangNhuan=0):
+        self.ngayDuong, self.thangDuong, self.namDuong = nn, tt, nnnn
+        self.gioSinh = gioSinh
+        self.gioiTinh = gioiTinh
+        self.duongLich = duongLich
+        self.timeZone = timeZone
+        if duongLich is True:
+            self.ngayAm, self.thangAm, self.namAm, self.thangNhuan = \
+                ngayThangNam(nn, tt, nnnn, True, timeZone)
+            self.jd = jdFromDate(nn, tt, nnnn)
+            jdNgay = self.jd
+        else:
+            self.ngayAm, self.thangAm, self.namAm = nn, tt, nnnn
+            self.thangNhuan = thangNhuan
+            # Can giờ vẫn tính từ nn, tt, nnnn như lapThienBan trước đây;
+            # can chi ngày theo ngày dương lịch tương ứng
+            self.jd = jdFromDate(nn, tt, nnnn)
+            jdNgay = jdFromDate(*L2S(nn, tt, nnnn, thangNhuan, timeZone))
+
+        self.canNgay = (jdNgay + 9) % 10 + 1
+        self.chiNgay = (jdNgay + 1) % 12 + 1
+        self.canThang = (self.namAm * 12 + self.thangAm + 3) % 10 + 1
+        canGio = ((self.jd - 1) * 2 % 10 + gioSinh) % 10
+        self.canGio = 10 if canGio == 0 else canGio
+        self.nam = namCanChi(self.namAm)
+
+    @property
+    def canNam(self):
+        return self.nam.canNam
+
+    @property
+    def chiNam(self):
+        return self.nam.chiNam
+
+    @property
+    def chiThang(self):
+        return self.thangAm
+
+    def __repr__(self):
+        return "NgaySinh(%d/%d/%d âm lịch, giờ %d, %s)" % (
+            self.ngayAm, self.thangAm, self.namAm, self.gioSinh,
+            "nam" if self.gioiTinh == 1 else "nữ")
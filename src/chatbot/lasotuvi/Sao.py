@@ -2,6 +2,9 @@
 """
 (c) 2016 doanguyen <dungnv2410@gmail.com>.
 """
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from lasotuvi.AmDuong import nguHanh
 
 
@@ -24,46 +27,113 @@ class Sao(object):
                                             1: Thuộc vòng Tràng sinh
         """
 
+    __slots__ = ("saoID", "saoTen", "saoNguHanh", "saoLoai", "saoPhuongVi",
+                 "saoAmDuong", "vongTrangSinh", "cssSao")
+
     def __init__(self, saoID, saoTen, saoNguHanh, saoLoai=2, saoPhuongVi="",
                  saoAmDuong="", vongTrangSinh=0):
-        super(Sao, self).__init__()
-        self.saoID = saoID
-        self.saoTen = saoTen
-        self.saoNguHanh = saoNguHanh
-        self.saoLoai = saoLoai
-        self.saoPhuongVi = saoPhuongVi
-        self.saoAmDuong = saoAmDuong
-        self.vongTrangSinh = vongTrangSinh
-        self.cssSao = nguHanh(saoNguHanh)['css']
-        self.saoDacTinh = None
+        # Sao trong danh mục là bất biến để dùng chung giữa các lá số
+        # (kể cả khi lập lá số song song trên nhiều thread)
+        setattr_ = super(Sao, self).__setattr__
+        setattr_("saoID", saoID)
+        setattr_("saoTen", saoTen)
+        setattr_("saoNguHanh", saoNguHanh)
+        setattr_("saoLoai", saoLoai)
+        setattr_("saoPhuongVi", saoPhuongVi)
+        setattr_("saoAmDuong", saoAmDuong)
+        setattr_("vongTrangSinh", vongTrangSinh)
+        setattr_("cssSao", nguHanh(saoNguHanh)['css'])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Sao %s không sửa được" % self.saoTen)
+
+    __delattr__ = __setattr__
+
+    def __reduce__(self):
+        return (Sao, (self.saoID, self.saoTen, self.saoNguHanh, self.saoLoai,
+                      self.saoPhuongVi, self.saoAmDuong, self.vongTrangSinh))
+
+    def __repr__(self):
+        return "Sao(%d, %r)" % (self.saoID, self.saoTen)
 
     def anDacTinh(self, dacTinh):
-        """An Đặc tính cho sao: V, M, Đ, B, H
-        Args: saoDacTinh (str): Đặc tính của sao, Vượng (V), Miếu (M),
-                                Đắc (Đ), Bình (B), Hãm (H)
-        Returns:
-            object: self
+        """Đã bỏ: sao trong danh mục dùng chung giữa các lá số nên không
+        mang đặc tính. Đặc tính của sao tại một cung là
+        DiaBan.dacTinhSao(cungSo, sao), có sẵn trong bản ghi SaoCung
+        (s['saoDacTinh']) của cung trên lá số.
+
+        Raises:
+            AttributeError: luôn luôn
         """
-        dt = {
-            "V": "vuongDia",
-            "M": "mieuDia",
-            "Đ": "dacDia",
-            "B": "binhHoa",
-            "H": "hamDia",
-        }
-        self.saoDacTinh = dacTinh
-        # self.saoTen += " (%s)" % dacTinh
-        # self.cssSao = dt[dacTinh]
-        return self
+        raise AttributeError(
+            "Sao.anDacTinh đã bỏ: dùng DiaBan.dacTinhSao(cungSo, sao) hoặc "
+            "s['saoDacTinh'] trong cungSao của lá số")
 
     def anCung(self, saoViTriCung):
-        """Summary
+        """Đã bỏ: sao trong danh mục không mang vị trí. Vị trí của sao trên
+        một lá số là cungSo của bản ghi SaoCung, an bằng
+        cungDiaBan.themSao hoặc diaBan.nhapSao(cungSo, sao).
 
-        Returns:
-            TYPE: Description
+        Raises:
+            AttributeError: luôn luôn
         """
-        self.saoViTriCung = saoViTriCung
-        return self
+        raise AttributeError(
+            "Sao.anCung đã bỏ: dùng diaBan.nhapSao(cungSo, sao); vị trí là "
+            "s.cungSo trong cungSao của lá số")
+
+
+class SaoCung(Mapping):
+    """Một sao được an vào một cung của lá số.
+
+    Bản ghi gồm sao trong danh mục, vị trí cung trên địa bàn và đặc tính
+    (Miếu, Vượng, Đắc, Bình, Hãm hoặc None) của sao tại cung đó. Bản ghi
+    đọc được như dict của sao trước đây: s['saoTen'], s.get('saoLoai'),
+    s['saoDacTinh'].
+    """
+    __slots__ = ("sao", "cungSo", "saoDacTinh")
+    truong = Sao.__slots__ + ("saoDacTinh",)
+
+    def __init__(self, sao, cungSo, saoDacTinh=None):
+        # Bản ghi cũng bất biến: DiaBan dùng chung một bản ghi cho mỗi
+        # (sao, cung) giữa các lá số
+        setattr_ = super(SaoCung, self).__setattr__
+        setattr_("sao", sao)
+        setattr_("cungSo", cungSo)
+        setattr_("saoDacTinh", saoDacTinh)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("SaoCung không sửa được")
+
+    __delattr__ = __setattr__
+
+    def __getitem__(self, key):
+        if key == "saoDacTinh":
+            return self.saoDacTinh
+        if key in Sao.__slots__:
+            return getattr(self.sao, key)
+        raise KeyError(key)
+
+    def __getattr__(self, name):
+        # Chỉ được gọi với các thuộc tính của sao (saoID, saoTen,...)
+        if name in Sao.__slots__:
+            return getattr(self.sao, name)
+        raise AttributeError(name)
+
+    def __iter__(self):
+        return iter(self.truong)
+
+    def __len__(self):
+        return len(self.truong)
+
+    def __hash__(self):
+        return hash((self.sao.saoID, self.cungSo, self.saoDacTinh))
+
+    def __reduce__(self):
+        return (SaoCung, (self.sao, self.cungSo, self.saoDacTinh))
+
+    def __repr__(self):
+        return "SaoCung(%r, %r, %r)" % (self.sao, self.cungSo,
+                                        self.saoDacTinh)
 
 
 # Tử vi tinh hệ
@@ -206,3 +276,8 @@ saoHoaCai = Sao(105, "Hoa cái", "K", 14)
 saoVanTinh = Sao(106, "Văn tinh", "H", 6)
 saoDauQuan = Sao(107, "Đẩu quân", "H", 5)
 saoThienKhong = Sao(108, "Thiên không", "T", 11)
+
+# Danh mục sao theo saoID
+danhMucSao = MappingProxyType({
+    sao.saoID: sao for sao in list(globals().values())
+    if isinstance(sao, Sao)})
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+24 tiết khí, tính theo kinh độ Mặt trời (Lich_HND.apparentSunLongitude).
+
+Thời điểm bắt đầu các tiết khí được tính sẵn trong LichData (LichGen) dưới
+dạng số phút kể từ MJD 0 (giờ UTC); tra cứu bằng tìm kiếm nhị phân. Ngoài
+khoảng tính sẵn thì giải trực tiếp trên mô hình kinh độ Mặt trời.
+"""
+from bisect import bisect_left
+from itertools import accumulate
+
+from lasotuvi.Lich_HND import apparentSunLongitude, jdFromDate, jdToDate
+
+try:
+    from lasotuvi import LichData
+    _firstTerm = LichData.SOLAR_TERM_FIRST
+    _termMinutes = tuple(accumulate(LichData.SOLAR_TERM_STEPS,
+                                    initial=LichData.SOLAR_TERM_START))
+except (ImportError, AttributeError):
+    _firstTerm = 0
+    _termMinutes = ()
+
+MJD_EPOCH = 2400000.5
+MINUTES_PER_DAY = 1440
+SUN_DEGREES_PER_DAY = 360 / 365.2422
+
+# Tiết khí thứ i bắt đầu khi kinh độ Mặt trời đạt 15 * i độ
+tenTietKhi = [
+    "Xuân phân", "Thanh minh", "Cốc vũ", "Lập hạ", "Tiểu mãn", "Mang chủng",
+    "Hạ chí", "Tiểu thử", "Đại thử", "Lập thu", "Xử thử", "Bạch lộ",
+    "Thu phân", "Hàn lộ", "Sương giáng", "Lập đông", "Tiểu tuyết",
+    "Đại tuyết", "Đông chí", "Tiểu hàn", "Đại hàn", "Lập xuân", "Vũ thủy",
+    "Kinh trập"
+]
+
+
+def timThoiDiemTietKhi(kinhDo, jdGanDung):
+    """Tìm thời điểm (ngày Julius, UTC) Mặt trời đạt kinh độ kinhDo gần nhất
+    với jdGanDung.
+
+    Args:
+        kinhDo (float): kinh độ Mặt trời cần tìm, tính bằng độ
+        jdGanDung (float): thời điểm ước lượng ban đầu
+
+    Returns:
+        float: thời điểm bắt đầu tiết khí
+    """
+    jd = jdGanDung
+    for _ in range(20):
+        lech = (kinhDo - apparentSunLongitude(jd) + 180.) % 360. - 180.
+        jd += lech / SUN_DEGREES_PER_DAY
+        if abs(lech) < 1e-7:
+            break
+    return jd
+
+
+def _tietKhi(index, thoiDiem, timeZone):
+    return {
+        "id": index % 24,
+        "tenTietKhi": tenTietKhi[index % 24],
+        "kinhDo": index % 24 * 15,
+        "batDau": thoiDiem,
+        "ngayBatDau": jdToDate(int(thoiDiem + 0.5 + timeZone / 24.)),
+    }
+
+
+def _phut(jd):
+    return (jd - MJD_EPOCH) * MINUTES_PER_DAY
+
+
+def _thoiDiem(i):
+    return _termMinutes[i] / MINUTES_PER_DAY + MJD_EPOCH
+
+
+def _cuoiNgay(dd, mm, yy, timeZone):
+    # Nửa đêm cuối ngày dd/mm/yy theo giờ địa phương, tính theo UTC
+    return jdFromDate(dd, mm, yy) + 0.5 - timeZone / 24.
+
+
+def _tinhTietKhi(jd, timeZone):
+    index = int(apparentSunLongitude(jd) // 15)
+    thoiDiem = timThoiDiemTietKhi(index * 15,
+                                  jd - (apparentSunLongitude(jd) % 15) /
+                                  SUN_DEGREES_PER_DAY)
+    if thoiDiem >= jd:
+        # Sát ranh giới: lấy tiết khí trước đó
+        index -= 1
+        thoiDiem = timThoiDiemTietKhi(index % 24 * 15, thoiDiem - 15.2)
+    return _tietKhi(index, thoiDiem, timeZone)
+
+
+def timTietKhi(dd, mm, yy, timeZone=7):
+    """Tiết khí của ngày dd/mm/yy (dương lịch): tiết khí cuối cùng bắt đầu
+    trước khi hết ngày đó theo giờ địa phương.
+
+    Returns:
+        dict: id (0: Xuân phân ... 23: Kinh trập), tenTietKhi, kinhDo,
+        batDau (ngày Julius UTC), ngayBatDau ([ngày, tháng, năm] địa phương)
+    """
+    cuoiNgay = _cuoiNgay(dd, mm, yy, timeZone)
+    i = bisect_left(_termMinutes, _phut(cuoiNgay)) - 1
+    if 0 <= i < len(_termMinutes) - 1:
+        return _tietKhi(_firstTerm + i, _thoiDiem(i), timeZone)
+    return _tinhTietKhi(cuoiNgay, timeZone)
+
+
+def cacTietKhi(ngayDau, ngayCuoi, timeZone=7):
+    """Các tiết khí bắt đầu trong khoảng ngày [ngayDau, ngayCuoi].
+
+    Args:
+        ngayDau (list): [ngày, tháng, năm] dương lịch
+        ngayCuoi (list): [ngày, tháng, năm] dương lịch
+
+    Returns:
+        list: các tiết khí (xem timTietKhi) theo thứ tự thời gian
+    """
+    tu = _cuoiNgay(*ngayDau, timeZone=timeZone) - 1
+    den = _cuoiNgay(*ngayCuoi, timeZone=timeZone)
+    if len(_termMinutes) > 1 and \
+            _termMinutes[0] <= _phut(tu) and _phut(den) <= _termMinutes[-1]:
+        dau = bisect_left(_termMinutes, _phut(tu))
+        cuoi = bisect_left(_termMinutes, _phut(den))
+        return [_tietKhi(_firstTerm + i, _thoiDiem(i), timeZone)
+                for i in range(dau, cuoi)]
+    ketQua = []
+    tk = _tinhTietKhi(tu, timeZone)
+    index, thoiDiem = tk["id"], tk["batDau"]
+    while True:
+        index += 1
+        thoiDiem = timThoiDiemTietKhi(index % 24 * 15, thoiDiem + 15.2)
+        if thoiDiem >= den:
+            return ketQua
+        ketQua.append(_tietKhi(index, thoiDiem, timeZone))
+
+
+def chiThangTietKhi(dd, mm, yy, timeZone=7):
+    """Chi của tháng theo tiết khí (tháng Dần bắt đầu từ Lập xuân), dùng cho
+    trụ tháng trong Bát tự.
+
+    Returns:
+        int: 1: Tý, 2: Sửu, 3: Dần, ...
+    """
+    thang = (timTietKhi(dd, mm, yy, timeZone)["id"] - 21) % 24 // 2
+    return (thang + 2) % 12 + 1
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+Xuất lá số (địa bàn và thiên bàn) ra dict chỉ gồm kiểu JSON cơ bản.
+
+laSoChuan là dạng chuẩn có phiên bản lược đồ (PHIEN_BAN_LUOC_DO) và vân tay
+lá số; laSoNhiPhan/docLaSoNhiPhan là dạng nhị phân gọn: msgpack nếu có thư
+viện msgpack, nếu không là bản ghi struct của kho lá số (chỉ địa bàn).
+"""
+import hashlib
+import struct
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from lasotuvi.DiaBan import bangSaoCung
+from lasotuvi.KhoLaSo import RECORD, giaiMaDiaBan, maHoaDiaBan
+from lasotuvi.LRUCache import LRUCache, kichThuocTuMoiTruong
+
+# Tăng khi đổi nội dung đưa vào vanTayLaSo để các vân tay cũ không còn khớp
+PHIEN_BAN_VAN_TAY = 1
+
+# Tăng khi đổi tên, kiểu hoặc ý nghĩa một trường của laSoChuan
+PHIEN_BAN_LUOC_DO = 1
+
+# Byte đầu của laSoNhiPhan cho biết định dạng
+NHI_PHAN_MSGPACK = b"M"
+NHI_PHAN_STRUCT = b"S"
+# Dạng struct: phiên bản lược đồ, tháng âm lịch, giờ sinh, rồi KhoLaSo.RECORD
+DAU_STRUCT = struct.Struct("<BBB")
+
+# Phần địa bàn của laSoChuan, theo khóa (vanTayLaSo, có đại/tiểu hạn). Đặt
+# LASOTUVI_EXPORT_CACHE_SIZE=0 hoặc gọi cacheXuatLaSo.disable() để tắt.
+cacheXuatLaSo = LRUCache(
+    kichThuocTuMoiTruong("LASOTUVI_EXPORT_CACHE_SIZE", 1024))
+
+# Các trường của lapThienBan được xuất, theo thứ tự
+TRUONG_THIEN_BAN = (
+    "ten", "gioiTinh", "namNu", "timeZone",
+    "ngayDuong", "thangDuong", "namDuong",
+    "ngayAm", "thangAm", "namAm", "thangNhuan",
+    "gioSinh", "canNgayTen", "chiNgayTen", "canThangTen", "chiThangTen",
+    "canNamTen", "chiNamTen", "amDuongNamSinh", "amDuongMenh",
+    "menh", "banMenh", "menhChu", "thanChu", "hanhCuc", "tenCuc", "sinhKhac",
+)
+
+# Các trường của một sao trong cung
+TRUONG_SAO = ("saoID", "saoTen", "saoNguHanh", "saoLoai", "saoPhuongVi",
+              "saoAmDuong", "vongTrangSinh", "saoDacTinh")
+
+
+def cungDict(cung):
+    return {
+        "cungSo": cung.cungSo,
+        "cungTen": cung.cungTen,
+        "hanhCung": cung.hanhCung,
+        "cungAmDuong": cung.cungAmDuong,
+        "cungChu": getattr(cung, "cungChu", None),
+        "cungDaiHan": getattr(cung, "cungDaiHan", None),
+        "cungTieuHan": getattr(cung, "cungTieuHan", None),
+        "cungThan": cung.cungThan,
+        "tuanTrung": cung.tuanTrung,
+        "trietLo": cung.trietLo,
+        "cungSao": [{truong: sao[truong] for truong in TRUONG_SAO}
+                    for sao in cung.cungSao],
+    }
+
+
+def thienBanDict(thienBan):
+    """Các trường TRUONG_THIEN_BAN, None với trường thienBan không có (như
+    tên, ngày dương lịch của KhoLaSo.LaSo)."""
+    return {truong: getattr(thienBan, truong, None)
+            for truong in TRUONG_THIEN_BAN}
+
+
+def laSoDict(diaBan, thienBan=None):
+    """Lá số dưới dạng dict (dùng được với json.dumps).
+
+    Args:
+        diaBan (diaBan): địa bàn của lapDiaBan
+        thienBan (lapThienBan, optional): thiên bàn, None nếu chỉ xuất địa
+            bàn
+
+    Returns:
+        dict: thienBan (nếu có), cungMenh, cungThan và thapNhiCung (12 cung
+        từ Tý đến Hợi)
+    """
+    laSo = {}
+    if thienBan is not None:
+        laSo["thienBan"] = thienBanDict(thienBan)
+    laSo["cungMenh"] = diaBan.cungMenh
+    laSo["cungThan"] = diaBan.cungThan
+    laSo["thapNhiCung"] = [cungDict(cung) for cung in diaBan.thapNhiCung[1:]]
+    return laSo
+
+
+def vanTayLaSo(diaBan, thienBan, cacSao=None):
+    """Vân tay nội dung của lá số: hai lá số có cùng vân tay thì giống hệt
+    nhau về giới tính, can chi năm, bản mệnh, cục, cung Mệnh, cung Thân,
+    Tuần, Triệt và các sao (saoID, đặc tính) trong từng cung, dù ngày giờ
+    sinh hay người khác nhau.
+
+    Args:
+        diaBan (diaBan): địa bàn của lapDiaBan
+        thienBan: lapThienBan hoặc KhoLaSo.LaSo (cần gioiTinh, canNamTen,
+            chiNamTen, banMenh, tenCuc)
+        cacSao (iterable, optional): chỉ xét các sao này (ví dụ
+            boLuat.theoNhom(...).cacSao), để lá số đầy đủ và lá số rút gọn
+            cho cùng vân tay; mặc định xét mọi sao
+
+    Returns:
+        str: chuỗi hex sha1
+    """
+    mask = -1 if cacSao is None else \
+        sum(1 << saoID for saoID in set(sao.saoID for sao in cacSao))
+    phan = [str(PHIEN_BAN_VAN_TAY), str(thienBan.gioiTinh),
+            thienBan.canNamTen, thienBan.chiNamTen, thienBan.banMenh,
+            thienBan.tenCuc, str(diaBan.cungMenh), str(diaBan.cungThan),
+            str(diaBan.tuanBits), str(diaBan.trietBits)]
+    # Sao trong cung theo thứ tự saoID, không theo thứ tự của cungSao
+    for cungSo in range(1, 13):
+        bits = diaBan.saoBits[cungSo] & mask
+        cacSao = []
+        while bits:
+            thap = bits & -bits
+            saoID = thap.bit_length() - 1
+            cacSao.append("%d%s" % (
+                saoID, bangSaoCung[saoID][cungSo].saoDacTinh or ""))
+            bits ^= thap
+        phan.append(",".join(cacSao))
+    return hashlib.sha1("|".join(phan).encode("utf-8")).hexdigest()
+
+
+def laSoChuan(diaBan, thienBan):
+    """Lá số dạng chuẩn: laSoDict(diaBan, thienBan) cùng phienBan
+    (PHIEN_BAN_LUOC_DO) và vanTay (vanTayLaSo).
+
+    Phần địa bàn (cungMenh, cungThan, thapNhiCung) chỉ phụ thuộc vân tay
+    nên được cache theo vân tay; mỗi lần gọi nhận một bản chép riêng, sửa
+    kết quả không làm đổi cache.
+
+    Returns:
+        dict: phienBan, vanTay, thienBan, cungMenh, cungThan, thapNhiCung
+    """
+    vanTay = vanTayLaSo(diaBan, thienBan)
+    khoa = (vanTay, diaBan.daiHanCung[1] is not None)
+    phanDiaBan = cacheXuatLaSo.get(khoa)
+    if phanDiaBan is None:
+        phanDiaBan = laSoDict(diaBan)
+        cacheXuatLaSo.put(khoa, phanDiaBan)
+    laSo = {"phienBan": PHIEN_BAN_LUOC_DO, "vanTay": vanTay,
+            "thienBan": thienBanDict(thienBan)}
+    laSo.update(_chepPhanDiaBan(phanDiaBan))
+    return laSo
+
+
+def _chepPhanDiaBan(phanDiaBan):
+    # Chép sâu phần địa bàn của laSoDict: mọi giá trị lá đều bất biến (int,
+    # str, bool) nên chỉ cần chép các dict và list, nhanh hơn copy.deepcopy
+    # và hơn cả lập lại laSoDict
+    return {"cungMenh": phanDiaBan["cungMenh"],
+            "cungThan": phanDiaBan["cungThan"],
+            "thapNhiCung": [dict(cung, cungSao=[dict(sao)
+                                                for sao in cung["cungSao"]])
+                            for cung in phanDiaBan["thapNhiCung"]]}
+
+
+def laSoNhiPhan(diaBan, thienBan=None, dungMsgpack=None):
+    """Lá số dạng nhị phân gọn, đọc lại bằng docLaSoNhiPhan.
+
+    Args:
+        diaBan (diaBan): địa bàn của lapDiaBan
+        thienBan (optional): thiên bàn, chỉ được giữ ở dạng msgpack
+        dungMsgpack (bool, optional): True là msgpack của laSoChuan (hoặc
+            laSoDict nếu không có thienBan), False là bản ghi struct của
+            địa bàn như trong kho lá số (cần đại hạn, tiểu hạn); mặc định
+            dùng msgpack nếu đã cài
+
+    Returns:
+        bytes
+    """
+    if dungMsgpack is None:
+        dungMsgpack = msgpack is not None
+    if dungMsgpack:
+        if msgpack is None:
+            raise ImportError("laSoNhiPhan cần thư viện msgpack.")
+        laSo = laSoDict(diaBan) if thienBan is None else \
+            laSoChuan(diaBan, thienBan)
+        return NHI_PHAN_MSGPACK + msgpack.packb(laSo, use_bin_type=True)
+    return NHI_PHAN_STRUCT + DAU_STRUCT.pack(
+        PHIEN_BAN_LUOC_DO, diaBan.thangSinhAmLich,
+        diaBan.gioSinhAmLich) + maHoaDiaBan(diaBan)
+
+
+def docLaSoNhiPhan(duLieu):
+    """Ngược lại của laSoNhiPhan.
+
+    Returns:
+        dict: như laSoChuan (dạng msgpack) hoặc laSoDict của địa bàn cùng
+        phienBan (dạng struct)
+
+    Raises:
+        Exception: dữ liệu không phải của laSoNhiPhan
+    """
+    dinhDang, noiDung = duLieu[:1], duLieu[1:]
+    if dinhDang == NHI_PHAN_MSGPACK:
+        if msgpack is None:
+            raise ImportError("docLaSoNhiPhan cần thư viện msgpack.")
+        return msgpack.unpackb(noiDung, raw=False)
+    if dinhDang == NHI_PHAN_STRUCT and \
+            len(noiDung) == DAU_STRUCT.size + RECORD.size:
+        phienBan, thangAm, gioSinh = DAU_STRUCT.unpack_from(noiDung)
+        laSo = {"phienBan": phienBan}
+        laSo.update(laSoDict(giaiMaDiaBan(noiDung[DAU_STRUCT.size:],
+                                          thangAm, gioSinh)))
+        return laSo
+    raise Exception("Không đọc được lá số nhị phân.")
@@ -0,0 +1,460 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark và kiểm tra tương đương cho các đường nhanh của lasotuvi.Lich_HND.
+
+    python bench_lich_hnd.py [--from 1900] [--to 2100] [--tz 7 -8 1 10]
+    pytest bench_lich_hnd.py [--benchmark-only]   # cần pytest-benchmark
+
+Mọi đường nhanh (bảng LichData, file lịch mmap, S2L_batch/L2S_batch,
+iterLunarDates) được so với bản gốc của thuật toán Hồ Ngọc Đức dưới đây,
+chỉ dùng công thức Meeus (NewMoon, getSunLongitude), cho từng ngày trong
+khoảng và từng múi giờ. jdFromDate/jdToDate được so với datetime.
+"""
+import argparse
+import datetime
+import functools
+import os
+import sys
+import tempfile
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from lasotuvi import Lich_HND  # noqa: E402
+from lasotuvi.Lich_HND import (L2S, S2L, NewMoon, getSunLongitude,  # noqa
+                               iterLunarDates, jdFromDate, jdToDate)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Ngày Julius của 1/1/1 (lịch Gregory) theo datetime.date.toordinal()
+ORDINAL_OFFSET = 1721425
+
+
+# ------------------------------------------------------------------
+# Thuật toán gốc (chỉ dùng công thức, không bảng, không cache)
+# ------------------------------------------------------------------
+def ref_getNewMoonDay(k, timeZone):
+    return int(NewMoon(k) + 0.5 + timeZone / 24.)
+
+
+def ref_getLunarMonth11(yy, timeZone):
+    off = jdFromDate(31, 12, yy) - 2415021.
+    k = int(off / 29.530588853)
+    nm = ref_getNewMoonDay(k, timeZone)
+    if getSunLongitude(nm, timeZone) >= 9:
+        nm = ref_getNewMoonDay(k - 1, timeZone)
+    return nm
+
+
+def ref_getLeapMonthOffset(a11, timeZone):
+    k = int((a11 - 2415021.076998695) / 29.530588853 + 0.5)
+    i = 1
+    arc = getSunLongitude(ref_getNewMoonDay(k + i, timeZone), timeZone)
+    while True:
+        last = arc
+        i += 1
+        arc = getSunLongitude(ref_getNewMoonDay(k + i, timeZone), timeZone)
+        if not (arc != last and i < 14):
+            break
+    return i - 1
+
+
+def ref_S2L(dd, mm, yy, timeZone=7):
+    dayNumber = jdFromDate(dd, mm, yy)
+    k = int((dayNumber - 2415021.076998695) / 29.530588853)
+    monthStart = ref_getNewMoonDay(k + 1, timeZone)
+    if monthStart > dayNumber:
+        monthStart = ref_getNewMoonDay(k, timeZone)
+    a11 = ref_getLunarMonth11(yy, timeZone)
+    b11 = a11
+    if a11 >= monthStart:
+        lunarYear = yy
+        a11 = ref_getLunarMonth11(yy - 1, timeZone)
+    else:
+        lunarYear = yy + 1
+        b11 = ref_getLunarMonth11(yy + 1, timeZone)
+    lunarDay = dayNumber - monthStart + 1
+    diff = int((monthStart - a11) / 29.)
+    lunarLeap = 0
+    lunarMonth = diff + 11
+    if b11 - a11 > 365:
+        leapMonthDiff = ref_getLeapMonthOffset(a11, timeZone)
+        if diff >= leapMonthDiff:
+            lunarMonth = diff + 10
+            if diff == leapMonthDiff:
+                lunarLeap = 1
+    if lunarMonth > 12:
+        lunarMonth = lunarMonth - 12
+    if lunarMonth >= 11 and diff < 4:
+        lunarYear -= 1
+    return [lunarDay, lunarMonth, lunarYear, lunarLeap]
+
+
+def ref_L2S(lunarD, lunarM, lunarY, lunarLeap, tZ=7):
+    if lunarM < 11:
+        a11 = ref_getLunarMonth11(lunarY - 1, tZ)
+        b11 = ref_getLunarMonth11(lunarY, tZ)
+    else:
+        a11 = ref_getLunarMonth11(lunarY, tZ)
+        b11 = ref_getLunarMonth11(lunarY + 1, tZ)
+    k = int(0.5 + (a11 - 2415021.076998695) / 29.530588853)
+    off = lunarM - 11
+    if off < 0:
+        off += 12
+    if b11 - a11 > 365:
+        leapOff = ref_getLeapMonthOffset(a11, tZ)
+        leapM = leapOff - 2
+        if leapM < 0:
+            leapM += 12
+        if lunarLeap != 0 and lunarM != leapM:
+            return [0, 0, 0]
+        elif lunarLeap != 0 or off >= leapOff:
+            off += 1
+    monthStart = ref_getNewMoonDay(k + off, tZ)
+    return jdToDate(monthStart + lunarD - 1)
+
+
+# ------------------------------------------------------------------
+# Dữ liệu kiểm tra
+# ------------------------------------------------------------------
+def solarDays(namDau, namCuoi):
+    d = datetime.date(namDau, 1, 1)
+    end = datetime.date(namCuoi, 12, 31)
+    days = []
+    while d <= end:
+        days.append((d.day, d.month, d.year))
+        d += datetime.timedelta(1)
+    return days
+
+
+def lunarCases(s2lRef):
+    """Các ngày âm lịch xuất hiện trong khoảng, cộng thêm ngày nhuận không
+    hợp lệ để kiểm tra nhánh trả về [0, 0, 0] của L2S."""
+    cases = sorted(set(s2lRef))
+    cases += [(d, m, y, 1) for (d, m, y, leap) in cases
+              if leap == 0 and d == 1]
+    return cases
+
+
+# ------------------------------------------------------------------
+# Đo đạc
+# ------------------------------------------------------------------
+def percentile(sortedValues, p):
+    return sortedValues[min(len(sortedValues) - 1,
+                            int(p / 100. * len(sortedValues)))]
+
+
+def _list(value):
+    return list(value) if isinstance(value, (list, tuple)) else value
+
+
+def measureScalar(name, fn, cases, expected):
+    latencies = []
+    mismatches = []
+    clock = time.perf_counter_ns
+    for args, exp in zip(cases, expected):
+        t0 = clock()
+        got = fn(*args)
+        latencies.append(clock() - t0)
+        if _list(got) != _list(exp):
+            mismatches.append((args, _list(got), _list(exp)))
+    latencies.sort()
+    total = sum(latencies) / 1e9
+    return {
+        "name": name,
+        "n": len(cases),
+        "rate": len(cases) / total if total else float("inf"),
+        "p50_us": percentile(latencies, 50) / 1e3,
+        "p99_us": percentile(latencies, 99) / 1e3,
+        "mismatches": mismatches,
+    }
+
+
+def measureBatch(name, fn, columns, expected, repeat=3):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        got = fn(*columns)
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    got = np.stack(got, axis=1)
+    bad = np.flatnonzero((got != np.asarray(expected)).any(axis=1))
+    return {
+        "name": name,
+        "n": len(expected),
+        "rate": len(expected) / best,
+        "p50_us": best * 1e6,  # một lần gọi cho cả mảng
+        "p99_us": best * 1e6,
+        "mismatches": [(tuple(int(c[i]) for c in columns), got[i].tolist(),
+                        list(expected[i])) for i in bad[:20]],
+    }
+
+
+def restoreCalendarFile():
+    # Trả lại file lịch mặc định (nếu có) như lúc import Lich_HND
+    Lich_HND.closeCalendarFile()
+    if os.path.exists(Lich_HND.CALENDAR_PATH):
+        Lich_HND.openCalendarFile(Lich_HND.CALENDAR_PATH)
+
+
+def iterCases(namDau, namCuoi, timeZone):
+    return [(solar, lunar) for solar, lunar, _ in
+            iterLunarDates([1, 1, namDau], [31, 12, namCuoi], timeZone)]
+
+
+def runTimeZone(namDau, namCuoi, timeZone, calendarPath=None):
+    days = solarDays(namDau, namCuoi)
+    results = []
+
+    t0 = time.perf_counter()
+    s2lRef = [tuple(ref_S2L(d, m, y, timeZone)) for d, m, y in days]
+    refRate = len(days) / (time.perf_counter() - t0)
+    lunar = lunarCases(s2lRef)
+    l2sRef = [ref_L2S(*c, tZ=timeZone) for c in lunar]
+
+    # S2L chỉ dùng bảng LichData (và cache) khi không mở file lịch
+    Lich_HND.closeCalendarFile()
+    Lich_HND.clearLunarCache()
+    results.append(measureScalar(
+        "S2L", lambda d, m, y: S2L(d, m, y, timeZone), days, s2lRef))
+    if calendarPath:
+        calendar = Lich_HND.openCalendarFile(calendarPath)
+        if calendar.timeZone == timeZone:
+            results.append(measureScalar(
+                "S2L (mmap)", lambda d, m, y: S2L(d, m, y, timeZone),
+                days, s2lRef))
+    restoreCalendarFile()
+    results.append(measureScalar(
+        "L2S", lambda *a: L2S(*a, tZ=timeZone), lunar, l2sRef))
+
+    # iterLunarDates: bỏ qua các ngày S2L trả về ngày âm 0 (lỗi của S2L)
+    t0 = time.perf_counter()
+    it = iterCases(namDau, namCuoi, timeZone)
+    dt = time.perf_counter() - t0
+    bad = [(solar, got, list(exp)) for (solar, got), exp in zip(it, s2lRef)
+           if got != list(exp) and exp[0] >= 1]
+    results.append({"name": "iterLunarDates", "n": len(it),
+                    "rate": len(it) / dt, "p50_us": dt / len(it) * 1e6,
+                    "p99_us": dt / len(it) * 1e6, "mismatches": bad})
+
+    if np is not None:
+        cols = [np.array(c) for c in zip(*days)]
+        results.append(measureBatch(
+            "S2L_batch", lambda d, m, y: Lich_HND.S2L_batch(d, m, y, timeZone),
+            cols, s2lRef))
+        cols = [np.array(c) for c in zip(*lunar)]
+        results.append(measureBatch(
+            "L2S_batch", lambda *a: Lich_HND.L2S_batch(*a, tZ=timeZone),
+            cols, l2sRef))
+    return refRate, results
+
+
+def runJulianDay(namDau, namCuoi):
+    days = solarDays(namDau, namCuoi)
+    jds = [datetime.date(y, m, d).toordinal() + ORDINAL_OFFSET
+           for d, m, y in days]
+    return [
+        measureScalar("jdFromDate", jdFromDate, days, jds),
+        measureScalar("jdToDate", jdToDate, [(jd,) for jd in jds], days),
+    ]
+
+
+def printReport(title, results):
+    print("\n== %s" % title)
+    print("%-18s %9s %14s %10s %10s %8s" % (
+        "", "n", "conv/s", "p50 (us)", "p99 (us)", "lệch"))
+    for r in results:
+        print("%-18s %9d %14.0f %10.2f %10.2f %8d" % (
+            r["name"], r["n"], r["rate"], r["p50_us"], r["p99_us"],
+            len(r["mismatches"])))
+        for m in r["mismatches"][:3]:
+            print("    %s -> %s, gốc %s" % m)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--from", dest="namDau", type=int, default=1900)
+    parser.add_argument("--to", dest="namCuoi", type=int, default=2100)
+    parser.add_argument("--tz", type=float, nargs="+", default=[7, -8, 1, 10])
+    args = parser.parse_args(argv)
+
+    from lasotuvi.LichGen import ghiFileLich
+    tongLech = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for tz in args.tz:
+            tz = int(tz) if tz == int(tz) else tz
+            path = os.path.join(tmp, "amlich_%s.bin" % tz)
+            ghiFileLich(args.namDau, args.namCuoi, tz, path)
+            refRate, results = runTimeZone(args.namDau, args.namCuoi, tz,
+                                           path)
+            printReport("UTC%+g, %d-%d (thuật toán gốc: %.0f conv/s)" % (
+                tz, args.namDau, args.namCuoi, refRate), results)
+            tongLech += sum(len(r["mismatches"]) for r in results)
+    results = runJulianDay(args.namDau, args.namCuoi)
+    printReport("Ngày Julius", results)
+    tongLech += sum(len(r["mismatches"]) for r in results)
+    return 1 if tongLech else 0
+
+
+# ------------------------------------------------------------------
+# pytest / pytest-benchmark
+# ------------------------------------------------------------------
+BENCH_RANGE = (1900, 2100)
+
+
+@functools.lru_cache(maxsize=None)
+def _pytestCases(timeZone):
+    days = solarDays(*BENCH_RANGE)
+    s2lRef = [tuple(ref_S2L(d, m, y, timeZone)) for d, m, y in days]
+    return days, s2lRef
+
+
+def test_equivalence_utc7():
+    days, s2lRef = _pytestCases(7)
+    Lich_HND.closeCalendarFile()
+    try:
+        assert [tuple(S2L(*d)) for d in days] == s2lRef
+    finally:
+        restoreCalendarFile()
+    assert [tuple(S2L(*d)) for d in days] == s2lRef
+    lunar = lunarCases(s2lRef)
+    assert [L2S(*c) for c in lunar] == [ref_L2S(*c) for c in lunar]
+    it = iterCases(*BENCH_RANGE, timeZone=7)
+    assert [lunar for (_, lunar), exp in zip(it, s2lRef)
+            if exp[0] >= 1] == [list(exp) for exp in s2lRef if exp[0] >= 1]
+
+
+def test_equivalence_other_zones():
+    for tz in (-8, 1, 10):
+        days, s2lRef = _pytestCases(tz)
+        assert [tuple(S2L(*d, timeZone=tz)) for d in days[::7]] == \
+            s2lRef[::7]
+
+
+def test_equivalence_julian_day():
+    for r in runJulianDay(*BENCH_RANGE):
+        assert not r["mismatches"], r["name"]
+
+
+def test_bench_S2L(benchmark):
+    days, _ = _pytestCases(7)
+    sample = days[::97]
+    benchmark(lambda: [S2L(*d) for d in sample])
+
+
+def test_bench_L2S(benchmark):
+    _, s2lRef = _pytestCases(7)
+    sample = s2lRef[::97]
+    benchmark(lambda: [L2S(*c) for c in sample])
+
+
+def test_bench_iterLunarDates(benchmark):
+    benchmark(lambda: sum(1 for _ in iterLunarDates([1, 1, 2020],
+                                                    [31, 12, 2029])))
+
+
+def test_bench_S2L_batch(benchmark):
+    import pytest
+    pytest.importorskip("numpy")
+    days, s2lRef = _pytestCases(7)
+    cols = [np.array(c) for c in zip(*days)]
+    got = benchmark(Lich_HND.S2L_batch, *cols)
+    assert (np.stack(got, axis=1) == np.asarray(s2lRef)).all()
+
+
+def test_zone_cache_size_env():
+    # LASOTUVI_ZONE_CACHE_SIZE được kiểm tra ngay khi import
+    import subprocess
+
+    def chay(giaTri):
+        return subprocess.run(
+            [sys.executable, "-c",
+             "from lasotuvi.Lich_HND import cacheBangLich as c; "
+             "print(c.maxsize, c.enabled)"],
+            cwd=current_dir, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            universal_newlines=True,
+            env=dict(os.environ, LASOTUVI_ZONE_CACHE_SIZE=giaTri))
+
+    assert chay(" 3 ").stdout.split() == ["3", "True"]
+    assert chay("0").stdout.split() == ["0", "False"]
+    assert chay("").stdout.split() == ["8", "True"]
+    for giaTri in ("abc", "-1", "2.5"):
+        ketQua = chay(giaTri)
+        assert ketQua.returncode != 0
+        assert "LASOTUVI_ZONE_CACHE_SIZE" in ketQua.stderr
+
+
+def test_batch_zone_cache():
+    # S2L_batch/L2S_batch dùng cacheBangLich như S2L: cache tắt thì không
+    # lập bảng mà đổi từng ngày bằng công thức, bật thì lập một lần và giữ
+    import pytest
+    pytest.importorskip("numpy")
+    tz = 5.5
+    days, s2lRef = _pytestCases(7)
+    days = days[::53]
+    cols = [np.array(c) for c in zip(*days)]
+    expected = np.asarray([S2L(*d, timeZone=tz) for d in days])
+    lunar = [list(expected[:, i]) for i in range(4)]
+    expectedL2S = np.asarray([L2S(*c, tz) for c in zip(*lunar)])
+    cache = Lich_HND.cacheBangLich
+    kichThuoc = cache.maxsize
+    tinhBangLich = Lich_HND.tinhBangLich
+
+    def khongLapBang(*args, **kwargs):
+        raise AssertionError("cache tắt nhưng vẫn lập BangLich")
+
+    try:
+        cache.disable()
+        Lich_HND.tinhBangLich = khongLapBang
+        assert (np.stack(Lich_HND.S2L_batch(*cols, timeZone=tz), axis=1)
+                == expected).all()
+        assert (np.stack(Lich_HND.L2S_batch(*lunar, tZ=tz), axis=1)
+                == expectedL2S).all()
+        Lich_HND.tinhBangLich = tinhBangLich
+        cache.enable(kichThuoc)
+        assert (np.stack(Lich_HND.S2L_batch(*cols, timeZone=tz), axis=1)
+                == expected).all()
+        assert (cache.misses, len(cache)) == (1, 1)
+        assert (np.stack(Lich_HND.L2S_batch(*lunar, tZ=tz), axis=1)
+                == expectedL2S).all()
+        assert (cache.hits, cache.misses) == (1, 1)
+    finally:
+        Lich_HND.tinhBangLich = tinhBangLich
+        cache.clear()
+        cache.enable(kichThuoc)
+
+
+def ref_nextAnniversary(lunarD, lunarM, dd, mm, yy, timeZone=7):
+    # Ngày giỗ tiếp theo: luôn ở tháng thường, ngày 30 của tháng thiếu
+    # được tính vào ngày 29
+    fromDay = jdFromDate(dd, mm, yy)
+    lunarY = ref_S2L(dd, mm, yy, timeZone)[2]
+    for year in (lunarY, lunarY + 1):
+        start = jdFromDate(*ref_L2S(1, lunarM, year, 0, timeZone))
+        length = 30 if ref_S2L(*jdToDate(start + 29),
+                               timeZone=timeZone)[0] == 30 else 29
+        day = start + min(lunarD, length) - 1
+        if day >= fromDay:
+            return jdToDate(day)
+
+
+def test_bench_nextAnniversary_batch(benchmark):
+    import pytest
+    pytest.importorskip("numpy")
+    days = solarDays(*BENCH_RANGE)[::97]
+    cols = [np.array(c) for c in zip(*days)]
+    lunarD = np.arange(len(days)) % 30 + 1
+    lunarM = np.arange(len(days)) % 12 + 1
+    got = benchmark(Lich_HND.nextAnniversary_batch, lunarD, lunarM, *cols)
+    expected = [ref_nextAnniversary(int(d), int(m), *day)
+                for d, m, day in zip(lunarD, lunarM, days)]
+    assert (np.stack(got, axis=1) == np.asarray(expected)).all()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,9 +15,23 @@ try:
     from lasotuvi.App import lapDiaBan
     from lasotuvi.DiaBan import diaBan as DiaBanClass
     from lasotuvi.ThienBan import lapThienBan
+    from lasotuvi.KhoLaSo import traLaSoAmLich, maLaSo, laSoTheoMa
+    from lasotuvi.NgaySinh import NgaySinh
+    from lasotuvi.LuatAnSao import boLuatMacDinh
+    from lasotuvi.XuatLaSo import vanTayLaSo, laSoChuan
+    from lasotuvi.CachCuc import timCachCuc, SAO_CACH_CUC
+    # Prompt Tử Vi dùng chính tinh và cách cục: lá số rút gọn chỉ an chính
+    # tinh và đúng các sao của cách cục (sao phụ thuộc được tính nhưng không
+    # an); Tuần, Triệt đi kèm để vân tay lá số rút gọn trùng với lá số đầy đủ
+    # trong kho
+    NHOM_SAO_PROMPT = ("chinhTinh", "tuanTriet") + SAO_CACH_CUC
+    SAO_PROMPT = tuple(dict.fromkeys(boLuatMacDinh.theoNhom("chinhTinh").cacSao + SAO_CACH_CUC))
 except ImportError:
     print("WARNING: Thư viện lasotuvi không khả dụng.")
-    lapDiaBan = DiaBanClass = lapThienBan = None
+    lapDiaBan = DiaBanClass = lapThienBan = traLaSoAmLich = NgaySinh = None
+    vanTayLaSo = NHOM_SAO_PROMPT = SAO_PROMPT = None
+    maLaSo = laSoTheoMa = laSoChuan = None
+    timCachCuc = None
 
 from prompts import (
     get_tarot_prompt, 
@@ -296,6 +310,24 @@ def parse_time_to_chi(time_str):
     except: return 1
     return 1 if (hour >= 23 or hour < 1) else (hour + 1) // 2 + 1
 
+def parse_timezone(tz_value, default=7):
+    """Chuyển múi giờ nơi sinh (7, "+10", "UTC-8", "GMT+5:30") sang số giờ lệch UTC."""
+    if tz_value is None or str(tz_value).strip() == '': return default
+    s = str(tz_value).strip().upper().replace('UTC', '').replace('GMT', '')
+    if not s: return 0
+    sign = -1 if s.startswith('-') else 1
+    s = s.lstrip('+-')
+    try:
+        if ':' in s:
+            h, m = s.split(':', 1)
+            tz = int(h) + int(m) / 60
+        else:
+            tz = float(s)
+    except ValueError: return default
+    tz *= sign
+    if not -12 <= tz <= 14: return default
+    return int(tz) if tz == int(tz) else tz
+
 def extract_tuvi_metadata(thien_ban, dia_ban):
     """KHÔI PHỤC: Lấy metadata để hiển thị summary."""
     try:
@@ -313,27 +345,45 @@ def handle_horoscope(body):
     dob = parse_date(u.get('birth_date'))
     if not dob or lapDiaBan is None: return "Hệ thống Tử Vi chưa sẵn sàng."
 
-    bid = generate_birth_id(u.get('birth_date'), u.get('birth_time',''), u.get('gender',''))
+    # Múi giờ nơi sinh, mặc định Việt Nam (UTC+7)
+    tz = parse_timezone(u.get('birth_timezone', u.get('timezone')))
+    chi_gio = parse_time_to_chi(u.get('birth_time', '12:00'))
+    gender_val = 1 if str(u.get('gender')).lower() in ['male', 'nam', '1'] else -1
+
+    # Đổi lịch một lần, dùng chung cho kho lá số, địa bàn và thiên bàn
+    ns = NgaySinh(dob.day, dob.month, dob.year, chi_gio, gender_val, True, tz)
+    # Kho lá số tính sẵn (nếu có trong package) thay cho việc lập lá số
+    la_so = traLaSoAmLich(ns.ngayAm, ns.thangAm, ns.namAm, chi_gio, gender_val)
+    if la_so is not None:
+        db, tb = la_so.diaBan, la_so
+    else:
+        # Prompt chỉ dùng chính tinh và cách cục: lập lá số rút gọn
+        db = lapDiaBan(DiaBanClass, ns, nhomSao=NHOM_SAO_PROMPT)
+        tb = lapThienBan(ns, ten=u.get('name', ''), diaBan=db)
+
+    # Cache theo vân tay lá số thay vì theo người: mọi người có cùng lá số
+    # (cùng dữ liệu đưa vào prompt) dùng chung một lần gọi LLM
+    bid = f"tuvi_{vanTayLaSo(db, tb, SAO_PROMPT)}"
     fid = "horo_chart"
     try:
         cached = table_cache.get_item(Key={"birth_id": bid, "feature_id": fid})
         if "Item" in cached: return json.loads(cached["Item"]["answer"])
     except: pass
 
-    chi_gio = parse_time_to_chi(u.get('birth_time', '12:00'))
-    gender_val = 1 if str(u.get('gender')).lower() in ['male', 'nam', '1'] else -1
-
-    db = lapDiaBan(DiaBanClass, dob.day, dob.month, dob.year, chi_gio, gender_val, True, 7)
-    tb = lapThienBan(dob.day, dob.month, dob.year, chi_gio, gender_val, u.get('name','Đương số'), db, True, 7)
-    
     # KHÔI PHỤC: Logic tạo context 12 cung chi tiết
-    lines = [f"Đương số: {tb.ten}, Mệnh: {tb.banMenh}, Cục: {tb.tenCuc}"]
+    # Prompt không chứa tên hay ngày sinh để câu trả lời dùng chung được
+    gender_key = 'male' if gender_val == 1 else 'female'
+    lines = [f"Đương số: {'Nam' if gender_val == 1 else 'Nữ'}, Mệnh: {tb.banMenh}, Cục: {tb.tenCuc}"]
+    # Cách cục tìm sẵn trên lá số, LLM không phải tự suy ra
+    cach_cuc = timCachCuc(db)
+    if cach_cuc:
+        lines.append("Cách cục: " + ", ".join(f"{c.ten} ({c.tinhChat})" for c in cach_cuc))
     for i in range(1, 13):
         c = db.thapNhiCung[i]
         sao_chinh = [s['saoTen'] for s in c.cungSao if s.get('saoLoai') == 1]
         lines.append(f"Cung {getattr(c, 'cungChu', '')} tại {c.cungTen}: {', '.join(sao_chinh)}")
     
-    prompt = get_horoscope_prompt("\n".join(lines), u)
+    prompt = get_horoscope_prompt("\n".join(lines), {'gender': gender_key})
     ans, in_t, out_t = call_bedrock_llm(prompt, 0.7)
     
     res = {"summary": extract_tuvi_metadata(tb, db), "analysis": ans}
@@ -343,6 +393,31 @@ def handle_horoscope(body):
     })
     return res
 
+# --- LÁ SỐ (CHART, KHÔNG GỌI LLM) ---
+def handle_chart(body):
+    """Lá số dạng chuẩn (laSoChuan) kèm mã lá số, từ ngày giờ sinh hoặc chart_code."""
+    if lapDiaBan is None: return "Hệ thống Tử Vi chưa sẵn sàng."
+    u = body.get('user_context', {})
+    code = body.get('chart_code') or u.get('chart_code')
+    if code:
+        # Mã lá số chỉ giữ lá số, không giữ tên hay ngày dương lịch
+        try: tb = laSoTheoMa(code)
+        except Exception: return "Mã lá số không hợp lệ."
+        return dict(laSoChuan(tb.diaBan, tb), ma=str(code).strip().upper())
+
+    dob = parse_date(u.get('birth_date'))
+    if not dob: return "Ngày sinh không hợp lệ."
+    tz = parse_timezone(u.get('birth_timezone', u.get('timezone')))
+    chi_gio = parse_time_to_chi(u.get('birth_time', '12:00'))
+    gender_val = 1 if str(u.get('gender')).lower() in ['male', 'nam', '1'] else -1
+
+    ns = NgaySinh(dob.day, dob.month, dob.year, chi_gio, gender_val, True, tz)
+    la_so = traLaSoAmLich(ns.ngayAm, ns.thangAm, ns.namAm, chi_gio, gender_val)
+    db = la_so.diaBan if la_so is not None else lapDiaBan(DiaBanClass, ns)
+    tb = lapThienBan(ns, ten=u.get('name', ''), diaBan=db)
+    # Phần địa bàn được cache theo vân tay lá số trong laSoChuan
+    return dict(laSoChuan(db, tb), ma=maLaSo(ns.ngayAm, ns.thangAm, ns.namAm, chi_gio, gender_val))
+
 # ==========================================
 # 5. LAMBDA HANDLER
 # ==========================================
@@ -357,6 +432,7 @@ def lambda_handler(event, context):
         elif domain == 'astrology': ans = handle_astrology(body)
         elif domain == 'numerology': ans = handle_numerology(body)
         elif domain == 'horoscope': ans = handle_horoscope(body)
+        elif domain == 'chart': ans = handle_chart(body)
         else: return {'statusCode': 400, 'body': 'Invalid domain'}
             
         return {
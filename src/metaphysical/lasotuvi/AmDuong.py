@@ -3,6 +3,8 @@
 (c) 2016 doanguyen <dungnv2410@gmail.com>.
 """
 
+from types import MappingProxyType
+
 from lasotuvi.Lich_HND import S2L, L2S, jdFromDate
 
 
@@ -305,6 +307,32 @@ def ngayThangNamCanChi(nn, tt, nnnn, duongLich=True, timeZone=7):
     return [canThang, canNamSinh, chiNam]
 
 
+_nguHanhKim = MappingProxyType(
+    {"id": 1, "tenHanh": "Kim", "cuc": 4, "tenCuc": "Kim tứ Cục",
+     "css": "hanhKim"})
+_nguHanhMoc = MappingProxyType(
+    {"id": 2, "tenHanh": "Mộc", "cuc": 3, "tenCuc": "Mộc tam Cục",
+     "css": "hanhMoc"})
+_nguHanhThuy = MappingProxyType(
+    {"id": 3, "tenHanh": "Thủy", "cuc": 2, "tenCuc": "Thủy nhị Cục",
+     "css": "hanhThuy"})
+_nguHanhHoa = MappingProxyType(
+    {"id": 4, "tenHanh": "Hỏa", "cuc": 6, "tenCuc": "Hỏa lục Cục",
+     "css": "hanhHoa"})
+_nguHanhTho = MappingProxyType(
+    {"id": 5, "tenHanh": "Thổ", "cuc": 5, "tenCuc": "Thổ ngũ Cục",
+     "css": "hanhTho"})
+
+# Tra cứu Hành theo tên đầy đủ (không dấu) hoặc chữ viết tắt
+bangNguHanh = MappingProxyType({
+    "Kim": _nguHanhKim, "K": _nguHanhKim,
+    "Moc": _nguHanhMoc, "M": _nguHanhMoc,
+    "Thuy": _nguHanhThuy, "T": _nguHanhThuy,
+    "Hoa": _nguHanhHoa, "H": _nguHanhHoa,
+    "Tho": _nguHanhTho, "O": _nguHanhTho,
+})
+
+
 def nguHanh(tenHanh):
     """
     Args:
@@ -312,32 +340,30 @@ def nguHanh(tenHanh):
         Thuy hoặc T, Hoa hoặc H, Tho hoặc O
 
     Returns:
-        Dictionary: ID của Hành, tên đầy đủ của Hành, số Cục của Hành
+        Dictionary: ID của Hành, tên đầy đủ của Hành, số Cục của Hành (dict
+        mới mỗi lần gọi, chép từ bangNguHanh dùng chung chỉ đọc)
 
     Raises:
         Exception: Description
     """
-    if tenHanh in ["Kim", "K"]:
-        return {"id": 1, "tenHanh": "Kim", "cuc": 4, "tenCuc": "Kim tứ Cục",
-                "css": "hanhKim"}
-    elif tenHanh == "Moc" or tenHanh == "M":
-        return {"id": 2, "tenHanh": "Mộc", "cuc": 3, "tenCuc": "Mộc tam Cục",
-                "css": "hanhMoc"}
-    elif tenHanh == "Thuy" or tenHanh == "T":
-        return {"id": 3, "tenHanh": "Thủy", "cuc": 2, "tenCuc": "Thủy nhị Cục",
-                "css": "hanhThuy"}
-    elif tenHanh == "Hoa" or tenHanh == "H":
-        return {"id": 4, "tenHanh": "Hỏa", "cuc": 6, "tenCuc": "Hỏa lục Cục",
-                "css": "hanhHoa"}
-    elif tenHanh == "Tho" or tenHanh == "O":
-        return {"id": 5, "tenHanh": "Thổ", "cuc": 5, "tenCuc": "Thổ ngũ Cục",
-                "css": "hanhTho"}
-    else:
+    try:
+        return dict(bangNguHanh[tenHanh])
+    except (KeyError, TypeError):
         raise Exception(
             "Tên Hành phải thuộc Kim (K), Mộc (M), Thủy (T), \
              Hỏa (H) hoặc Thổ (O)")
 
 
+matranSinhKhac = (
+    (None, None, None, None, None, None),
+    (None, 0, -1, 1, -1j, 1j),
+    (None, -1j, 0, 1j, 1, -1),
+    (None, 1j, 1, 0, 1, -1j),
+    (None, -1, 1j, -1j, 0, 1),
+    (None, 1, -1j, -1, 1j, 0)
+)
+
+
 def sinhKhac(hanh1, hanh2):
     """
     Args:
@@ -347,17 +373,58 @@ def sinhKhac(hanh1, hanh2):
     Returns:
         TYPE: Description
     """
-    matranSinhKhac = [
-        [None, None, None, None, None, None],
-        [None, 0, -1, 1, -1j, 1j],
-        [None, -1j, 0, 1j, 1, -1],
-        [None, 1j, 1, 0, 1, -1j],
-        [None, -1, 1j, -1j, 0, 1],
-        [None, 1, -1j, -1, 1j, 0]
-    ]
     return matranSinhKhac[hanh1][hanh2]
 
 
+banMenh = MappingProxyType({
+    "K1": "HẢI TRUNG KIM",
+    "T1": "GIÁNG HẠ THỦY",
+    "H1": "TÍCH LỊCH HỎA",
+    "O1": "BÍCH THƯỢNG THỔ",
+    "M1": "TANG ÐỐ MỘC",
+    "T2": "ÐẠI KHÊ THỦY",
+    "H2": "LƯ TRUNG HỎA",
+    "O2": "THÀNH ÐẦU THỔ",
+    "M2": "TÒNG BÁ MỘC",
+    "K2": "KIM BẠCH KIM",
+    "H3": "PHÚ ÐĂNG HỎA",
+    "O3": "SA TRUNG THỔ",
+    "M3": "ÐẠI LÂM MỘC",
+    "K3": "BẠCH LẠP KIM",
+    "T3": "TRƯỜNG LƯU THỦY",
+    "K4": "SA TRUNG KIM",
+    "T4": "THIÊN HÀ THỦY",
+    "H4": "THIÊN THƯỢNG HỎA",
+    "O4": "LỘ BÀN THỔ",
+    "M4": "DƯƠNG LIỄU MỘC",
+    "T5": "TRUYỀN TRUNG THỦY",
+    "H5": "SƠN HẠ HỎA",
+    "O5": "ÐẠI TRẠCH THỔ",
+    "M5": "THẠCH LỰU MỘC",
+    "K5": "KIẾM PHONG KIM",
+    "H6": "SƠN ÐẦU HỎA",
+    "O6": "ỐC THƯỢNG THỔ",
+    "M6": "BÌNH ÐỊA MỘC",
+    "K6": "XOA XUYẾN KIM",
+    "T6": "ÐẠI HẢI THỦY"})
+
+matranNapAm = (
+    (0, "G", "Ất", "Bính", "Đinh", "Mậu", "Kỷ", "Canh", "Tân", "N", "Q"),
+    (1, "K1", False, "T1", False, "H1", False, "O1", False, "M1", False),
+    (2, False, "K1", False, "T1", False, "H1", False, "O1", False, "M1"),
+    (3, "T2", False, "H2", False, "O2", False, "M2", False, "K2", False),
+    (4, False, "T2", False, "H2", False, "O2", False, "M2", False, "K2"),
+    (5, "H3", False, "O3", False, "M3", False, "K3", False, "T3", False),
+    (6, False, "H3", False, "O3", False, "M3", False, "K3", False, "T3"),
+    (7, "K4", False, "T4", False, "H4", False, "O4", False, "M4", False),
+    (8, False, "K4", False, "T4", False, "H4", False, "O4", False, "M4"),
+    (9, "T5", False, "H5", False, "O5", False, "M5", False, "K5", False),
+    (10, False, "T5", False, "H5", False, "O5", False, "M5", False, "K5"),
+    (11, "H6", False, "O6", False, "M6", False, "K6", False, "T6", False),
+    (12, False, "H6", False, "O6", False, "M6", False, "K6", False, "T6")
+)
+
+
 def nguHanhNapAm(diaChi, thienCan, xuatBanMenh=False):
     """Sử dụng Ngũ Hành nạp âm để tính Hành của năm.
 
@@ -368,52 +435,6 @@ def nguHanhNapAm(diaChi, thienCan, xuatBanMenh=False):
     Returns:
         Trả về chữ viết tắt Hành của năm (K, T, H, O, M)
     """
-    banMenh = {
-        "K1": "HẢI TRUNG KIM",
-        "T1": "GIÁNG HẠ THỦY",
-        "H1": "TÍCH LỊCH HỎA",
-        "O1": "BÍCH THƯỢNG THỔ",
-        "M1": "TANG ÐỐ MỘC",
-        "T2": "ÐẠI KHÊ THỦY",
-        "H2": "LƯ TRUNG HỎA",
-        "O2": "THÀNH ÐẦU THỔ",
-        "M2": "TÒNG BÁ MỘC",
-        "K2": "KIM BẠCH KIM",
-        "H3": "PHÚ ÐĂNG HỎA",
-        "O3": "SA TRUNG THỔ",
-        "M3": "ÐẠI LÂM MỘC",
-        "K3": "BẠCH LẠP KIM",
-        "T3": "TRƯỜNG LƯU THỦY",
-        "K4": "SA TRUNG KIM",
-        "T4": "THIÊN HÀ THỦY",
-        "H4": "THIÊN THƯỢNG HỎA",
-        "O4": "LỘ BÀN THỔ",
-        "M4": "DƯƠNG LIỄU MỘC",
-        "T5": "TRUYỀN TRUNG THỦY",
-        "H5": "SƠN HẠ HỎA",
-        "O5": "ÐẠI TRẠCH THỔ",
-        "M5": "THẠCH LỰU MỘC",
-        "K5": "KIẾM PHONG KIM",
-        "H6": "SƠN ÐẦU HỎA",
-        "O6": "ỐC THƯỢNG THỔ",
-        "M6": "BÌNH ÐỊA MỘC",
-        "K6": "XOA XUYẾN KIM",
-        "T6": "ÐẠI HẢI THỦY"}
-    matranNapAm = [
-        [0, "G", "Ất", "Bính", "Đinh", "Mậu", "Kỷ", "Canh", "Tân", "N", "Q"],
-        [1, "K1", False, "T1", False, "H1", False, "O1", False, "M1", False],
-        [2, False, "K1", False, "T1", False, "H1", False, "O1", False, "M1"],
-        [3, "T2", False, "H2", False, "O2", False, "M2", False, "K2", False],
-        [4, False, "T2", False, "H2", False, "O2", False, "M2", False, "K2"],
-        [5, "H3", False, "O3", False, "M3", False, "K3", False, "T3", False],
-        [6, False, "H3", False, "O3", False, "M3", False, "K3", False, "T3"],
-        [7, "K4", False, "T4", False, "H4", False, "O4", False, "M4", False],
-        [8, False, "K4", False, "T4", False, "H4", False, "O4", False, "M4"],
-        [9, "T5", False, "H5", False, "O5", False, "M5", False, "K5", False],
-        [10, False, "T5", False, "H5", False, "O5", False, "M5", False, "K5"],
-        [11, "H6", False, "O6", False, "M6", False, "K6", False, "T6", False],
-        [12, False, "H6", False, "O6", False, "M6", False, "K6", False, "T6"]
-    ]
     try:
         nh = matranNapAm[diaChi][thienCan]
         if nh[0] in ["K", "M", "T", "H", "O"]:
@@ -449,6 +470,28 @@ def timCuc(viTriCungMenhTrenDiaBan, canNamSinh):
     return nguHanhNapAm(viTriCungMenhTrenDiaBan, canThangMenh)
 
 
+def _timTuViVongLap(cuc, ngaySinhAmLich):
+    # Cách tìm Tử vi gốc: từ cung Dần đếm theo số cục cho tới ngày sinh.
+    # Chỉ dùng để sinh bangTuVi và cho các ngày nằm ngoài 1 - 30.
+    cungDan = 3  # Vị trí cung Dần ban đầu là 3
+    cucBanDau = cuc
+    while cuc < ngaySinhAmLich:
+        cuc += cucBanDau
+        cungDan += 1  # Dịch vị trí cung Dần
+    saiLech = cuc - ngaySinhAmLich
+    if saiLech % 2 == 1:
+        saiLech = -saiLech  # Nếu sai lệch là chẵn thì tiến, lẻ thì lùi
+    return dichCung(cungDan, saiLech)
+
+
+# bangTuVi[cuc][ngaySinhAmLich]: vị trí Tử vi theo số cục (2 - 6) và ngày
+# sinh âm lịch (1 - 30)
+bangTuVi = tuple(
+    (None,) + tuple(_timTuViVongLap(cuc, ngay) for ngay in range(1, 31))
+    if cuc in (2, 3, 4, 5, 6) else None
+    for cuc in range(7))
+
+
 def timTuVi(cuc, ngaySinhAmLich):
     """Tìm vị trí của sao Tử vi
 
@@ -462,17 +505,16 @@ def timTuVi(cuc, ngaySinhAmLich):
     Raises:
         Exception: Description
     """
-    cungDan = 3  # Vị trí cung Dần ban đầu là 3
-    cucBanDau = cuc
     if cuc not in [2, 3, 4, 5, 6]:  # Tránh trường hợp infinite loop
         raise Exception("Số cục phải là 2, 3, 4, 5, 6")
-    while cuc < ngaySinhAmLich:
-        cuc += cucBanDau
-        cungDan += 1  # Dịch vị trí cung Dần
-    saiLech = cuc - ngaySinhAmLich
-    if saiLech % 2 == 1:
-        saiLech = -saiLech  # Nếu sai lệch là chẵn thì tiến, lẻ thì lùi
-    return dichCung(cungDan, saiLech)
+    if 1 <= ngaySinhAmLich <= 30:
+        return bangTuVi[cuc][ngaySinhAmLich]
+    return _timTuViVongLap(cuc, ngaySinhAmLich)
+
+
+# Vị trí Tràng sinh theo số cục: Thủy nhị cục, Thổ ngũ cục ở Thân, Mộc tam
+# cục ở Hợi, Kim tứ cục ở Tỵ, Hỏa lục cục ở Dần
+bangTrangSinh = (None, None, 9, 12, 6, 9, 3)
 
 
 def timTrangSinh(cucSo):
@@ -491,134 +533,128 @@ def timTrangSinh(cucSo):
     Raises:
         Exception: Description
     """
-    if cucSo == 6:  # Hỏa lục cục
-        return 3  # Tràng sinh ở Dần
-    elif cucSo == 4:  # Kim tứ cục
-        return 6  # Tràng sinh ở Tỵ
-    elif cucSo == 2 or cucSo == 5:  # Thủy nhị cục, Thổ ngũ cục
-        return 9  # Tràng sinh ở Thân
-    elif cucSo == 3:  # Mộc tam cục
-        return 12  # Tràng sinh ở Hợi
-    else:
-        # print cucSo
-        raise Exception("Không tìm được cung an sao Trường sinh")
+    if cucSo in [2, 3, 4, 5, 6]:
+        return bangTrangSinh[cucSo]
+    raise Exception("Không tìm được cung an sao Trường sinh")
+
+
+# Cung khởi Hỏa tinh, Linh tinh theo chi năm sinh
+khoiCungHoaLinh = (None, (3, 11), (11, 4), (2, 4), (10, 11), (3, 11),
+                   (11, 4), (2, 4), (10, 11), (3, 11), (11, 4), (2, 4),
+                   (10, 11))
+
+
+def _timHoaLinh(khoiCung, gioSinh, chieu):
+    khoiCungHoaTinh, khoiCungLinhTinh = khoiCung
+    if chieu == -1:
+        return (dichCung(khoiCungHoaTinh + 1, (-1) * gioSinh),
+                dichCung(khoiCungLinhTinh - 1, gioSinh))
+    return (dichCung(khoiCungHoaTinh - 1, gioSinh),
+            dichCung(khoiCungLinhTinh + 1, (-1) * gioSinh))
+
+
+# bangHoaLinh[chieu][chiNamSinh][gioSinh], chieu = gioiTinh * amDuongNamSinh
+# (1: thuận, -1: nghịch)
+bangHoaLinh = {
+    chieu: tuple(
+        None if khoiCung is None else
+        (None,) + tuple(_timHoaLinh(khoiCung, gio, chieu)
+                        for gio in range(1, 13))
+        for khoiCung in khoiCungHoaLinh)
+    for chieu in (1, -1)
+}
 
 
 def timHoaLinh(chiNamSinh, gioSinh, gioiTinh, amDuongNamSinh):
-    if chiNamSinh in [3, 7, 11]:
-        khoiCungHoaTinh = 2
-        khoiCungLinhTinh = 4
-    elif chiNamSinh in [1, 5, 9]:
-        khoiCungHoaTinh = 3
-        khoiCungLinhTinh = 11
-    elif chiNamSinh in [6, 10, 2]:
-        khoiCungHoaTinh = 11
-        khoiCungLinhTinh = 4
-    elif chiNamSinh in [12, 4, 8]:
-        khoiCungHoaTinh = 10
-        khoiCungLinhTinh = 11
-    else:
+    if not 1 <= chiNamSinh <= 12:
         raise Exception("Không thể khởi cung tìm Hỏa-Linh")
-    # print khoiCungHoaTinh, khoiCungLinhTinh
+    chieu = gioiTinh * amDuongNamSinh
+    if 1 <= gioSinh <= 12:
+        return list(bangHoaLinh[chieu][chiNamSinh][gioSinh])
+    return list(_timHoaLinh(khoiCungHoaLinh[chiNamSinh], gioSinh, chieu))
 
-    if (gioiTinh * amDuongNamSinh) == -1:
-        viTriHoaTinh = dichCung(khoiCungHoaTinh + 1, (-1) * gioSinh)
-        viTriLinhTinh = dichCung(khoiCungLinhTinh - 1, gioSinh)
-    elif (gioiTinh * amDuongNamSinh) == 1:
-        viTriHoaTinh = dichCung(khoiCungHoaTinh - 1, gioSinh)
-        viTriLinhTinh = dichCung(khoiCungLinhTinh + 1, (-1) * gioSinh)
 
-    return [viTriHoaTinh, viTriLinhTinh]
+# Vị trí Thiên khôi theo can năm
+khoiViet = (None, 2, 1, 12, 10, 8, 1, 8, 7, 6, 4)
 
 
 def timThienKhoi(canNam):
-    khoiViet = [None, 2, 1, 12, 10, 8, 1, 8, 7, 6, 4]
     try:
         return khoiViet[canNam]
     except:
         raise Exception("Không tìm được vị trí Khôi-Việt")
 
 
+# Giáp dương Nhâm khuyển Ất long nghi
+# Mậu thổ Canh chư Quý mã thượng
+# Kỳ nhân quý hiển khả tiên tri
+thienQuan = (None, 8, 5, 6, 3, 4, 10, 12, 10, 11, 7)
+
+# Giáp ái kim kê Ất ái hầu
+# Đinh chư Bính thử Kỷ hổ đầu
+# Tân quý phùng xà phúc lộc nhiêu
+thienPhuc = (None, 10, 9, 1, 12, 4, 3, 7, 6, 7, 6)
+
+
 def timThienQuanThienPhuc(canNam):
-    # Giáp dương Nhâm khuyển Ất long nghi
-    # Mậu thổ Canh chư Quý mã thượng
-    # Kỳ nhân quý hiển khả tiên tri
-    thienQuan = [None, 8, 5, 6, 3, 4, 10, 12, 10, 11, 7]
-
-    # Giáp ái kim kê Ất ái hầu
-    # Đinh chư Bính thử Kỷ hổ đầu
-    # Tân quý phùng xà phúc lộc nhiêu
-    thienPhuc = [None, 10, 9, 1, 12, 4, 3, 7, 6, 7, 6]
     try:
         return thienQuan[canNam], thienPhuc[canNam]
     except:
         raise Exception("Không tìm được Quan-Phúc")
 
 
+# Cô thần theo chi năm: Hợi Tý Sửu ở Dần, Dần Mão Thìn ở Tỵ,
+# Tỵ Ngọ Mùi ở Thân, Thân Dậu Tuất ở Hợi
+bangCoThan = (12, 3, 3, 6, 6, 6, 9, 9, 9, 12, 12, 12, 3)
+
+
 def timCoThan(chiNam):
-    if chiNam in [12, 1, 2]:
-        return 3
-    elif chiNam in [3, 4, 5]:
-        return 6
-    elif chiNam in [6, 7, 8]:
-        return 9
-    else:
-        return 12
+    if 1 <= chiNam <= 12:
+        return bangCoThan[chiNam]
+    return 12
+
+
+# Thiên mã theo chiNam % 4: Dần Ngọ Tuất ở Thân, Thân Tý Thìn ở Dần,
+# Tỵ Dậu Sửu ở Hợi, Hợi Mão Mùi ở Tỵ
+bangThienMa = (6, 3, 12, 9)
 
 
 def timThienMa(chiNam):
-    demNghich = chiNam % 4
-    if demNghich == 1:
-        return 3
-    elif demNghich == 2:
-        return 12
-    elif demNghich == 3:
-        return 9
-    elif demNghich == 0:
-        return 6
-    else:
+    try:
+        return bangThienMa[chiNam % 4]
+    except:
         raise Exception("Không tìm được Thiên mã")
 
 
+# Phá toái theo chiNam % 3
+bangPhaToai = (6, 10, 2)
+
+
 def timPhaToai(chiNam):
-    demNghich = chiNam % 3
-    if demNghich == 0:
-        return 6
-    elif demNghich == 1:
-        return 10
-    elif demNghich == 2:
-        return 2
-    else:
+    try:
+        return bangPhaToai[chiNam % 3]
+    except:
         raise Exception("Không tìm được Phá toái")
 
 
-def timTriet(canNam):
-    # Giáp Kỷ, Thân Dậu cung
-    if canNam in [1, 6]:
-        return 9, 10
+# Triệt theo can năm:
+# Giáp Kỷ, Thân Dậu cung; Ất Canh, Ngọ Mùi cung; Bính Tân, Thìn Tị cung;
+# Đinh Nhâm, Dần Mão cung; Mậu Quý, Tý Sửu cung
+bangTriet = (None, (9, 10), (7, 8), (5, 6), (3, 4), (1, 2), (9, 10), (7, 8),
+             (5, 6), (3, 4), (1, 2))
 
-    # Ất Canh, Ngọ Mùi cung
-    elif canNam in [2, 7]:
-        return 7, 8
 
-    # Bính Tân, Thìn Tị cung
-    elif canNam in [3, 8]:
-        return 5, 6
+def timTriet(canNam):
+    if canNam in [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]:
+        return bangTriet[canNam]
+    raise Exception("Không tìm được Triệt")
 
-    # Đinh Nhâm, Dần Mão cung
-    elif canNam in [4, 9]:
-        return 3, 4
 
-    # Mậu Quý, Tý Sửu cung
-    elif canNam in [5, 10]:
-        return 1, 2
-    else:
-        raise Exception("Không tìm được Triệt")
+maTranLuuHa = (None, 10, 11, 8, 5, 6, 7, 9, 4, 12, 3)
+maTranThienTru = (None, 6, 7, 1, 6, 7, 9, 3, 7, 10, 11)
 
 
 def timLuuTru(canNam):
-    maTranLuuHa = [None, 10, 11, 8, 5, 6, 7, 9, 4, 12, 3]
-    maTranThienTru = [None, 6, 7, 1, 6, 7, 9, 3, 7, 10, 11]
     try:
         return maTranLuuHa[canNam], maTranThienTru[canNam]
     except:
@@ -3,151 +3,173 @@
 (c) 2016 doanguyen <dungnv2410@gmail.com>.
 """
 
+from collections.abc import Sequence
+from types import MappingProxyType
+
 from lasotuvi.AmDuong import diaChi, dichCung, khoangCachCung
+from lasotuvi.Sao import SaoCung, danhMucSao
+
+hanhCung = (None, "Thủy", "Thổ", "Mộc", "Mộc", "Thổ", "Hỏa",
+            "Hỏa", "Thổ", "Kim", "Kim", "Thổ", "Thủy")
+
+
+# Tên 12 cung chức theo thứ tự tính từ cung Mệnh
+tenCungChu = ("Mệnh", "Phụ mẫu", "Phúc đức", "Điền trạch", "Quan lộc",
+              "Nô bộc", "Thiên di", "Tật Ách", "Tài Bạch", "Tử tức",
+              "Phu thê", "Huynh đệ")
 
 
 class cungDiaBan(object):
-    """docstring for cungDiaBan"""
-    def __init__(self, cungID):
-        # super(cungDiaBan, self).__init__()
-        hanhCung = [None, "Thủy", "Thổ", "Mộc", "Mộc", "Thổ", "Hỏa",
-                    "Hỏa", "Thổ", "Kim", "Kim", "Thổ", "Thủy"]
+    """Một cung trên địa bàn.
+
+    Cung chỉ giữ địa bàn và số cung; sao, cung chủ, đại hạn, tiểu hạn,
+    Tuần, Triệt được đọc và ghi vào các mảng của diaBan.
+    """
+    __slots__ = ("diaBan", "cungSo")
+
+    def __init__(self, diaBan, cungID):
+        self.diaBan = diaBan
         self.cungSo = cungID
-        self.hanhCung = hanhCung[cungID]
-        self.cungSao = []
-        self.cungAmDuong = -1 if (self.cungSo % 2 == 0) else 1
-        self.cungTen = diaChi[self.cungSo]['tenChi']
-        self.cungThan = False
 
-    def themSao(self, sao):
-        dacTinhSao(self.cungSo, sao)
-        self.cungSao.append(sao.__dict__)
-        return self
+    @property
+    def hanhCung(self):
+        return hanhCung[self.cungSo]
+
+    @property
+    def cungAmDuong(self):
+        return -1 if (self.cungSo % 2 == 0) else 1
+
+    @property
+    def cungTen(self):
+        return diaChi[self.cungSo]['tenChi']
+
+    @property
+    def cungSao(self):
+        return self.diaBan.saoTrongCung(self.cungSo)
+
+    @property
+    def cungChu(self):
+        cungChuId = self.diaBan.cungChuCung[self.cungSo]
+        if cungChuId is None:
+            raise AttributeError("cungChu")
+        return tenCungChu[cungChuId]
+
+    @cungChu.setter
+    def cungChu(self, tenCung):
+        self.diaBan.cungChuCung[self.cungSo] = tenCungChu.index(tenCung)
+
+    @property
+    def cungDaiHan(self):
+        daiHan = self.diaBan.daiHanCung[self.cungSo]
+        if daiHan is None:
+            raise AttributeError("cungDaiHan")
+        return daiHan
+
+    @property
+    def cungTieuHan(self):
+        tieuHan = self.diaBan.tieuHanCung[self.cungSo]
+        if tieuHan is None:
+            raise AttributeError("cungTieuHan")
+        return diaChi[tieuHan + 1]['tenChi']
+
+    @property
+    def cungThan(self):
+        return bool(self.diaBan.cungThanBits >> self.cungSo & 1)
+
+    @property
+    def tuanTrung(self):
+        return bool(self.diaBan.tuanBits >> self.cungSo & 1)
+
+    @property
+    def trietLo(self):
+        return bool(self.diaBan.trietBits >> self.cungSo & 1)
 
-    def cungChu(self, tenCungChu):
-        self.cungChu = tenCungChu
+    def themSao(self, sao):
+        self.diaBan.saoBits[self.cungSo] |= 1 << sao.saoID
         return self
 
     def daiHan(self, daiHan):
-        self.cungDaiHan = daiHan
+        self.diaBan.daiHanCung[self.cungSo] = daiHan
         return self
 
     def tieuHan(self, tieuHan):
-        self.cungTieuHan = diaChi[tieuHan + 1]['tenChi']
+        self.diaBan.tieuHanCung[self.cungSo] = tieuHan
         return self
 
     def anCungThan(self):
-        self.cungThan = True
+        self.diaBan.cungThanBits |= 1 << self.cungSo
 
     def anTuan(self):
-        self.tuanTrung = True
+        self.diaBan.tuanBits |= 1 << self.cungSo
 
     def anTriet(self):
-        self.trietLo = True
+        self.diaBan.trietBits |= 1 << self.cungSo
+
+
+class thapNhiCung(Sequence):
+    """13 cung (0 - 12) của một địa bàn, cung 0 không dùng."""
+    __slots__ = ("diaBan",)
+
+    def __init__(self, diaBan):
+        self.diaBan = diaBan
+
+    def __getitem__(self, cungSo):
+        if isinstance(cungSo, slice):
+            return [cungDiaBan(self.diaBan, i) for i in range(13)[cungSo]]
+        return cungDiaBan(self.diaBan, range(13)[cungSo])
+
+    def __len__(self):
+        return 13
 
 
 class diaBan(object):
+    """Địa bàn lá số ở dạng gọn.
+
+    Mỗi cung chỉ lưu một số nguyên bitset các saoID (saoBits), cung chủ
+    (chỉ số trong tenCungChu), đại hạn và tiểu hạn; cung Thân, Tuần, Triệt là
+    bitset theo số cung. Đặc tính của sao được tra từ bangSaoCung. Truy cập
+    kiểu cũ qua thapNhiCung[i].cungSao, cungTen, cungChu,... vẫn dùng được.
+    """
+    __slots__ = ("thangSinhAmLich", "gioSinhAmLich", "cungThan", "cungMenh",
+                 "cungNoboc", "cungTatAch", "saoBits", "cungChuCung",
+                 "daiHanCung", "tieuHanCung", "cungThanBits", "tuanBits",
+                 "trietBits")
+
     def __init__(self, thangSinhAmLich, gioSinhAmLich):
         super(diaBan, self).__init__()
         self.thangSinhAmLich = thangSinhAmLich
         self.gioSinhAmLich = gioSinhAmLich
-        self.thapNhiCung = [cungDiaBan(i) for i in range(13)]
+        self.saoBits = [0] * 13
+        self.cungChuCung = [None] * 13
+        self.daiHanCung = [None] * 13
+        self.tieuHanCung = [None] * 13
+        self.cungThanBits = self.tuanBits = self.trietBits = 0
         self.nhapCungChu()
         self.nhapCungThan()
 
-    def cungChu(self, thangSinhAmLich, gioSinhAmLich):
+    @property
+    def thapNhiCung(self):
+        return thapNhiCung(self)
+
+    def anCungMenhThan(self, thangSinhAmLich, gioSinhAmLich):
         self.cungThan = dichCung(3, thangSinhAmLich - 1, gioSinhAmLich - 1)
         self.cungMenh = dichCung(3, thangSinhAmLich - 1, - (gioSinhAmLich) + 1)
-        cungPhuMau = dichCung(self.cungMenh, 1)
-        cungPhucDuc = dichCung(self.cungMenh, 2)
-        cungDienTrach = dichCung(self.cungMenh, 3)
-        cungQuanLoc = dichCung(self.cungMenh, 4)
         self.cungNoboc = dichCung(self.cungMenh, 5)  # Để an sao Thiên thương
-        cungThienDi = dichCung(self.cungMenh, 6)
         self.cungTatAch = dichCung(self.cungMenh, 7)  # an sao Thiên sứ
-        cungTaiBach = dichCung(self.cungMenh, 8)
-        cungTuTuc = dichCung(self.cungMenh, 9)
-        cungTheThiep = dichCung(self.cungMenh, 10)
-        cungHuynhDe = dichCung(self.cungMenh, 11)
-
-        cungChuThapNhiCung = [
-            {
-                'cungId': 1,
-                'tenCung': "Mệnh",
-                'cungSoDiaBan': self.cungMenh
-            },
-            {
-                'cungId': 2,
-                'tenCung': "Phụ mẫu",
-                'cungSoDiaBan': cungPhuMau
-
-            },
-            {
-                'cungId': 3,
-                'tenCung': "Phúc đức",
-                'cungSoDiaBan': cungPhucDuc
 
-            },
-            {
-                'cungId': 4,
-                'tenCung': "Điền trạch",
-                'cungSoDiaBan': cungDienTrach
-
-            },
-            {
-                'cungId': 5,
-                'tenCung': "Quan lộc",
-                'cungSoDiaBan': cungQuanLoc
-
-            },
-            {
-                'cungId': 6,
-                'tenCung': "Nô bộc",
-                'cungSoDiaBan': self.cungNoboc
-
-            },
-            {
-                'cungId': 7,
-                'tenCung': "Thiên di",
-                'cungSoDiaBan': cungThienDi
-
-            },
-            {
-                'cungId': 8,
-                'tenCung': "Tật Ách",
-                'cungSoDiaBan': self.cungTatAch
-
-            },
-            {
-                'cungId': 9,
-                'tenCung': "Tài Bạch",
-                'cungSoDiaBan': cungTaiBach
-
-            },
-            {
-                'cungId': 10,
-                'tenCung': "Tử tức",
-                'cungSoDiaBan': cungTuTuc
-
-            },
-            {
-                'cungId': 11,
-                'tenCung': "Phu thê",
-                'cungSoDiaBan': cungTheThiep
-
-            },
+    def cungChu(self, thangSinhAmLich, gioSinhAmLich):
+        self.anCungMenhThan(thangSinhAmLich, gioSinhAmLich)
+        return [
             {
-                'cungId': 12,
-                'tenCung': "Huynh đệ",
-                'cungSoDiaBan': cungHuynhDe
-
-            }
-        ]
-        return cungChuThapNhiCung
+                'cungId': i + 1,
+                'tenCung': tenCung,
+                'cungSoDiaBan': dichCung(self.cungMenh, i)
+            } for i, tenCung in enumerate(tenCungChu)]
 
     def nhapCungChu(self):
-        for cung in self.cungChu(self.thangSinhAmLich, self.gioSinhAmLich):
-            self.thapNhiCung[cung['cungSoDiaBan']].cungChu(cung['tenCung'])
+        self.anCungMenhThan(self.thangSinhAmLich, self.gioSinhAmLich)
+        for i in range(12):
+            self.cungChuCung[(self.cungMenh + i - 1) % 12 + 1] = i
         return self
 
     def nhapDaiHan(self, cucSo, gioiTinh):
@@ -160,9 +182,9 @@ class diaBan(object):
         Returns:
             TYPE: Description
         """
-        for cung in self.thapNhiCung:
-            khoangCach = khoangCachCung(cung.cungSo, self.cungMenh, gioiTinh)
-            cung.daiHan(cucSo + khoangCach * 10)
+        for cungSo in range(13):
+            khoangCach = khoangCachCung(cungSo, self.cungMenh, gioiTinh)
+            self.daiHanCung[cungSo] = cucSo + khoangCach * 10
         return self
 
     def nhapTieuHan(self, khoiTieuHan, gioiTinh, chiNam):
@@ -171,93 +193,170 @@ class diaBan(object):
         viTriCungTy1 = dichCung(khoiTieuHan, -gioiTinh * (chiNam - 1))
 
         # Tiếp đó là nhập hạn
-        for cung in self.thapNhiCung:
-            khoangCach = khoangCachCung(cung.cungSo, viTriCungTy1, gioiTinh)
-            cung.tieuHan(khoangCach)
+        for cungSo in range(13):
+            self.tieuHanCung[cungSo] = \
+                khoangCachCung(cungSo, viTriCungTy1, gioiTinh)
         return self
 
     def nhapCungThan(self):
-        self.thapNhiCung[self.cungThan].anCungThan()
+        self.cungThanBits |= 1 << self.cungThan
 
     def nhapSao(self, cungSo, *args):
         for sao in args:
-            self.thapNhiCung[cungSo].themSao(sao)
+            self.saoBits[cungSo] |= 1 << sao.saoID
         return self
 
     def nhapTuan(self, *args):
         for cung in args:
-            self.thapNhiCung[cung].anTuan()
+            self.tuanBits |= 1 << cung
         return self
 
     def nhapTriet(self, *args):
         for cung in args:
-            self.thapNhiCung[cung].anTriet()
+            self.trietBits |= 1 << cung
         return self
 
+    def saoTrongCung(self, cungSo):
+        """Các sao trong cung, theo thứ tự an sao (thuTuAnSao).
+
+        Returns:
+            list: các bản ghi SaoCung (dùng chung, bất biến)
+        """
+        bits = self.saoBits[cungSo]
+        cacHang = []
+        while bits:
+            thap = bits & -bits
+            cacHang.append(_hangAnSao[thap.bit_length() - 1])
+            bits ^= thap
+        cacHang.sort()
+        return [bangSaoCung[_saoTheoHang[hang]][cungSo] for hang in cacHang]
+
+    def khoa(self):
+        """Toàn bộ nội dung địa bàn dưới dạng tuple, dùng để so sánh/băm."""
+        return (self.thangSinhAmLich, self.gioSinhAmLich, self.cungThan,
+                self.cungMenh, tuple(self.saoBits), tuple(self.cungChuCung),
+                tuple(self.daiHanCung), tuple(self.tieuHanCung),
+                self.cungThanBits, self.tuanBits, self.trietBits)
+
+    def __eq__(self, other):
+        if not isinstance(other, diaBan):
+            return NotImplemented
+        return self.khoa() == other.khoa()
+
+    def __hash__(self):
+        return hash(self.khoa())
+
+    def copy(self):
+        banSao = object.__new__(type(self))
+        for ten in diaBan.__slots__:
+            giaTri = getattr(self, ten)
+            setattr(banSao, ten,
+                    list(giaTri) if isinstance(giaTri, list) else giaTri)
+        return banSao
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+
+cacDacTinh = frozenset(("M", "V", "Đ", "B", "H"))
+
+# Đặc tính (Miếu, Vượng, Đắc, Bình, Hãm) của sao theo vị trí trên địa bàn
+maTranDacTinh = MappingProxyType({
+    1: ("Tử vi", "B", "Đ", "M", "B", "V", "M", "M", "Đ", "M", "B", "V",
+        "B"),
+    2: ("Liêm trinh", "V", "Đ", "V", "H", "M", "H", "V", "Đ", "V", "H",
+        "M", "H"),
+    3: ("Thiên đồng", "V", "H", "M", "Đ", "H", "Đ", "H", "H", "M", "H",
+        "H", "Đ"),
+    4: ("Vũ khúc", "V", "M", "V", "Đ", "M", "H", "V", "M", "V", "Đ", "M",
+        "H"),
+    5: ("Thái dương", "H", "Đ", "V", "V", "V", "M", "M", "Đ", "H", "H",
+        "H", "H"),
+    6: ("Thiên cơ", "Đ", "Đ", "H", "M", "M", "V", "Đ", "Đ", "V", "M", "M",
+        "H"),
+    8: ("Thái âm", "V", "Đ", "H", "H", "H", "H", "H", "Đ", "V", "M",
+        "M", "M"),
+    9: ("Tham lang", "H", "M", "Đ", "H", "V", "H", "H", "M", "Đ", "H",
+        "V", "H"),
+    10: ("Cự môn", "V", "H", "V", "M", "H", "H", "V", "H", "Đ", "M", "H",
+         "Đ"),
+    11: ("Thiên tướng", "V", "Đ", "M", "H", "V", "Đ", "V", "Đ", "M", "H",
+         "V", "Đ"),
+    12: ("Thiên lương", "V", "Đ", "V", "V", "M", "H", "M", "Đ", "V", "H",
+         "M", "H"),
+    13: ("Thất sát", "M", "Đ", "M", "H", "H", "V", "M", "Đ", "M", "H",
+         "H", "V"),
+    14: ("Phá quân", "M", "V", "H", "H", "Đ", "H", "M", "V", "H", "H",
+         "Đ", "H"),
+    51: ("Đà la", "H", "Đ", "H", "H", "Đ", "H", "H", "Đ", "H", "H", "Đ",
+         "H"),
+    52: ("Kình dương", "H", "Đ", "H", "H", "Đ", "H", "H", "Đ", "H", "H",
+         "Đ", "H"),
+    55: ("Linh tinh", "H", "H", "Đ", "Đ", "Đ", "Đ", "Đ", "H", "H", "H",
+         "H", "H"),
+    56: ("Hỏa tinh", "H", "H", "Đ", "Đ", "Đ", "Đ", "Đ", "H", "H", "H",
+         "H", "H"),
+    57: ("Văn xương", "H", "Đ", "H", "Đ", "H", "Đ", "H", "Đ", "H", "H",
+         "Đ", "Đ"),
+    58: ("Văn khúc", "H", "Đ", "H", "Đ", "H", "Đ", "H", "Đ", "H", "H",
+         "Đ", "Đ"),
+    53: ("Địa không", "H", "H", "Đ", "H", "H", "Đ", "H", "H", "Đ", "H",
+         "H", "Đ"),
+    54: ("Địa kiếp", "H", "H", "Đ", "H", "H", "Đ", "H", "H", "Đ", "H", "H",
+         "Đ"),
+    95: ("Hóa kỵ", None, "Đ", None, None, "Đ", None, None, "Đ", None, None,
+         "Đ", None),
+    36: ("Đại hao", None, None, "Đ", "Đ", None, None, None, None, "Đ", "Đ",
+         None, None),
+    30: ("Tiểu Hao", None, None, "Đ", "Đ", None, None, None, None, "Đ",
+         "Đ", None, None),
+    69: ("Thiên khốc", "Đ", "Đ", None, "Đ", None, None, "Đ", "Đ", None,
+         "Đ", None, None),
+    70: ("Thiên hư", "Đ", "Đ", None, "Đ", None, None, "Đ", "Đ", None, "Đ",
+         None, None),
+    98: ("Thiên mã", None, None, "Đ", None, None, "Đ", None, None, None,
+         None, None, None),
+    73: ("Thiên Hình", None, None, "Đ", "Đ", None, None, None, None, "Đ",
+         "Đ", None, None),
+    74: ("Thiên riêu", None, None, "Đ", "Đ", None, None, None, None, None,
+         "Đ", "Đ", None)
+})
+
 
 def dacTinhSao(viTriDiaBan, sao):
-    saoId = sao.saoID
-    maTranDacTinh = {
-        1: ["Tử vi", "B", "Đ", "M", "B", "V", "M", "M", "Đ", "M", "B", "V",
-            "B"],
-        2: ["Liêm trinh", "V", "Đ", "V", "H", "M", "H", "V", "Đ", "V", "H",
-            "M", "H"],
-        3: ["Thiên đồng", "V", "H", "M", "Đ", "H", "Đ", "H", "H", "M", "H",
-            "H", "Đ"],
-        4: ["Vũ khúc", "V", "M", "V", "Đ", "M", "H", "V", "M", "V", "Đ", "M",
-            "H"],
-        5: ["Thái dương", "H", "Đ", "V", "V", "V", "M", "M", "Đ", "H", "H",
-            "H", "H"],
-        6: ["Thiên cơ", "Đ", "Đ", "H", "M", "M", "V", "Đ", "Đ", "V", "M", "M",
-            "H"],
-        8: ["Thái âm", "V", "Đ", "H", "H", "H", "H", "H", "Đ", "V", "M",
-            "M", "M"],
-        9: ["Tham lang", "H", "M", "Đ", "H", "V", "H", "H", "M", "Đ", "H",
-            "V", "H"],
-        10: ["Cự môn", "V", "H", "V", "M", "H", "H", "V", "H", "Đ", "M", "H",
-             "Đ"],
-        11: ["Thiên tướng", "V", "Đ", "M", "H", "V", "Đ", "V", "Đ", "M", "H",
-             "V", "Đ"],
-        12: ["Thiên lương", "V", "Đ", "V", "V", "M", "H", "M", "Đ", "V", "H",
-             "M", "H"],
-        13: ["Thất sát", "M", "Đ", "M", "H", "H", "V", "M", "Đ", "M", "H",
-             "H", "V"],
-        14: ["Phá quân", "M", "V", "H", "H", "Đ", "H", "M", "V", "H", "H",
-             "Đ", "H"],
-        51: ["Đà la", "H", "Đ", "H", "H", "Đ", "H", "H", "Đ", "H", "H", "Đ",
-             "H"],
-        52: ["Kình dương", "H", "Đ", "H", "H", "Đ", "H", "H", "Đ", "H", "H",
-             "Đ", "H"],
-        55: ["Linh tinh", "H", "H", "Đ", "Đ", "Đ", "Đ", "Đ", "H", "H", "H",
-             "H", "H"],
-        56: ["Hỏa tinh", "H", "H", "Đ", "Đ", "Đ", "Đ", "Đ", "H", "H", "H",
-             "H", "H"],
-        57: ["Văn xương", "H", "Đ", "H", "Đ", "H", "Đ", "H", "Đ", "H", "H",
-             "Đ", "Đ"],
-        58: ["Văn khúc", "H", "Đ", "H", "Đ", "H", "Đ", "H", "Đ", "H", "H",
-             "Đ", "Đ"],
-        53: ["Địa không", "H", "H", "Đ", "H", "H", "Đ", "H", "H", "Đ", "H",
-             "H", "Đ"],
-        54: ["Địa kiếp", "H", "H", "Đ", "H", "H", "Đ", "H", "H", "Đ", "H", "H",
-             "Đ"],
-        95: ["Hóa kỵ", None, "Đ", None, None, "Đ", None, None, "Đ", None, None,
-             "Đ", None],
-        36: ["Đại hao", None, None, "Đ", "Đ", None, None, None, None, "Đ", "Đ",
-             None, None],
-        30: ["Tiểu Hao", None, None, "Đ", "Đ", None, None, None, None, "Đ",
-             "Đ", None, None],
-        69: ["Thiên khốc", "Đ", "Đ", None, "Đ", None, None, "Đ", "Đ", None,
-             "Đ", None, None],
-        70: ["Thiên hư", "Đ", "Đ", None, "Đ", None, None, "Đ", "Đ", None, "Đ",
-             None, None],
-        98: ["Thiên mã", None, None, "Đ", None, None, "Đ", None, None, None,
-             None, None, None],
-        73: ["Thiên Hình", None, None, "Đ", "Đ", None, None, None, None, "Đ",
-             "Đ", None, None],
-        74: ["Thiên riêu", None, None, "Đ", "Đ", None, None, None, None, None,
-             "Đ", "Đ", None],
-
-    }
-    if sao.saoID in maTranDacTinh.keys():
-        if maTranDacTinh[sao.saoID][viTriDiaBan] in ["M", "V", "Đ", "B", "H"]:
-            sao.anDacTinh(maTranDacTinh[sao.saoID][viTriDiaBan])
+    """Đặc tính của sao tại một vị trí trên địa bàn.
+
+    Returns:
+        str: M, V, Đ, B, H hoặc None nếu không xét đặc tính
+    """
+    dacTinh = maTranDacTinh.get(sao.saoID)
+    if dacTinh is not None and dacTinh[viTriDiaBan] in cacDacTinh:
+        return dacTinh[viTriDiaBan]
+    return None
+
+
+# bangSaoCung[saoID][cungSo]: bản ghi SaoCung (sao, cung, đặc tính) dùng chung
+# cho mọi lá số
+bangSaoCung = tuple(
+    None if saoID not in danhMucSao else
+    (None,) + tuple(SaoCung(danhMucSao[saoID], cungSo,
+                            dacTinhSao(cungSo, danhMucSao[saoID]))
+                    for cungSo in range(1, 13))
+    for saoID in range(max(danhMucSao) + 1))
+
+# Thứ tự các sao trong cungSao: thứ tự các lần nhapSao của lapDiaBan viết
+# tay trước khi có LuatAnSao, để danh sách sao trong cung không đổi theo cách
+# an. Sao không có ở đây xếp sau, theo saoID.
+thuTuAnSao = (
+    1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 27, 109, 28, 29, 30, 31, 32,
+    33, 34, 35, 36, 37, 38, 15, 16, 108, 17, 18, 19, 20, 72, 21, 22, 23, 24,
+    71, 25, 26, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 54, 53,
+    56, 55, 63, 64, 83, 61, 62, 58, 57, 65, 66, 67, 68, 59, 60, 70, 69, 86, 87,
+    79, 80, 100, 101, 73, 74, 75, 96, 97, 106, 77, 76, 84, 85, 81, 82, 90, 91,
+    88, 89, 98, 105, 104, 78, 99, 107, 94, 93, 92, 95, 102, 103)
+_hangAnSao = tuple(
+    thuTuAnSao.index(saoID) if saoID in thuTuAnSao else
+    len(thuTuAnSao) + saoID for saoID in range(len(bangSaoCung)))
+_saoTheoHang = {hang: saoID for saoID, hang in enumerate(_hangAnSao)}
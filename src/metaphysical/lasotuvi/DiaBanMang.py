@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+An sao cho nhiều lá số một lúc bằng mảng NumPy.
+
+Hầu hết các vị trí an sao là dichCung(gốc, khoảng dịch), tức phép cộng
+modulo 12 trên các số nguyên nhỏ suy ra từ ngày, tháng, năm âm lịch, giờ sinh
+và giới tính; phần còn lại là tra bảng theo can, chi năm hoặc số cục.
+lapDiaBanMang chạy bộ luật của LuatAnSao (anSaoMang) trên cả mảng N lá số
+như App.lapDiaBan chạy trên một lá số (anSao), và trả về ma trận
+(N x saoID) vị trí cung cùng ma trận đặc tính, không tạo đối tượng diaBan
+nào. Mỗi dòng trùng với lapDiaBan của lá số tương ứng (xem diaBanTaiDong).
+
+Dùng cho thống kê hoặc tính sẵn trên hàng triệu lá số, chạy offline: cần
+thư viện numpy, không có trong gói Lambda (xem requirements.txt).
+"""
+import functools
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from lasotuvi.DiaBan import bangSaoCung, cacDacTinh, diaBan
+from lasotuvi.Lich_HND import S2L_batch
+from lasotuvi.LuatAnSao import boLuatMacDinh
+from lasotuvi.LucThapHoaGiap import bangCuc, lucThapHoaGiap
+
+# Mã đặc tính trong ma trận dacTinhSao: 0 là không xét đặc tính
+tenDacTinh = (None, "M", "V", "Đ", "B", "H")
+
+SO_COT_SAO = len(bangSaoCung)
+
+DiaBanMang = namedtuple("DiaBanMang", [
+    "thangAm", "gioSinh", "gioiTinh", "cungMenh", "cungThan", "cucSo",
+    "viTriSao", "dacTinhSao", "daiHan", "tieuHan", "tuan", "triet"])
+DiaBanMang.__doc__ = """Kết quả của lapDiaBanMang, mỗi dòng là một lá số.
+
+    thangAm, gioSinh, gioiTinh, cungMenh, cungThan, cucSo: mảng (N,)
+    viTriSao: (N, SO_COT_SAO) int8, cung (1 - 12) của từng saoID, 0 là
+        không có sao đó
+    dacTinhSao: (N, SO_COT_SAO) int8, chỉ số trong tenDacTinh
+    daiHan, tieuHan: (N, 13) như diaBan.daiHanCung, diaBan.tieuHanCung
+    tuan, triet: (N, 2) hai cung Tuần, hai cung Triệt (0 nếu bộ luật không
+        an Tuần, Triệt)
+"""
+
+
+def _canNumpy():
+    if np is None:
+        raise ImportError("DiaBanMang cần thư viện numpy.")
+
+
+@functools.lru_cache(maxsize=None)
+def _bangTra():
+    _canNumpy()
+    bang = {}
+    bang["canNam"] = np.array([nam.canNam for nam in lucThapHoaGiap])
+    bang["chiNam"] = np.array([nam.chiNam for nam in lucThapHoaGiap])
+    bang["amDuongNam"] = np.array(
+        [nam.amDuongNamSinh for nam in lucThapHoaGiap])
+    bang["amDuongChiNam"] = np.array(
+        [nam.amDuongChiNamSinh for nam in lucThapHoaGiap])
+    bang["cucSo"] = np.array(
+        [[0] + [cuc.cucSo for cuc in hang[1:]] for hang in bangCuc])
+    maDacTinh = np.zeros((SO_COT_SAO, 13), dtype=np.int8)
+    for saoID, hang in enumerate(bangSaoCung):
+        for cungSo in range(1, 13):
+            if hang is not None and hang[cungSo].saoDacTinh in cacDacTinh:
+                maDacTinh[saoID, cungSo] = \
+                    tenDacTinh.index(hang[cungSo].saoDacTinh)
+    bang["dacTinh"] = maDacTinh
+    return bang
+
+
+def _dichCung(cungBanDau, *args):
+    # dichCung trên mảng: kết quả trong 1 - 12
+    return (cungBanDau + sum(args) - 1) % 12 + 1
+
+
+def _khoangCachCung(cung1, cung2, chieu):
+    return np.where(chieu == 1, (cung1 - cung2) % 12, (cung2 - cung1) % 12)
+
+
+def lapDiaBanMang(nn, tt, nnnn, gioSinh, gioiTinh, duongLich=True,
+                  timeZone=7, boLuat=None):
+    """Lập địa bàn cho N lá số (tham số như lapDiaBan nhưng là mảng).
+
+    Args:
+        nn, tt, nnnn (array_like): ngày, tháng, năm (dương lịch hoặc âm lịch)
+        gioSinh (array_like): chi giờ sinh 1 - 12
+        gioiTinh (array_like): 1 nam, -1 nữ
+        duongLich (bool): True nếu nn, tt, nnnn là dương lịch
+        timeZone (int): múi giờ khi đổi sang âm lịch
+        boLuat (BoLuatAnSao, optional): bộ luật an sao, mặc định
+            boLuatMacDinh
+
+    Returns:
+        DiaBanMang
+
+    Raises:
+        Exception: có phần tử nằm ngoài miền của lapDiaBan
+    """
+    _canNumpy()
+    nn, tt, nnnn, gioSinh, gioiTinh = np.broadcast_arrays(
+        *[np.asarray(x, dtype=np.int64).ravel()
+          for x in (nn, tt, nnnn, gioSinh, gioiTinh)])
+    if ((nn < 1) | (nn > 31) | (tt < 1) | (tt > 12)).any():
+        raise Exception("Ngày, tháng, năm không chính xác.")
+    if duongLich is True:
+        nn, tt, nnnn, _ = S2L_batch(nn, tt, nnnn, timeZone)
+    if ((gioSinh < 1) | (gioSinh > 12)).any():
+        raise Exception("Giờ sinh phải từ 1 (Tý) đến 12 (Hợi)")
+    if ((gioiTinh != 1) & (gioiTinh != -1)).any():
+        raise Exception("Giới tính phải là 1 (nam) hoặc -1 (nữ)")
+
+    if boLuat is None:
+        boLuat = boLuatMacDinh
+    bang = _bangTra()
+    n = len(nn)
+    viTriNam = (nnnn - 4) % 60
+    canNam = bang["canNam"][viTriNam]
+    chiNam = bang["chiNam"][viTriNam]
+    amDuongNamNu = gioiTinh * bang["amDuongNam"][viTriNam]
+
+    cungThan = _dichCung(3, tt - 1, gioSinh - 1)
+    cungMenh = _dichCung(3, tt - 1, -gioSinh + 1)
+    cucSo = bang["cucSo"][viTriNam, cungMenh]
+
+    # An sao theo bộ luật (LuatAnSao), kể cả Tuần, Triệt
+    viTriSao = np.zeros((n, SO_COT_SAO), dtype=np.int8)
+    viTri = boLuat.anSaoMang(nn, tt, gioSinh, gioiTinh, canNam, chiNam,
+                             amDuongNamNu, cucSo, cungMenh, cungThan,
+                             viTriSao)
+    # Bộ luật rút gọn (boLuat.theoNhom) không có Tuần, Triệt: để 0
+    tuan = np.stack(np.broadcast_arrays(
+        viTri.get("tuan1", 0), viTri.get("tuan2", 0), nn)[:2], axis=1)
+    triet = np.stack(np.broadcast_arrays(
+        viTri.get("triet1", 0), viTri.get("triet2", 0), nn)[:2], axis=1)
+
+    # Đại hạn, tiểu hạn của 13 cung (kể cả cung 0 như diaBan)
+    cacCung = np.arange(13)
+    chieuDaiHan = (gioiTinh * bang["amDuongChiNam"][viTriNam])[:, None]
+    daiHan = cucSo[:, None] + 10 * _khoangCachCung(
+        cacCung, cungMenh[:, None], chieuDaiHan)
+    khoiHan = _dichCung(11, -3 * (chiNam - 1))
+    cungTy = _dichCung(khoiHan, -gioiTinh * (chiNam - 1))
+    tieuHan = _khoangCachCung(cacCung, cungTy[:, None], gioiTinh[:, None])
+
+    dacTinhSao = bang["dacTinh"][np.arange(SO_COT_SAO), viTriSao]
+    return DiaBanMang(tt, gioSinh, gioiTinh, cungMenh, cungThan, cucSo,
+                      viTriSao, dacTinhSao, daiHan, tieuHan, tuan, triet)
+
+
+def diaBanTaiDong(mang, i, lopDiaBan=diaBan):
+    """Dựng địa bàn (như lapDiaBan) từ dòng i của lapDiaBanMang.
+
+    Args:
+        mang (DiaBanMang): kết quả của lapDiaBanMang
+        i (int): chỉ số dòng
+        lopDiaBan (type, optional): lớp địa bàn
+
+    Returns:
+        diaBan
+    """
+    db = lopDiaBan(int(mang.thangAm[i]), int(mang.gioSinh[i]))
+    saoBits = db.saoBits
+    for saoID, cungSo in enumerate(mang.viTriSao[i].tolist()):
+        if cungSo:
+            saoBits[cungSo] |= 1 << saoID
+    db.nhapTuan(*[c for c in mang.tuan[i].tolist() if c])
+    db.nhapTriet(*[c for c in mang.triet[i].tolist() if c])
+    db.daiHanCung[:] = mang.daiHan[i].tolist()
+    db.tieuHanCung[:] = mang.tieuHan[i].tolist()
+    return db
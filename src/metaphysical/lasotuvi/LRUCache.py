@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Bộ nhớ đệm LRU có giới hạn kích thước, an toàn khi dùng nhiều thread.
+
+Khác functools.lru_cache, LRUCache được dùng như một dict (get/put) nên
+người gọi tự chọn khóa chuẩn hóa và tự quyết định trả về bản sao; đồng
+thời đếm hit, miss, eviction và có thể tắt/bật khi đang chạy.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+
+def kichThuocTuMoiTruong(tenBien, macDinh):
+    """Kích thước cache đọc từ biến môi trường tenBien.
+
+    Args:
+        tenBien (str): tên biến môi trường, ví dụ "LASOTUVI_CHART_CACHE_SIZE"
+        macDinh (int): kích thước khi biến không được đặt hoặc rỗng
+
+    Returns:
+        int: kích thước, 0 là tắt cache
+
+    Raises:
+        Exception: giá trị không phải số nguyên không âm
+    """
+    giaTri = os.environ.get(tenBien, "").strip()
+    if not giaTri:
+        return macDinh
+    try:
+        kichThuoc = int(giaTri)
+    except ValueError:
+        kichThuoc = -1
+    if kichThuoc < 0:
+        raise Exception("%s phải là số nguyên không âm (0 là tắt cache), "
+                        "không phải %r" % (tenBien, giaTri))
+    return kichThuoc
+
+
+class LRUCache(object):
+    """Bộ nhớ đệm LRU.
+
+    Args:
+        maxsize (int): số phần tử tối đa, 0 hoặc âm là tắt cache
+    """
+
+    def __init__(self, maxsize=128):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = max(int(maxsize), 0)
+        self.enabled = self.maxsize > 0
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key, default=None):
+        """Giá trị của key (đánh dấu vừa dùng), hoặc default."""
+        if not self.enabled:
+            return default
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def disable(self):
+        """Tắt cache và bỏ các phần tử đang giữ."""
+        self.enabled = False
+        self.clear()
+
+    def enable(self, maxsize=None):
+        if maxsize is not None:
+            self.maxsize = max(int(maxsize), 0)
+        self.enabled = self.maxsize > 0
+
+    def info(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "enabled": self.enabled,
+        }
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
@@ -0,0 +1,1956 @@
+# -*- coding: utf-8 -*-
+"""
+Bảng âm lịch tính sẵn cho Lich_HND, múi giờ 7, năm 1800 - 2200.
+
+File được sinh tự động bởi `python -m lasotuvi.LichGen`, không sửa bằng tay.
+"""
+
+TIME_ZONE = 7
+YEAR_MIN = 1799
+YEAR_MAX = 2201
+NEW_MOON_K_MIN = -1237
+NEW_MOON_DAYS = (
+    2378491, 2378521, 2378551, 2378580, 2378610, 2378639, 2378669, 2378699,
+    2378728, 2378758, 2378787, 2378817, 2378846, 2378875, 2378905, 2378934,
+    2378964, 2378994, 2379023, 2379053, 2379082, 2379112, 2379142, 2379171,
+    2379201, 2379230, 2379260, 2379289, 2379318, 2379348, 2379377, 2379407,
+    2379436, 2379466, 2379496, 2379525, 2379555, 2379585, 2379614, 2379644,
+    2379673, 2379702, 2379732, 2379761, 2379791, 2379820, 2379850, 2379880,
+    2379909, 2379939, 2379969, 2379998, 2380028, 2380057, 2380086, 2380116,
+    2380145, 2380174, 2380204, 2380234, 2380263, 2380293, 2380323, 2380353,
+    2380382, 2380412, 2380441, 2380470, 2380500, 2380529, 2380558, 2380588,
+    2380617, 2380647, 2380677, 2380707, 2380736, 2380766, 2380796, 2380825,
+    2380854, 2380884, 2380913, 2380942, 2380972, 2381001, 2381031, 2381061,
+    2381090, 2381120, 2381150, 2381180, 2381209, 2381238, 2381268, 2381297,
+    2381326, 2381356, 2381385, 2381415, 2381444, 2381474, 2381504, 2381534,
+    2381563, 2381593, 2381622, 2381652, 2381681, 2381710, 2381740, 2381769,
+    2381799, 2381828, 2381858, 2381888, 2381917, 2381947, 2381977, 2382006,
+    2382036, 2382065, 2382095, 2382124, 2382153, 2382183, 2382212, 2382242,
+    2382271, 2382301, 2382331, 2382360, 2382390, 2382419, 2382449, 2382479,
+    2382508, 2382538, 2382567, 2382596, 2382626, 2382655, 2382685, 2382714,
+    2382744, 2382774, 2382803, 2382833, 2382863, 2382892, 2382922, 2382951,
+    2382980, 2383010, 2383039, 2383069, 2383098, 2383128, 2383157, 2383187,
+    2383217, 2383247, 2383276, 2383306, 2383335, 2383364, 2383394, 2383423,
+    2383452, 2383482, 2383511, 2383541, 2383571, 2383601, 2383630, 2383660,
+    2383690, 2383719, 2383748, 2383778, 2383807, 2383836, 2383866, 2383895,
+    2383925, 2383955, 2383984, 2384014, 2384044, 2384074, 2384103, 2384132,
+    2384162, 2384191, 2384220, 2384250, 2384279, 2384309, 2384338, 2384368,
+    2384398, 2384428, 2384457, 2384487, 2384516, 2384546, 2384575, 2384604,
+    2384634, 2384663, 2384693, 2384722, 2384752, 2384782, 2384811, 2384841,
+    2384871, 2384900, 2384930, 2384959, 2384988, 2385018, 2385047, 2385077,
+    2385106, 2385136, 2385165, 2385195, 2385225, 2385254, 2385284, 2385314,
+    2385343, 2385373, 2385402, 2385431, 2385461, 2385490, 2385520, 2385549,
+    2385579, 2385608, 2385638, 2385668, 2385697, 2385727, 2385757, 2385786,
+    2385816, 2385845, 2385874, 2385904, 2385933, 2385963, 2385992, 2386022,
+    2386051, 2386081, 2386111, 2386140, 2386170, 2386200, 2386229, 2386258,
+    2386288, 2386317, 2386346, 2386376, 2386405, 2386435, 2386465, 2386495,
+    2386524, 2386554, 2386584, 2386613, 2386642, 2386672, 2386701, 2386730,
+    2386760, 2386789, 2386819, 2386849, 2386878, 2386908, 2386938, 2386968,
+    2386997, 2387026, 2387056, 2387085, 2387114, 2387144, 2387173, 2387203,
+    2387232, 2387262, 2387292, 2387322, 2387351, 2387381, 2387410, 2387440,
+    2387469, 2387498, 2387528, 2387557, 2387587, 2387616, 2387646, 2387676,
+    2387705, 2387735, 2387765, 2387794, 2387824, 2387853, 2387882, 2387912,
+    2387941, 2387971, 2388000, 2388030, 2388059, 2388089, 2388119, 2388149,
+    2388178, 2388208, 2388237, 2388266, 2388296, 2388325, 2388355, 2388384,
+    2388414, 2388443, 2388473, 2388503, 2388532, 2388562, 2388591, 2388621,
+    2388650, 2388680, 2388709, 2388739, 2388768, 2388798, 2388827, 2388857,
+    2388886, 2388916, 2388945, 2388975, 2389005, 2389034, 2389064, 2389093,
+    2389123, 2389152, 2389182, 2389211, 2389241, 2389270, 2389300, 2389329,
+    2389359, 2389389, 2389418, 2389448, 2389478, 2389507, 2389536, 2389566,
+    2389595, 2389624, 2389654, 2389683, 2389713, 2389743, 2389772, 2389802,
+    2389832, 2389862, 2389891, 2389920, 2389950, 2389979, 2390008, 2390038,
+    2390067, 2390097, 2390126, 2390156, 2390186, 2390216, 2390245, 2390275,
+    2390304, 2390334, 2390363, 2390392, 2390422, 2390451, 2390481, 2390510,
+    2390540, 2390570, 2390600, 2390629, 2390659, 2390688, 2390718, 2390747,
+    2390776, 2390806, 2390835, 2390865, 2390894, 2390924, 2390954, 2390983,
+    2391013, 2391043, 2391072, 2391102, 2391131, 2391160, 2391190, 2391219,
+    2391249, 2391278, 2391308, 2391337, 2391367, 2391397, 2391426, 2391456,
+    2391486, 2391515, 2391544, 2391574, 2391603, 2391633, 2391662, 2391692,
+    2391721, 2391751, 2391780, 2391810, 2391840, 2391869, 2391899, 2391928,
+    2391958, 2391987, 2392017, 2392046, 2392076, 2392105, 2392135, 2392164,
+    2392194, 2392223, 2392253, 2392283, 2392312, 2392342, 2392371, 2392401,
+    2392430, 2392460, 2392489, 2392518, 2392548, 2392577, 2392607, 2392637,
+    2392666, 2392696, 2392726, 2392755, 2392785, 2392814, 2392844, 2392873,
+    2392902, 2392932, 2392961, 2392991, 2393020, 2393050, 2393080, 2393110,
+    2393139, 2393169, 2393198, 2393228, 2393257, 2393286, 2393316, 2393345,
+    2393375, 2393404, 2393434, 2393464, 2393494, 2393523, 2393553, 2393582,
+    2393612, 2393641, 2393670, 2393700, 2393729, 2393758, 2393788, 2393818,
+    2393847, 2393877, 2393907, 2393937, 2393966, 2393996, 2394025, 2394054,
+    2394084, 2394113, 2394142, 2394172, 2394202, 2394231, 2394261, 2394291,
+    2394320, 2394350, 2394380, 2394409, 2394438, 2394468, 2394497, 2394527,
+    2394556, 2394586, 2394615, 2394645, 2394674, 2394704, 2394734, 2394763,
+    2394793, 2394822, 2394852, 2394881, 2394911, 2394940, 2394970, 2394999,
+    2395029, 2395058, 2395088, 2395117, 2395147, 2395177, 2395206, 2395236,
+    2395265, 2395295, 2395324, 2395354, 2395383, 2395412, 2395442, 2395472,
+    2395501, 2395531, 2395560, 2395590, 2395620, 2395649, 2395679, 2395708,
+    2395738, 2395767, 2395796, 2395826, 2395855, 2395885, 2395914, 2395944,
+    2395974, 2396004, 2396033, 2396063, 2396092, 2396122, 2396151, 2396180,
+    2396210, 2396239, 2396269, 2396298, 2396328, 2396358, 2396387, 2396417,
+    2396447, 2396476, 2396506, 2396535, 2396564, 2396594, 2396623, 2396652,
+    2396682, 2396712, 2396741, 2396771, 2396801, 2396831, 2396860, 2396890,
+    2396919, 2396948, 2396978, 2397007, 2397036, 2397066, 2397096, 2397125,
+    2397155, 2397185, 2397215, 2397244, 2397274, 2397303, 2397332, 2397362,
+    2397391, 2397420, 2397450, 2397479, 2397509, 2397539, 2397569, 2397598,
+    2397628, 2397657, 2397687, 2397716, 2397746, 2397775, 2397804, 2397834,
+    2397863, 2397893, 2397923, 2397952, 2397982, 2398012, 2398041, 2398071,
+    2398100, 2398130, 2398159, 2398189, 2398218, 2398248, 2398277, 2398306,
+    2398336, 2398366, 2398395, 2398425, 2398455, 2398484, 2398514, 2398543,
+    2398573, 2398602, 2398632, 2398661, 2398690, 2398720, 2398749, 2398779,
+    2398809, 2398838, 2398868, 2398898, 2398927, 2398957, 2398986, 2399016,
+    2399045, 2399074, 2399104, 2399133, 2399163, 2399192, 2399222, 2399252,
+    2399281, 2399311, 2399341, 2399370, 2399400, 2399429, 2399458, 2399488,
+    2399517, 2399546, 2399576, 2399606, 2399635, 2399665, 2399695, 2399725,
+    2399754, 2399784, 2399813, 2399842, 2399872, 2399901, 2399930, 2399960,
+    2399989, 2400019, 2400049, 2400079, 2400109, 2400138, 2400168, 2400197,
+    2400226, 2400256, 2400285, 2400314, 2400344, 2400373, 2400403, 2400433,
+    2400463, 2400492, 2400522, 2400552, 2400581, 2400610, 2400640, 2400669,
+    2400698, 2400728, 2400757, 2400787, 2400817, 2400846, 2400876, 2400906,
+    2400935, 2400965, 2400994, 2401024, 2401053, 2401082, 2401112, 2401141,
+    2401171, 2401200, 2401230, 2401260, 2401289, 2401319, 2401349, 2401378,
+    2401408, 2401437, 2401467, 2401496, 2401525, 2401555, 2401584, 2401614,
+    2401643, 2401673, 2401703, 2401732, 2401762, 2401792, 2401821, 2401851,
+    2401880, 2401910, 2401939, 2401968, 2401998, 2402027, 2402057, 2402086,
+    2402116, 2402146, 2402175, 2402205, 2402235, 2402264, 2402294, 2402323,
+    2402352, 2402382, 2402411, 2402441, 2402470, 2402500, 2402529, 2402559,
+    2402589, 2402619, 2402648, 2402678, 2402707, 2402736, 2402766, 2402795,
+    2402824, 2402854, 2402883, 2402913, 2402943, 2402973, 2403003, 2403032,
+    2403062, 2403091, 2403120, 2403150, 2403179, 2403208, 2403238, 2403267,
+    2403297, 2403327, 2403357, 2403386, 2403416, 2403446, 2403475, 2403504,
+    2403534, 2403563, 2403592, 2403622, 2403651, 2403681, 2403711, 2403740,
+    2403770, 2403800, 2403829, 2403859, 2403888, 2403918, 2403947, 2403976,
+    2404006, 2404035, 2404065, 2404094, 2404124, 2404154, 2404184, 2404213,
+    2404243, 2404272, 2404302, 2404331, 2404360, 2404390, 2404419, 2404449,
+    2404478, 2404508, 2404538, 2404567, 2404597, 2404627, 2404656, 2404686,
+    2404715, 2404745, 2404774, 2404803, 2404833, 2404862, 2404892, 2404921,
+    2404951, 2404981, 2405010, 2405040, 2405069, 2405099, 2405129, 2405158,
+    2405188, 2405217, 2405246, 2405276, 2405305, 2405335, 2405364, 2405394,
+    2405424, 2405453, 2405483, 2405513, 2405542, 2405572, 2405601, 2405630,
+    2405660, 2405689, 2405718, 2405748, 2405778, 2405807, 2405837, 2405867,
+    2405897, 2405926, 2405956, 2405985, 2406014, 2406044, 2406073, 2406102,
+    2406132, 2406161, 2406191, 2406221, 2406251, 2406280, 2406310, 2406340,
+    2406369, 2406398, 2406428, 2406457, 2406486, 2406516, 2406545, 2406575,
+    2406605, 2406634, 2406664, 2406694, 2406724, 2406753, 2406782, 2406812,
+    2406841, 2406870, 2406900, 2406929, 2406959, 2406988, 2407018, 2407048,
+    2407078, 2407107, 2407137, 2407166, 2407196, 2407225, 2407254, 2407284,
+    2407313, 2407343, 2407372, 2407402, 2407432, 2407461, 2407491, 2407521,
+    2407550, 2407580, 2407609, 2407638, 2407668, 2407697, 2407727, 2407756,
+    2407786, 2407815, 2407845, 2407875, 2407904, 2407934, 2407963, 2407993,
+    2408022, 2408052, 2408081, 2408111, 2408140, 2408170, 2408199, 2408229,
+    2408258, 2408288, 2408318, 2408347, 2408377, 2408406, 2408436, 2408465,
+    2408495, 2408524, 2408554, 2408583, 2408613, 2408642, 2408672, 2408701,
+    2408731, 2408761, 2408790, 2408820, 2408850, 2408879, 2408908, 2408938,
+    2408967, 2408996, 2409026, 2409055, 2409085, 2409115, 2409145, 2409174,
+    2409204, 2409234, 2409263, 2409292, 2409322, 2409351, 2409380, 2409410,
+    2409439, 2409469, 2409499, 2409528, 2409558, 2409588, 2409618, 2409647,
+    2409676, 2409706, 2409735, 2409764, 2409794, 2409823, 2409853, 2409882,
+    2409912, 2409942, 2409972, 2410001, 2410031, 2410060, 2410090, 2410119,
+    2410148, 2410178, 2410207, 2410237, 2410266, 2410296, 2410326, 2410355,
+    2410385, 2410415, 2410444, 2410474, 2410503, 2410532, 2410562, 2410591,
+    2410621, 2410650, 2410680, 2410709, 2410739, 2410769, 2410798, 2410828,
+    2410858, 2410887, 2410916, 2410946, 2410975, 2411005, 2411034, 2411064,
+    2411093, 2411123, 2411153, 2411182, 2411212, 2411241, 2411271, 2411300,
+    2411330, 2411359, 2411389, 2411418, 2411448, 2411477, 2411507, 2411536,
+    2411566, 2411595, 2411625, 2411655, 2411684, 2411714, 2411743, 2411773,
+    2411802, 2411832, 2411861, 2411890, 2411920, 2411950, 2411979, 2412009,
+    2412039, 2412068, 2412098, 2412127, 2412157, 2412186, 2412216, 2412245,
+    2412274, 2412304, 2412333, 2412363, 2412393, 2412422, 2412452, 2412482,
+    2412511, 2412541, 2412570, 2412600, 2412629, 2412658, 2412688, 2412717,
+    2412747, 2412776, 2412806, 2412836, 2412866, 2412895, 2412925, 2412954,
+    2412984, 2413013, 2413042, 2413072, 2413101, 2413131, 2413160, 2413190,
+    2413220, 2413249, 2413279, 2413309, 2413338, 2413368, 2413397, 2413426,
+    2413456, 2413485, 2413515, 2413544, 2413574, 2413603, 2413633, 2413663,
+    2413693, 2413722, 2413752, 2413781, 2413810, 2413840, 2413869, 2413899,
+    2413928, 2413958, 2413987, 2414017, 2414047, 2414076, 2414106, 2414135,
+    2414165, 2414194, 2414224, 2414253, 2414283, 2414312, 2414342, 2414371,
+    2414401, 2414430, 2414460, 2414490, 2414519, 2414549, 2414578, 2414608,
+    2414637, 2414667, 2414696, 2414726, 2414755, 2414785, 2414814, 2414844,
+    2414873, 2414903, 2414933, 2414962, 2414992, 2415021, 2415051, 2415080,
+    2415110, 2415139, 2415168, 2415198, 2415227, 2415257, 2415287, 2415316,
+    2415346, 2415376, 2415405, 2415435, 2415464, 2415494, 2415523, 2415552,
+    2415582, 2415611, 2415641, 2415670, 2415700, 2415730, 2415760, 2415789,
+    2415819, 2415848, 2415878, 2415907, 2415936, 2415966, 2415995, 2416025,
+    2416054, 2416084, 2416114, 2416143, 2416173, 2416203, 2416232, 2416262,
+    2416291, 2416320, 2416350, 2416379, 2416408, 2416438, 2416468, 2416497,
+    2416527, 2416557, 2416587, 2416616, 2416646, 2416675, 2416704, 2416734,
+    2416763, 2416792, 2416822, 2416852, 2416881, 2416911, 2416941, 2416970,
+    2417000, 2417030, 2417059, 2417088, 2417118, 2417147, 2417176, 2417206,
+    2417236, 2417265, 2417295, 2417324, 2417354, 2417384, 2417413, 2417443,
+    2417472, 2417502, 2417531, 2417561, 2417590, 2417620, 2417649, 2417679,
+    2417708, 2417738, 2417767, 2417797, 2417827, 2417856, 2417886, 2417915,
+    2417945, 2417974, 2418004, 2418033, 2418062, 2418092, 2418121, 2418151,
+    2418181, 2418210, 2418240, 2418270, 2418299, 2418329, 2418358, 2418388,
+    2418417, 2418446, 2418476, 2418505, 2418535, 2418564, 2418594, 2418624,
+    2418654, 2418683, 2418713, 2418742, 2418772, 2418801, 2418830, 2418860,
+    2418889, 2418919, 2418948, 2418978, 2419008, 2419037, 2419067, 2419097,
+    2419126, 2419156, 2419185, 2419214, 2419244, 2419273, 2419302, 2419332,
+    2419362, 2419391, 2419421, 2419451, 2419481, 2419510, 2419540, 2419569,
+    2419598, 2419628, 2419657, 2419686, 2419716, 2419746, 2419775, 2419805,
+    2419835, 2419865, 2419894, 2419924, 2419953, 2419982, 2420012, 2420041,
+    2420070, 2420100, 2420129, 2420159, 2420189, 2420219, 2420248, 2420278,
+    2420307, 2420337, 2420366, 2420396, 2420425, 2420454, 2420484, 2420513,
+    2420543, 2420573, 2420602, 2420632, 2420662, 2420691, 2420721, 2420750,
+    2420780, 2420809, 2420839, 2420868, 2420897, 2420927, 2420956, 2420986,
+    2421016, 2421045, 2421075, 2421105, 2421134, 2421164, 2421193, 2421223,
+    2421252, 2421282, 2421311, 2421340, 2421370, 2421399, 2421429, 2421459,
+    2421488, 2421518, 2421548, 2421577, 2421607, 2421636, 2421666, 2421695,
+    2421724, 2421754, 2421783, 2421813, 2421842, 2421872, 2421902, 2421931,
+    2421961, 2421991, 2422020, 2422050, 2422079, 2422108, 2422138, 2422167,
+    2422196, 2422226, 2422256, 2422285, 2422315, 2422345, 2422375, 2422404,
+    2422434, 2422463, 2422492, 2422522, 2422551, 2422580, 2422610, 2422639,
+    2422669, 2422699, 2422729, 2422759, 2422788, 2422818, 2422847, 2422876,
+    2422906, 2422935, 2422964, 2422994, 2423023, 2423053, 2423083, 2423113,
+    2423142, 2423172, 2423202, 2423231, 2423260, 2423290, 2423319, 2423348,
+    2423378, 2423407, 2423437, 2423467, 2423496, 2423526, 2423556, 2423585,
+    2423615, 2423644, 2423674, 2423703, 2423732, 2423762, 2423791, 2423821,
+    2423850, 2423880, 2423910, 2423939, 2423969, 2423999, 2424028, 2424058,
+    2424087, 2424117, 2424146, 2424175, 2424205, 2424234, 2424264, 2424293,
+    2424323, 2424353, 2424382, 2424412, 2424442, 2424471, 2424501, 2424530,
+    2424560, 2424589, 2424618, 2424648, 2424677, 2424707, 2424736, 2424766,
+    2424796, 2424825, 2424855, 2424885, 2424914, 2424944, 2424973, 2425002,
+    2425032, 2425061, 2425091, 2425120, 2425150, 2425179, 2425209, 2425239,
+    2425269, 2425298, 2425328, 2425357, 2425386, 2425416, 2425445, 2425474,
+    2425504, 2425533, 2425563, 2425593, 2425623, 2425653, 2425682, 2425712,
+    2425741, 2425770, 2425800, 2425829, 2425858, 2425888, 2425917, 2425947,
+    2425977, 2426007, 2426036, 2426066, 2426096, 2426125, 2426154, 2426184,
+    2426213, 2426242, 2426272, 2426301, 2426331, 2426361, 2426390, 2426420,
+    2426450, 2426479, 2426509, 2426538, 2426568, 2426597, 2426626, 2426656,
+    2426685, 2426715, 2426744, 2426774, 2426804, 2426834, 2426863, 2426893,
+    2426922, 2426952, 2426981, 2427010, 2427040, 2427069, 2427099, 2427128,
+    2427158, 2427188, 2427217, 2427247, 2427276, 2427306, 2427336, 2427365,
+    2427394, 2427424, 2427453, 2427483, 2427512, 2427542, 2427571, 2427601,
+    2427631, 2427660, 2427690, 2427719, 2427749, 2427779, 2427808, 2427837,
+    2427867, 2427896, 2427926, 2427955, 2427985, 2428014, 2428044, 2428074,
+    2428103, 2428133, 2428163, 2428192, 2428222, 2428251, 2428280, 2428310,
+    2428339, 2428368, 2428398, 2428428, 2428457, 2428487, 2428517, 2428546,
+    2428576, 2428606, 2428635, 2428664, 2428694, 2428723, 2428752, 2428782,
+    2428811, 2428841, 2428871, 2428901, 2428930, 2428960, 2428990, 2429019,
+    2429048, 2429078, 2429107, 2429136, 2429166, 2429195, 2429225, 2429255,
+    2429284, 2429314, 2429344, 2429373, 2429403, 2429432, 2429462, 2429491,
+    2429520, 2429550, 2429579, 2429609, 2429638, 2429668, 2429698, 2429728,
+    2429757, 2429787, 2429816, 2429846, 2429875, 2429904, 2429934, 2429963,
+    2429993, 2430022, 2430052, 2430082, 2430111, 2430141, 2430171, 2430200,
+    2430230, 2430259, 2430288, 2430318, 2430347, 2430377, 2430406, 2430436,
+    2430465, 2430495, 2430525, 2430554, 2430584, 2430613, 2430643, 2430672,
+    2430702, 2430731, 2430761, 2430790, 2430820, 2430849, 2430879, 2430908,
+    2430938, 2430968, 2430997, 2431027, 2431056, 2431086, 2431115, 2431145,
+    2431174, 2431204, 2431233, 2431263, 2431292, 2431322, 2431351, 2431381,
+    2431411, 2431440, 2431470, 2431500, 2431529, 2431558, 2431588, 2431617,
+    2431646, 2431676, 2431705, 2431735, 2431765, 2431795, 2431824, 2431854,
+    2431884, 2431913, 2431942, 2431972, 2432001, 2432030, 2432060, 2432089,
+    2432119, 2432149, 2432178, 2432208, 2432238, 2432267, 2432297, 2432326,
+    2432356, 2432385, 2432414, 2432444, 2432473, 2432503, 2432532, 2432562,
+    2432592, 2432622, 2432651, 2432681, 2432710, 2432740, 2432769, 2432798,
+    2432828, 2432857, 2432887, 2432916, 2432946, 2432976, 2433005, 2433035,
+    2433065, 2433094, 2433124, 2433153, 2433182, 2433212, 2433241, 2433271,
+    2433300, 2433330, 2433359, 2433389, 2433419, 2433448, 2433478, 2433507,
+    2433537, 2433566, 2433596, 2433625, 2433655, 2433684, 2433714, 2433743,
+    2433773, 2433802, 2433832, 2433862, 2433891, 2433921, 2433950, 2433980,
+    2434009, 2434039, 2434068, 2434098, 2434127, 2434157, 2434186, 2434216,
+    2434245, 2434275, 2434305, 2434334, 2434364, 2434393, 2434423, 2434452,
+    2434482, 2434511, 2434540, 2434570, 2434599, 2434629, 2434659, 2434689,
+    2434718, 2434748, 2434777, 2434807, 2434836, 2434866, 2434895, 2434924,
+    2434954, 2434983, 2435013, 2435043, 2435072, 2435102, 2435132, 2435161,
+    2435191, 2435220, 2435250, 2435279, 2435308, 2435338, 2435367, 2435397,
+    2435426, 2435456, 2435486, 2435516, 2435545, 2435575, 2435604, 2435634,
+    2435663, 2435692, 2435722, 2435751, 2435780, 2435810, 2435840, 2435870,
+    2435899, 2435929, 2435959, 2435988, 2436018, 2436047, 2436076, 2436106,
+    2436135, 2436164, 2436194, 2436224, 2436253, 2436283, 2436313, 2436343,
+    2436372, 2436402, 2436431, 2436460, 2436490, 2436519, 2436549, 2436578,
+    2436608, 2436637, 2436667, 2436697, 2436726, 2436756, 2436785, 2436815,
+    2436844, 2436874, 2436903, 2436933, 2436962, 2436992, 2437021, 2437051,
+    2437080, 2437110, 2437140, 2437169, 2437199, 2437228, 2437258, 2437287,
+    2437317, 2437346, 2437376, 2437405, 2437434, 2437464, 2437494, 2437523,
+    2437553, 2437583, 2437612, 2437642, 2437671, 2437701, 2437730, 2437760,
+    2437789, 2437818, 2437848, 2437877, 2437907, 2437937, 2437966, 2437996,
+    2438026, 2438055, 2438085, 2438114, 2438144, 2438173, 2438202, 2438232,
+    2438261, 2438291, 2438320, 2438350, 2438380, 2438410, 2438439, 2438469,
+    2438498, 2438528, 2438557, 2438586, 2438616, 2438645, 2438674, 2438704,
+    2438734, 2438764, 2438793, 2438823, 2438853, 2438882, 2438912, 2438941,
+    2438970, 2439000, 2439029, 2439058, 2439088, 2439118, 2439147, 2439177,
+    2439207, 2439237, 2439266, 2439296, 2439325, 2439354, 2439384, 2439413,
+    2439442, 2439472, 2439502, 2439531, 2439561, 2439591, 2439620, 2439650,
+    2439680, 2439709, 2439738, 2439768, 2439797, 2439826, 2439856, 2439885,
+    2439915, 2439945, 2439974, 2440004, 2440034, 2440063, 2440093, 2440122,
+    2440152, 2440181, 2440211, 2440240, 2440269, 2440299, 2440329, 2440358,
+    2440388, 2440417, 2440447, 2440477, 2440506, 2440536, 2440565, 2440595,
+    2440624, 2440654, 2440683, 2440712, 2440742, 2440771, 2440801, 2440831,
+    2440860, 2440890, 2440920, 2440949, 2440979, 2441008, 2441038, 2441067,
+    2441096, 2441126, 2441155, 2441185, 2441214, 2441244, 2441274, 2441304,
+    2441333, 2441363, 2441392, 2441422, 2441451, 2441480, 2441510, 2441539,
+    2441569, 2441598, 2441628, 2441658, 2441687, 2441717, 2441747, 2441776,
+    2441806, 2441835, 2441864, 2441894, 2441923, 2441952, 2441982, 2442012,
+    2442041, 2442071, 2442101, 2442131, 2442160, 2442190, 2442219, 2442248,
+    2442278, 2442307, 2442336, 2442366, 2442395, 2442425, 2442455, 2442485,
+    2442514, 2442544, 2442574, 2442603, 2442632, 2442662, 2442691, 2442720,
+    2442750, 2442779, 2442809, 2442839, 2442869, 2442898, 2442928, 2442957,
+    2442987, 2443016, 2443046, 2443075, 2443104, 2443134, 2443163, 2443193,
+    2443223, 2443252, 2443282, 2443312, 2443341, 2443371, 2443400, 2443430,
+    2443459, 2443489, 2443518, 2443547, 2443577, 2443606, 2443636, 2443666,
+    2443695, 2443725, 2443754, 2443784, 2443814, 2443843, 2443873, 2443902,
+    2443931, 2443961, 2443990, 2444020, 2444049, 2444079, 2444109, 2444138,
+    2444168, 2444198, 2444227, 2444257, 2444286, 2444316, 2444345, 2444374,
+    2444404, 2444433, 2444463, 2444492, 2444522, 2444552, 2444581, 2444611,
+    2444641, 2444670, 2444700, 2444729, 2444758, 2444788, 2444817, 2444846,
+    2444876, 2444906, 2444935, 2444965, 2444995, 2445025, 2445054, 2445084,
+    2445113, 2445142, 2445172, 2445201, 2445230, 2445260, 2445289, 2445319,
+    2445349, 2445379, 2445409, 2445438, 2445468, 2445497, 2445526, 2445556,
+    2445585, 2445614, 2445644, 2445673, 2445703, 2445733, 2445763, 2445792,
+    2445822, 2445851, 2445881, 2445910, 2445940, 2445969, 2445998, 2446028,
+    2446057, 2446087, 2446117, 2446146, 2446176, 2446206, 2446235, 2446265,
+    2446294, 2446324, 2446353, 2446382, 2446412, 2446441, 2446471, 2446500,
+    2446530, 2446560, 2446589, 2446619, 2446649, 2446678, 2446708, 2446737,
+    2446766, 2446796, 2446825, 2446855, 2446884, 2446914, 2446943, 2446973,
+    2447003, 2447032, 2447062, 2447092, 2447121, 2447151, 2447180, 2447209,
+    2447239, 2447268, 2447298, 2447327, 2447357, 2447386, 2447416, 2447446,
+    2447475, 2447505, 2447535, 2447564, 2447594, 2447623, 2447652, 2447682,
+    2447711, 2447740, 2447770, 2447800, 2447829, 2447859, 2447889, 2447919,
+    2447948, 2447978, 2448007, 2448036, 2448066, 2448095, 2448124, 2448154,
+    2448183, 2448213, 2448243, 2448273, 2448303, 2448332, 2448362, 2448391,
+    2448420, 2448450, 2448479, 2448508, 2448538, 2448567, 2448597, 2448627,
+    2448657, 2448686, 2448716, 2448746, 2448775, 2448804, 2448834, 2448863,
+    2448892, 2448922, 2448951, 2448981, 2449011, 2449040, 2449070, 2449100,
+    2449129, 2449159, 2449188, 2449218, 2449247, 2449276, 2449306, 2449335,
+    2449365, 2449394, 2449424, 2449454, 2449484, 2449513, 2449543, 2449572,
+    2449602, 2449631, 2449660, 2449690, 2449719, 2449749, 2449778, 2449808,
+    2449838, 2449867, 2449897, 2449926, 2449956, 2449985, 2450015, 2450044,
+    2450074, 2450103, 2450133, 2450162, 2450192, 2450221, 2450251, 2450280,
+    2450310, 2450340, 2450369, 2450399, 2450428, 2450458, 2450487, 2450517,
+    2450546, 2450576, 2450605, 2450635, 2450664, 2450694, 2450723, 2450753,
+    2450783, 2450812, 2450842, 2450872, 2450901, 2450930, 2450960, 2450989,
+    2451018, 2451048, 2451078, 2451107, 2451137, 2451167, 2451196, 2451226,
+    2451256, 2451285, 2451314, 2451344, 2451373, 2451402, 2451432, 2451461,
+    2451491, 2451521, 2451551, 2451580, 2451610, 2451640, 2451669, 2451698,
+    2451728, 2451757, 2451786, 2451816, 2451845, 2451875, 2451905, 2451934,
+    2451964, 2451994, 2452023, 2452053, 2452082, 2452112, 2452141, 2452170,
+    2452200, 2452229, 2452259, 2452288, 2452318, 2452348, 2452378, 2452407,
+    2452437, 2452466, 2452496, 2452525, 2452554, 2452584, 2452613, 2452643,
+    2452672, 2452702, 2452732, 2452761, 2452791, 2452821, 2452850, 2452880,
+    2452909, 2452938, 2452968, 2452997, 2453027, 2453056, 2453086, 2453115,
+    2453145, 2453175, 2453204, 2453234, 2453263, 2453293, 2453322, 2453352,
+    2453381, 2453411, 2453440, 2453470, 2453499, 2453529, 2453558, 2453588,
+    2453618, 2453647, 2453677, 2453706, 2453736, 2453765, 2453795, 2453824,
+    2453854, 2453883, 2453912, 2453942, 2453972, 2454001, 2454031, 2454061,
+    2454090, 2454120, 2454149, 2454179, 2454208, 2454238, 2454267, 2454296,
+    2454326, 2454355, 2454385, 2454415, 2454445, 2454474, 2454504, 2454534,
+    2454563, 2454592, 2454622, 2454651, 2454680, 2454710, 2454739, 2454769,
+    2454798, 2454828, 2454858, 2454888, 2454917, 2454947, 2454976, 2455006,
+    2455035, 2455064, 2455094, 2455123, 2455153, 2455182, 2455212, 2455242,
+    2455272, 2455301, 2455331, 2455360, 2455390, 2455419, 2455448, 2455478,
+    2455507, 2455537, 2455566, 2455596, 2455626, 2455655, 2455685, 2455715,
+    2455744, 2455774, 2455803, 2455832, 2455862, 2455891, 2455921, 2455950,
+    2455980, 2456009, 2456039, 2456069, 2456098, 2456128, 2456157, 2456187,
+    2456216, 2456246, 2456275, 2456305, 2456334, 2456364, 2456393, 2456423,
+    2456452, 2456482, 2456512, 2456541, 2456571, 2456600, 2456630, 2456659,
+    2456689, 2456718, 2456748, 2456777, 2456807, 2456836, 2456866, 2456895,
+    2456925, 2456955, 2456984, 2457014, 2457043, 2457073, 2457102, 2457132,
+    2457161, 2457190, 2457220, 2457249, 2457279, 2457309, 2457339, 2457368,
+    2457398, 2457427, 2457457, 2457486, 2457516, 2457545, 2457574, 2457604,
+    2457633, 2457663, 2457693, 2457722, 2457752, 2457782, 2457811, 2457841,
+    2457870, 2457900, 2457929, 2457958, 2457988, 2458017, 2458047, 2458076,
+    2458106, 2458136, 2458166, 2458195, 2458225, 2458254, 2458284, 2458313,
+    2458342, 2458372, 2458401, 2458430, 2458460, 2458490, 2458520, 2458549,
+    2458579, 2458609, 2458638, 2458668, 2458697, 2458726, 2458756, 2458785,
+    2458814, 2458844, 2458874, 2458903, 2458933, 2458963, 2458993, 2459022,
+    2459052, 2459081, 2459110, 2459140, 2459169, 2459198, 2459228, 2459258,
+    2459287, 2459317, 2459347, 2459376, 2459406, 2459435, 2459465, 2459494,
+    2459524, 2459553, 2459583, 2459612, 2459642, 2459671, 2459701, 2459730,
+    2459760, 2459790, 2459819, 2459849, 2459878, 2459908, 2459937, 2459967,
+    2459996, 2460026, 2460055, 2460084, 2460114, 2460144, 2460173, 2460203,
+    2460233, 2460262, 2460292, 2460321, 2460351, 2460380, 2460410, 2460439,
+    2460468, 2460498, 2460527, 2460557, 2460587, 2460616, 2460646, 2460676,
+    2460705, 2460735, 2460764, 2460794, 2460823, 2460852, 2460882, 2460911,
+    2460941, 2460970, 2461000, 2461030, 2461060, 2461089, 2461119, 2461148,
+    2461178, 2461207, 2461236, 2461266, 2461295, 2461324, 2461354, 2461384,
+    2461414, 2461443, 2461473, 2461503, 2461532, 2461562, 2461591, 2461620,
+    2461650, 2461679, 2461708, 2461738, 2461768, 2461797, 2461827, 2461857,
+    2461887, 2461916, 2461946, 2461975, 2462004, 2462034, 2462063, 2462092,
+    2462122, 2462152, 2462181, 2462211, 2462241, 2462270, 2462300, 2462329,
+    2462359, 2462388, 2462418, 2462447, 2462476, 2462506, 2462535, 2462565,
+    2462595, 2462624, 2462654, 2462684, 2462713, 2462743, 2462772, 2462802,
+    2462831, 2462861, 2462890, 2462919, 2462949, 2462978, 2463008, 2463038,
+    2463067, 2463097, 2463127, 2463156, 2463186, 2463215, 2463245, 2463274,
+    2463303, 2463333, 2463362, 2463392, 2463421, 2463451, 2463481, 2463510,
+    2463540, 2463570, 2463599, 2463629, 2463658, 2463688, 2463717, 2463746,
+    2463776, 2463805, 2463835, 2463864, 2463894, 2463924, 2463954, 2463983,
+    2464013, 2464042, 2464072, 2464101, 2464130, 2464160, 2464189, 2464218,
+    2464248, 2464278, 2464308, 2464337, 2464367, 2464397, 2464426, 2464456,
+    2464485, 2464514, 2464544, 2464573, 2464602, 2464632, 2464662, 2464691,
+    2464721, 2464751, 2464781, 2464810, 2464840, 2464869, 2464898, 2464928,
+    2464957, 2464986, 2465016, 2465045, 2465075, 2465105, 2465135, 2465164,
+    2465194, 2465224, 2465253, 2465282, 2465312, 2465341, 2465370, 2465400,
+    2465429, 2465459, 2465489, 2465518, 2465548, 2465578, 2465607, 2465637,
+    2465666, 2465696, 2465725, 2465754, 2465784, 2465813, 2465843, 2465873,
+    2465902, 2465932, 2465962, 2465991, 2466021, 2466050, 2466080, 2466109,
+    2466138, 2466168, 2466197, 2466227, 2466256, 2466286, 2466316, 2466345,
+    2466375, 2466404, 2466434, 2466464, 2466493, 2466523, 2466552, 2466581,
+    2466611, 2466640, 2466670, 2466699, 2466729, 2466758, 2466788, 2466818,
+    2466848, 2466877, 2466907, 2466936, 2466966, 2466995, 2467024, 2467054,
+    2467083, 2467113, 2467142, 2467172, 2467202, 2467231, 2467261, 2467291,
+    2467320, 2467350, 2467379, 2467408, 2467438, 2467467, 2467496, 2467526,
+    2467556, 2467585, 2467615, 2467645, 2467675, 2467704, 2467734, 2467763,
+    2467792, 2467822, 2467851, 2467880, 2467910, 2467939, 2467969, 2467999,
+    2468029, 2468059, 2468088, 2468118, 2468147, 2468176, 2468206, 2468235,
+    2468264, 2468294, 2468323, 2468353, 2468383, 2468413, 2468442, 2468472,
+    2468501, 2468531, 2468560, 2468590, 2468619, 2468648, 2468678, 2468707,
+    2468737, 2468767, 2468796, 2468826, 2468856, 2468885, 2468915, 2468944,
+    2468974, 2469003, 2469032, 2469062, 2469091, 2469121, 2469150, 2469180,
+    2469210, 2469239, 2469269, 2469299, 2469328, 2469358, 2469387, 2469416,
+    2469446, 2469475, 2469505, 2469534, 2469564, 2469593, 2469623, 2469653,
+    2469682, 2469712, 2469741, 2469771, 2469801, 2469830, 2469859, 2469889,
+    2469918, 2469948, 2469977, 2470007, 2470036, 2470066, 2470096, 2470125,
+    2470155, 2470185, 2470214, 2470243, 2470273, 2470302, 2470332, 2470361,
+    2470390, 2470420, 2470450, 2470479, 2470509, 2470539, 2470569, 2470598,
+    2470628, 2470657, 2470686, 2470716, 2470745, 2470774, 2470804, 2470833,
+    2470863, 2470893, 2470923, 2470952, 2470982, 2471012, 2471041, 2471070,
+    2471100, 2471129, 2471158, 2471188, 2471217, 2471247, 2471277, 2471307,
+    2471336, 2471366, 2471396, 2471425, 2471454, 2471484, 2471513, 2471542,
+    2471572, 2471601, 2471631, 2471661, 2471690, 2471720, 2471750, 2471779,
+    2471809, 2471838, 2471868, 2471897, 2471926, 2471956, 2471985, 2472015,
+    2472044, 2472074, 2472104, 2472133, 2472163, 2472193, 2472222, 2472252,
+    2472281, 2472310, 2472340, 2472369, 2472399, 2472428, 2472458, 2472487,
+    2472517, 2472547, 2472576, 2472606, 2472635, 2472665, 2472694, 2472724,
+    2472753, 2472783, 2472812, 2472842, 2472871, 2472901, 2472930, 2472960,
+    2472990, 2473019, 2473049, 2473078, 2473108, 2473137, 2473167, 2473196,
+    2473226, 2473255, 2473285, 2473314, 2473344, 2473373, 2473403, 2473433,
+    2473462, 2473492, 2473521, 2473551, 2473580, 2473610, 2473639, 2473668,
+    2473698, 2473727, 2473757, 2473787, 2473817, 2473846, 2473876, 2473906,
+    2473935, 2473964, 2473994, 2474023, 2474052, 2474082, 2474111, 2474141,
+    2474171, 2474201, 2474230, 2474260, 2474290, 2474319, 2474348, 2474378,
+    2474407, 2474436, 2474466, 2474495, 2474525, 2474554, 2474584, 2474614,
+    2474644, 2474673, 2474703, 2474732, 2474762, 2474791, 2474820, 2474850,
+    2474879, 2474909, 2474938, 2474968, 2474998, 2475028, 2475057, 2475087,
+    2475116, 2475146, 2475175, 2475204, 2475234, 2475263, 2475293, 2475322,
+    2475352, 2475382, 2475411, 2475441, 2475471, 2475500, 2475529, 2475559,
+    2475588, 2475618, 2475647, 2475677, 2475706, 2475736, 2475765, 2475795,
+    2475825, 2475854, 2475884, 2475913, 2475943, 2475972, 2476002, 2476031,
+    2476061, 2476090, 2476120, 2476149, 2476179, 2476208, 2476238, 2476268,
+    2476297, 2476327, 2476356, 2476386, 2476415, 2476445, 2476474, 2476504,
+    2476533, 2476562, 2476592, 2476622, 2476651, 2476681, 2476711, 2476740,
+    2476770, 2476799, 2476829, 2476858, 2476888, 2476917, 2476946, 2476976,
+    2477005, 2477035, 2477065, 2477095, 2477124, 2477154, 2477183, 2477213,
+    2477242, 2477272, 2477301, 2477330, 2477360, 2477389, 2477419, 2477448,
+    2477478, 2477508, 2477538, 2477567, 2477597, 2477626, 2477656, 2477685,
+    2477714, 2477744, 2477773, 2477803, 2477832, 2477862, 2477892, 2477922,
+    2477951, 2477981, 2478010, 2478040, 2478069, 2478098, 2478128, 2478157,
+    2478187, 2478216, 2478246, 2478276, 2478305, 2478335, 2478365, 2478394,
+    2478424, 2478453, 2478482, 2478512, 2478541, 2478570, 2478600, 2478630,
+    2478659, 2478689, 2478719, 2478748, 2478778, 2478807, 2478837, 2478866,
+    2478896, 2478925, 2478955, 2478984, 2479014, 2479043, 2479073, 2479102,
+    2479132, 2479162, 2479191, 2479221, 2479250, 2479280, 2479309, 2479339,
+    2479368, 2479398, 2479427, 2479457, 2479486, 2479516, 2479545, 2479575,
+    2479605, 2479634, 2479664, 2479693, 2479723, 2479752, 2479782, 2479811,
+    2479840, 2479870, 2479899, 2479929, 2479959, 2479989, 2480018, 2480048,
+    2480077, 2480107, 2480136, 2480166, 2480195, 2480224, 2480254, 2480283,
+    2480313, 2480342, 2480372, 2480402, 2480432, 2480461, 2480491, 2480520,
+    2480550, 2480579, 2480608, 2480638, 2480667, 2480697, 2480726, 2480756,
+    2480786, 2480816, 2480845, 2480875, 2480904, 2480934, 2480963, 2480992,
+    2481021, 2481051, 2481080, 2481110, 2481140, 2481170, 2481199, 2481229,
+    2481259, 2481288, 2481318, 2481347, 2481376, 2481406, 2481435, 2481464,
+    2481494, 2481524, 2481553, 2481583, 2481613, 2481642, 2481672, 2481701,
+    2481731, 2481760, 2481790, 2481819, 2481848, 2481878, 2481908, 2481937,
+    2481967, 2481997, 2482026, 2482056, 2482085, 2482115, 2482144, 2482174,
+    2482203, 2482233, 2482262, 2482292, 2482321, 2482351, 2482380, 2482410,
+    2482440, 2482469, 2482499, 2482528, 2482558, 2482587, 2482617, 2482646,
+    2482675, 2482705, 2482734, 2482764, 2482794, 2482823, 2482853, 2482882,
+    2482912, 2482942, 2482971, 2483001, 2483030, 2483059, 2483089, 2483118,
+    2483148, 2483177, 2483207, 2483237, 2483266, 2483296, 2483326, 2483355,
+    2483385, 2483414, 2483444, 2483473, 2483502, 2483532, 2483561, 2483591,
+    2483620, 2483650, 2483680, 2483710, 2483739, 2483769, 2483798, 2483828,
+    2483857, 2483886, 2483915, 2483945, 2483974, 2484004, 2484034, 2484064,
+    2484093, 2484123, 2484153, 2484182, 2484212, 2484241, 2484270, 2484299,
+    2484329, 2484358, 2484388, 2484418, 2484447, 2484477, 2484507, 2484537,
+    2484566, 2484596, 2484625, 2484654, 2484684, 2484713, 2484742, 2484772,
+    2484801, 2484831, 2484861, 2484891, 2484920, 2484950, 2484979, 2485009,
+    2485038, 2485068, 2485097, 2485126, 2485156, 2485185, 2485215, 2485245,
+    2485274, 2485304, 2485334, 2485363, 2485393, 2485422, 2485452, 2485481,
+    2485510, 2485540, 2485569, 2485599, 2485628, 2485658, 2485688, 2485717,
+    2485747, 2485777, 2485806, 2485836, 2485865, 2485895, 2485924, 2485953,
+    2485983, 2486012, 2486042, 2486071, 2486101, 2486131, 2486160, 2486190,
+    2486220, 2486249, 2486279, 2486308, 2486337, 2486367, 2486396, 2486426,
+    2486455, 2486485, 2486514, 2486544, 2486574, 2486604, 2486633, 2486663,
+    2486692, 2486722, 2486751, 2486780, 2486810, 2486839, 2486868, 2486898,
+    2486928, 2486958, 2486987, 2487017, 2487047, 2487076, 2487106, 2487135,
+    2487164, 2487193, 2487223, 2487252, 2487282, 2487312, 2487341, 2487371,
+    2487401, 2487431, 2487460, 2487490, 2487519, 2487548, 2487577, 2487607,
+    2487636, 2487666, 2487695, 2487725, 2487755, 2487785, 2487814, 2487844,
+    2487873, 2487903, 2487932, 2487961, 2487991, 2488020, 2488050, 2488079,
+    2488109, 2488139, 2488168, 2488198, 2488228, 2488257, 2488287, 2488316,
+    2488346, 2488375, 2488404, 2488434, 2488463, 2488493, 2488523, 2488552,
+    2488582, 2488611, 2488641, 2488671, 2488700, 2488730, 2488759, 2488788,
+    2488818, 2488847, 2488877, 2488906, 2488936, 2488965, 2488995, 2489025,
+    2489054, 2489084, 2489114, 2489143, 2489173, 2489202, 2489231, 2489261,
+    2489290, 2489320, 2489349, 2489379, 2489408, 2489438, 2489468, 2489497,
+    2489527, 2489557, 2489586, 2489615, 2489645, 2489674, 2489704, 2489733,
+    2489763, 2489792, 2489822, 2489852, 2489881, 2489911, 2489941, 2489970,
+    2490000, 2490029, 2490058, 2490087, 2490117, 2490146, 2490176, 2490206,
+    2490235, 2490265, 2490295, 2490325, 2490354, 2490384, 2490413, 2490442,
+    2490471, 2490501, 2490530, 2490560, 2490589, 2490619, 2490649, 2490679,
+    2490708, 2490738, 2490768, 2490797, 2490826, 2490855, 2490885, 2490914,
+    2490944, 2490973, 2491003, 2491033, 2491063, 2491092, 2491122, 2491151,
+    2491181, 2491210, 2491239, 2491269, 2491298, 2491328, 2491357, 2491387,
+    2491417, 2491446, 2491476, 2491506, 2491535, 2491565, 2491594, 2491624,
+    2491653, 2491682, 2491712, 2491741, 2491771, 2491800, 2491830, 2491860,
+    2491889, 2491919, 2491948, 2491978, 2492008, 2492037, 2492066, 2492096,
+    2492125, 2492155, 2492184, 2492214, 2492243, 2492273, 2492303, 2492332,
+    2492362, 2492391, 2492421, 2492450, 2492480, 2492509, 2492539, 2492568,
+    2492598, 2492627, 2492657, 2492686, 2492716, 2492746, 2492775, 2492805,
+    2492835, 2492864, 2492893, 2492923, 2492952, 2492982, 2493011, 2493040,
+    2493070, 2493100, 2493129, 2493159, 2493189, 2493219, 2493248, 2493278,
+    2493307, 2493336, 2493365, 2493395, 2493424, 2493454, 2493483, 2493513,
+    2493543, 2493573, 2493602, 2493632, 2493662, 2493691, 2493720, 2493749,
+    2493779, 2493808, 2493838, 2493867, 2493897, 2493927, 2493957, 2493986,
+    2494016, 2494045, 2494075, 2494104, 2494133, 2494163, 2494192, 2494222,
+    2494251, 2494281, 2494311, 2494340, 2494370, 2494400, 2494429, 2494459,
+    2494488, 2494517, 2494547, 2494576, 2494606, 2494635, 2494665, 2494694,
+    2494724, 2494754, 2494783, 2494813, 2494843, 2494872, 2494901, 2494931,
+    2494960, 2494990, 2495019, 2495049, 2495078, 2495108, 2495137, 2495167,
+    2495197, 2495226, 2495256, 2495285, 2495315, 2495344, 2495374, 2495403,
+    2495433, 2495462, 2495492, 2495521, 2495551, 2495580, 2495610, 2495640,
+    2495669, 2495699, 2495728, 2495758, 2495787, 2495817, 2495846, 2495876,
+    2495905, 2495934, 2495964, 2495994, 2496023, 2496053, 2496083, 2496112,
+    2496142, 2496171, 2496201, 2496230, 2496259, 2496289, 2496318, 2496348,
+    2496377, 2496407, 2496437, 2496467, 2496496, 2496526, 2496555, 2496585,
+    2496614, 2496643, 2496673, 2496702, 2496732, 2496761, 2496791, 2496821,
+    2496851, 2496880, 2496910, 2496939, 2496969, 2496998, 2497027, 2497057,
+    2497086, 2497116, 2497145, 2497175, 2497204, 2497234, 2497264, 2497294,
+    2497323, 2497353, 2497382, 2497411, 2497441, 2497470, 2497500, 2497529,
+    2497559, 2497588, 2497618, 2497648, 2497678, 2497707, 2497737, 2497766,
+    2497795, 2497825, 2497854, 2497884, 2497913, 2497943, 2497972, 2498002,
+    2498032, 2498061, 2498091, 2498120, 2498150, 2498179, 2498209, 2498238,
+    2498268, 2498297, 2498327, 2498356, 2498386, 2498415, 2498445, 2498475,
+    2498504, 2498534, 2498563, 2498593, 2498622, 2498652, 2498681, 2498711,
+    2498740, 2498770, 2498799, 2498829, 2498858, 2498888, 2498918, 2498947,
+    2498977, 2499006, 2499036, 2499065, 2499095, 2499124, 2499154, 2499183,
+    2499212, 2499242, 2499272, 2499301, 2499331, 2499361, 2499390, 2499420,
+    2499449, 2499479, 2499508, 2499537, 2499567, 2499596, 2499626, 2499655,
+    2499685, 2499715, 2499744, 2499774, 2499804, 2499833, 2499863, 2499892,
+    2499921, 2499951, 2499980, 2500010, 2500039, 2500069, 2500098, 2500128,
+    2500158, 2500188, 2500217, 2500247, 2500276, 2500306, 2500335, 2500364,
+    2500393, 2500423, 2500453, 2500482, 2500512, 2500542, 2500572, 2500601,
+    2500631, 2500660, 2500689, 2500719, 2500748, 2500777, 2500807, 2500836,
+    2500866, 2500896, 2500926, 2500955, 2500985, 2501015, 2501044, 2501073,
+    2501103, 2501132, 2501162, 2501191, 2501220, 2501250, 2501280, 2501309,
+    2501339, 2501369, 2501398, 2501428, 2501457, 2501487, 2501516, 2501546,
+    2501575, 2501605, 2501634, 2501664, 2501693, 2501723, 2501752, 2501782,
+    2501812, 2501841, 2501871, 2501900, 2501930, 2501959, 2501989, 2502018,
+    2502048, 2502077, 2502106, 2502136, 2502166, 2502195, 2502225, 2502255,
+    2502284, 2502314, 2502343, 2502373, 2502402, 2502431, 2502461, 2502490,
+    2502520, 2502549, 2502579, 2502609, 2502638, 2502668, 2502698, 2502727,
+    2502757, 2502786, 2502815, 2502845, 2502874, 2502904, 2502933, 2502963,
+    2502992, 2503022, 2503052, 2503082, 2503111, 2503141, 2503170, 2503199,
+    2503229, 2503258, 2503287, 2503317, 2503347, 2503376, 2503406, 2503436,
+    2503466, 2503495, 2503525, 2503554, 2503584, 2503613, 2503642, 2503671,
+    2503701, 2503730, 2503760, 2503790, 2503820, 2503849, 2503879, 2503909,
+    2503938, 2503967, 2503997, 2504026, 2504055, 2504085, 2504114, 2504144,
+    2504174, 2504203, 2504233, 2504263, 2504292, 2504322, 2504351, 2504381,
+    2504410, 2504440, 2504469, 2504498, 2504528, 2504558, 2504587, 2504617,
+    2504647, 2504676, 2504706, 2504735, 2504765, 2504794, 2504824, 2504853,
+    2504882, 2504912, 2504941, 2504971, 2505001, 2505030, 2505060, 2505089,
+    2505119, 2505149, 2505178, 2505208, 2505237, 2505267, 2505296, 2505325,
+    2505355, 2505384, 2505414, 2505443, 2505473, 2505503, 2505532, 2505562,
+    2505592, 2505621, 2505651, 2505680, 2505709, 2505739, 2505768, 2505798,
+    2505827, 2505857, 2505887, 2505916, 2505946, 2505976, 2506005, 2506035,
+    2506064, 2506093, 2506123, 2506152, 2506182, 2506211, 2506241, 2506270,
+    2506300, 2506330, 2506360, 2506389, 2506419, 2506448, 2506478, 2506507,
+    2506536, 2506565, 2506595, 2506624, 2506654, 2506684, 2506714, 2506743,
+    2506773, 2506803, 2506832, 2506862, 2506891, 2506920, 2506949, 2506979,
+    2507008, 2507038, 2507068, 2507097, 2507127, 2507157, 2507187, 2507216,
+    2507245, 2507275, 2507304, 2507333, 2507363, 2507392, 2507422, 2507451,
+    2507481, 2507511, 2507541, 2507570, 2507600, 2507629, 2507659, 2507688,
+    2507718, 2507747, 2507776, 2507806, 2507835, 2507865, 2507895, 2507924,
+    2507954, 2507984, 2508013, 2508043, 2508072, 2508102, 2508131, 2508160,
+    2508190, 2508219, 2508249, 2508278, 2508308, 2508338, 2508367, 2508397,
+    2508427, 2508456, 2508486, 2508515, 2508545, 2508574, 2508603, 2508633,
+    2508662, 2508692, 2508721, 2508751, 2508781, 2508810, 2508840, 2508870,
+    2508899, 2508929, 2508958, 2508987, 2509017, 2509046, 2509076, 2509105,
+    2509135, 2509164, 2509194, 2509224, 2509254, 2509283, 2509313, 2509342,
+    2509371, 2509401, 2509430, 2509459, 2509489, 2509518, 2509548, 2509578,
+    2509608, 2509637, 2509667, 2509697, 2509726, 2509756, 2509785, 2509814,
+    2509843, 2509873, 2509902, 2509932, 2509962, 2509991, 2510021, 2510051,
+    2510081, 2510110, 2510139, 2510169, 2510198, 2510227, 2510257, 2510286,
+    2510316, 2510345, 2510375, 2510405, 2510435, 2510464, 2510494, 2510523,
+    2510553, 2510582, 2510611, 2510641, 2510670, 2510700, 2510729, 2510759,
+    2510789, 2510818, 2510848, 2510878, 2510907, 2510937, 2510966, 2510995,
+    2511025, 2511054, 2511084, 2511113, 2511143, 2511172, 2511202, 2511232,
+    2511261, 2511291, 2511321, 2511350, 2511380, 2511409, 2511438, 2511468,
+    2511497, 2511527, 2511556, 2511586, 2511615, 2511645, 2511675, 2511704,
+    2511734, 2511764, 2511793, 2511822, 2511852, 2511881, 2511911, 2511940,
+    2511970, 2511999, 2512029, 2512058, 2512088, 2512118, 2512147, 2512177,
+    2512207, 2512236, 2512265, 2512295, 2512324, 2512353, 2512383, 2512412,
+    2512442, 2512472, 2512502, 2512531, 2512561, 2512591, 2512620, 2512649,
+    2512679, 2512708, 2512737, 2512767, 2512796, 2512826, 2512856, 2512885,
+    2512915, 2512945, 2512975, 2513004, 2513033, 2513063, 2513092, 2513121,
+    2513151, 2513180, 2513210, 2513239, 2513269, 2513299, 2513329, 2513358,
+    2513388, 2513417, 2513447, 2513476, 2513505, 2513535, 2513564, 2513594,
+    2513623, 2513653, 2513683, 2513712, 2513742, 2513772, 2513801, 2513831,
+    2513860, 2513889, 2513919, 2513948, 2513978, 2514007, 2514037, 2514066,
+    2514096, 2514126, 2514156, 2514185, 2514215, 2514244, 2514273, 2514303,
+    2514332, 2514362, 2514391, 2514421, 2514450, 2514480, 2514510, 2514539,
+    2514569, 2514598, 2514628, 2514657, 2514687, 2514716, 2514746, 2514775,
+    2514805, 2514834, 2514864, 2514893, 2514923, 2514953, 2514982, 2515012,
+    2515041, 2515071, 2515100, 2515130, 2515159, 2515189, 2515218, 2515248,
+    2515277, 2515307, 2515336, 2515366, 2515396, 2515425, 2515455, 2515485,
+    2515514, 2515543, 2515573, 2515602, 2515631, 2515661, 2515690, 2515720,
+    2515750, 2515779, 2515809, 2515839, 2515869, 2515898, 2515927, 2515957,
+    2515986, 2516015, 2516045, 2516074, 2516104, 2516133, 2516163, 2516193,
+    2516223, 2516252, 2516282, 2516311, 2516341, 2516370, 2516399, 2516429,
+    2516458, 2516488, 2516517, 2516547, 2516577, 2516607, 2516636, 2516666,
+    2516695, 2516725, 2516754, 2516783, 2516813, 2516842, 2516872, 2516901,
+    2516931, 2516961, 2516990, 2517020, 2517050, 2517079, 2517109, 2517138,
+    2517167, 2517197, 2517226, 2517256, 2517285, 2517315, 2517344, 2517374,
+    2517404, 2517433, 2517463, 2517493, 2517522, 2517551, 2517581, 2517610,
+    2517640, 2517669, 2517699, 2517728, 2517758, 2517787, 2517817, 2517847,
+    2517876, 2517906, 2517935, 2517965, 2517994, 2518024, 2518053, 2518083,
+    2518112, 2518142, 2518171, 2518201, 2518230, 2518260, 2518290, 2518319,
+    2518349, 2518378, 2518408, 2518437, 2518467, 2518496, 2518526, 2518555,
+    2518584, 2518614, 2518644, 2518673, 2518703, 2518733, 2518762, 2518792,
+    2518821, 2518851, 2518880, 2518909, 2518939, 2518968, 2518998, 2519027,
+    2519057, 2519087, 2519117, 2519146, 2519176, 2519205, 2519235, 2519264,
+    2519293, 2519323, 2519352, 2519382, 2519411, 2519441, 2519471, 2519501,
+    2519530, 2519560, 2519589, 2519619, 2519648, 2519677, 2519707, 2519736,
+    2519765, 2519795, 2519825, 2519854, 2519884, 2519914, 2519944, 2519973,
+    2520003, 2520032, 2520061, 2520091, 2520120, 2520149, 2520179, 2520209,
+    2520238, 2520268, 2520298, 2520328, 2520357, 2520387, 2520416, 2520445,
+    2520475, 2520504, 2520534, 2520563, 2520593, 2520622, 2520652, 2520682,
+    2520711, 2520741, 2520770, 2520800, 2520829, 2520859, 2520888, 2520918,
+    2520947, 2520977, 2521006, 2521036, 2521065, 2521095, 2521125, 2521154,
+    2521184, 2521213, 2521243, 2521272, 2521302, 2521331, 2521361, 2521390,
+    2521420, 2521449, 2521479, 2521508, 2521538, 2521567, 2521597, 2521627,
+    2521656, 2521686, 2521715, 2521745, 2521774, 2521803, 2521833, 2521862,
+    2521892, 2521921, 2521951, 2521981, 2522011, 2522040, 2522070, 2522099,
+    2522129, 2522158, 2522187, 2522217, 2522246, 2522276, 2522305, 2522335,
+    2522365, 2522394, 2522424, 2522454, 2522483, 2522513, 2522542, 2522571,
+    2522601, 2522630, 2522659, 2522689, 2522719, 2522748, 2522778, 2522808,
+    2522838, 2522867, 2522897, 2522926, 2522955, 2522985, 2523014, 2523043,
+    2523073, 2523103, 2523132, 2523162, 2523192, 2523222, 2523251, 2523281,
+    2523310, 2523339, 2523369, 2523398, 2523427, 2523457, 2523486, 2523516,
+    2523546, 2523576, 2523605, 2523635, 2523665, 2523694, 2523723, 2523753,
+    2523782, 2523811, 2523841, 2523870, 2523900, 2523930, 2523959, 2523989,
+    2524019, 2524048, 2524078, 2524107, 2524137, 2524166, 2524196, 2524225,
+    2524255, 2524284, 2524314, 2524343, 2524373, 2524402, 2524432, 2524462,
+    2524491, 2524521, 2524550, 2524580, 2524609, 2524639, 2524668, 2524697,
+    2524727, 2524756, 2524786, 2524816, 2524845, 2524875, 2524905, 2524934,
+    2524964, 2524993, 2525023, 2525052, 2525081, 2525111, 2525140, 2525170,
+    2525199, 2525229, 2525259, 2525288, 2525318, 2525348, 2525377, 2525407,
+    2525436, 2525465, 2525495, 2525524, 2525554, 2525583, 2525613, 2525642,
+    2525672, 2525702, 2525732,
+)
+MONTH11_DAYS = (
+    2378491, 2378846, 2379201, 2379585, 2379939, 2380293, 2380677, 2381031,
+    2381415, 2381769, 2382124, 2382508, 2382863, 2383217, 2383601, 2383955,
+    2384338, 2384693, 2385047, 2385431, 2385786, 2386140, 2386524, 2386878,
+    2387232, 2387616, 2387971, 2388355, 2388709, 2389064, 2389448, 2389802,
+    2390156, 2390540, 2390894, 2391278, 2391633, 2391987, 2392371, 2392726,
+    2393080, 2393464, 2393818, 2394172, 2394556, 2394911, 2395295, 2395649,
+    2396004, 2396387, 2396741, 2397096, 2397479, 2397834, 2398218, 2398573,
+    2398927, 2399311, 2399665, 2400019, 2400403, 2400757, 2401112, 2401496,
+    2401851, 2402235, 2402589, 2402943, 2403327, 2403681, 2404035, 2404419,
+    2404774, 2405158, 2405513, 2405867, 2406251, 2406605, 2406959, 2407343,
+    2407697, 2408052, 2408436, 2408790, 2409174, 2409528, 2409882, 2410266,
+    2410621, 2410975, 2411359, 2411714, 2412098, 2412452, 2412806, 2413190,
+    2413544, 2413899, 2414283, 2414637, 2414992, 2415376, 2415730, 2416084,
+    2416468, 2416822, 2417176, 2417561, 2417915, 2418270, 2418654, 2419008,
+    2419391, 2419746, 2420100, 2420484, 2420839, 2421193, 2421577, 2421931,
+    2422315, 2422669, 2423023, 2423407, 2423762, 2424117, 2424501, 2424855,
+    2425209, 2425593, 2425947, 2426331, 2426685, 2427040, 2427424, 2427779,
+    2428133, 2428517, 2428871, 2429255, 2429609, 2429963, 2430347, 2430702,
+    2431056, 2431440, 2431795, 2432149, 2432532, 2432887, 2433271, 2433625,
+    2433980, 2434364, 2434718, 2435072, 2435456, 2435810, 2436194, 2436549,
+    2436903, 2437287, 2437642, 2437996, 2438380, 2438734, 2439088, 2439472,
+    2439826, 2440211, 2440565, 2440920, 2441304, 2441658, 2442012, 2442395,
+    2442750, 2443134, 2443489, 2443843, 2444227, 2444581, 2444935, 2445319,
+    2445673, 2446028, 2446412, 2446766, 2447151, 2447505, 2447859, 2448243,
+    2448597, 2448951, 2449335, 2449690, 2450074, 2450428, 2450783, 2451167,
+    2451521, 2451875, 2452259, 2452613, 2452968, 2453352, 2453706, 2454090,
+    2454445, 2454798, 2455182, 2455537, 2455891, 2456275, 2456630, 2457014,
+    2457368, 2457722, 2458106, 2458460, 2458814, 2459198, 2459553, 2459908,
+    2460292, 2460646, 2461030, 2461384, 2461738, 2462122, 2462476, 2462831,
+    2463215, 2463570, 2463924, 2464308, 2464662, 2465045, 2465400, 2465754,
+    2466138, 2466493, 2466848, 2467231, 2467585, 2467969, 2468323, 2468678,
+    2469062, 2469416, 2469771, 2470155, 2470509, 2470893, 2471247, 2471601,
+    2471985, 2472340, 2472694, 2473078, 2473433, 2473787, 2474171, 2474525,
+    2474909, 2475263, 2475618, 2476002, 2476356, 2476711, 2477095, 2477448,
+    2477832, 2478187, 2478541, 2478925, 2479280, 2479634, 2480018, 2480372,
+    2480726, 2481110, 2481464, 2481848, 2482203, 2482558, 2482942, 2483296,
+    2483650, 2484034, 2484388, 2484772, 2485126, 2485481, 2485865, 2486220,
+    2486574, 2486958, 2487312, 2487666, 2488050, 2488404, 2488788, 2489143,
+    2489497, 2489881, 2490235, 2490589, 2490973, 2491328, 2491712, 2492066,
+    2492421, 2492805, 2493159, 2493513, 2493897, 2494251, 2494606, 2494990,
+    2495344, 2495728, 2496083, 2496437, 2496821, 2497175, 2497529, 2497913,
+    2498268, 2498622, 2499006, 2499361, 2499744, 2500098, 2500453, 2500836,
+    2501191, 2501546, 2501930, 2502284, 2502668, 2503022, 2503376, 2503760,
+    2504114, 2504469, 2504853, 2505208, 2505562, 2505946, 2506300, 2506684,
+    2507038, 2507392, 2507776, 2508131, 2508486, 2508870, 2509224, 2509608,
+    2509962, 2510316, 2510700, 2511054, 2511409, 2511793, 2512147, 2512531,
+    2512885, 2513239, 2513623, 2513978, 2514332, 2514716, 2515071, 2515425,
+    2515809, 2516163, 2516547, 2516901, 2517256, 2517640, 2517994, 2518349,
+    2518733, 2519087, 2519441, 2519825, 2520179, 2520563, 2520918, 2521272,
+    2521656, 2522011, 2522365, 2522748, 2523103, 2523486, 2523841, 2524196,
+    2524580, 2524934, 2525288,
+)
+LEAP_MONTH_OFFSETS = (
+    4, 13, 13, 2, 13, 8, 13, 13,
+    5, 13, 13, 3, 13, 9, 2, 13,
+    6, 13, 13, 4, 13, 13, 3, 13,
+    8, 13, 13, 5, 13, 13, 4, 13,
+    10, 1, 13, 6, 13, 13, 4, 13,
+    13, 3, 13, 8, 13, 13, 5, 13,
+    13, 4, 13, 9, 2, 13, 7, 13,
+    13, 5, 13, 13, 3, 13, 9, 13,
+    13, 5, 13, 13, 4, 13, 11, 13,
+    13, 6, 13, 13, 5, 13, 13, 3,
+    13, 8, 13, 13, 5, 13, 13, 4,
+    13, 13, 2, 13, 6, 13, 13, 5,
+    13, 13, 3, 13, 9, 13, 13, 7,
+    13, 13, 6, 13, 13, 4, 13, 8,
+    13, 13, 7, 13, 13, 5, 13, 9,
+    13, 13, 8, 13, 13, 6, 13, 13,
+    4, 13, 8, 13, 13, 7, 13, 13,
+    5, 13, 10, 13, 13, 8, 13, 13,
+    6, 13, 13, 4, 13, 9, 13, 13,
+    7, 13, 13, 5, 13, 10, 13, 13,
+    8, 13, 13, 6, 13, 13, 5, 13,
+    9, 13, 13, 7, 13, 13, 6, 13,
+    10, 13, 13, 8, 13, 13, 6, 13,
+    13, 4, 13, 9, 13, 13, 7, 13,
+    13, 5, 13, 10, 13, 13, 7, 13,
+    13, 6, 13, 13, 4, 13, 9, 13,
+    13, 7, 13, 13, 6, 13, 11, 13,
+    13, 8, 13, 13, 6, 13, 13, 4,
+    13, 8, 13, 13, 7, 13, 13, 5,
+    13, 10, 1, 13, 8, 13, 13, 7,
+    13, 13, 4, 13, 9, 13, 13, 7,
+    13, 13, 5, 13, 10, 1, 13, 8,
+    13, 13, 6, 13, 13, 5, 13, 9,
+    13, 13, 7, 13, 13, 6, 13, 10,
+    13, 13, 8, 13, 13, 6, 13, 13,
+    5, 13, 9, 13, 13, 7, 13, 13,
+    6, 13, 10, 13, 13, 8, 13, 13,
+    6, 13, 13, 4, 13, 9, 13, 13,
+    7, 13, 13, 6, 13, 11, 13, 13,
+    8, 13, 13, 6, 13, 13, 5, 13,
+    9, 13, 13, 7, 13, 13, 6, 13,
+    11, 1, 13, 8, 13, 13, 7, 13,
+    13, 4, 13, 9, 13, 13, 7, 13,
+    13, 6, 13, 10, 3, 13, 8, 13,
+    13, 7, 13, 13, 5, 13, 9, 13,
+    13, 8, 13, 13, 6, 13, 12, 2,
+    13, 8, 13, 13, 7, 13, 13, 5,
+    13, 9, 13, 13, 8, 13, 13, 6,
+    13, 10, 4, 13, 8, 13, 13, 7,
+    13, 13, 5, 13, 9, 13, 13, 8,
+    13, 13, 6,
+)
+SOLAR_TERM_FIRST = 19
+SOLAR_TERM_START = -31485251
+SOLAR_TERM_STEPS = (
+    21207, 21272, 21379, 21522, 21692, 21880, 22072, 22254,
+    22414, 22541, 22624, 22657, 22638, 22568, 22451, 22299,
+    22121, 21931, 21741, 21565, 21413, 21296, 21221, 21190,
+    21207, 21272, 21378, 21522, 21693, 21879, 22072, 22253,
+    22415, 22540, 22624, 22657, 22638, 22568, 22451, 22300,
+    22121, 21931, 21741, 21565, 21414, 21296, 21220, 21190,
+    21208, 21271, 21379, 21521, 21692, 21880, 22071, 22253,
+    22414, 22541, 22624, 22657, 22638, 22567, 22452, 22300,
+    22121, 21931, 21742, 21565, 21414, 21296, 21220, 21190,
+    21208, 21271, 21379, 21521, 21692, 21879, 22071, 22253,
+    22414, 22541, 22623, 22657, 22638, 22568, 22452, 22300,
+    22121, 21932, 21742, 21565, 21414, 21296, 21221, 21190,
+    21207, 21272, 21378, 21521, 21692, 21879, 22070, 22253,
+    22414, 22540, 22624, 22657, 22638, 22568, 22452, 22300,
+    22122, 21932, 21742, 21565, 21414, 21297, 21220, 21191,
+    21207, 21271, 21378, 21521, 21692, 21879, 22070, 22253,
+    22413, 22541, 22623, 22657, 22638, 22568, 22453, 22300,
+    22122, 21932, 21742, 21566, 21414, 21297, 21221, 21190,
+    21207, 21272, 21377, 21521, 21692, 21878, 22070, 22253,
+    22413, 22541, 22623, 22657, 22638, 22568, 22453, 22300,
+    22123, 21932, 21742, 21566, 21415, 21297, 21221, 21190,
+    21207, 21272, 21377, 21521, 21691, 21879, 22070, 22252,
+    22413, 22540, 22624, 22657, 22638, 22568, 22453, 22300,
+    22123, 21933, 21742, 21567, 21414, 21297, 21221, 21191,
+    21207, 21271, 21378, 21520, 21691, 21879, 22069, 22253,
+    22413, 22540, 22623, 22657, 22638, 22569, 22453, 22300,
+    22123, 21933, 21743, 21567, 21414, 21298, 21221, 21190,
+    21208, 21271, 21377, 21521, 21690, 21878, 22070, 22252,
+    22413, 22540, 22623, 22657, 22639, 22568, 22453, 22301,
+    22123, 21933, 21743, 21567, 21415, 21298, 21221, 21190,
+    21208, 21271, 21377, 21520, 21691, 21878, 22069, 22252,
+    22413, 22540, 22623, 22657, 22638, 22569, 22453, 22301,
+    22124, 21933, 21743, 21567, 21416, 21297, 21221, 21191,
+    21207, 21271, 21377, 21521, 21690, 21878, 22069, 22252,
+    22413, 22539, 22623, 22657, 22639, 22568, 22454, 22301,
+    22124, 21933, 21744, 21567, 21415, 21298, 21221, 21191,
+    21207, 21271, 21377, 21520, 21690, 21878, 22069, 22252,
+    22412, 22540, 22623, 22657, 22638, 22569, 22453, 22302,
+    22124, 21933, 21744, 21567, 21416, 21298, 21221, 21190,
+    21208, 21271, 21377, 21520, 21690, 21877, 22069, 22251,
+    22413, 22539, 22623, 22657, 22638, 22569, 22454, 22301,
+    22124, 21934, 21744, 21568, 21415, 21298, 21221, 21191,
+    21207, 21271, 21377, 21520, 21690, 21877, 22068, 22252,
+    22412, 22539, 22623, 22657, 22638, 22569, 22454, 22301,
+    22125, 21934, 21744, 21567, 21416, 21298, 21222, 21190,
+    21207, 21271, 21377, 21519, 21690, 21877, 22068, 22251,
+    22412, 22539, 22623, 22657, 22638, 22569, 22454, 22302,
+    22124, 21934, 21745, 21568, 21416, 21298, 21221, 21191,
+    21207, 21270, 21377, 21519, 21690, 21876, 22069, 22250,
+    22412, 22539, 22623, 22656, 22639, 22569, 22454, 22302,
+    22124, 21935, 21744, 21568, 21416, 21298, 21222, 21190,
+    21208, 21270, 21376, 21519, 21690, 21876, 22068, 22251,
+    22411, 22539, 22622, 22657, 22638, 22569, 22454, 22303,
+    22124, 21935, 21745, 21568, 21416, 21298, 21222, 21190,
+    21207, 21271, 21376, 21519, 21689, 21876, 22068, 22250,
+    22411, 22539, 22622, 22657, 22638, 22569, 22454, 22303,
+    22125, 21934, 21745, 21569, 21416, 21298, 21222, 21191,
+    21207, 21270, 21376, 21519, 21688, 21876, 22068, 22250,
+    22411, 22538, 22622, 22657, 22638, 22570, 22454, 22302,
+    22125, 21935, 21746, 21568, 21417, 21298, 21222, 21190,
+    21207, 21270, 21376, 21519, 21688, 21876, 22067, 22250,
+    22411, 22538, 22622, 22657, 22638, 22569, 22455, 22303,
+    22125, 21935, 21745, 21569, 21417, 21298, 21222, 21191,
+    21207, 21270, 21376, 21518, 21688, 21876, 22066, 22250,
+    22411, 22538, 22622, 22656, 22639, 22569, 22455, 22302,
+    22126, 21935, 21746, 21569, 21417, 21299, 21221, 21191,
+    21207, 21270, 21376, 21518, 21688, 21875, 22067, 22249,
+    22410, 22538, 22622, 22657, 22638, 22570, 22454, 22304,
+    22125, 21936, 21746, 21569, 21417, 21299, 21222, 21191,
+    21207, 21269, 21376, 21518, 21688, 21875, 22066, 22249,
+    22410, 22538, 22622, 22657, 22638, 22570, 22455, 22303,
+    22126, 21936, 21746, 21570, 21417, 21299, 21222, 21191,
+    21206, 21270, 21376, 21517, 21688, 21875, 22066, 22249,
+    22410, 22538, 22622, 22656, 22639, 22569, 22455, 22304,
+    22126, 21936, 21747, 21570, 21417, 21299, 21222, 21191,
+    21207, 21270, 21375, 21518, 21687, 21875, 22066, 22248,
+    22410, 22538, 22622, 22656, 22639, 22570, 22455, 22304,
+    22126, 21937, 21746, 21570, 21418, 21299, 21222, 21191,
+    21207, 21270, 21375, 21518, 21687, 21874, 22066, 22249,
+    22409, 22538, 22622, 22656, 22639, 22570, 22455, 22304,
+    22127, 21937, 21747, 21570, 21418, 21299, 21222, 21191,
+    21207, 21270, 21375, 21517, 21688, 21874, 22065, 22249,
+    22409, 22538, 22621, 22657, 22639, 22570, 22455, 22305,
+    22127, 21936, 21748, 21570, 21418, 21300, 21222, 21191,
+    21207, 21270, 21375, 21517, 21687, 21874, 22065, 22248,
+    22410, 22537, 22622, 22656, 22639, 22570, 22456, 22304,
+    22128, 21937, 21747, 21571, 21418, 21300, 21222, 21191,
+    21207, 21270, 21375, 21517, 21687, 21873, 22066, 22248,
+    22409, 22537, 22622, 22656, 22639, 22570, 22456, 22305,
+    22127, 21938, 21747, 21571, 21418, 21300, 21223, 21191,
+    21207, 21269, 21375, 21517, 21687, 21873, 22065, 22248,
+    22410, 22537, 22621, 22657, 22639, 22570, 22456, 22305,
+    22127, 21938, 21748, 21571, 21418, 21300, 21223, 21191,
+    21207, 21269, 21375, 21517, 21686, 21874, 22064, 22248,
+    22409, 22537, 22621, 22657, 22639, 22570, 22456, 22305,
+    22128, 21938, 21748, 21571, 21419, 21300, 21223, 21191,
+    21207, 21269, 21374, 21517, 21686, 21874, 22064, 22248,
+    22409, 22536, 22622, 22656, 22639, 22570, 22457, 22305,
+    22128, 21938, 21748, 21571, 21419, 21300, 21223, 21191,
+    21207, 21269, 21375, 21516, 21686, 21873, 22064, 22248,
+    22408, 22537, 22621, 22657, 22639, 22570, 22457, 22305,
+    22128, 21938, 21748, 21572, 21419, 21300, 21223, 21191,
+    21207, 21269, 21374, 21516, 21686, 21873, 22064, 22247,
+    22409, 22536, 22621, 22657, 22638, 22571, 22457, 22305,
+    22128, 21939, 21748, 21572, 21419, 21300, 21223, 21191,
+    21207, 21269, 21374, 21516, 21686, 21872, 22064, 22247,
+    22408, 22536, 22621, 22657, 22639, 22570, 22457, 22305,
+    22129, 21938, 21749, 21572, 21419, 21301, 21223, 21191,
+    21206, 21269, 21374, 21516, 21685, 21873, 22063, 22247,
+    22408, 22536, 22621, 22656, 22639, 22571, 22456, 22306,
+    22129, 21938, 21749, 21572, 21420, 21300, 21223, 21191,
+    21207, 21269, 21374, 21515, 21685, 21872, 22064, 22246,
+    22408, 22536, 22620, 22657, 22639, 22570, 22457, 22306,
+    22129, 21939, 21749, 21572, 21419, 21301, 21223, 21191,
+    21207, 21269, 21373, 21516, 21685, 21871, 22063, 22247,
+    22407, 22536, 22620, 22657, 22639, 22570, 22457, 22306,
+    22129, 21939, 21750, 21572, 21420, 21301, 21223, 21191,
+    21206, 21269, 21374, 21515, 21684, 21872, 22063, 22246,
+    22407, 22536, 22620, 22656, 22639, 22571, 22457, 22306,
+    22130, 21939, 21749, 21573, 21420, 21301, 21223, 21191,
+    21207, 21268, 21374, 21515, 21684, 21871, 22063, 22246,
+    22407, 22535, 22621, 22656, 22639, 22571, 22457, 22306,
+    22130, 21939, 21750, 21573, 21420, 21301, 21224, 21191,
+    21206, 21269, 21373, 21515, 21684, 21871, 22062, 22246,
+    22407, 22535, 22620, 22656, 22639, 22572, 22457, 22307,
+    22129, 21940, 21750, 21573, 21420, 21302, 21223, 21191,
+    21207, 21268, 21373, 21515, 21684, 21871, 22062, 22245,
+    22407, 22535, 22620, 22656, 22639, 22572, 22457, 22307,
+    22130, 21940, 21750, 21574, 21420, 21302, 21223, 21191,
+    21207, 21268, 21373, 21515, 21684, 21870, 22062, 22245,
+    22407, 22535, 22620, 22656, 22639, 22572, 22457, 22307,
+    22131, 21940, 21751, 21573, 21421, 21301, 21224, 21191,
+    21207, 21268, 21373, 21514, 21684, 21870, 22062, 22245,
+    22406, 22535, 22620, 22656, 22640, 22571, 22458, 22307,
+    22131, 21941, 21750, 21574, 21421, 21302, 21223, 21192,
+    21206, 21268, 21373, 21514, 21684, 21870, 22062, 22244,
+    22407, 22535, 22620, 22656, 22639, 22572, 22458, 22307,
+    22131, 21941, 21751, 21574, 21421, 21302, 21224, 21191,
+    21207, 21268, 21372, 21514, 21684, 21870, 22061, 22245,
+    22406, 22535, 22620, 22656, 22639, 22572, 22458, 22308,
+    22131, 21941, 21751, 21574, 21421, 21303, 21224, 21191,
+    21207, 21268, 21372, 21514, 21683, 21870, 22061, 22245,
+    22406, 22534, 22620, 22656, 22640, 22572, 22458, 22308,
+    22131, 21941, 21752, 21574, 21422, 21302, 21224, 21192,
+    21206, 21268, 21372, 21514, 21683, 21870, 22061, 22244,
+    22406, 22535, 22620, 22656, 22639, 22572, 22459, 22308,
+    22131, 21941, 21752, 21575, 21421, 21303, 21224, 21191,
+    21207, 21268, 21372, 21514, 21683, 21869, 22061, 22244,
+    22406, 22534, 22620, 22656, 22639, 22572, 22459, 22308,
+    22132, 21942, 21751, 21575, 21422, 21302, 21225, 21191,
+    21207, 21267, 21373, 21513, 21683, 21869, 22061, 22244,
+    22405, 22534, 22620, 22656, 22640, 22572, 22459, 22308,
+    22132, 21942, 21752, 21574, 21422, 21303, 21224, 21192,
+    21206, 21268, 21372, 21513, 21683, 21869, 22060, 22244,
+    22405, 22534, 22620, 22656, 22640, 22572, 22459, 22308,
+    22132, 21942, 21752, 21575, 21422, 21303, 21225, 21191,
+    21206, 21268, 21372, 21513, 21683, 21868, 22061, 22243,
+    22405, 22534, 22620, 22655, 22640, 22572, 22459, 22309,
+    22132, 21942, 21753, 21575, 21422, 21303, 21224, 21192,
+    21206, 21268, 21371, 21513, 21682, 21869, 22060, 22243,
+    22405, 22534, 22619, 22656, 22640, 22572, 22459, 22309,
+    22132, 21942, 21753, 21575, 21423, 21303, 21224, 21192,
+    21206, 21267, 21372, 21513, 21682, 21868, 22060, 22243,
+    22404, 22534, 22619, 22656, 22639, 22573, 22459, 22309,
+    22132, 21943, 21753, 21575, 21423, 21303, 21224, 21192,
+    21206, 21267, 21372, 21512, 21682, 21868, 22059, 22243,
+    22405, 22533, 22619, 22656, 22639, 22573, 22459, 22309,
+    22133, 21943, 21753, 21575, 21423, 21303, 21225, 21191,
+    21206, 21268, 21371, 21512, 21682, 21867, 22060, 22242,
+    22404, 22534, 22619, 22655, 22640, 22572, 22460, 22309,
+    22133, 21943, 21753, 21576, 21423, 21303, 21224, 21192,
+    21206, 21267, 21371, 21513, 21681, 21867, 22059, 22242,
+    22404, 22534, 22619, 22655, 22640, 22572, 22460, 22309,
+    22133, 21943, 21754, 21576, 21423, 21303, 21225, 21192,
+    21206, 21267, 21371, 21512, 21681, 21867, 22058, 22242,
+    22404, 22533, 22619, 22656, 22639, 22573, 22460, 22309,
+    22133, 21944, 21753, 21577, 21423, 21303, 21225, 21192,
+    21206, 21267, 21371, 21511, 21681, 21867, 22059, 22241,
+    22404, 22533, 22619, 22655, 22640, 22572, 22460, 22310,
+    22134, 21943, 21754, 21577, 21423, 21304, 21225, 21191,
+    21206, 21267, 21371, 21511, 21681, 21867, 22058, 22242,
+    22403, 22533, 22618, 22656, 22639, 22573, 22460, 22310,
+    22134, 21944, 21754, 21577, 21424, 21303, 21225, 21192,
+    21206, 21267, 21371, 21511, 21680, 21867, 22058, 22241,
+    22404, 22532, 22619, 22655, 22640, 22573, 22460, 22310,
+    22134, 21944, 21755, 21577, 21424, 21304, 21225, 21192,
+    21205, 21267, 21371, 21511, 21680, 21867, 22057, 22241,
+    22404, 22532, 22619, 22655, 22640, 22573, 22460, 22311,
+    22134, 21945, 21754, 21577, 21424, 21305, 21225, 21192,
+    21206, 21266, 21371, 21511, 21680, 21866, 22058, 22241,
+    22403, 22532, 22618, 22656, 22640, 22573, 22460, 22311,
+    22135, 21944, 21755, 21578, 21424, 21304, 21226, 21191,
+    21206, 21267, 21370, 21511, 21680, 21866, 22058, 22240,
+    22403, 22532, 22619, 22655, 22640, 22574, 22460, 22311,
+    22135, 21945, 21755, 21578, 21424, 21305, 21225, 21192,
+    21206, 21266, 21371, 21511, 21679, 21866, 22057, 22241,
+    22403, 22532, 22618, 22656, 22640, 22573, 22461, 22311,
+    22135, 21945, 21756, 21577, 21425, 21305, 21225, 21192,
+    21206, 21267, 21370, 21511, 21679, 21866, 22057, 22240,
+    22403, 22532, 22618, 22655, 22641, 22573, 22461, 22311,
+    22135, 21946, 21756, 21578, 21424, 21305, 21226, 21192,
+    21206, 21266, 21370, 21511, 21679, 21866, 22057, 22240,
+    22402, 22532, 22618, 22656, 22640, 22573, 22462, 22311,
+    22135, 21946, 21756, 21578, 21425, 21305, 21226, 21192,
+    21206, 21266, 21370, 21510, 21680, 21865, 22057, 22240,
+    22402, 22532, 22618, 22655, 22640, 22574, 22461, 22312,
+    22135, 21946, 21756, 21579, 21425, 21305, 21225, 21192,
+    21206, 21267, 21369, 21511, 21679, 21865, 22056, 22240,
+    22402, 22532, 22618, 22655, 22640, 22574, 22462, 22311,
+    22136, 21946, 21756, 21579, 21425, 21305, 21226, 21192,
+    21206, 21266, 21370, 21510, 21679, 21865, 22056, 22239,
+    22402, 22532, 22618, 22655, 22640, 22574, 22461, 22312,
+    22136, 21946, 21757, 21579, 21425, 21305, 21226, 21192,
+    21206, 21266, 21369, 21510, 21679, 21865, 22056, 22239,
+    22402, 22531, 22618, 22655, 22640, 22574, 22462, 22312,
+    22136, 21946, 21757, 21579, 21425, 21305, 21226, 21192,
+    21206, 21266, 21370, 21509, 21679, 21864, 22056, 22239,
+    22401, 22531, 22618, 22655, 22640, 22574, 22462, 22312,
+    22136, 21947, 21757, 21579, 21425, 21306, 21226, 21192,
+    21206, 21266, 21369, 21509, 21678, 21865, 22055, 22239,
+    22401, 22531, 22618, 22655, 22640, 22574, 22462, 22312,
+    22136, 21947, 21757, 21579, 21426, 21306, 21226, 21192,
+    21205, 21266, 21369, 21510, 21678, 21863, 22056, 22238,
+    22401, 22531, 22618, 22655, 22640, 22574, 22462, 22312,
+    22137, 21947, 21757, 21579, 21426, 21306, 21226, 21192,
+    21206, 21265, 21369, 21509, 21678, 21864, 22055, 22238,
+    22401, 22530, 22618, 22655, 22640, 22574, 22462, 22313,
+    22136, 21948, 21757, 21580, 21426, 21305, 21227, 21192,
+    21205, 21266, 21369, 21508, 21678, 21863, 22055, 22238,
+    22401, 22530, 22617, 22655, 22640, 22575, 22462, 22313,
+    22137, 21947, 21758, 21580, 21426, 21306, 21226, 21192,
+    21206, 21265, 21369, 21508, 21678, 21863, 22054, 22238,
+    22401, 22530, 22617, 22655, 22640, 22574, 22463, 22313,
+    22137, 21948, 21757, 21580, 21427, 21306, 21226, 21192,
+    21206, 21265, 21369, 21508, 21677, 21863, 22054, 22238,
+    22400, 22531, 22617, 22654, 22641, 22574, 22463, 22313,
+    22137, 21948, 21758, 21581, 21426, 21306, 21227, 21192,
+    21205, 21266, 21368, 21509, 21676, 21863, 22054, 22238,
+    22400, 22530, 22617, 22654, 22641, 22574, 22463, 22313,
+    22138, 21948, 21758, 21581, 21427, 21306, 21227, 21192,
+    21205, 21266, 21368, 21508, 21677, 21862, 22054, 22237,
+    22400, 22530, 22617, 22655, 22640, 22575, 22463, 22313,
+    22138, 21949, 21758, 21581, 21427, 21307, 21226, 21193,
+    21205, 21265, 21368, 21509, 21676, 21862, 22054, 22237,
+    22400, 22529, 22617, 22655, 22641, 22574, 22463, 22314,
+    22138, 21949, 21759, 21581, 21427, 21307, 21227, 21192,
+    21205, 21266, 21368, 21508, 21676, 21862, 22053, 22237,
+    22400, 22530, 22616, 22655, 22641, 22575, 22463, 22314,
+    22138, 21949, 21759, 21581, 21428, 21307, 21227, 21192,
+    21206, 21265, 21368, 21507, 21676, 21862, 22054, 22236,
+    22400, 22529, 22617, 22655, 22641, 22575, 22463, 22314,
+    22139, 21949, 21759, 21582, 21427, 21307, 21227, 21193,
+    21205, 21265, 21368, 21508, 21676, 21862, 22053, 22236,
+    22400, 22529, 22617, 22655, 22640, 22575, 22464, 22314,
+    22139, 21949, 21760, 21582, 21427, 21308, 21227, 21192,
+    21206, 21265, 21368, 21507, 21676, 21861, 22053, 22237,
+    22399, 22529, 22617, 22655, 22640, 22575, 22464, 22315,
+    22139, 21949, 21760, 21582, 21428, 21307, 21227, 21193,
+    21205, 21265, 21368, 21508, 21675, 21861, 22053, 22236,
+    22399, 22530, 22616, 22655, 22641, 22575, 22464, 22314,
+    22140, 21950, 21759, 21583, 21428, 21307, 21227, 21193,
+    21205, 21265, 21368, 21507, 21675, 21862, 22052, 22236,
+    22399, 22529, 22617, 22654, 22641, 22575, 22464, 22315,
+    22139, 21951, 21760, 21582, 21428, 21308, 21227, 21193,
+    21205, 21265, 21367, 21507, 21676, 21861, 22052, 22236,
+    22398, 22529, 22617, 22654, 22641, 22575, 22464, 22315,
+    22140, 21950, 21760, 21583, 21428, 21308, 21227, 21193,
+    21205, 21265, 21367, 21507, 21675, 21861, 22052, 22236,
+    22398, 22529, 22616, 22655, 22640, 22576, 22464, 22315,
+    22140, 21950, 21761, 21582, 21429, 21308, 21227, 21193,
+    21205, 21265, 21367, 21507, 21674, 21861, 22052, 22235,
+    22398, 22529, 22616, 22655, 22640, 22576, 22464, 22315,
+    22140, 21951, 21760, 21583, 21429, 21308, 21227, 21193,
+    21205, 21265, 21367, 21506, 21675, 21860, 22051, 22236,
+    22398, 22528, 22616, 22655, 22640, 22576, 22464, 22316,
+    22140, 21950, 21761, 21583, 21429, 21308, 21227, 21193,
+    21205, 21265, 21367, 21506, 21674, 21860, 22051, 22235,
+    22398, 22528, 22616, 22655, 22640, 22576, 22464, 22316,
+    22140, 21951, 21761, 21583, 21429, 21308, 21228, 21193,
+    21205, 21264, 21367, 21506, 21674, 21860, 22051, 22234,
+    22398, 22528, 22616, 22654, 22641, 22576, 22464, 22316,
+    22140, 21952, 21761, 21583, 21429, 21308, 21228, 21193,
+    21205, 21264, 21366, 21506, 21674, 21860, 22051, 22234,
+    22397, 22528, 22616, 22654, 22641, 22576, 22464, 22316,
+    22141, 21951, 21762, 21583, 21429, 21309, 21227, 21193,
+    21205, 21264, 21367, 21505, 21674, 21859, 22051, 22234,
+    22397, 22528, 22615, 22655, 22640, 22576, 22465, 22316,
+    22141, 21952, 21761, 21584, 21430, 21308, 21228, 21193,
+    21205, 21264, 21366, 21505, 21674, 21859, 22050, 22234,
+    22397, 22527, 22616, 22654, 22641, 22576, 22465, 22316,
+    22141, 21952, 21762, 21584, 21430, 21308, 21228, 21193,
+    21205, 21264, 21366, 21505, 21673, 21859, 22050, 22234,
+    22397, 22527, 22616, 22654, 22641, 22576, 22465, 22316,
+    22142, 21952, 21762, 21584, 21430, 21309, 21228, 21193,
+    21205, 21263, 21366, 21506, 21673, 21858, 22050, 22234,
+    22396, 22527, 22616, 22654, 22641, 22576, 22465, 22317,
+    22142, 21952, 21762, 21585, 21430, 21309, 21228, 21193,
+    21205, 21264, 21366, 21505, 21672, 21859, 22049, 22234,
+    22396, 22527, 22616, 22654, 22641, 22576, 22465, 22317,
+    22142, 21953, 21763, 21584, 21431, 21308, 21229, 21193,
+    21205, 21263, 21366, 21505, 21673, 21858, 22049, 22234,
+    22396, 22527, 22615, 22654, 22641, 22577, 22465, 22318,
+    22142, 21953, 21762, 21585, 21431, 21309, 21228, 21193,
+    21205, 21264, 21366, 21505, 21672, 21858, 22049, 22233,
+    22397, 22526, 22616, 22654, 22641, 22576, 22466, 22318,
+    22142, 21953, 21763, 21585, 21431, 21309, 21229, 21193,
+    21205, 21263, 21366, 21505, 21672, 21858, 22049, 22233,
+    22396, 22527, 22615, 22654, 22641, 22577, 22466, 22317,
+    22143, 21953, 21763, 21586, 21431, 21309, 21229, 21193,
+    21205, 21263, 21366, 21504, 21673, 21857, 22049, 22233,
+    22396, 22526, 22615, 22655, 22641, 22576, 22467, 22317,
+    22143, 21954, 21763, 21586, 21431, 21310, 21228, 21193,
+    21205, 21264, 21365, 21505, 21672, 21857, 22049, 22232,
+    22396, 22527, 22615, 22654, 22641, 22577, 22466, 22318,
+    22143, 21954, 21764, 21585, 21431, 21310, 21229, 21193,
+    21205, 21264, 21365, 21504, 21672, 21857, 22049, 22232,
+    22396, 22526, 22615, 22654, 22641, 22577, 22467, 22318,
+    22143, 21954, 21764, 21586, 21431, 21310, 21229, 21193,
+    21205, 21263, 21366, 21504, 21671, 21857, 22049, 22232,
+    22395, 22526, 22615, 22654, 22641, 22577, 22467, 22318,
+    22144, 21954, 21764, 21586, 21432, 21309, 21229, 21194,
+    21205, 21263, 21365, 21504, 21671, 21857, 22048, 22232,
+    22395, 22526, 22615, 22654, 22641, 22577, 22467, 22318,
+    22144, 21954, 21765, 21586, 21431, 21311, 21229, 21193,
+    21205, 21263, 21365, 21504, 21671, 21856, 22048, 22232,
+    22395, 22526, 22614, 22654, 22642, 22577, 22466, 22319,
+    22144, 21954, 21765, 21586, 21432, 21310, 21229, 21193,
+    21205, 21263, 21365, 21504, 21671, 21856, 22048, 22231,
+    22395, 22526, 22614, 22654, 22641, 22577, 22467, 22319,
+    22144, 21954, 21765, 21587, 21431, 21311, 21229, 21193,
+    21205, 21263, 21365, 21503, 21671, 21856, 22047, 22231,
+    22395, 22525, 22615, 22654, 22641, 22577, 22467, 22319,
+    22144, 21955, 21765, 21586, 21432, 21311, 21229, 21193,
+    21205, 21263, 21364, 21503, 21671, 21856, 22047, 22231,
+    22394, 22526, 22614, 22654, 22641, 22577, 22467, 22319,
+    22144, 21955, 21765, 21587, 21432, 21311, 21229, 21193,
+    21205, 21263, 21364, 21503, 21670, 21856, 22047, 22231,
+    22394, 22525, 22614, 22654, 22641, 22577, 22467, 22320,
+    22144, 21955, 21766, 21587, 21432, 21311, 21229, 21193,
+    21205, 21263, 21364, 21502, 21670, 21856, 22046, 22231,
+    22394, 22525, 22614, 22653, 22642, 22577, 22467, 22320,
+    22144, 21956, 21765, 21588, 21432, 21311, 21229, 21194,
+    21204, 21263, 21364, 21502, 21670, 21855, 22047, 22230,
+    22394, 22525, 22613, 22654, 22641, 22578, 22467, 22320,
+    22144, 21956, 21766, 21588, 21432, 21311, 21230, 21193,
+    21205, 21262, 21364, 21502, 21670, 21855, 22046, 22230,
+    22393, 22525, 22614, 22654, 22641, 22577, 22468, 22320,
+    22145, 21956, 21766, 21588, 21432, 21311, 21230, 21193,
+    21205, 21262, 21364, 21502, 21670, 21854, 22046, 22230,
+    22394, 22524, 22614, 22653, 22642, 22577, 22468, 22320,
+    22145, 21957, 21766, 21588, 21433, 21311, 21230, 21193,
+    21205, 21262, 21364, 21502, 21669, 21855, 22045, 22230,
+    22393, 22525, 22613, 22654, 22641, 22578, 22468, 22320,
+    22145, 21957, 21767, 21588, 21433, 21311, 21230, 21194,
+    21204, 21263, 21363, 21502, 21669, 21854, 22046, 22229,
+    22393, 22525, 22613, 22654, 22641, 22578, 22468, 22321,
+    22145, 21957, 21767, 21588, 21434, 21311, 21230, 21194,
+    21205, 21262, 21363, 21502, 21669, 21854, 22045, 22229,
+    22393, 22525, 22613, 22654, 22641, 22578, 22468, 22321,
+    22146, 21957, 21767, 21589, 21434, 21311, 21230, 21194,
+    21204, 21263, 21363, 21502, 21668, 21854, 22045, 22229,
+    22393, 22524, 22614, 22653, 22642, 22578, 22468, 22321,
+    22146, 21958, 21767, 21589, 21434, 21312, 21230, 21194,
+    21204, 21262, 21364, 21501, 21669, 21853, 22045, 22229,
+    22393, 22524, 22613, 22654, 22641, 22579, 22468, 22321,
+    22147, 21957, 21768, 21589, 21434, 21312, 21230, 21194,
+    21204, 21263, 21363, 21501, 21668, 21854, 22045, 22228,
+    22393, 22524, 22613, 22654, 22641, 22579, 22468, 22322,
+    22146, 21958, 21768, 21589, 21434, 21312, 21231, 21194,
+    21204, 21262, 21363, 21501, 21669, 21853, 22045, 22228,
+    22392, 22524, 22613, 22654, 22642, 22578, 22469, 22321,
+    22147, 21958, 21768, 21589, 21435, 21312, 21231, 21193,
+    21205, 21262, 21363, 21501, 21668, 21853, 22045, 22228,
+    22392, 22524, 22613, 22653, 22642, 22578, 22469, 22322,
+    22147, 21958, 21768, 21590, 21434, 21313, 21230, 21194,
+    21205, 21262, 21362, 21501, 21668, 21853, 22044, 22228,
+    22392, 22524, 22613, 22653, 22642, 22579, 22469, 22321,
+    22147, 21959, 21768, 21590, 21435, 21312, 21231, 21194,
+    21204, 21262, 21363, 21500, 21668, 21853, 22044, 22228,
+    22391, 22524, 22613, 22653, 22642, 22578, 22469, 22322,
+    22148, 21958, 21769, 21590, 21434, 21313, 21231, 21194,
+    21204, 21262, 21362, 21501, 21667, 21853, 22043, 22228,
+    22392, 22523, 22613, 22653, 22642, 22578, 22470, 22321,
+    22148, 21959, 21768, 21591, 21435, 21312, 21231, 21194,
+    21204, 21262, 21362, 21501, 21667, 21852, 22043, 22228,
+    22391, 22523, 22613, 22653, 22642, 22578, 22470, 22322,
+    22148, 21958, 21769, 21591, 21435, 21313, 21230, 21194,
+    21205, 21261, 21362, 21501, 21667, 21852, 22043, 22227,
+    22391, 22523, 22612, 22654, 22641, 22579, 22469, 22323,
+    22147, 21960, 21769, 21590, 21435, 21313, 21231, 21194,
+    21204, 21262, 21362, 21500, 21666, 21852, 22043, 22227,
+    22391, 22523, 22612, 22653, 22642, 22579, 22469, 22323,
+    22148, 21959, 21769, 21591, 21435, 21313, 21231, 21194,
+    21204, 21262, 21362, 21499, 21667, 21851, 22043, 22227,
+    22390, 22523, 22612, 22653, 22642, 22579, 22469, 22323,
+    22148, 21960, 21769, 21591, 21436, 21313, 21231, 21194,
+    21204, 21261, 21362, 21499, 21667, 21851, 22042, 22227,
+    22390, 22523, 22612, 22653, 22641, 22579, 22470, 22323,
+    22148, 21960, 21770, 21591, 21436, 21313, 21231, 21194,
+    21204, 21261, 21362, 21499, 21666, 21851, 22043, 22226,
+    22390, 22522, 22612, 22653, 22642, 22579, 22470, 22323,
+    22149, 21960, 21769, 21592, 21436, 21313, 21231, 21194,
+    21205, 21261, 21361, 21499, 21666, 21851, 22042, 22226,
+    22390, 22522, 22612, 22653, 22642, 22579, 22470, 22323,
+    22149, 21960, 21770, 21592, 21436, 21314, 21231, 21194,
+    21204, 21261, 21362, 21499, 21665, 21851, 22041, 22226,
+    22390, 22522, 22612, 22653, 22642, 22579, 22470, 22324,
+    22149, 21960, 21771, 21592, 21436, 21314, 21231, 21194,
+    21204, 21261, 21361, 21499, 21666, 21850, 22042, 22225,
+    22390, 22522, 22612, 22652, 22642, 22580, 22470, 22324,
+    22149, 21961, 21771, 21592, 21436, 21314, 21232, 21194,
+    21204, 21261, 21361, 21499, 21665, 21850, 22042, 22225,
+    22390, 22521, 22612, 22653, 22642, 22579, 22471, 22324,
+    22149, 21961, 21771, 21593, 21436, 21315, 21231, 21194,
+    21204, 21261, 21361, 21499, 21665, 21850, 22041, 22225,
+    22390, 22521, 22612, 22653, 22642, 22580, 22470, 22324,
+    22150, 21962, 21771, 21592, 21437, 21315, 21231, 21194,
+    21205, 21261, 21361, 21498, 21665, 21850, 22041, 22225,
+    22389, 22522, 22611, 22653, 22642, 22580, 22471, 22324,
+    22150, 21961, 21772, 21593, 21437, 21314, 21232, 21194,
+    21205, 21260, 21361, 21499, 21664, 21850, 22041, 22225,
+    22389, 22521, 22612, 22653, 22642, 22580, 22471, 22324,
+    22150, 21962, 21772, 21593, 21437, 21315, 21231, 21195,
+    21204, 21261, 21361, 21498, 21664, 21850, 22040, 22225,
+    22389, 22521, 22612, 22653, 22642, 22580, 22471, 22325,
+    22150, 21962, 21772, 21593, 21438, 21314, 21232, 21195,
+    21204, 21261, 21360, 21498, 21665, 21849, 22040, 22225,
+    22389, 22521, 22611, 22653, 22642, 22580, 22472, 22324,
+    22151, 21962, 21772, 21594, 21437, 21315, 21232, 21194,
+    21205, 21260, 21361, 21498, 21664, 21849, 22040, 22225,
+    22388, 22521, 22612, 22652, 22642, 22580, 22472, 22325,
+    22151, 21962, 21772, 21594, 21438, 21315, 21232, 21194,
+    21204, 21261, 21360, 21498, 21664, 21849, 22040, 22224,
+    22389, 22520, 22612, 22652, 22642, 22580, 22472, 22325,
+    22151, 21963, 21772, 21594, 21438, 21315, 21232, 21194,
+    21205, 21260, 21360, 21498, 21664, 21848, 22040, 22224,
+    22388, 22521, 22611, 22653, 22642, 22580, 22472, 22325,
+    22151, 21963, 21772, 21594, 21438, 21315, 21233, 21194,
+    21204, 21261, 21360, 21497, 21664, 21848, 22040, 22223,
+    22388, 22521, 22611, 22652, 22642, 22581, 22471, 22326,
+    22151, 21963, 21773, 21594, 21438, 21315, 21233, 21194,
+    21204, 21260, 21360, 21497, 21664, 21848, 22039, 22224,
+    22388, 22520, 22611, 22652, 22642, 22581, 22471, 22326,
+    22151, 21963, 21773, 21595, 21438, 21315, 21233, 21194,
+    21204, 21260, 21360, 21497, 21663, 21848, 22039, 22223,
+    22388, 22520, 22611, 22652, 22642, 22581, 22472, 22325,
+    22152, 21963, 21773, 21595, 21438, 21316, 21232, 21195,
+    21204, 21260, 21359, 21497, 21663, 21848, 22038, 22223,
+    22388, 22520, 22610, 22653, 22642, 22580, 22472, 22326,
+    22152, 21963, 21774, 21594, 21439, 21316, 21232, 21195,
+    21203, 21260, 21360, 21496, 21663, 21848, 22038, 22223,
+    22387, 22520, 22610, 22652, 22643, 22580, 22472, 22326,
+    22152, 21964, 21774, 21594, 21439, 21316, 21232, 21195,
+    21204, 21260, 21359, 21497, 21662, 21847, 22038, 22223,
+    22387, 22519, 22611, 22652, 22642, 22581, 22472, 22326,
+    22152, 21964, 21774, 21595, 21439, 21316, 21233, 21194,
+    21204, 21260, 21359, 21496, 21663, 21847, 22038, 22222,
+    22387, 22519, 22610, 22653, 22642, 22580, 22473, 22326,
+    22153, 21964, 21774, 21595, 21439, 21316, 21233, 21195,
+    21204, 21259, 21359, 21496, 21663, 21846, 22038, 22222,
+    22387, 22519, 22610, 22652, 22642, 22581, 22473, 22326,
+    22153, 21965, 21774, 21595, 21440, 21316, 21233, 21195,
+    21203, 21260, 21359, 21496, 21662, 21846, 22038, 22222,
+    22386, 22519, 22610, 22652, 22643, 22581, 22472, 22327,
+    22153, 21965, 21774, 21596, 21440, 21316, 21233, 21195,
+    21204, 21259, 21359, 21496, 21662, 21846, 22037, 22222,
+    22386, 22519, 22610, 22652, 22643, 22581, 22473, 22327,
+    22153, 21965, 21775, 21596, 21440, 21316, 21233, 21195,
+    21204, 21259, 21359, 21496, 21661, 21846, 22037, 22222,
+    22386, 22519, 22610, 22652, 22642, 22581, 22474, 22327,
+    22153, 21966, 21775, 21596, 21440, 21317, 21233, 21195,
+    21203, 21260, 21359, 21495, 21662, 21845, 22037, 22222,
+    22386, 22518, 22610, 22653, 22642, 22581, 22474, 22327,
+    22154, 21965, 21775, 21597, 21440, 21317, 21233, 21195,
+    21204, 21259, 21359, 21495, 21662, 21845, 22037, 22221,
+    22386, 22519, 22610, 22652, 22642, 22582, 22473, 22328,
+    22154, 21965, 21776, 21596, 21441, 21317, 21233, 21195,
+    21204, 21260, 21358, 21495, 21661, 21846, 22037, 22220,
+    22386, 22519, 22609, 22653, 22642, 22581, 22474, 22328,
+    22154, 21966, 21776, 21597, 21440, 21317, 21234, 21195,
+    21204, 21259, 21359, 21495, 21661, 21845, 22036, 22221,
+    22386, 22518, 22610, 22652, 22642, 22582, 22474, 22328,
+    22154, 21966, 21776, 21597, 21441, 21317, 21234, 21195,
+    21204, 21259, 21358, 21495, 21661, 21845, 22036, 22221,
+    22385, 22518, 22610, 22652, 22643, 22581, 22474, 22328,
+    22155, 21966, 21776, 21597, 21441, 21318, 21233, 21196,
+    21203, 21260, 21358, 21495, 21660, 21845, 22036, 22220,
+    22386, 22518, 22609, 22652, 22643, 22581, 22475, 22328,
+    22154, 21967, 21776, 21598, 21441, 21317, 21234, 21195,
+    21204, 21259, 21358, 21495, 21660, 21845, 22036, 22220,
+    22385, 22518, 22609, 22652, 22643, 22581, 22474, 22329,
+    22155, 21966, 21777, 21597, 21442, 21317, 21234, 21195,
+    21204, 21259, 21358, 21494, 21660, 21845, 22035, 22220,
+    22385, 22518, 22609, 22652, 22643, 22581, 22475, 22328,
+    22155, 21967, 21777, 21597, 21442, 21318, 21233, 21196,
+    21203, 21259, 21358, 21494, 21660, 21844, 22036, 22219,
+    22385, 22518, 22609, 22652, 22642, 22582, 22474, 22329,
+    22155, 21967, 21777, 21598, 21441, 21318, 21234, 21195,
+    21204, 21259, 21357, 21494, 21660, 21844, 22035, 22220,
+    22384, 22517, 22609, 22652, 22643, 22581, 22475, 22329,
+    22155, 21967, 21777, 21598, 21442, 21318, 21234, 21195,
+    21204, 21258, 21358, 21494, 21659, 21844, 22035, 22219,
+    22384, 22517, 22609, 22652, 22642, 22582, 22475, 22329,
+    22155, 21968, 21777, 21598, 21442, 21318, 21234, 21195,
+    21204, 21258, 21358, 21493, 21660, 21843, 22035, 22219,
+    22383, 22518, 22608, 22652, 22643, 22581, 22475, 22329,
+    22156, 21968, 21777, 21599, 21442, 21318, 21234, 21195,
+    21203, 21259, 21357, 21494, 21659, 21843, 22034, 22219,
+    22384, 22516, 22609, 22652, 22642, 22582, 22475, 22329,
+    22156, 21968, 21778, 21598, 21443, 21318, 21234, 21195,
+    21204, 21258, 21357, 21494, 21658, 21843, 22034, 22219,
+    22383, 22517, 22609, 22651, 22643, 22582, 22475, 22329,
+    22156, 21968, 21778, 21599, 21443, 21318, 21234, 21196,
+    21203, 21258, 21357, 21494, 21658, 21843, 22034, 22218,
+    22383, 22517, 22608, 22652, 22642, 22583, 22475, 22329,
+    22157, 21968, 21778, 21599, 21443, 21318, 21235, 21195,
+    21204, 21258, 21357, 21493, 21658, 21843, 22033, 22218,
+    22383, 22517, 22608, 22652, 22642, 22583, 22475, 22330,
+    22156, 21969, 21778, 21600, 21443, 21318, 21235, 21195,
+    21204, 21258, 21357, 21492, 21659, 21842, 22033, 22218,
+    22383, 22516, 22609, 22651, 22643, 22582, 22476, 22330,
+    22157, 21968, 21779, 21600, 21443, 21319, 21234, 21196,
+    21203, 21258, 21357, 21493, 21658, 21842, 22033, 22218,
+    22382, 22517, 22608, 22651, 22643, 22583, 22475, 22330,
+    22158, 21969, 21779, 21599, 21444, 21319, 21235, 21195,
+    21203, 21259, 21356, 21493, 21657, 21843, 22032, 22218,
+    22383, 22516, 22608, 22651, 22643, 22583, 22476, 22330,
+    22157, 21970, 21779, 21600, 21443, 21320, 21235, 21195,
+    21204, 21258, 21356, 21492, 21658, 21842, 22033, 22217,
+    22382, 22517, 22608, 22651, 22643, 22583, 22476, 22330,
+    22158, 21969, 21780, 21600, 21444, 21319, 21235, 21196,
+    21203, 21258, 21357, 21492, 21658, 21841, 22033, 22217,
+    22382, 22516, 22608, 22652, 22642, 22583, 22476, 22331,
+    22158, 21970, 21780, 21600, 21444, 21319, 21236, 21195,
+    21204, 21258, 21356, 21492, 21657, 21842, 22032, 22217,
+    22382, 22516, 22608, 22652, 22643, 22582, 22477, 22331,
+    22158, 21970, 21780, 21600, 21444, 21320, 21235, 21196,
+    21203, 21258, 21356, 21492, 21658, 21841, 22032, 22217,
+    22382, 22516, 22608, 22651, 22643, 22583, 22476, 22331,
+    22159, 21970, 21780, 21601, 21444, 21320, 21235, 21196,
+    21203, 21258, 21356, 21492, 21657, 21841, 22032, 22217,
+    22381, 22516, 22608, 22651, 22643, 22583, 22477, 22331,
+    22158, 21971, 21780, 21601, 21444, 21320, 21236, 21195,
+    21204, 21258, 21356, 21491, 21657, 21841, 22032, 22216,
+    22382, 22515, 22608, 22651, 22643, 22583, 22477, 22331,
+    22159, 21971, 21780, 21601, 21445, 21320, 21235, 21196,
+    21203, 21258, 21356, 21491, 21657, 21841, 22031, 22216,
+    22382, 22515, 22608, 22651, 22643, 22583, 22477, 22331,
+    22159, 21971, 21780, 21602, 21444, 21320, 21236, 21196,
+    21203, 21258, 21355, 21492, 21656, 21841, 22031, 22216,
+    22381, 22515, 22607, 22652, 22643, 22583, 22477, 22331,
+    22159, 21971, 21781, 21602, 21444, 21320, 21236, 21196,
+    21203, 21258, 21355, 21491, 21656, 21841, 22031, 22215,
+    22381, 22515, 22608, 22651, 22643, 22583, 22477, 22332,
+    22159, 21971, 21781, 21602, 21444, 21321, 21235, 21196,
+    21203, 21258, 21355, 21491, 21656, 21840, 22031, 22215,
+    22381, 22515, 22607, 22651, 22643, 22583, 22477, 22332,
+    22159, 21972, 21781, 21602, 21445, 21320, 21236, 21196,
+    21203, 21257, 21355, 21491, 21656, 21840, 22030, 22215,
+    22381, 22514, 22607, 22651, 22643, 22584, 22477, 22332,
+    22159, 21972, 21781, 21602, 21446, 21320, 21236, 21196,
+    21203, 21257, 21355, 21491, 21655, 21840, 22030, 22215,
+    22380, 22515, 22606, 22651, 22643, 22584, 22477, 22332,
+    22160, 21972, 21781, 21603, 21445, 21321, 21235, 21196,
+    21203, 21258, 21354, 21491, 21655, 21839, 22030, 22215,
+    22380, 22514, 22607, 22651, 22643, 22583, 22478, 22332,
+    22160, 21972, 21782, 21602, 21446, 21321, 21236, 21196,
+    21203, 21257, 21355, 21490, 21655, 21839, 22029, 22215,
+    22380, 22514, 22607, 22650, 22643, 22584, 22477, 22333,
+    22160, 21972, 21783, 21602, 21446, 21321, 21236, 21196,
+    21203, 21257, 21355, 21490, 21655, 21838, 22030, 22214,
+    22380, 22514, 22606, 22651, 22643, 22584, 22477, 22333,
+    22161, 21972, 21782, 21603, 21446, 21322, 21236, 21196,
+    21203, 21257, 21354, 21490, 21655, 21838, 22030, 22214,
+    22379, 22514, 22606, 22651, 22643, 22584, 22478, 22333,
+    22161, 21972, 21783, 21603, 21446, 21322, 21236, 21196,
+    21203, 21257, 21354, 21490, 21654, 21839, 22029, 22214,
+    22379, 22514, 22606, 22651, 22643, 22584, 22478, 22333,
+    22161, 21973, 21783, 21603, 21447, 21321, 21237, 21196,
+    21203, 21257, 21354, 21489, 21655, 21838, 22029, 22214,
+    22379, 22513, 22607, 22650, 22644, 22584, 22478, 22333,
+    22161, 21974, 21783, 21603, 21447, 21322, 21236, 21196,
+    21203, 21257, 21354, 21490, 21654, 21838, 22029, 22213,
+    22379, 22514, 22606, 22651, 22643, 22584, 22478, 22334,
+    22161, 21974, 21783, 21604, 21447, 21322, 21236, 21197,
+    21203, 21256, 21355, 21489, 21654, 21838, 22028, 22214,
+    22378, 22514, 22606, 22651, 22643, 22584, 22479, 22334,
+    22161, 21974, 21784, 21604, 21447, 21322, 21236, 21197,
+    21203, 21256, 21355, 21489, 21654, 21837, 22028, 22214,
+    22378, 22514, 22606, 22651, 22643, 22584, 22479, 22334,
+    22162, 21974, 21783, 21605, 21447, 21322, 21237, 21196,
+    21203, 21257, 21354, 21489, 21654, 21837, 22028, 22213,
+    22379, 22513, 22606, 22651, 22643, 22584, 22479, 22334,
+    22162, 21974, 21785, 21604, 21447, 21323, 21236, 21197,
+    21203, 21257, 21354, 21488, 21654, 21837, 22028, 22213,
+    22378, 22513, 22606, 22651, 22643, 22585, 22479, 22334,
+    22162, 21975, 21784, 21604, 21448, 21322, 21237, 21197,
+    21203, 21256, 21354, 21489, 21653, 21837, 22028, 22213,
+    22378, 22513, 22606, 22650, 22644, 22584, 22479, 22335,
+    22162, 21974, 21785, 21605, 21447, 21323, 21237, 21196,
+    21203, 21257, 21354, 21488, 21653, 21837, 22028, 22212,
+    22378, 22513, 22606, 22650, 22643, 22585, 22479, 22335,
+    22162, 21975, 21785, 21605, 21447, 21323, 21237, 21197,
+    21203, 21256, 21353, 21489, 21653, 21836, 22028, 22212,
+    22378, 22512, 22606, 22650, 22644, 22584, 22479, 22335,
+    22163, 21975, 21785, 21605, 21448, 21322, 21238, 21196,
+    21203, 21256, 21354, 21488, 21653, 21836, 22027, 22212,
+    22378, 22512, 22606, 22650, 22643, 22585, 22479, 22335,
+    22163, 21975, 21785, 21605, 21448, 21323, 21237, 21197,
+    21203, 21256, 21353, 21488, 21653, 21836, 22027, 22211,
+    22378, 22512, 22605, 22651, 22643, 22585, 22479, 22335,
+    22163, 21975, 21785, 21606, 21448, 21323, 21237, 21197,
+    21203, 21256, 21353, 21488, 21652, 21836, 22026, 22212,
+    22377, 22512, 22605, 22651, 22643, 22585, 22479, 22335,
+    22164, 21975, 21785, 21606, 21448, 21323, 21238, 21196,
+    21203, 21256, 21353, 21488, 21652, 21835, 22027, 22211,
+    22377, 22511, 22606, 22650, 22643, 22585, 22480, 22335,
+    22163, 21976, 21786, 21605, 21449, 21323, 21238, 21196,
+    21203, 21256, 21353, 21487, 21652, 21835, 22026, 22211,
+    22377, 22511, 22606, 22650, 22643, 22585, 22479, 22336,
+    22164, 21976, 21785, 21606, 21449, 21323, 21238, 21197,
+    21202, 21256, 21353, 21487, 21652, 21835, 22025, 22211,
+    22377, 22511, 22605, 22650, 22643, 22585, 22480, 22336,
+    22164, 21976, 21786, 21606, 21449, 21324, 21237, 21197,
+    21203, 21255, 21353, 21487, 21651, 21835, 22026, 22210,
+    22377, 22511, 22605, 22650, 22643, 22585, 22480, 22336,
+    22164, 21976, 21787, 21606, 21449, 21324, 21238, 21196,
+    21203, 21256, 21352, 21487, 21651, 21835, 22025, 22210,
+    22377, 22511, 22604, 22650, 22644, 22585, 22480, 22336,
+    22165, 21976, 21787, 21607, 21449, 21324, 21237, 21197,
+    21203, 21256, 21352, 21486, 21651, 21835, 22025, 22210,
+    22376, 22511, 22605, 22650, 22643, 22585, 22481, 22336,
+    22165, 21977, 21786, 21607, 21450, 21324, 21238, 21197,
+    21202, 21256, 21352, 21487, 21650, 21835, 22025, 22209,
+    22376, 22511, 22605, 22650, 22643, 22586, 22480, 22337,
+    22164, 21978, 21787, 21607, 21450, 21324, 21238, 21197,
+    21202, 21256, 21352, 21486, 21651, 21834, 22025, 22210,
+    22375, 22511, 22605, 22650, 22643, 22586, 22480, 22337,
+    22165, 21977, 21788, 21607, 21450, 21324, 21239, 21197,
+    21202, 21256, 21352, 21486, 21651, 21833, 22025, 22210,
+    22375, 22511, 22604, 22650, 22644, 22585, 22481, 22337,
+    22165, 21978, 21788, 21607, 21450, 21325, 21238, 21197,
+    21203, 21255, 21352, 21487, 21650, 21834, 22024, 22209,
+    22376, 22510, 22605, 22650, 22643, 22586, 22481, 22337,
+    22165, 21978, 21788, 21608, 21450, 21325, 21238, 21197,
+    21203, 21256, 21351, 21486, 21651, 21833, 22024, 22210,
+    22375, 22510, 22605, 22649, 22644, 22586, 22481, 22337,
+    22166, 21978, 21788, 21608, 21451, 21324, 21239, 21197,
+    21203, 21255, 21352, 21486, 21650, 21833, 22024, 22209,
+    22375, 22511, 22604, 22650, 22643, 22586, 22481, 22338,
+    22166, 21978, 21788, 21609, 21450, 21325, 21239, 21197,
+    21203, 21255, 21352, 21485, 21650, 21833, 22024, 22209,
+    22375, 22510, 22604, 22650, 22644, 22586, 22481, 22338,
+    22166, 21978, 21788, 21609, 21451, 21325, 21238, 21198,
+    21202, 21256, 21351, 21486, 21649, 21833, 22024, 22209,
+    22374, 22510, 22604, 22650, 22644, 22586, 22481, 22338,
+    22166, 21979, 21788, 21609, 21451, 21325, 21239, 21197,
+    21203, 21255, 21351, 21486, 21649, 21833, 22023, 22209,
+    22374, 22510, 22604, 22650, 22643, 22587, 22481, 22338,
+    22166, 21979, 21789, 21609, 21451, 21325, 21239, 21197,
+    21203, 21255, 21351, 21485, 21650, 21832, 22023, 22208,
+    22375, 22509, 22604, 22650, 22643, 22587, 22481, 22338,
+    22167, 21979, 21789, 21609, 21451, 21325, 21239, 21197,
+    21203, 21255, 21351, 21485, 21649, 21832, 22023, 22208,
+    22374, 22510, 22603, 22650, 22644, 22586, 22482, 22338,
+    22166, 21980, 21789, 21609, 21451, 21326, 21239, 21197,
+    21202, 21255, 21351, 21485, 21649, 21832, 22023, 22207,
+    22374, 22509, 22604, 22650, 22643, 22586, 22482, 22339,
+    22166, 21980, 21789, 21609, 21452, 21325, 21239, 21198,
+    21202, 21255, 21351, 21484, 21649, 21832, 22022, 22207,
+    22374, 22509, 22604, 22649, 22644, 22586, 22482, 22338,
+    22167, 21980, 21790, 21609, 21452, 21325, 21239, 21198,
+    21202, 21255, 21351, 21484, 21648, 21832, 22022, 22207,
+    22374, 22508, 22604, 22649, 22644, 22586, 22482, 22339,
+    22167, 21980, 21790, 21609, 21452, 21326, 21239, 21197,
+    21203, 21254, 21351, 21484, 21648, 21832, 22021, 22207,
+    22374, 22508, 22603, 22650, 22643, 22587, 22482, 22339,
+    22167, 21980, 21790, 21610, 21452, 21326, 21239, 21198,
+    21202, 21255, 21350, 21484, 21648, 21831, 22022, 22206,
+    22373, 22509, 22603, 22649, 22644, 22586, 22483, 22339,
+    22167, 21981, 21790, 21610, 21452, 21326, 21240, 21197,
+    21203, 21254, 21350, 21484, 21648, 21831, 22021, 22206,
+    22373, 22509, 22603, 22649, 22644, 22586, 22483, 22339,
+    22168, 21980, 21791, 21610, 21453, 21326, 21239, 21198,
+    21202, 21254, 21351, 21483, 21648, 21830, 22022, 22206,
+    22372, 22509, 22603, 22649, 22644, 22586, 22483, 22339,
+    22168, 21981, 21791, 21611, 21452, 21327, 21239, 21198,
+    21202, 21254, 21350, 21484, 21647, 21831, 22021, 22206,
+    22372, 22508, 22603, 22649, 22644, 22587, 22483, 22339,
+    22169, 21981, 21791, 21611, 21453, 21326, 21240, 21197,
+    21203, 21254, 21350, 21483, 21648, 21830, 22021, 22205,
+    22373, 22508, 22603, 22649, 22644, 22586, 22483, 22340,
+    22169, 21981, 21791, 21612, 21453, 21326, 21240, 21198,
+    21202, 21254, 21350, 21484, 21647, 21830, 22020, 22206,
+    22372, 22508, 22603, 22649, 22644, 22587, 22483, 22340,
+    22169, 21981, 21792, 21611, 21453, 21327, 21240, 21198,
+    21202, 21255, 21349, 21484, 21646, 21830, 22021, 22205,
+    22372, 22508, 22603, 22649, 22644, 22587, 22483, 22340,
+    22169, 21982, 21792, 21611, 21454, 21327, 21240, 21198,
+    21202, 21254, 21350, 21483, 21647, 21830, 22020, 22205,
+    22372, 22508, 22602, 22649, 22644, 22588, 22483, 22340,
+    22170, 21982, 21792, 21611, 21454, 21327, 21240, 21198,
+    21203, 21254, 21349, 21483, 21647, 21829, 22020, 22206,
+    22371, 22508, 22602, 22649, 22644, 22588, 22483, 22341,
+    22169, 21983, 21792, 21612, 21454, 21327, 21240, 21198,
+    21202, 21255, 21349, 21483, 21646, 21829, 22020, 22205,
+    22372, 22507, 22603, 22649, 22644, 22587, 22484, 22341,
+    22169, 21983, 21792, 21612, 21454, 21328, 21240, 21198,
+    21202, 21254, 21350, 21482, 21646, 21830, 22019, 22205,
+    22371, 22508, 22602, 22649, 22644, 22587, 22484, 22341,
+    22170, 21983, 21792, 21612, 21455, 21327, 21241, 21197,
+    21203, 21254, 21349, 21483, 21646, 21828, 22020, 22204,
+    22372, 22507, 22602, 22649, 22644, 22587, 22484, 22341,
+    22170, 21983, 21793, 21612, 21455, 21327, 21241, 21198,
+    21202, 21254, 21349, 21483, 21645, 21829, 22019, 22204,
+    22371, 22507, 22602, 22649, 22644, 22588, 22484, 22341,
+    22170, 21983, 21793, 21613, 21454, 21328, 21241, 21197,
+    21203, 21254, 21349, 21482, 21645, 21829, 22019, 22204,
+    22371, 22506, 22602, 22649, 22644, 22588, 22484, 22341,
+    22170, 21983, 21793, 21613, 21455, 21328, 21240, 21198,
+    21203, 21253, 21349, 21482, 21646, 21828, 22018, 22204,
+    22371, 22506, 22602, 22649, 22644, 22588, 22484, 22341,
+    22171, 21983, 21793, 21613, 21455, 21328, 21241, 21198,
+    21202, 21254, 21348, 21482, 21645, 21828, 22018, 22204,
+    22370, 22507, 22601, 22649, 22644, 22588, 22484, 22342,
+    22170, 21984, 21793, 21613, 21455, 21328, 21241, 21198,
+    21202, 21254, 21348, 21482, 21645, 21828, 22018, 22203,
+    22370, 22506, 22602, 22649, 22644, 22587, 22485, 22341,
+    22171, 21984, 21793, 21614, 21455, 21328, 21241, 21198,
+    21202, 21254, 21348, 21481, 21645, 21827, 22018, 22203,
+    22370, 22506, 22602, 22648, 22644, 22588, 22485, 22342,
+    22171, 21983, 21794, 21614, 21455, 21329, 21241, 21198,
+    21202, 21253, 21348, 21481, 21645, 21827, 22018, 22203,
+    22369, 22506, 22601, 22649, 22644, 22588, 22484, 22343,
+    22171, 21984, 21794, 21614, 21455, 21329, 21241, 21198,
+    21202, 21253, 21348, 21481, 21645, 21827, 22017, 22203,
+    22369, 22506, 22601, 22648, 22644, 22588, 22485, 22342,
+    22172, 21984, 21795, 21614, 21455, 21329, 21241, 21198,
+    21202, 21254, 21347, 21481, 21644, 21827, 22017, 22203,
+    22369, 22506, 22601, 22648, 22644, 22588, 22485, 22343,
+    22171, 21985, 21795, 21614, 21456, 21329, 21241, 21198,
+    21202, 21253, 21348, 21481, 21644, 21826, 22017, 22202,
+    22369, 22506, 22601, 22648, 22644, 22589, 22485, 22342,
+    22172, 21985, 21795, 21615, 21456, 21329, 21241, 21198,
+    21202, 21253, 21348, 21481, 21643, 21827, 22017, 22202,
+    22369, 22505, 22601, 22648, 22644, 22589, 22485, 22343,
+    22172, 21985, 21795, 21615, 21456, 21329, 21242, 21198,
+    21202, 21253, 21348, 21481, 21643, 21826, 22017, 22202,
+    22368, 22506, 22600, 22649, 22644, 22588, 22486, 22343,
+    22172, 21986, 21795, 21615, 21457, 21329, 21242, 21198,
+    21202, 21253, 21348, 21480, 21643, 21826, 22017, 22201,
+    22369, 22505, 22601, 22648, 22644, 22589, 22485, 22344,
+    22172, 21986, 21796, 21615, 21457, 21329, 21242, 21198,
+    21203, 21253, 21347, 21480, 21643, 21826, 22016, 22202,
+    22368, 22505, 22601, 22648, 22645, 22588, 22486, 22344,
+    22172, 21986, 21796, 21616, 21456, 21330, 21242, 21198,
+    21203, 21253, 21347, 21480, 21643, 21826, 22016, 22201,
+    22368, 22505, 22601, 22648, 22645, 22588, 22486, 22344,
+    22173, 21986, 21796, 21616, 21457, 21330, 21241, 21199,
+    21202, 21253, 21347, 21480, 21643, 21826, 22015, 22202,
+    22368, 22505, 22600, 22648, 22645, 22588, 22486, 22344,
+    22174, 21986, 21796, 21616, 21457, 21330, 21242, 21199,
+    21202, 21253, 21347, 21480, 21643, 21825, 22015, 22201,
+    22368, 22505, 22600, 22649, 22644, 22589, 22486, 22344,
+    22173, 21987, 21796, 21616, 21458, 21330, 21242, 21199,
+    21202, 21253, 21347, 21479, 21643, 21825, 22015, 22201,
+    22368, 22504, 22601, 22648, 22644, 22589, 22486, 22345,
+    22173, 21987, 21796, 21617, 21457, 21330, 21243, 21198,
+    21202, 21253, 21347, 21480, 21642, 21825, 22015, 22200,
+    22368, 22504, 22601, 22648, 22644, 22589, 22486, 22345,
+    22173, 21987, 21797, 21616, 21458, 21330, 21243, 21198,
+    21202, 21253, 21347, 21479, 21642, 21825, 22015, 22200,
+    22368, 22504, 22600, 22648, 22644, 22589, 22486, 22345,
+    22174, 21987, 21797, 21617, 21457, 21331, 21242, 21199,
+    21202, 21252, 21347, 21479, 21642, 21824, 22015, 22200,
+    22367, 22504, 22600, 22648, 22645, 22589, 22486, 22345,
+    22174, 21987, 21797, 21617, 21458, 21330, 21243, 21198,
+    21202, 21253, 21346, 21479, 21642, 21824, 22015, 22199,
+    22367, 22504, 22600, 22648, 22644, 22589, 22487, 22344,
+    22175, 21987, 21797, 21617, 21459, 21330, 21243, 21198,
+    21202, 21253, 21346, 21479, 21641, 21824, 22014, 22200,
+    22367, 22503, 22600, 22648, 22644, 22589, 22487, 22345,
+    22174, 21988, 21797, 21617, 21459, 21330, 21243, 21199,
+    21202, 21252, 21346, 21479, 21641, 21823, 22014, 22200,
+    22366, 22503, 22600, 22648, 22644, 22589, 22487, 22345,
+    22175, 21988, 21797, 21618, 21458, 21331, 21243, 21198,
+    21202, 21252, 21346, 21479, 21641, 21823, 22014, 22199,
+    22366, 22503, 22600, 22648, 22644, 22589, 22487, 22345,
+    22175, 21988, 21798, 21618, 21458, 21331, 21243, 21199,
+    21202, 21252, 21346, 21478, 21640, 21824, 22013, 22199,
+    22366, 22503, 22599, 22648, 22644, 22590, 22487, 22345,
+    22175, 21988, 21799, 21617, 21459, 21331, 21243, 21199,
+    21202, 21252, 21346, 21478, 21640, 21823, 22013, 22199,
+    22366, 22503, 22599, 22648, 22644, 22589, 22487, 22346,
+    22175, 21989, 21798, 21618, 21459, 21332, 21243, 21198,
+    21202, 21252, 21346, 21478, 21640, 21823, 22013, 22198,
+    22366, 22503, 22599, 22648, 22644, 22589, 22488, 22345,
+    22176, 21989, 21798, 21619, 21459, 21331, 21243, 21199,
+    21202, 21252, 21346, 21477, 21641, 21822, 22013, 22198,
+    22366, 22502, 22599, 22648, 22644, 22590, 22487, 22346,
+    22176, 21989, 21799, 21619, 21459, 21332, 21243, 21199,
+    21202, 21252, 21345, 21478, 21640, 21822, 22013, 22198,
+    22365, 22502, 22599, 22648, 22644, 22590, 22488, 22346,
+    22176, 21989, 21800, 21618, 21460, 21332, 21243, 21199,
+    21202, 21252, 21345, 21478, 21639, 21823, 22012, 22198,
+    22365, 22502, 22599, 22648, 22644, 22590, 22488, 22346,
+    22177, 21989, 21800, 21619, 21460, 21332, 21243, 21199,
+    21202, 21252, 21345, 21477, 21640, 21822, 22012, 22198,
+    22365, 22502, 22599, 22648, 22644, 22590, 22488, 22347,
+    22176, 21990, 21800, 21619, 21460, 21332, 21244, 21199,
+    21202, 21251, 21346, 21477, 21639, 21822, 22012, 22198,
+    22365, 22502, 22599, 22647, 22645, 22590, 22488, 22347,
+    22176, 21990, 21800, 21620, 21460, 21332, 21244, 21199,
+    21202, 21252, 21345, 21477, 21639, 21822, 22012, 22197,
+    22365, 22502, 22599, 22647, 22645, 22590, 22488, 22347,
+    22177, 21990, 21800, 21620, 21460, 21333, 21243, 21200,
+    21202, 21251, 21345, 21477, 21640, 21821, 22012, 22197,
+    22364, 22502, 22599, 22647, 22645, 22590, 22489, 22347,
+    22177, 21990, 21800, 21620, 21461, 21332, 21244, 21200,
+    21202, 21251, 21345, 21477, 21639, 21821, 22012, 22197,
+    22364, 22502, 22598, 22648, 22644, 22590, 22489, 22347,
+    22178, 21990, 21801, 21620, 21460, 21333, 21244, 21199,
+    21202, 21252, 21345, 21476, 21639, 21821, 22011, 22197,
+    22364, 22502, 22598, 22648, 22644, 22591, 22488, 22348,
+    22177, 21991, 21801, 21620, 21461, 21332, 21244, 21200,
+    21202, 21251, 21345, 21476, 21639, 21821, 22011, 22196,
+    22364, 22502, 22598, 22647, 22645, 22590, 22489, 22347,
+    22178, 21991, 21801, 21620, 21461, 21333, 21244, 21200,
+    21202, 21251, 21344, 21477, 21638, 21821, 22010, 22197,
+    22364, 22501, 22598, 22647, 22645, 22590, 22489, 22348,
+    22177, 21991, 21802, 21620, 21461, 21333, 21244, 21200,
+    21202, 21251, 21344, 21476, 21639, 21820, 22010, 22196,
+    22364, 22501, 22598, 22647, 22645, 22590, 22489, 22348,
+    22178, 21991, 21801, 21621, 21461, 21334, 21244, 21199,
+    21202, 21251, 21344, 21476, 21638, 21820, 22011, 22195,
+    22364, 22501, 22598, 22647, 22644, 22591, 22488, 22348,
+    22179, 21991, 21802, 21620, 21462, 21333, 21244, 21200,
+    21202, 21251, 21344, 21475, 21638, 21820, 22010, 22196,
+    22363, 22500, 22598, 22647, 22645, 22590, 22489, 22348,
+    22179, 21991, 21802, 21621, 21462, 21333, 21244, 21200,
+    21202, 21250, 21344, 21476, 21638, 21819, 22010, 22195,
+    22363, 22501, 22597, 22647, 22645, 22590, 22489, 22349,
+    22178, 21992, 21802, 21621, 21462, 21333, 21245, 21199,
+    21202, 21251, 21344, 21475, 21637, 21820, 22009, 22195,
+    22363, 22500, 22598, 22647, 22644, 22591, 22489, 22349,
+    22178, 21992, 21803, 21621, 21462, 21334, 21244, 21200,
+    21201, 21251, 21344, 21475, 21637, 21819, 22009, 22195,
+    22363, 22500, 22597, 22647, 22645, 22590, 22490, 22348,
+    22179, 21993, 21802, 21622, 21462, 21334, 21244, 21200,
+    21202, 21250, 21344, 21475, 21637, 21819, 22009, 22194,
+    22363, 22500, 22597, 22647, 22644, 22591, 22490, 22349,
+    22179, 21992, 21803, 21622, 21462, 21334, 21245, 21200,
+    21201, 21251, 21344, 21474, 21637, 21819, 22008, 22195,
+    22362, 22500, 22597, 22647, 22644, 22591, 22490, 22349,
+    22179, 21993, 21803, 21622, 21463, 21334, 21245, 21200,
+    21202, 21250, 21343, 21475, 21637, 21818, 22009, 22194,
+    22362, 22500, 22597, 22647, 22644, 22591, 22490, 22349,
+    22180, 21993, 21803, 21623, 21462, 21335, 21245, 21200,
+    21201, 21251, 21343, 21475, 21636, 21818, 22009, 22194,
+    22362, 22499, 22597, 22647, 22645, 22591, 22490, 22349,
+    22180, 21994, 21803, 21623, 21463, 21334, 21245, 21200,
+    21202, 21250, 21344, 21474, 21636, 21818, 22009, 22193,
+    22362, 22500, 22597, 22646, 22645, 22591, 22490, 22350,
+    22180, 21994, 21803, 21623, 21464, 21334, 21245, 21200,
+    21202, 21251, 21343, 21474, 21636, 21818, 22008, 22194,
+    22361, 22500, 22597, 22646, 22645, 22591, 22491, 22350,
+    22180, 21994, 21804, 21623, 21463, 21335, 21245, 21200,
+    21202, 21251, 21343, 21474, 21636, 21817, 22008, 22194,
+    22361, 22499, 22597, 22647, 22645, 22591, 22491, 22350,
+    22180, 21994, 21804, 21624, 21463, 21335, 21246, 21200,
+    21202, 21250, 21343, 21474, 21636, 21817, 22008, 22193,
+    22361, 22500, 22596, 22647, 22645, 22591, 22491, 22350,
+    22181, 21994, 21805, 21623, 21464, 21335, 21245, 21201,
+    21201, 21251, 21343, 21474, 21635, 21817, 22008, 22193,
+    22361, 22499, 22597, 22646, 22645, 22592, 22491, 22350,
+    22181, 21994, 21805, 21623, 21464, 21336, 21245, 21200,
+    21202, 21250, 21343, 21474, 21635, 21818, 22007, 22193,
+    22361, 22498, 22597, 22647, 22644, 22592, 22491, 22350,
+    22181, 21995, 21805, 21624, 21464, 21335, 21246, 21200,
+    21202, 21250, 21343, 21473, 21635, 21817, 22007, 22193,
+    22361, 22499, 22596, 22647, 22644, 22592, 22491, 22351,
+    22181, 21995, 21805, 21624, 21464, 21335, 21246, 21200,
+    21202, 21250, 21343, 21473, 21635, 21817, 22007, 22192,
+    22361, 22498, 22596, 22647, 22645, 22591, 22491, 22351,
+    22181, 21996, 21805, 21624, 21464, 21336, 21246, 21200,
+    21202, 21250, 21342, 21473, 21635, 21816, 22007, 22192,
+    22360, 22499, 22596, 22646, 22645, 22592, 22491, 22351,
+    22181, 21996, 21805, 21624, 21465, 21336, 21245, 21201,
+    21201, 21250, 21343, 21473, 21634, 21816, 22007, 22192,
+    22360, 22498, 22596, 22646, 22645, 22592, 22491, 22351,
+    22182, 21995, 21806, 21624, 21465, 21336, 21245, 21201,
+    21201, 21250, 21342, 21473, 21635, 21815, 22007, 22191,
+    22360, 22498, 22596, 22646, 22645, 22592, 22491, 22351,
+    22182, 21996, 21805, 21625, 21465, 21336, 21246, 21200,
+    21202, 21249, 21342, 21473, 21634, 21816, 22006, 22191,
+    22360, 22498, 22595, 22647, 22644, 22592, 22492, 22351,
+    22182, 21996, 21806, 21624, 21465, 21337, 21246, 21200,
+    21202, 21249, 21342, 21473, 21633, 21816, 22005, 22192,
+    22359, 22498, 22595, 22646, 22645, 22592, 22491, 22352,
+    22182, 21996, 21806, 21625, 21466, 21336, 21246, 21200,
+    21202, 21249, 21342, 21473, 21633, 21815, 22006, 22191,
+    22359, 22497, 22596, 22646, 22645, 22592, 22491, 22352,
+    22182, 21997, 21806, 21625, 21466, 21336, 21246, 21201,
+    21201, 21250, 21341, 21472, 21634, 21815, 22005, 22191,
+    22359, 22497, 22595, 22646, 22645, 22592, 22492, 22352,
+    22183, 21996, 21807, 21625, 21466, 21336, 21247, 21200,
+    21202, 21249, 21342, 21472, 21633, 21814, 22005, 22191,
+    22359, 22497, 22595, 22646, 22645, 22592, 22492, 22352,
+    22183, 21997, 21807, 21625, 21466, 21337, 21246, 21201,
+    21201, 21250, 21341, 21472, 21633, 21815, 22004, 22191,
+    22358, 22497, 22595, 22646, 22645, 22592, 22493, 22352,
+    22183, 21997, 21807, 21626, 21466, 21337, 21247, 21200,
+    21202, 21249, 21341, 21472, 21633, 21814, 22005, 22190,
+    22358, 22497, 22595, 22646, 22645, 22593, 22492, 22352,
+    22184, 21997, 21807, 21627, 21466, 21337, 21247, 21200,
+    21202, 21249, 21341, 21472, 21633, 21814, 22004, 22190,
+    22358, 22497, 22595, 22646, 22645, 22592, 22493, 22353,
+    22183, 21998, 21807, 21627, 21466, 21338, 21246, 21201,
+    21202, 21249, 21341, 21472, 21632, 21814, 22004, 22190,
+    22358, 22497, 22595, 22646, 22645, 22592, 22493, 22353,
+    22184, 21997, 21808, 21627, 21467, 21337, 21247, 21201,
+    21201, 21250, 21341, 21471, 21632, 21814, 22004, 22190,
+    22358, 22496, 22595, 22646, 22645, 22593, 22492, 22353,
+    22185, 21998, 21808, 21627, 21466, 21338, 21247, 21201,
+    21201, 21250, 21341, 21471, 21632, 21814, 22003, 22190,
+    22358, 22496, 22595, 22646, 22645, 22593, 22492, 22354,
+    22184, 21998, 21808, 21628, 21467, 21337, 21248, 21201,
+    21201, 21249, 21341, 21471, 21632, 21814, 22003, 22190,
+    22357, 22496, 22595, 22646, 22645, 22593, 22493, 22353,
+    22185, 21998, 21809, 21627, 21467, 21338, 21247, 21201,
+    21202, 21249, 21341, 21471, 21632, 21813, 22003, 22189,
+    22358, 22496, 22595, 22645, 22645, 22593, 22493, 22354,
+    22185, 21998, 21809, 21627, 21468, 21338, 21247, 21201,
+    21202, 21249, 21340, 21471, 21632, 21813, 22003, 22189,
+    22357, 22496, 22595, 22645, 22646, 22592, 22494, 22353,
+    22185, 21999, 21809, 21628, 21467, 21338, 21248, 21201,
+    21201, 21249, 21341, 21470, 21632, 21813, 22003, 22188,
+    22357, 22496, 22595, 22645, 22645, 22593, 22493, 22354,
+    22185, 21999, 21809, 21628, 21468, 21338, 21248, 21201,
+    21201, 21249, 21340, 21471, 21631, 21813, 22002, 22189,
+    22357, 22495, 22595, 22645, 22645, 22593, 22494, 22354,
+    22185, 21999, 21809, 21628, 21468, 21338, 21248, 21201,
+    21201, 21249, 21340, 21471, 21631, 21812, 22003, 22188,
+    22356, 22496, 22594, 22646, 22645, 22593, 22493, 22354,
+    22185, 22000, 21809, 21628, 21468, 21339, 21247, 21201,
+    21202, 21249, 21340, 21470, 21631, 21812, 22002, 22188,
+    22356, 22496, 22594, 22645, 22645, 22593, 22494, 22354,
+    22185, 22000, 21809, 21629, 21468, 21338, 21248, 21201,
+    21202, 21248, 21340, 21470, 21631, 21812, 22002, 22187,
+    22356, 22495, 22594, 22646, 22645, 22593, 22493, 22355,
+    22185, 22000, 21810, 21629, 21468, 21338, 21248, 21201,
+    21202, 21248, 21340, 21470, 21630, 21812, 22001, 22188,
+    22356, 22495, 22594, 22645, 22645, 22593, 22494, 22354,
+    22186, 22000, 21810, 21629, 21468, 21339, 21248, 21201,
+    21201, 21249, 21339, 21470, 21630, 21812, 22001, 22187,
+    22356, 22495, 22593, 22645, 22645, 22594, 22494, 22354,
+    22186, 22000, 21811, 21629, 21468, 21339, 21248, 21201,
+    21202, 21248, 21340, 21469, 21630, 21811, 22001, 22187,
+    22356, 22494, 22594, 22645, 22645, 22593, 22494, 22355,
+    22186, 22001, 21810, 21629, 21469, 21339, 21248, 21202,
+    21201, 21248, 21340, 21469, 21630, 21811, 22000, 22187,
+    22356, 22494, 22593, 22645, 22645, 22594, 22494, 22355,
+    22187, 22000, 21811, 21629, 21469, 21340, 21248, 21201,
+    21202, 21248, 21339, 21469, 21630, 21810, 22001, 22187,
+    22355, 22494, 22593, 22645, 22645, 22594, 22494, 22356,
+    22186, 22001, 21811, 21630, 21469, 21340, 21248, 21201,
+    21202, 21248, 21339, 21469, 21629, 21811, 22000, 22187,
+    22354, 22495, 22593, 22645, 22645, 22594, 22494, 22356,
+    22187, 22001, 21811, 21630, 21469, 21340, 21248, 21202,
+    21201, 21248, 21339, 21469, 21629, 21811, 22000, 22186,
+    22355, 22494, 22593, 22645, 22645, 22594, 22495, 22355,
+    22188, 22001, 21811, 21631, 21469, 21340, 21249, 21201,
+    21202, 21248, 21339, 21468, 21629, 21811, 22000, 22186,
+    22354, 22494, 22593, 22645, 22645, 22594, 22495, 22356,
+    22187, 22002, 21812, 21630, 21470, 21340, 21249, 21201,
+    21202, 21248, 21339, 21468, 21629, 21810, 22000, 22186,
+    22354, 22494, 22593, 22645, 22645, 22594, 22495, 22356,
+    22188, 22002, 21812, 21630, 21470, 21341, 21248, 21202,
+    21202, 21248, 21338, 21469, 21629, 21809, 22000, 22186,
+    22354, 22494, 22593, 22645, 22645, 22594, 22495, 22356,
+    22188, 22002, 21812, 21631, 21471, 21340, 21249, 21201,
+    21202, 21248, 21339, 21468, 21629, 21809, 22000, 22185,
+    22354, 22494, 22593, 22645, 22645, 22594, 22495, 22357,
+    22188, 22002, 21812, 21632, 21470, 21340, 21249, 21202,
+    21202, 21248, 21338, 21468, 21629, 21809, 22000, 22185,
+    22354, 22493, 22593, 22645, 22645, 22594, 22496, 22356,
+    22189, 22002, 21813, 21631, 21471, 21340, 21249, 21202,
+    21201, 21248, 21339, 21468, 21628, 21809, 22000, 22185,
+    22353, 22494, 22592, 22645, 22646, 22594, 22495, 22357,
+    22188, 22003, 21813, 21631, 21471, 21341, 21249, 21202,
+    21201, 21248, 21338, 21468, 21628, 21809, 21999, 22185,
+    22354, 22493, 22593, 22644, 22646, 22594, 22495, 22357,
+    22189, 22003, 21813, 21631, 21471, 21341, 21249, 21202,
+    21201, 21248, 21339, 21467, 21628, 21809, 21999, 22184,
+    22354, 22493, 22592, 22645, 22645, 22594, 22496, 22357,
+    22189, 22003, 21813, 21632, 21471, 21341, 21249, 21202,
+    21201, 21248, 21338, 21467, 21628, 21809, 21998, 22185,
+    22353, 22493, 22592, 22644, 22646, 22594, 22496, 22357,
+    22189, 22003, 21813, 21632, 21471, 21341, 21250, 21202,
+    21201, 21248, 21338, 21467, 21627, 21809, 21998, 22184,
+    22353, 22493, 22592, 22644, 22646, 22594, 22496, 22357,
+    22189, 22004, 21813, 21632, 21472, 21341, 21249, 21202,
+    21201, 21248, 21338, 21467, 21627, 21808, 21998, 22184,
+    22353, 22492, 22592, 22645, 22645, 22594, 22496, 22357,
+    22190, 22003, 21814, 21632, 21472, 21341, 21250, 21202,
+    21201, 21247, 21338, 21467, 21627, 21808, 21997, 22184,
+    22353, 22492, 22592, 22644, 22645, 22595, 22496, 22357,
+    22190, 22003, 21814, 21633, 21472, 21341, 21250, 21201,
+    21202, 21247, 21338, 21466, 21627, 21808, 21997, 22184,
+    22352, 22492, 22592, 22644, 22645, 22595, 22496, 22357,
+    22190, 22004, 21814, 21633, 21472, 21341, 21250, 21202,
+    21201, 21247, 21338, 21466, 21627, 21807, 21998, 22183,
+    22352, 22492, 22591, 22644, 22646, 22594, 22496, 22358,
+    22190, 22004, 21815, 21633, 21472, 21341, 21250, 21202,
+    21201, 21248, 21337, 21466, 21627, 21807, 21997, 22183,
+    22352, 22491, 22592, 22644, 22645, 22595, 22496, 22358,
+    22190, 22005, 21814, 21634, 21472, 21342, 21250, 21202,
+    21201, 21247, 21337, 21466, 21627, 21806, 21997, 22183,
+    22352, 22491, 22592, 22644, 22645, 22595, 22496, 22358,
+    22191, 22004, 21815, 21634, 21472, 21342, 21250, 21202,
+    21202, 21247, 21337, 21466, 21626, 21806, 21997, 22182,
+    22352, 22491, 22592, 22644, 22645, 22595, 22497, 22358,
+    22191, 22005, 21815, 21633, 21473, 21342, 21250, 21203,
+    21201, 21247, 21337, 21466, 21625, 21807, 21996, 22183,
+    22351, 22491, 22591, 22645, 22645, 22595, 22497, 22358,
+    22191, 22005, 21816, 21634, 21472, 21343, 21250, 21202,
+    21202, 21247, 21337, 21465, 21626, 21806, 21996, 22183,
+    22351, 22491, 22591, 22644, 22645, 22595, 22498, 22358,
+    22191, 22006, 21816, 21634, 21473, 21342, 21251, 21202,
+    21201, 21247, 21337, 21466, 21625, 21806, 21996, 22182,
+    22351, 22491, 22591, 22644, 22646, 22595, 22497, 22359,
+    22191, 22006, 21816, 21634, 21474, 21342, 21251, 21202,
+    21202, 21247, 21336, 21466, 21625, 21806, 21996, 22182,
+    22351, 22491, 22591, 22644, 22645, 22595, 22498, 22359,
+    22191, 22006, 21816, 21635, 21473, 21343, 21251, 21203,
+    21201, 21247, 21336, 21466, 21625, 21806, 21995, 22182,
+    22351, 22490, 22591, 22644, 22646, 22595, 22498, 22359,
+    22192, 22006, 21816, 21635, 21474, 21343, 21250, 21203,
+    21201, 21247, 21337, 21465, 21625, 21806, 21995, 22182,
+    22350, 22491, 22591, 22644, 22645, 22595, 22498, 22360,
+    22191, 22007, 21816, 21635, 21474, 21343, 21251, 21203,
+    21201, 21247, 21336, 21466, 21624, 21806, 21995, 22181,
+    22351, 22490, 22591, 22644, 22645, 22596, 22497, 22360,
+    22192, 22007, 21817, 21635, 21474, 21343, 21251, 21203,
+    21201, 21247, 21336, 21465, 21625, 21805, 21995, 22181,
+    22350, 22490, 22591, 22644, 22646, 22595, 22498, 22360,
+    22192, 22007, 21817, 21635, 21474, 21343, 21252, 21202,
+    21201, 21247, 21336, 21465, 21625, 21805, 21995, 22180,
+    22350, 22491, 22590, 22644, 22645, 22596, 22498, 22360,
+    22192, 22007, 21817, 21636, 21474, 21343, 21252, 21202,
+    21202, 21246, 21336, 21465, 21624, 21805, 21995, 22180,
+    22350, 22490, 22590, 22644, 22646, 22595, 22498, 22360,
+    22193, 22007, 21817, 21636, 21474, 21344, 21251, 21203,
+    21201, 21246, 21337, 21464, 21624, 21805, 21994, 22180,
+    22350, 22490, 22590, 22644, 22645, 22596, 22498, 22360,
+    22193, 22007, 21817, 21636, 21475, 21343, 21252, 21203,
+    21201, 21246, 21336, 21464, 21624, 21804, 21994, 22181,
+    22349, 22489, 22591, 22643, 22646, 22595, 22498, 22361,
+    22193, 22007, 21818, 21636, 21475, 21343, 21252, 21202,
+    21202, 21246, 21336, 21464, 21623, 21804, 21994, 22180,
+    22349, 22490, 22590, 22643, 22645, 22596, 22498, 22361,
+    22193, 22008, 21817, 21637, 21475, 21344, 21251, 21203,
+    21201, 21246, 21336, 21464, 21623, 21804, 21993, 22180,
+    22349, 22489, 22590, 22643, 22646, 22595, 22499, 22360,
+    22194, 22007, 21819, 21636, 21475, 21344, 21252, 21202,
+    21202, 21246, 21335, 21464, 21623, 21804, 21993, 22179,
+    22349, 22489, 22590, 22643, 22645, 22596, 22499, 22360,
+    22194, 22008, 21818, 21637, 21475, 21344, 21252, 21203,
+    21201, 21246, 21335, 21464, 21623, 21803, 21993, 22179,
+    22349, 22489, 22589, 22643, 22646, 22596, 22498, 22361,
+    22194, 22008, 21819, 21637, 21475, 21345, 21251, 21203,
+    21201, 21246, 21335, 21464, 21623, 21803, 21992, 22179,
+    22349, 22488, 22590, 22643, 22645, 22596, 22499, 22361,
+    22194, 22009, 21818, 21638, 21475, 21345, 21252, 21203,
+    21201, 21246, 21335, 21463, 21623, 21802, 21993, 22179,
+    22348, 22488, 22590, 22643, 22645, 22596, 22499, 22362,
+    22194, 22009, 21819, 21637, 21476, 21344, 21252, 21204,
+    21201, 21245, 21335, 21464, 21622, 21803, 21992, 22178,
+    22348, 22489, 22589, 22643, 22646, 22596, 22499, 22361,
+    22195, 22009, 21819, 21638, 21476, 21345, 21252, 21203,
+    21201, 21246, 21335, 21463, 21622, 21802, 21993, 22178,
+    22348, 22488, 22589, 22643, 22646, 22596, 22499, 22362,
+    22195, 22009, 21819, 21638, 21477, 21345, 21252, 21203,
+    21201, 21246, 21335, 21463, 21622, 21802, 21992, 22178,
+    22348, 22488, 22589, 22643, 22646, 22596, 22499, 22362,
+    22195, 22010, 21820, 21638, 21476, 21345, 21253, 21203,
+    21201, 21246, 21335, 21462, 21622, 21802, 21992, 22178,
+    22348, 22488, 22589, 22643, 22645, 22597, 22499, 22363,
+    22195, 22009, 21820, 21639, 21476, 21346, 21252, 21204,
+    21201, 21246, 21334, 21463, 21622, 21802, 21991, 22178,
+    22347, 22488, 22589, 22643, 22646, 22596, 22500, 22362,
+    22196, 22010, 21820, 21638, 21477, 21346, 21253, 21203,
+    21201, 21246, 21334, 21463, 21622, 21801, 21992, 22177,
+    22347, 22488, 22589, 22643, 22646, 22596, 22500, 22363,
+    22195, 22010, 21821, 21639, 21477, 21345, 21253, 21204,
+    21201, 21245, 21335, 21462, 21622, 21801, 21992, 22177,
+    22347, 22488, 22588, 22643, 22646, 22597, 22500, 22362,
+    22196, 22010, 21821, 21639, 21477, 21346, 21253, 21203,
+    21202, 21245, 21335, 21462, 21621, 21802, 21991, 22177,
+    22347, 22487, 22589, 22643, 22645, 22597, 22500, 22363,
+    22196, 22010, 21821, 21639, 21478, 21346, 21253, 21203,
+    21201, 21246, 21334, 21462, 21621, 21802, 21990, 22177,
+    22347, 22487, 22589, 22643, 22645, 22597, 22500, 22363,
+    22196, 22011, 21821, 21639, 21478, 21346, 21253, 21204,
+    21201, 21245, 21334, 21462, 21621, 21801, 21991, 22177,
+    22346, 22487, 22589, 22642, 22646, 22597, 22500, 22363,
+    22196, 22011, 21821, 21640, 21478, 21346, 21253, 21204,
+    21201, 21245, 21334, 21462, 21620, 21801, 21991, 22176,
+    22346, 22487, 22589, 22642, 22646, 22597, 22500, 22363,
+    22197, 22011, 21821, 21640, 21478, 21346, 21253, 21204,
+    21201, 21245, 21334, 21462, 21620, 21800, 21991, 22176,
+    22346, 22487, 22588, 22643, 22645, 22597, 22500, 22364,
+    22196, 22011, 21822, 21640, 21478, 21346, 21253, 21204,
+    21201, 21245, 21334, 21461, 21621, 21800, 21990, 22176,
+    22346, 22486, 22588, 22643, 22645, 22597, 22501, 22363,
+    22197, 22011, 21822, 21640, 21478, 21347, 21253, 21204,
+    21201, 21245, 21334, 21461, 21620, 21800, 21989, 22176,
+    22346, 22486, 22588, 22642, 22646, 22597, 22500, 22364,
+    22197, 22012, 21822, 21640, 21478, 21347, 21253, 21204,
+    21201, 21245, 21333, 21461, 21620, 21800, 21989, 22176,
+    22345, 22486, 22588, 22642, 22646, 22597, 22501, 22363,
+    22197, 22012, 21823, 21640, 21478, 21347, 21254, 21203,
+    21201, 21245, 21334, 21460, 21620, 21800, 21989, 22175,
+    22345, 22486, 22588, 22642, 22646, 22597, 22500, 22364,
+    22198, 22012, 21822, 21641, 21478, 21347, 21254, 21204,
+    21201, 21245, 21333, 21460, 21620, 21799, 21989, 22175,
+    22345, 22486, 22587, 22643, 22645, 22597, 22501, 22364,
+    22198, 22012, 21823, 21641, 21478, 21348, 21253, 21204,
+    21201, 21245, 21333, 21460, 21620, 21799, 21988, 22175,
+    22345, 22485, 22588, 22642, 22646, 22597, 22501, 22364,
+    22198, 22013, 21823, 21641, 21479, 21347, 21254, 21204,
+    21201, 21244, 21333, 21461, 21619, 21799, 21988, 22174,
+    22345, 22486, 22587, 22642, 22646, 22597, 22501, 22365,
+    22198, 22013, 21823, 21641, 21479, 21348, 21254, 21204,
+    21201, 21244, 21333, 21460, 21619, 21799, 21988, 22175,
+    22344, 22485, 22588, 22642, 22645, 22598, 22501, 22365,
+    22198, 22013, 21824, 21641, 21480, 21347, 21254, 21204,
+    21201, 21245, 21333, 21460, 21619, 21798, 21988, 22174,
+    22344, 22486, 22587, 22642, 22646, 22597, 22502, 22365,
+    22198, 22014, 21823, 21642, 21480, 21348, 21254, 21204,
+    21201, 21245, 21332, 21460, 21619, 21798, 21988, 22174,
+    22344, 22485, 22587, 22642, 22646, 22598, 22501, 22365,
+    22199, 22014, 21824, 21642, 21480, 21348, 21254, 21204,
+    21201, 21245, 21332, 21460, 21619, 21798, 21987, 22174,
+    22344, 22485, 22587, 22642, 22646, 22598, 22502, 22365,
+    22199, 22014, 21824, 21642, 21480, 21348, 21255, 21204,
+    21201, 21245, 21332, 21460, 21618, 21798, 21988, 22173,
+    22344, 22485, 22587, 22642, 22646, 22597, 22502, 22366,
+    22199, 22014, 21824, 21643, 21480, 21349, 21254, 21204,
+    21201, 21245, 21333, 21459, 21618, 21798, 21987, 22174,
+    22343, 22485, 22587, 22642, 22646, 22598, 22502, 22365,
+    22200, 22014, 21825, 21642, 21481, 21348, 21255, 21204,
+    21201, 21245, 21332, 21460, 21617, 21798, 21987, 22173,
+    22344, 22484, 22587, 22642, 22646, 22598, 22502, 22366,
+    22199, 22015, 21825, 21643, 21480, 21349, 21255, 21204,
+    21201, 21245, 21332, 21459, 21618, 21797, 21987, 22173,
+    22343, 22485, 22587, 22642, 22645, 22598, 22503, 22366,
+    22199, 22015, 21825, 21643, 21481, 21348, 21255, 21205,
+    21201, 21244, 21332, 21459, 21618, 21797, 21987, 22173,
+    22343, 22484, 22587, 22642, 22645, 22598, 22503, 22366,
+    22199, 22015, 21826, 21643, 21481, 21349, 21254, 21205,
+    21201, 21244, 21332, 21459, 21618, 21797, 21986, 22173,
+    22342, 22485, 22586, 22642, 22646, 22598, 22502, 22366,
+    22200, 22015, 21826, 21643, 21481, 21349, 21255, 21205,
+    21200, 21245, 21332, 21458, 21618, 21796, 21986, 22173,
+    22342, 22484, 22587, 22642, 22645, 22598, 22503, 22366,
+    22200, 22015, 21826, 21644, 21481, 21349, 21255, 21204,
+    21201, 21245, 21331, 21459, 21617, 21796, 21986, 22172,
+    22343, 22484, 22586, 22641, 22646, 22598, 22503, 22366,
+    22200, 22016, 21826, 21643, 21482, 21349, 21255, 21205,
+    21200, 21245, 21331, 21459, 21616, 21796, 21986, 22172,
+    22342, 22484, 22586, 22641, 22646, 22598, 22503, 22367,
+    22200, 22016, 21825, 21644, 21482, 21349, 21255, 21205,
+    21201, 21244, 21331, 21459, 21616, 21796, 21985, 22172,
+    22342, 22483, 22586, 22642, 22645, 22599, 22502, 22367,
+    22201, 22016, 21826, 21644, 21482, 21349, 21255, 21205,
+    21201, 21244, 21331, 21458, 21616, 21796, 21985, 22171,
+    22342, 22483, 22586, 22642, 22645, 22598, 22503, 22367,
+    22201, 22016, 21826, 21645, 21482, 21349, 21256, 21204,
+    21201, 21244, 21331, 21458, 21616, 21795, 21985, 22172,
+    22341, 22483, 22586, 22641, 22646, 22598, 22503, 22367,
+    22201, 22016, 21827, 21644, 21483, 21349, 21256, 21205,
+    21200, 21244, 21331, 21458, 21616, 21795, 21985, 22171,
+    22341, 22483, 22585, 22642, 22645, 22599, 22503, 22367,
+    22201, 22017, 21827, 21644, 21483, 21350, 21255, 21205,
+    21201, 21243, 21331, 21458, 21616, 21795, 21984, 22171,
+    22341, 22483, 22585, 22641, 22646, 22598, 22504, 22367,
+    22202, 22016, 21827, 21645, 21483, 21350, 21256, 21205,
+    21200, 21244, 21331, 21457, 21616, 21795, 21984, 22171,
+    22340, 22483, 22585, 22641, 22646, 22599, 22503, 22368,
+    22202, 22017, 21827, 21645, 21483, 21350, 21256, 21205,
+    21201, 21243, 21331, 21458, 21615, 21794, 21984, 22171,
+    22340, 22483, 22585, 22641, 22646, 22599, 22503, 22368,
+    22202, 22018, 21827, 21646, 21483, 21350, 21256, 21205,
+    21201, 21243, 21331, 21457, 21615, 21795, 21984, 22170,
+    22340, 22483, 22585, 22641, 22646, 22599, 22503, 22369,
+    22202, 22017, 21828, 21646, 21483, 21351, 21256, 21205,
+    21201, 21243, 21331, 21457, 21615, 21794, 21984, 22170,
+    22340, 22482, 22585, 22642, 22645, 22599, 22504, 22369,
+    22202, 22018, 21828, 21646, 21483, 21351, 21256, 21205,
+    21201, 21244, 21330, 21457, 21615, 21794, 21984, 22169,
+    22341, 22482, 22585, 22641, 22646, 22599, 22504, 22368,
+    22203, 22018, 21828, 21646, 21484, 21351, 21256, 21205,
+    21201, 21244, 21330, 21457, 21615, 21794, 21983, 22170,
+    22340, 22482, 22585, 22641, 22646, 22599, 22504, 22368,
+    22203, 22018, 21829, 21646, 21484, 21351, 21257, 21205,
+    21201, 21243, 21331, 21456, 21615, 21794, 21983, 22169,
+    22340, 22482, 22585, 22641, 22646, 22599, 22504, 22369,
+    22203, 22018, 21829, 21647, 21484, 21351, 21256,
+)
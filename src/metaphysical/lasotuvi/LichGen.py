@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+Sinh bảng tra cứu âm lịch (LichData.py) cho Lich_HND.
+
+    python -m lasotuvi.LichGen [--from 1800] [--to 2200] [--tz 7]
+    python -m lasotuvi.LichGen --bin lasotuvi/amlich.bin [--from 1900]
+                               [--to 2100]
+
+Bảng được tính bằng chính các công thức Meeus trong Lich_HND, vì vậy kết quả
+tra bảng trùng khớp tuyệt đối với kết quả tính trực tiếp. Tùy chọn --bin sinh
+file lịch theo từng ngày (xem Lich_HND.CalendarFile) từ S2L và kiểm tra lại
+toàn bộ các bản ghi sau khi ghi.
+"""
+import argparse
+import os
+import sys
+from array import array
+
+from lasotuvi.Lich_HND import (CALENDAR_HEADER, CALENDAR_MAGIC, CalendarFile,
+                               S2L, closeCalendarFile, jdFromDate, jdToDate,
+                               packLunarDate, tinhBangLich)
+from lasotuvi.TietKhi import (MINUTES_PER_DAY, MJD_EPOCH, SUN_DEGREES_PER_DAY,
+                              apparentSunLongitude, timThoiDiemTietKhi)
+
+NUMBERS_PER_LINE = 8
+
+
+def tinhTietKhi(jdDau, jdCuoi):
+    """Thời điểm bắt đầu (số phút kể từ MJD 0, UTC) của các tiết khí nằm
+    trong khoảng [jdDau, jdCuoi].
+
+    Returns:
+        tuple: (id của tiết khí đầu tiên, danh sách số phút)
+    """
+    index = int(apparentSunLongitude(jdDau) // 15) + 1
+    thoiDiem = jdDau
+    dau = index % 24
+    phut = []
+    while True:
+        thoiDiem = timThoiDiemTietKhi(
+            index % 24 * 15, thoiDiem + 15 / SUN_DEGREES_PER_DAY)
+        if thoiDiem > jdCuoi:
+            return dau, phut
+        phut.append(int(round((thoiDiem - MJD_EPOCH) * MINUTES_PER_DAY)))
+        index += 1
+
+
+def taoBangLich(namDau, namCuoi, timeZone):
+    """Tính các bảng sóc, tháng 11 âm lịch, tháng nhuận và tiết khí.
+
+    Args:
+        namDau (int): năm dương lịch đầu tiên cần chuyển đổi
+        namCuoi (int): năm dương lịch cuối cùng cần chuyển đổi
+        timeZone (int): múi giờ
+
+    Returns:
+        dict: các bảng sẽ được ghi vào LichData.py
+    """
+    # S2L/L2S dùng tháng 11 của năm trước và năm sau
+    yearMin, yearMax = namDau - 1, namCuoi + 1
+    bang = tinhBangLich(yearMin, yearMax, timeZone)
+    firstTerm, termMinutes = tinhTietKhi(jdFromDate(1, 1, yearMin),
+                                         jdFromDate(31, 12, yearMax))
+    return {
+        "TIME_ZONE": timeZone,
+        "YEAR_MIN": yearMin,
+        "YEAR_MAX": yearMax,
+        "NEW_MOON_K_MIN": bang.newMoonK0,
+        "NEW_MOON_DAYS": list(bang.newMoonDays),
+        "MONTH11_DAYS": list(bang.month11Days),
+        "LEAP_MONTH_OFFSETS": list(bang.leapMonthOffsets),
+        "SOLAR_TERM_FIRST": firstTerm,
+        "SOLAR_TERM_START": termMinutes[0],
+        # Lưu khoảng cách (phút) giữa hai tiết khí liên tiếp cho gọn
+        "SOLAR_TERM_STEPS": [b - a for a, b in zip(termMinutes,
+                                                   termMinutes[1:])],
+    }
+
+
+def _tuple(name, values):
+    lines = ["%s = (" % name]
+    for i in range(0, len(values), NUMBERS_PER_LINE):
+        lines.append("    " + ", ".join(
+            str(v) for v in values[i:i + NUMBERS_PER_LINE]) + ",")
+    lines.append(")")
+    return "\n".join(lines)
+
+
+def ghiLichData(bang, path):
+    parts = [
+        "# -*- coding: utf-8 -*-",
+        '"""',
+        "Bảng âm lịch tính sẵn cho Lich_HND, múi giờ %s, năm %d - %d." % (
+            bang["TIME_ZONE"], bang["YEAR_MIN"] + 1, bang["YEAR_MAX"] - 1),
+        "",
+        "File được sinh tự động bởi `python -m lasotuvi.LichGen`, không sửa "
+        "bằng tay.",
+        '"""',
+        "",
+    ]
+    for name, value in bang.items():
+        if isinstance(value, list):
+            parts.append(_tuple(name, value))
+        else:
+            parts.append("%s = %r" % (name, value))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(parts) + "\n")
+
+
+def ghiFileLich(namDau, namCuoi, timeZone, path):
+    """Ghi file lịch âm theo từng ngày từ 1/1/namDau đến 31/12/namCuoi.
+
+    Returns:
+        int: số ngày đã ghi
+    """
+    # S2L phải tính từ bảng/công thức, không đọc lại file lịch cũ
+    closeCalendarFile()
+    jdStart = jdFromDate(1, 1, namDau)
+    count = jdFromDate(31, 12, namCuoi) - jdStart + 1
+    yearBase = namDau - 1
+    lunarDates = [S2L(*jdToDate(jdStart + i), timeZone=timeZone)
+                  for i in range(count)]
+    records = array("I")
+    for i, ld in enumerate(lunarDates):
+        if not (0 <= ld[0] < 32 and 0 <= ld[1] < 16 and ld[2] >= yearBase):
+            raise Exception("Không đóng gói được ngày %s: %s" % (
+                jdToDate(jdStart + i), ld))
+        records.append(packLunarDate(*ld, yearBase=yearBase))
+    if records.itemsize != 4 or sys.byteorder != "little":
+        raise Exception("File lịch cần uint32 little-endian.")
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(CALENDAR_HEADER.pack(CALENDAR_MAGIC, int(timeZone * 60),
+                                     yearBase, jdStart, count))
+        records.tofile(f)
+    calendar = CalendarFile(tmp)
+    try:
+        for i, ld in enumerate(lunarDates):
+            if calendar.lookup(jdStart + i) != ld:
+                raise Exception("Sai lệch tại ngày %s: %s" % (
+                    jdToDate(jdStart + i), calendar.lookup(jdStart + i)))
+    finally:
+        calendar.close()
+    os.replace(tmp, path)
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--from", dest="namDau", type=int)
+    parser.add_argument("--to", dest="namCuoi", type=int)
+    parser.add_argument("--tz", dest="timeZone", type=int, default=7)
+    parser.add_argument("--out", default=os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "LichData.py"))
+    parser.add_argument("--bin", metavar="PATH",
+                        help="sinh file lịch theo ngày thay cho LichData.py")
+    args = parser.parse_args(argv)
+
+    if args.bin:
+        count = ghiFileLich(args.namDau or 1900, args.namCuoi or 2100,
+                            args.timeZone, args.bin)
+        print("Đã ghi và kiểm tra %s: %d ngày" % (args.bin, count))
+        return
+
+    bang = taoBangLich(args.namDau or 1800, args.namCuoi or 2200,
+                       args.timeZone)
+    ghiLichData(bang, args.out)
+    print("Đã ghi %s: %d lần sóc, %d năm" % (
+        args.out, len(bang["NEW_MOON_DAYS"]), len(bang["MONTH11_DAYS"])))
+
+
+if __name__ == "__main__":
+    main()
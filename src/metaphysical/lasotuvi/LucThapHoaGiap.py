@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Bảng Lục thập hoa giáp (60 năm can chi, Giáp Tý = 0) và bảng Cục theo
+(năm, cung Mệnh), tính một lần khi import.
+
+Mọi thông tin chỉ phụ thuộc vào năm sinh âm lịch (can, chi, âm dương, nạp âm,
+bản mệnh, mệnh chủ, thân chủ) được tra bằng một chỉ số duy nhất
+viTriNam(namAm); Cục và quan hệ sinh khắc giữa bản Mệnh và Cục được tra bằng
+bangCuc[viTri][cungMenh].
+"""
+from collections import namedtuple
+
+from lasotuvi.AmDuong import (diaChi, nguHanh, nguHanhNapAm, sinhKhac,
+                              thienCan, timCuc)
+
+NamCanChi = namedtuple("NamCanChi", [
+    "viTri", "canNam", "chiNam", "canNamTen", "chiNamTen", "amDuongNamSinh",
+    "amDuongChiNamSinh", "menh", "menhId", "banMenh", "menhChu", "thanChu"])
+
+CucMenh = namedtuple("CucMenh", ["hanhCuc", "cucSo", "tenCuc", "menhCuc"])
+
+
+def viTriNam(namAm):
+    """Vị trí của năm âm lịch trong vòng Lục thập hoa giáp.
+
+    Args:
+        namAm (int): năm âm lịch
+
+    Returns:
+        int: 0 (Giáp Tý) đến 59 (Quý Hợi)
+    """
+    return (namAm - 4) % 60
+
+
+def _lapNamCanChi(viTri):
+    canNam = viTri % 10 + 1
+    chiNam = viTri % 12 + 1
+    menh = nguHanhNapAm(chiNam, canNam)
+    return NamCanChi(
+        viTri=viTri,
+        canNam=canNam,
+        chiNam=chiNam,
+        canNamTen=thienCan[canNam]['tenCan'],
+        chiNamTen=diaChi[chiNam]['tenChi'],
+        amDuongNamSinh=thienCan[canNam]['amDuong'],
+        amDuongChiNamSinh=diaChi[chiNam]['amDuong'],
+        menh=menh,
+        menhId=nguHanh(menh)['id'],
+        banMenh=nguHanhNapAm(chiNam, canNam, True),
+        # Mệnh chủ, Thân chủ tra theo can năm như bản gốc của lasotuvi
+        menhChu=diaChi[canNam]['menhChu'],
+        thanChu=diaChi[canNam]['thanChu'])
+
+
+def _lapCuc(namCanChi, cungMenh):
+    cuc = nguHanh(timCuc(cungMenh, namCanChi.canNam))
+    return CucMenh(hanhCuc=cuc['id'], cucSo=cuc['cuc'],
+                   tenCuc=cuc['tenCuc'],
+                   menhCuc=sinhKhac(namCanChi.menhId, cuc['id']))
+
+
+lucThapHoaGiap = tuple(_lapNamCanChi(viTri) for viTri in range(60))
+
+# bangCuc[viTri][cungMenh], cungMenh từ 1 (Tý) đến 12 (Hợi)
+bangCuc = tuple(
+    (None,) + tuple(_lapCuc(nam, cungMenh) for cungMenh in range(1, 13))
+    for nam in lucThapHoaGiap)
+
+
+def namCanChi(namAm):
+    """Thông tin can chi của năm âm lịch.
+
+    Args:
+        namAm (int): năm âm lịch
+
+    Returns:
+        NamCanChi: bản ghi trong lucThapHoaGiap
+    """
+    return lucThapHoaGiap[(namAm - 4) % 60]
+
+
+def traCuc(namAm, cungMenh):
+    """Cục của lá số theo năm sinh âm lịch và vị trí cung Mệnh.
+
+    Args:
+        namAm (int): năm âm lịch
+        cungMenh (int): vị trí cung Mệnh trên địa bàn (1 - 12)
+
+    Returns:
+        CucMenh: hành Cục, số Cục, tên Cục và sinh khắc giữa bản Mệnh và Cục
+    """
+    return bangCuc[(namAm - 4) % 60][cungMenh]
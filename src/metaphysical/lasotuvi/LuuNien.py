@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Lưu niên: các vị trí thay đổi theo năm xem, tính chồng lên lá số gốc.
+
+Lá số gốc không đổi theo năm; mỗi năm xem chỉ thêm lưu Thái Tuế, lưu Lộc
+Tồn, lưu Kình Dương, lưu Đà La (theo can chi năm xem), lưu Tứ Hóa (theo can
+năm xem, rơi vào cung của sao được hóa trên lá số gốc), cung đại hạn và cung
+tiểu hạn đang đến. LuuNienLaSo đọc một lần những gì cần từ lá số gốc, sau đó
+mỗi năm chỉ là vài phép tra bảng:
+
+    luuNien = LuuNienLaSo(db, tb)
+    namNay = luuNien.nam(2026)
+    muoiNam = luuNien.cacNam(2026, 2035)
+
+Kết quả chỉ phụ thuộc vào nội dung lá số (vanTayLaSo) và tuổi âm lịch
+trong năm xem (tuổi và can chi năm sinh cho can chi năm xem), nên được cache
+theo (vân tay, tuổi): những lá số giống nhau dùng chung kết quả.
+"""
+from collections import namedtuple
+
+from lasotuvi.AmDuong import dichCung, thienCan
+from lasotuvi.LRUCache import LRUCache, kichThuocTuMoiTruong
+from lasotuvi.LuatAnSao import bangTuHoa
+from lasotuvi.LucThapHoaGiap import namCanChi
+from lasotuvi.XuatLaSo import vanTayLaSo
+
+# Tên các sao lưu, theo thứ tự Lộc, Quyền, Khoa, Kỵ cho lưu Tứ Hóa
+TEN_LUU_THAI_TUE = "L.Thái tuế"
+TEN_LUU_LOC_TON = "L.Lộc tồn"
+TEN_LUU_KINH_DUONG = "L.Kình dương"
+TEN_LUU_DA_LA = "L.Đà la"
+TEN_LUU_TU_HOA = ("L.Hóa lộc", "L.Hóa quyền", "L.Hóa khoa", "L.Hóa kỵ")
+
+# Các sao có thể được hóa (chính tinh, Xương, Khúc, Tả, Hữu)
+_SAO_TU_HOA = tuple({sao.saoID: sao for hang in bangTuHoa[1:]
+                     for sao in hang}.values())
+
+# Lưu niên đã tính, theo khóa (vanTayLaSo, tuổi). Đặt
+# LASOTUVI_LUU_NIEN_CACHE_SIZE=0 hoặc gọi cacheLuuNien.disable() để tắt.
+cacheLuuNien = LRUCache(
+    kichThuocTuMoiTruong("LASOTUVI_LUU_NIEN_CACHE_SIZE", 4096))
+
+
+class LuuNien(namedtuple("LuuNien", [
+        "tuoi", "canNam", "chiNam", "thaiTue", "locTon", "kinhDuong", "daLa",
+        "tuHoa", "daiHan", "tieuHan"])):
+    """Lưu niên của một năm xem.
+
+    tuoi: tuổi âm lịch trong năm xem
+    canNam, chiNam: can, chi năm xem
+    thaiTue, locTon, kinhDuong, daLa: cung của các sao lưu
+    tuHoa: 4 cặp (sao được hóa, cung) theo thứ tự Lộc, Quyền, Khoa, Kỵ; cung
+        là 0 nếu lá số gốc không an sao đó
+    daiHan: cung đại hạn đang đến, 0 nếu chưa đến đại hạn đầu tiên
+    tieuHan: cung tiểu hạn
+    """
+    __slots__ = ()
+
+    def saoTheoCung(self):
+        """Tên các sao lưu trong từng cung.
+
+        Returns:
+            dict: cungSo -> list tên sao lưu (chỉ các cung có sao lưu)
+        """
+        cacSao = {}
+        for cungSo, ten in ((self.thaiTue, TEN_LUU_THAI_TUE),
+                            (self.locTon, TEN_LUU_LOC_TON),
+                            (self.kinhDuong, TEN_LUU_KINH_DUONG),
+                            (self.daLa, TEN_LUU_DA_LA)):
+            cacSao.setdefault(cungSo, []).append(ten)
+        for (sao, cungSo), ten in zip(self.tuHoa, TEN_LUU_TU_HOA):
+            if cungSo:
+                cacSao.setdefault(cungSo, []).append(ten)
+        return cacSao
+
+
+class LuuNienLaSo(object):
+    """Tính lưu niên của một lá số cho từng năm hoặc một dãy năm.
+
+    Args:
+        diaBan (diaBan): địa bàn có đại hạn, tiểu hạn (lá số đầy đủ, lá số
+            trong kho hoặc lá số rút gọn có App.NHOM_HAN)
+        thienBan: lapThienBan hoặc KhoLaSo.LaSo
+        namSinh (int, optional): năm sinh âm lịch, mặc định thienBan.namAm
+            (KhoLaSo.LaSo không có, cần truyền vào)
+
+    Raises:
+        Exception: địa bàn chưa có đại hạn, tiểu hạn
+    """
+    __slots__ = ("vanTay", "namSinh", "_viTriSao", "_daiHan", "_cungTieuHan")
+
+    def __init__(self, diaBan, thienBan, namSinh=None):
+        if diaBan.daiHanCung[1] is None or diaBan.tieuHanCung[1] is None:
+            raise Exception("Lá số chưa có đại hạn, tiểu hạn.")
+        self.namSinh = thienBan.namAm if namSinh is None else namSinh
+        self.vanTay = vanTayLaSo(diaBan, thienBan)
+        self._viTriSao = {}
+        for cungSo in range(1, 13):
+            bits = diaBan.saoBits[cungSo]
+            for sao in _SAO_TU_HOA:
+                if bits >> sao.saoID & 1:
+                    self._viTriSao[sao.saoID] = cungSo
+        self._daiHan = tuple((diaBan.daiHanCung[cungSo], cungSo)
+                             for cungSo in range(1, 13))
+        # tieuHanCung[cungSo] là chi (0 - 11) của năm có tiểu hạn tại cung
+        self._cungTieuHan = {diaBan.tieuHanCung[cungSo]: cungSo
+                             for cungSo in range(1, 13)}
+
+    def nam(self, namXem):
+        """Lưu niên của năm âm lịch namXem.
+
+        Raises:
+            Exception: năm xem trước năm sinh
+        """
+        tuoi = namXem - self.namSinh + 1
+        if tuoi < 1:
+            raise Exception("Năm xem phải từ năm sinh trở đi.")
+        khoa = (self.vanTay, tuoi)
+        luuNien = cacheLuuNien.get(khoa)
+        if luuNien is None:
+            luuNien = self._tinh(namXem, tuoi)
+            cacheLuuNien.put(khoa, luuNien)
+        return luuNien
+
+    def cacNam(self, tuNam, denNam):
+        """Lưu niên các năm từ tuNam đến denNam (kể cả denNam).
+
+        Returns:
+            list: LuuNien theo thứ tự năm
+        """
+        return [self.nam(namXem) for namXem in range(tuNam, denNam + 1)]
+
+    def _tinh(self, namXem, tuoi):
+        nam = namCanChi(namXem)
+        locTon = thienCan[nam.canNam]["vitriDiaBan"]
+        tuHoa = tuple((sao, self._viTriSao.get(sao.saoID, 0))
+                      for sao in bangTuHoa[nam.canNam])
+        daiHan = next((cungSo for batDau, cungSo in self._daiHan
+                       if batDau <= tuoi < batDau + 10), 0)
+        return LuuNien(tuoi, nam.canNam, nam.chiNam, nam.chiNam, locTon,
+                       dichCung(locTon, 1), dichCung(locTon, -1), tuHoa,
+                       daiHan, self._cungTieuHan[nam.chiNam - 1])
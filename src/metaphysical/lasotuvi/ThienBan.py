@@ -2,52 +2,68 @@
 """
 (c) 2016 doanguyen <dungnv2410@gmail.com>.
 """
-from lasotuvi.AmDuong import (canChiNgay, diaChi, ngayThangNam, ngayThangNamCanChi,
-                     nguHanh, nguHanhNapAm, thienCan, timCuc, sinhKhac)
+from lasotuvi.AmDuong import diaChi, thienCan
 import time
-from lasotuvi.Lich_HND import jdFromDate
+from lasotuvi.LucThapHoaGiap import traCuc
+from lasotuvi.NgaySinh import NgaySinh
+
+tenSinhKhac = {
+    1: "Bản Mệnh sinh Cục",
+    -1: "Bản Mệnh khắc Cục",
+    -1j: "Cục khắc Bản Mệnh",
+    1j: "Cục sinh Bản mệnh",
+    0: "Cục hòa Bản Mệnh",
+}
 
 
 class lapThienBan(object):
-    def __init__(self, nn, tt, nnnn, gioSinh, gioiTinh, ten, diaBan,
-                 duongLich=True, timeZone=7):
+    """Thiên bàn của lá số.
+
+    Gọi lapThienBan(nn, tt, nnnn, gioSinh, gioiTinh, ten, diaBan, duongLich,
+    timeZone) như trước, hoặc lapThienBan(ngaySinh, ten=..., diaBan=...) với
+    NgaySinh đã dùng cho lapDiaBan để không phải đổi lịch lại.
+    """
+
+    def __init__(self, nn, tt=None, nnnn=None, gioSinh=None, gioiTinh=None,
+                 ten="", diaBan=None, duongLich=True, timeZone=7):
         super(lapThienBan, self).__init__()
+        if isinstance(nn, NgaySinh):
+            ngaySinh = nn
+        else:
+            ngaySinh = NgaySinh(nn, tt, nnnn, gioSinh, gioiTinh, duongLich,
+                                timeZone)
+        self.ngaySinh = ngaySinh
+        gioSinh, gioiTinh = ngaySinh.gioSinh, ngaySinh.gioiTinh
         self.gioiTinh = 1 if gioiTinh == 1 else -1
         self.namNu = "Nam" if gioiTinh == 1 else "Nữ"
 
         chiGioSinh = diaChi[gioSinh]
-        canGioSinh = ((jdFromDate(nn, tt, nnnn) - 1) * 2 % 10 + gioSinh) % 10
-        if canGioSinh == 0:
-            canGioSinh = 10
         self.chiGioSinh = chiGioSinh
-        self.canGioSinh = canGioSinh
-        self.gioSinh = "{} {}".format(thienCan[canGioSinh]['tenCan'],
+        self.canGioSinh = ngaySinh.canGio
+        self.gioSinh = "{} {}".format(thienCan[ngaySinh.canGio]['tenCan'],
                                       chiGioSinh['tenChi'])
 
-        self.timeZone = timeZone
+        self.timeZone = ngaySinh.timeZone
         self.today = time.strftime("%d/%m/%Y")
-        self.ngayDuong, self.thangDuong, self.namDuong, self.ten = \
-            nn, tt, nnnn, ten
-        if duongLich is True:
-            self.ngayAm, self.thangAm, self.namAm, self.thangNhuan = \
-                ngayThangNam(self.ngayDuong, self.thangDuong, self.namDuong,
-                             True, self.timeZone)
-        else:
-            self.ngayAm, self.thangAm, self.namAm = self.ngayDuong,\
-                self.thangDuong, self.namDuong
+        self.ngayDuong, self.thangDuong, self.namDuong = \
+            ngaySinh.ngayDuong, ngaySinh.thangDuong, ngaySinh.namDuong
+        self.ten = ten
+        self.ngayAm, self.thangAm, self.namAm, self.thangNhuan = \
+            ngaySinh.ngayAm, ngaySinh.thangAm, ngaySinh.namAm, \
+            ngaySinh.thangNhuan
 
-        self.canThang, self.canNam, self.chiNam = \
-            ngayThangNamCanChi(self.ngayAm, self.thangAm,
-                               self.namAm, False, self.timeZone)
+        # Can chi tháng, năm, ngày đã tính trong NgaySinh; các thông tin
+        # theo năm sinh và Cục tra từ bảng Lục thập hoa giáp
+        self.canThang = ngaySinh.canThang
+        nam = ngaySinh.nam
+        self.canNam, self.chiNam = nam.canNam, nam.chiNam
         self.chiThang = self.thangAm
         self.canThangTen = thienCan[self.canThang]['tenCan']
-        self.canNamTen = thienCan[self.canNam]['tenCan']
+        self.canNamTen = nam.canNamTen
         self.chiThangTen = diaChi[self.thangAm]['tenChi']
-        self.chiNamTen = diaChi[self.chiNam]['tenChi']
+        self.chiNamTen = nam.chiNamTen
 
-        self.canNgay, self.chiNgay = canChiNgay(
-            self.ngayDuong, self.thangDuong, self.namDuong,
-            duongLich, timeZone)
+        self.canNgay, self.chiNgay = ngaySinh.canNgay, ngaySinh.chiNgay
         self.canNgayTen = thienCan[self.canNgay]['tenCan']
         self.chiNgayTen = diaChi[self.chiNgay]['tenChi']
 
@@ -58,25 +74,14 @@ class lapThienBan(object):
         else:
             self.amDuongMenh = "Âm dương nghịch lý"
 
-        cuc = timCuc(diaBan.cungMenh, self.canNam)
-        self.hanhCuc = nguHanh(cuc)['id']
-        self.tenCuc = nguHanh(cuc)['tenCuc']
+        cuc = traCuc(self.namAm, diaBan.cungMenh)
+        self.hanhCuc = cuc.hanhCuc
+        self.tenCuc = cuc.tenCuc
 
-        self.menhChu = diaChi[self.canNam]['menhChu']
-        self.thanChu = diaChi[self.canNam]['thanChu']
+        self.menhChu = nam.menhChu
+        self.thanChu = nam.thanChu
 
-        self.menh = nguHanhNapAm(self.chiNam, self.canNam)
-        menhId = nguHanh(self.menh)['id']
-        menhCuc = sinhKhac(menhId, self.hanhCuc)
-        if menhCuc == 1:
-            self.sinhKhac = "Bản Mệnh sinh Cục"
-        elif menhCuc == -1:
-            self.sinhKhac = "Bản Mệnh khắc Cục"
-        elif menhCuc == -1j:
-            self.sinhKhac = "Cục khắc Bản Mệnh"
-        elif menhCuc == 1j:
-            self.sinhKhac = "Cục sinh Bản mệnh"
-        else:
-            self.sinhKhac = "Cục hòa Bản Mệnh"
+        self.menh = nam.menh
+        self.sinhKhac = tenSinhKhac[cuc.menhCuc]
 
-        self.banMenh = nguHanhNapAm(self.chiNam, self.canNam, True)
+        self.banMenh = nam.banMenh
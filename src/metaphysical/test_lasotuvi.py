@@ -0,0 +1,797 @@
+# -*- coding: utf-8 -*-
+"""
+Kiểm tra tương đương cho các đường nhanh của lasotuvi.
+
+    pytest test_lasotuvi.py
+
+Mỗi đường nhanh (bảng tra, cache, lá số rút gọn, bản ghi KhoLaSo,...) được
+so với cách tính mà nó thay thế, trên toàn miền đầu vào hoặc trên các ngày
+sinh ngẫu nhiên (seed cố định).
+"""
+import hashlib
+import json
+import os
+import random
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from lasotuvi.AmDuong import (bangCoThan, bangHoaLinh,  # noqa: E402
+                              bangNguHanh, bangPhaToai, bangThienMa,
+                              bangTrangSinh, bangTriet, bangTuVi, diaChi,
+                              dichCung, khoiViet, maTranLuuHa,
+                              maTranThienTru, nguHanh, thienPhuc,
+                              thienQuan, timCoThan, timHoaLinh, timLuuTru,
+                              timPhaToai, timThienKhoi, timThienMa,
+                              timThienQuanThienPhuc, timTrangSinh, timTriet,
+                              timTuVi)
+from lasotuvi.App import NHOM_HAN, cacheDiaBan, lapDiaBan  # noqa: E402
+from lasotuvi.CachCuc import (DAC_TINH_SANG, GIAP, MENH, SANG,  # noqa: E402
+                              SAO_CACH_CUC, TAM_PHUONG, cachCuc,
+                              danhSachCachCuc, giap, khongCo, sang, taiMenh,
+                              tamPhuong, timCachCuc)
+from lasotuvi.DiaBan import dacTinhSao, diaBan  # noqa: E402
+from lasotuvi.KhoLaSo import (KHO_HEADER, KHO_MAGIC, RECORD,  # noqa: E402
+                              SO_LA_SO as SO_LA_SO_KHO, SO_SAO, LaSo,
+                              giaiMaDiaBan, giaiMaLaSo, giaTriChiSo,
+                              kiemTraKhoLaSo, laSoTheoMa, maHoaDiaBan, maLaSo)
+from lasotuvi.Lich_HND import L2S  # noqa: E402
+from lasotuvi.LuatAnSao import BoLuatAnSao, boLuatMacDinh  # noqa: E402
+from lasotuvi.LucThapHoaGiap import (lucThapHoaGiap, traCuc,  # noqa: E402
+                                     viTriNam)
+from lasotuvi.LuuNien import LuuNienLaSo, cacheLuuNien  # noqa: E402
+from lasotuvi.NgaySinh import NgaySinh  # noqa: E402
+from lasotuvi.Sao import (danhMucSao, saoDaLa, saoHoaKhoa,  # noqa: E402
+                          saoHoaKy, saoHoaLoc, saoHoaQuyen, saoKinhDuong,
+                          saoLocTon, saoThaiDuong, saoThaiTue, saoThienMa,
+                          saoTuVi, saoVanXuong)
+from lasotuvi.ThienBan import lapThienBan  # noqa: E402
+from lasotuvi.XuatLaSo import (PHIEN_BAN_LUOC_DO, docLaSoNhiPhan,  # noqa: E402
+                               cacheXuatLaSo, laSoChuan, laSoDict,
+                               laSoNhiPhan, vanTayLaSo)
+
+SO_LA_SO = 3000
+
+
+# ------------------------------------------------------------------
+# Bảng tra của AmDuong
+# ------------------------------------------------------------------
+# Cách tính của các hàm tim* trước khi được thay bằng bảng tra
+def _timTuViCu(cuc, ngaySinhAmLich):
+    cungDan = 3
+    cucBanDau = cuc
+    if cuc not in [2, 3, 4, 5, 6]:
+        raise Exception("Số cục phải là 2, 3, 4, 5, 6")
+    while cuc < ngaySinhAmLich:
+        cuc += cucBanDau
+        cungDan += 1
+    saiLech = cuc - ngaySinhAmLich
+    if saiLech % 2 == 1:
+        saiLech = -saiLech
+    return dichCung(cungDan, saiLech)
+
+
+def _timTrangSinhCu(cucSo):
+    if cucSo == 6:
+        return 3
+    elif cucSo == 4:
+        return 6
+    elif cucSo == 2 or cucSo == 5:
+        return 9
+    elif cucSo == 3:
+        return 12
+    raise Exception("Không tìm được cung an sao Trường sinh")
+
+
+def _timHoaLinhCu(chiNamSinh, gioSinh, gioiTinh, amDuongNamSinh):
+    if chiNamSinh in [3, 7, 11]:
+        khoiCungHoaTinh, khoiCungLinhTinh = 2, 4
+    elif chiNamSinh in [1, 5, 9]:
+        khoiCungHoaTinh, khoiCungLinhTinh = 3, 11
+    elif chiNamSinh in [6, 10, 2]:
+        khoiCungHoaTinh, khoiCungLinhTinh = 11, 4
+    elif chiNamSinh in [12, 4, 8]:
+        khoiCungHoaTinh, khoiCungLinhTinh = 10, 11
+    else:
+        raise Exception("Không thể khởi cung tìm Hỏa-Linh")
+    if (gioiTinh * amDuongNamSinh) == -1:
+        return [dichCung(khoiCungHoaTinh + 1, (-1) * gioSinh),
+                dichCung(khoiCungLinhTinh - 1, gioSinh)]
+    return [dichCung(khoiCungHoaTinh - 1, gioSinh),
+            dichCung(khoiCungLinhTinh + 1, (-1) * gioSinh)]
+
+
+def _timCoThanCu(chiNam):
+    if chiNam in [12, 1, 2]:
+        return 3
+    elif chiNam in [3, 4, 5]:
+        return 6
+    elif chiNam in [6, 7, 8]:
+        return 9
+    return 12
+
+
+def _timThienMaCu(chiNam):
+    return {1: 3, 2: 12, 3: 9, 0: 6}[chiNam % 4]
+
+
+def _timPhaToaiCu(chiNam):
+    return {0: 6, 1: 10, 2: 2}[chiNam % 3]
+
+
+def _timTrietCu(canNam):
+    for cacCan, triet in (([1, 6], (9, 10)), ([2, 7], (7, 8)),
+                          ([3, 8], (5, 6)), ([4, 9], (3, 4)),
+                          ([5, 10], (1, 2))):
+        if canNam in cacCan:
+            return triet
+    raise Exception("Không tìm được Triệt")
+
+
+# Các bảng viết thẳng trong hàm cũ (timThienKhoi, timThienQuanThienPhuc,
+# timLuuTru)
+_KHOI_VIET_CU = [None, 2, 1, 12, 10, 8, 1, 8, 7, 6, 4]
+_THIEN_QUAN_CU = [None, 8, 5, 6, 3, 4, 10, 12, 10, 11, 7]
+_THIEN_PHUC_CU = [None, 10, 9, 1, 12, 4, 3, 7, 6, 7, 6]
+_LUU_HA_CU = [None, 10, 11, 8, 5, 6, 7, 9, 4, 12, 3]
+_THIEN_TRU_CU = [None, 6, 7, 1, 6, 7, 9, 3, 7, 10, 11]
+
+
+def _ketQua(ham, *thamSo):
+    # Kết quả của hàm, hoặc Exception nếu hàm báo lỗi
+    try:
+        return ham(*thamSo)
+    except Exception:
+        return Exception
+
+
+def test_bang_tu_vi():
+    for cuc in range(2, 7):
+        for ngay in range(1, 31):
+            assert bangTuVi[cuc][ngay] == _timTuViCu(cuc, ngay)
+    # Ngoài ngày 1 - 30 và số cục sai vẫn như cũ
+    for cuc in range(-1, 9):
+        for ngay in range(-5, 61):
+            assert _ketQua(timTuVi, cuc, ngay) == \
+                _ketQua(_timTuViCu, cuc, ngay)
+
+
+def test_bang_trang_sinh():
+    for cuc in range(2, 7):
+        assert bangTrangSinh[cuc] == _timTrangSinhCu(cuc)
+    for cuc in range(-1, 9):
+        assert _ketQua(timTrangSinh, cuc) == _ketQua(_timTrangSinhCu, cuc)
+
+
+def test_bang_hoa_linh():
+    for gioiTinh in (1, -1):
+        for amDuong in (1, -1):
+            for chi in range(1, 13):
+                for gio in range(1, 13):
+                    assert list(bangHoaLinh[gioiTinh * amDuong][chi][gio]) \
+                        == _timHoaLinhCu(chi, gio, gioiTinh, amDuong)
+            for chi in range(-1, 15):
+                for gio in range(-1, 15):
+                    assert _ketQua(timHoaLinh, chi, gio, gioiTinh,
+                                   amDuong) == \
+                        _ketQua(_timHoaLinhCu, chi, gio, gioiTinh, amDuong)
+
+
+def test_bang_theo_can_nam():
+    for can in range(1, 11):
+        assert khoiViet[can] == _KHOI_VIET_CU[can]
+        assert (thienQuan[can], thienPhuc[can]) == \
+            (_THIEN_QUAN_CU[can], _THIEN_PHUC_CU[can])
+        assert bangTriet[can] == _timTrietCu(can)
+        assert (maTranLuuHa[can], maTranThienTru[can]) == \
+            (_LUU_HA_CU[can], _THIEN_TRU_CU[can])
+    for can in range(-12, 14):
+        assert _ketQua(timThienKhoi, can) == \
+            _ketQua(_KHOI_VIET_CU.__getitem__, can)
+        assert _ketQua(timThienQuanThienPhuc, can) == _ketQua(
+            lambda c: (_THIEN_QUAN_CU[c], _THIEN_PHUC_CU[c]), can)
+        assert _ketQua(timTriet, can) == _ketQua(_timTrietCu, can)
+        assert _ketQua(timLuuTru, can) == _ketQua(
+            lambda c: (_LUU_HA_CU[c], _THIEN_TRU_CU[c]), can)
+
+
+def test_bang_theo_chi_nam():
+    for chi in range(1, 13):
+        assert bangCoThan[chi] == _timCoThanCu(chi)
+        assert bangThienMa[chi % 4] == _timThienMaCu(chi)
+        assert bangPhaToai[chi % 3] == _timPhaToaiCu(chi)
+    for chi in range(-24, 25):
+        assert timCoThan(chi) == _timCoThanCu(chi)
+        assert timThienMa(chi) == _timThienMaCu(chi)
+        assert timPhaToai(chi) == _timPhaToaiCu(chi)
+
+
+def test_ngu_hanh():
+    # nguHanh trả về dict mới: sửa được, json.dumps được, không đổi bảng
+    for tenHanh, tenDayDu in (("K", "Kim"), ("M", "Moc"), ("T", "Thuy"),
+                              ("H", "Hoa"), ("O", "Tho")):
+        hanh = nguHanh(tenHanh)
+        assert type(hanh) is dict
+        assert hanh == nguHanh(tenDayDu) == dict(bangNguHanh[tenHanh])
+        assert json.loads(json.dumps(hanh)) == hanh
+        hanh["cuc"] = 0
+        assert nguHanh(tenHanh)["cuc"] == bangNguHanh[tenHanh]["cuc"] != 0
+    for tenHanh in ("X", None, ["K"]):
+        with pytest.raises(Exception):
+            nguHanh(tenHanh)
+
+
+# ------------------------------------------------------------------
+# Danh mục sao bất biến (Sao, SaoCung)
+# ------------------------------------------------------------------
+def _ngaySinhDuongLich(rng, soLaSo):
+    return [(rng.randint(1, 28), rng.randint(1, 12), rng.randint(1900, 2099),
+             rng.randint(1, 12), rng.choice((1, -1)))
+            for _ in range(soLaSo)]
+
+
+def test_dac_tinh_khi_lap_song_song():
+    # Sao trong danh mục dùng chung giữa các lá số: lập lá số trên nhiều
+    # thread cùng lúc không làm đặc tính của lá số này lẫn sang lá số khác
+    cacNgaySinh = _ngaySinhDuongLich(random.Random(13), SO_LA_SO)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        cacDiaBan = list(pool.map(
+            lambda ns: lapDiaBan(diaBan, *(ns + (True, 7))), cacNgaySinh))
+    for db in cacDiaBan:
+        for cungSo in range(1, 13):
+            for sao in db.thapNhiCung[cungSo].cungSao:
+                assert sao["saoDacTinh"] == \
+                    dacTinhSao(cungSo, danhMucSao[sao["saoID"]])
+    with pytest.raises(AttributeError):
+        saoTuVi.saoDacTinh = "M"
+
+
+def test_sao_bo_an_dac_tinh_an_cung():
+    # Hai hàm sửa sao cũ báo lỗi rõ ràng và không đổi sao trong danh mục
+    with pytest.raises(AttributeError, match="dacTinhSao"):
+        saoTuVi.anDacTinh("M")
+    with pytest.raises(AttributeError, match="nhapSao"):
+        saoTuVi.anCung(1)
+    assert not hasattr(saoTuVi, "saoDacTinh")
+    assert not hasattr(saoTuVi, "saoViTriCung")
+
+
+# ------------------------------------------------------------------
+# KhoLaSo.kiemTraKhoLaSo
+# ------------------------------------------------------------------
+def _ghiKhoRong(path, cacChiSo=()):
+    # File kho đủ kích thước, bản ghi toàn 0 trừ các chiSo được lập thật
+    with open(path, "wb") as f:
+        f.write(KHO_HEADER.pack(KHO_MAGIC, RECORD.size, SO_LA_SO_KHO,
+                                SO_SAO))
+        f.truncate(KHO_HEADER.size + SO_LA_SO_KHO * RECORD.size)
+        for chiSo in cacChiSo:
+            viTri, thangAm, ngayAm, gioSinh, gioiTinh = giaTriChiSo(chiSo)
+            f.seek(KHO_HEADER.size + chiSo * RECORD.size)
+            f.write(maHoaDiaBan(lapDiaBan(diaBan, ngayAm, thangAm,
+                                          1984 + viTri, gioSinh, gioiTinh,
+                                          False, 7)))
+
+
+def test_kiem_tra_kho_la_so(tmp_path):
+    path = str(tmp_path / "laso.bin")
+    _ghiKhoRong(path)
+    assert len(kiemTraKhoLaSo(path, 50, seed=15)) == 52
+    _ghiKhoRong(path, (0, SO_LA_SO_KHO - 1))
+    assert kiemTraKhoLaSo(path, 0) == []
+    # File thiếu bản ghi không mở được
+    with open(path, "r+b") as f:
+        f.truncate(KHO_HEADER.size + RECORD.size)
+    with pytest.raises(ValueError):
+        kiemTraKhoLaSo(path, 0)
+
+
+# ------------------------------------------------------------------
+# App.cacheDiaBan
+# ------------------------------------------------------------------
+def test_cache_dia_ban():
+    kichThuoc = cacheDiaBan.maxsize
+    cacheDiaBan.clear()
+    cacheDiaBan.enable(2)
+    try:
+        # Hai ngày dương lịch khác nhau, cùng ngày tháng âm lịch và cách nhau
+        # 60 năm: chung một khóa
+        ngay1 = tuple(L2S(15, 8, 1990, 0, 7))
+        ngay2 = tuple(L2S(15, 8, 2050, 0, 7))
+        assert ngay1[:2] != ngay2[:2]
+        a = lapDiaBan(diaBan, *(ngay1 + (5, 1, True, 7)))
+        b = lapDiaBan(diaBan, *(ngay2 + (5, 1, True, 7)))
+        assert a == b
+        info = cacheDiaBan.info()
+        assert (info["hits"], info["misses"], info["size"]) == (1, 1, 1)
+
+        # Sửa địa bàn nhận được không làm đổi địa bàn trong cache
+        a.nhapSao(1, saoTuVi)
+        a.nhapTuan(5, 6)
+        a.nhapTriet(7, 8)
+        c = lapDiaBan(diaBan, *(ngay1 + (5, 1, True, 7)))
+        assert c == b
+        assert c != a
+
+        # Quá kích thước thì bỏ địa bàn dùng lâu nhất
+        lapDiaBan(diaBan, 1, 1, 2000, 1, 1, False, 7)
+        lapDiaBan(diaBan, 2, 1, 2000, 1, 1, False, 7)
+        info = cacheDiaBan.info()
+        assert (info["hits"], info["misses"], info["evictions"],
+                info["size"]) == (2, 3, 1, 2)
+        assert lapDiaBan(diaBan, *(ngay1 + (5, 1, True, 7))) == b
+        assert cacheDiaBan.info()["misses"] == 4
+    finally:
+        cacheDiaBan.clear()
+        cacheDiaBan.enable(kichThuoc)
+
+
+def test_cache_dia_ban_tat():
+    # LASOTUVI_CHART_CACHE_SIZE=0 tắt cache ngay khi import
+    maLenh = ("from lasotuvi.App import cacheDiaBan, lapDiaBan\n"
+              "from lasotuvi.DiaBan import diaBan\n"
+              "a = lapDiaBan(diaBan, 1, 1, 2000, 1, 1, False, 7)\n"
+              "b = lapDiaBan(diaBan, 1, 1, 2000, 1, 1, False, 7)\n"
+              "print(a == b, cacheDiaBan.enabled, len(cacheDiaBan),\n"
+              "      cacheDiaBan.hits, cacheDiaBan.misses)\n")
+    ketQua = subprocess.run(
+        [sys.executable, "-c", maLenh], cwd=current_dir,
+        env=dict(os.environ, LASOTUVI_CHART_CACHE_SIZE="0"),
+        stdout=subprocess.PIPE, universal_newlines=True, check=True)
+    assert ketQua.stdout.split() == ["True", "False", "0", "0", "0"]
+
+
+# ------------------------------------------------------------------
+# DiaBanMang
+# ------------------------------------------------------------------
+def test_dia_ban_mang_solar():
+    np = pytest.importorskip("numpy")
+    from lasotuvi.DiaBanMang import diaBanTaiDong, lapDiaBanMang, tenDacTinh
+    rng = np.random.default_rng(18)
+    nn = rng.integers(1, 29, SO_LA_SO)
+    tt = rng.integers(1, 13, SO_LA_SO)
+    nnnn = rng.integers(1900, 2100, SO_LA_SO)
+    gioSinh = rng.integers(1, 13, SO_LA_SO)
+    gioiTinh = rng.choice([1, -1], SO_LA_SO)
+    mang = lapDiaBanMang(nn, tt, nnnn, gioSinh, gioiTinh)
+    for i in range(SO_LA_SO):
+        db = lapDiaBan(diaBan, int(nn[i]), int(tt[i]), int(nnnn[i]),
+                       int(gioSinh[i]), int(gioiTinh[i]), True, 7)
+        assert diaBanTaiDong(mang, i) == db, i
+        for cungSo in range(1, 13):
+            for sao in db.saoTrongCung(cungSo):
+                assert tenDacTinh[mang.dacTinhSao[i, sao.saoID]] == \
+                    sao.saoDacTinh
+
+
+def test_dia_ban_mang_lunar():
+    # Ngày âm lịch 1 - 30, gồm cả ngày 30 của tháng thiếu
+    np = pytest.importorskip("numpy")
+    from lasotuvi.DiaBanMang import diaBanTaiDong, lapDiaBanMang
+    rng = np.random.default_rng(1018)
+    nn = rng.integers(1, 31, SO_LA_SO)
+    tt = rng.integers(1, 13, SO_LA_SO)
+    nnnn = rng.integers(1900, 2100, SO_LA_SO)
+    gioSinh = rng.integers(1, 13, SO_LA_SO)
+    gioiTinh = rng.choice([1, -1], SO_LA_SO)
+    mang = lapDiaBanMang(nn, tt, nnnn, gioSinh, gioiTinh, duongLich=False)
+    for i in range(SO_LA_SO):
+        db = lapDiaBan(diaBan, int(nn[i]), int(tt[i]), int(nnnn[i]),
+                       int(gioSinh[i]), int(gioiTinh[i]), False, 7)
+        assert diaBanTaiDong(mang, i) == db, i
+
+
+# ------------------------------------------------------------------
+# LuatAnSao
+# ------------------------------------------------------------------
+# sha1 của 2000 lá số (seed 19) theo lapDiaBan viết tay trước khi có
+# LuatAnSao: cung chủ, đại hạn, tiểu hạn, cung Thân, Tuần, Triệt và saoID
+# theo thứ tự trong cungSao. Đặc tính sao không được tính vì bản cũ để đặc
+# tính của lá số trước lẫn sang lá số sau.
+VAN_TAY_LAP_DIA_BAN_CU = "bfdf3ba1220a1551b81bbec73a776a456b0453a8"
+
+
+def test_luat_an_sao_pre_series():
+    rng = random.Random(19)
+    h = hashlib.sha1()
+    for _ in range(2000):
+        nn, tt, nnnn = rng.randint(1, 28), rng.randint(1, 12), \
+            rng.randint(1900, 2099)
+        gioSinh, gioiTinh = rng.randint(1, 12), rng.choice((1, -1))
+        db = lapDiaBan(diaBan, nn, tt, nnnn, gioSinh, gioiTinh, True, 7)
+        for c in db.thapNhiCung[1:]:
+            h.update(repr((c.cungSo, c.cungChu, c.cungDaiHan, c.cungTieuHan,
+                           c.cungThan, c.tuanTrung, c.trietLo,
+                           [s["saoID"] for s in c.cungSao])).encode())
+    assert h.hexdigest() == VAN_TAY_LAP_DIA_BAN_CU
+
+
+@pytest.mark.parametrize("boLuat", [
+    boLuatMacDinh,
+    boLuatMacDinh.theoNhom("chinhTinh", "tuHoa"),
+    boLuatMacDinh.theoNhom("chinhTinh", saoLocTon, saoKinhDuong),
+    BoLuatAnSao(luuHaThienTru=False),
+    BoLuatAnSao(anQuang="vuThien"),
+], ids=repr)
+def test_luat_an_sao_mang(boLuat):
+    # anSaoMang và anSao dịch cùng bộ luật: mọi dòng phải trùng nhau
+    np = pytest.importorskip("numpy")
+    from lasotuvi.DiaBanMang import SO_COT_SAO
+    rng = np.random.default_rng(19)
+    n = 2000
+    thamSo = (rng.integers(1, 31, n), rng.integers(1, 13, n),
+              rng.integers(1, 13, n), rng.choice([1, -1], n),
+              rng.integers(1, 11, n), rng.integers(1, 13, n),
+              rng.choice([1, -1], n), rng.integers(2, 7, n),
+              rng.integers(1, 13, n), rng.integers(1, 13, n))
+    viTriSao = np.zeros((n, SO_COT_SAO), dtype=np.int8)
+    ketQuaMang = boLuat.anSaoMang(*thamSo, viTriSao)
+    for i in range(n):
+        saoBits = [0] * 13
+        ketQua = boLuat.anSao(*[int(x[i]) for x in thamSo], saoBits)
+        assert ketQua == {ten: int(x[i]) for ten, x in ketQuaMang.items()}
+        for cungSo in range(1, 13):
+            assert saoBits[cungSo] == sum(
+                1 << int(saoID)
+                for saoID in np.flatnonzero(viTriSao[i] == cungSo))
+
+
+# ------------------------------------------------------------------
+# Lá số rút gọn (lapDiaBan(..., nhomSao=...))
+# ------------------------------------------------------------------
+@pytest.mark.parametrize("nhomSao", [
+    ("chinhTinh",),
+    ("chinhTinh", "tuHoa"),
+    ("vongTrangSinh", "tuanTriet"),
+    ("satTinh", "phuTinh", NHOM_HAN),
+], ids=repr)
+def test_la_so_rut_gon(nhomSao):
+    # Lá số rút gọn là lá số đầy đủ chỉ giữ các sao của các nhóm được chọn
+    boLuat = boLuatMacDinh.theoNhom(*(set(nhomSao) - {NHOM_HAN}))
+    mask = sum(1 << sao.saoID for sao in boLuat.cacSao)
+    coTuanTriet = "tuanTriet" in nhomSao
+    coHan = NHOM_HAN in nhomSao
+    rng = random.Random(20)
+    for ngaySinh in _ngaySinhDuongLich(rng, 500):
+        thamSo = ngaySinh + (True, 7)
+        db = lapDiaBan(diaBan, *thamSo)
+        rutGon = lapDiaBan(diaBan, *thamSo, nhomSao=nhomSao)
+        assert rutGon.saoBits == [bits & mask for bits in db.saoBits]
+        assert (rutGon.cungMenh, rutGon.cungThan, rutGon.cungChuCung) == \
+            (db.cungMenh, db.cungThan, db.cungChuCung)
+        assert (rutGon.tuanBits, rutGon.trietBits) == \
+            ((db.tuanBits, db.trietBits) if coTuanTriet else (0, 0))
+        assert (rutGon.daiHanCung == db.daiHanCung and
+                rutGon.tieuHanCung == db.tieuHanCung) is coHan
+
+
+def test_la_so_rut_gon_theo_sao():
+    # Chỉ chọn từng sao: lá số rút gọn là lá số đầy đủ chỉ giữ các sao đó,
+    # không có sao khác cùng luật (Bác sỹ cùng luật với Lộc tồn, Đà la với
+    # Kình dương) hay sao của luật phụ thuộc (Văn xương của Hóa khoa)
+    cacSao = (saoLocTon, saoKinhDuong, saoHoaKhoa, saoThaiDuong)
+    assert set(boLuatMacDinh.theoNhom(*cacSao).cacSao) == set(cacSao)
+    mask = sum(1 << sao.saoID for sao in cacSao)
+    rng = random.Random(120)
+    for ngaySinh in _ngaySinhDuongLich(rng, 500):
+        thamSo = ngaySinh + (True, 7)
+        db = lapDiaBan(diaBan, *thamSo)
+        rutGon = lapDiaBan(diaBan, *thamSo, nhomSao=cacSao)
+        assert rutGon.saoBits == [bits & mask for bits in db.saoBits]
+        assert (rutGon.cungMenh, rutGon.cungThan, rutGon.cungChuCung) == \
+            (db.cungMenh, db.cungThan, db.cungChuCung)
+        assert (rutGon.tuanBits, rutGon.trietBits) == (0, 0)
+        assert sum(bin(bits).count("1") for bits in rutGon.saoBits) == 4
+    with pytest.raises(Exception):
+        boLuatMacDinh.theoNhom("chinhTinh", "khongCoNhomNay")
+
+
+# ------------------------------------------------------------------
+# XuatLaSo.vanTayLaSo
+# ------------------------------------------------------------------
+def _ngaySinhNgauNhien(rng):
+    return NgaySinh(rng.randint(1, 28), rng.randint(1, 12),
+                    rng.randint(1900, 2099), rng.randint(1, 12),
+                    rng.choice((1, -1)))
+
+
+def _laSoKho(db, ngaySinh):
+    # Lá số như KhoLaSo.laSo đọc ra từ bản ghi của db
+    return LaSo(giaiMaDiaBan(maHoaDiaBan(db), ngaySinh.thangAm,
+                             ngaySinh.gioSinh),
+                lucThapHoaGiap[viTriNam(ngaySinh.namAm)],
+                traCuc(ngaySinh.namAm, db.cungMenh), ngaySinh.gioiTinh)
+
+
+def test_van_tay_la_so_cung_lan_sinh():
+    # Lá số đầy đủ, rút gọn và lá số trong kho của cùng một lần sinh
+    nhomSao = ("chinhTinh", "tuanTriet")
+    cacSao = boLuatMacDinh.theoNhom(*nhomSao).cacSao
+    rng = random.Random(22)
+    for _ in range(500):
+        ns = _ngaySinhNgauNhien(rng)
+        db = lapDiaBan(diaBan, ns)
+        tb = lapThienBan(ns, diaBan=db)
+        rutGon = lapDiaBan(diaBan, ns, nhomSao=nhomSao)
+        kho = _laSoKho(db, ns)
+        assert vanTayLaSo(kho.diaBan, kho) == vanTayLaSo(db, tb)
+        vanTay = vanTayLaSo(db, tb, cacSao)
+        assert vanTayLaSo(rutGon, lapThienBan(ns, diaBan=rutGon),
+                          cacSao) == vanTay
+        assert vanTayLaSo(kho.diaBan, kho, cacSao) == vanTay
+        # Sao lặp lại trong cacSao không làm đổi vân tay
+        assert vanTayLaSo(db, tb, cacSao + cacSao[:5]) == vanTay
+
+
+def test_van_tay_la_so_khac_nhau():
+    # Hai lá số khác nội dung thì khác vân tay và ngược lại
+    rng = random.Random(2022)
+    theoVanTay = {}
+    for _ in range(3000):
+        ns = _ngaySinhNgauNhien(rng)
+        db = lapDiaBan(diaBan, ns)
+        tb = lapThienBan(ns, diaBan=db)
+        noiDung = (tb.gioiTinh, tb.canNamTen, tb.chiNamTen, db.cungMenh,
+                   db.cungThan, tuple(db.saoBits), db.tuanBits,
+                   db.trietBits)
+        assert theoVanTay.setdefault(vanTayLaSo(db, tb), noiDung) == noiDung
+    assert len(set(theoVanTay.values())) == len(theoVanTay)
+
+
+# ------------------------------------------------------------------
+# LuuNien.LuuNienLaSo
+# ------------------------------------------------------------------
+def _cungCuaSao(db, sao):
+    for cungSo in range(1, 13):
+        if db.saoBits[cungSo] >> sao.saoID & 1:
+            return cungSo
+    return 0
+
+
+def test_luu_nien():
+    rng = random.Random(23)
+    for _ in range(200):
+        ns = _ngaySinhNgauNhien(rng)
+        db = lapDiaBan(diaBan, ns)
+        luuNien = LuuNienLaSo(db, lapThienBan(ns, diaBan=db))
+        for tuoi in (1, 2, 13, rng.randint(3, 100), 101):
+            namXem = ns.namAm + tuoi - 1
+            ln = luuNien.nam(namXem)
+            assert ln.tuoi == tuoi
+            # Sao lưu năm xem ở vị trí của sao gốc trên lá số sinh năm đó
+            dbNamXem = lapDiaBan(diaBan, 1, 1, namXem, 1, 1, False)
+            assert (ln.thaiTue, ln.locTon, ln.kinhDuong, ln.daLa) == tuple(
+                _cungCuaSao(dbNamXem, sao)
+                for sao in (saoThaiTue, saoLocTon, saoKinhDuong, saoDaLa))
+            # Lưu Tứ Hóa: sao được hóa là sao cùng cung với Hóa Lộc, Quyền,
+            # Khoa, Kỵ gốc trên lá số sinh năm xem; cung là cung của sao
+            # đó trên lá số gốc
+            for (sao, cungSo), saoHoa in zip(ln.tuHoa, (
+                    saoHoaLoc, saoHoaQuyen, saoHoaKhoa, saoHoaKy)):
+                assert _cungCuaSao(dbNamXem, sao) == \
+                    _cungCuaSao(dbNamXem, saoHoa)
+                assert cungSo == _cungCuaSao(db, sao)
+            # Đại hạn, tiểu hạn theo nhapDaiHan, nhapTieuHan
+            cung = db.thapNhiCung
+            assert ln.daiHan == next(
+                (cungSo for cungSo in range(1, 13)
+                 if cung[cungSo].cungDaiHan <= tuoi <
+                 cung[cungSo].cungDaiHan + 10), 0)
+            assert cung[ln.tieuHan].cungTieuHan == \
+                diaChi[_cungCuaSao(dbNamXem, saoThaiTue)]["tenChi"]
+
+
+def test_luu_nien_cac_nam():
+    ns = NgaySinh(15, 6, 1990, 5, 1)
+    db = lapDiaBan(diaBan, ns)
+    luuNien = LuuNienLaSo(db, lapThienBan(ns, diaBan=db))
+    assert luuNien.cacNam(2020, 2029) == [luuNien.nam(namXem)
+                                          for namXem in range(2020, 2030)]
+    assert luuNien.cacNam(2020, 2020) == [luuNien.nam(2020)]
+    assert luuNien.cacNam(2021, 2020) == []
+    assert luuNien.cacNam(ns.namAm, ns.namAm)[0].tuoi == 1
+    with pytest.raises(Exception):
+        luuNien.nam(ns.namAm - 1)
+    with pytest.raises(Exception):
+        luuNien.cacNam(ns.namAm - 1, ns.namAm)
+
+
+def test_luu_nien_cache():
+    cacheLuuNien.clear()
+    ns = NgaySinh(15, 6, 1990, 5, 1)
+    db = lapDiaBan(diaBan, ns)
+    luuNien = LuuNienLaSo(db, lapThienBan(ns, diaBan=db))
+    namNay = luuNien.nam(2026)
+    assert (cacheLuuNien.hits, cacheLuuNien.misses) == (0, 1)
+    assert luuNien.nam(2026) is namNay
+    assert (cacheLuuNien.hits, cacheLuuNien.misses) == (1, 1)
+    # Cùng lá số, sinh sau 60 năm: cùng (vân tay, tuổi) nên dùng chung
+    ns60 = NgaySinh(ns.ngayAm, ns.thangAm, ns.namAm + 60, ns.gioSinh,
+                    ns.gioiTinh, False)
+    db60 = lapDiaBan(diaBan, ns60)
+    luuNien60 = LuuNienLaSo(db60, lapThienBan(ns60, diaBan=db60))
+    assert luuNien60.vanTay == luuNien.vanTay
+    assert luuNien60.nam(2086) is namNay
+    assert (cacheLuuNien.hits, cacheLuuNien.misses) == (2, 1)
+    # Tuổi khác là khóa khác
+    assert luuNien.nam(2027).tuoi == namNay.tuoi + 1
+    assert cacheLuuNien.misses == 2
+
+
+# ------------------------------------------------------------------
+# Mã lá số (KhoLaSo.maLaSo) và lá số nhị phân (XuatLaSo.laSoNhiPhan)
+# ------------------------------------------------------------------
+def test_ma_la_so():
+    # Mã -> lá số trùng lapDiaBan, dù kho lá số có mở hay không
+    rng = random.Random(24)
+    for _ in range(2000):
+        ngayAm, thangAm, namAm = rng.randint(1, 30), rng.randint(1, 12), \
+            rng.randint(1900, 2099)
+        gioSinh, gioiTinh = rng.randint(1, 12), rng.choice((1, -1))
+        ma = maLaSo(ngayAm, thangAm, namAm, gioSinh, gioiTinh)
+        assert giaiMaLaSo(ma.lower()) == (ngayAm, thangAm,
+                                          1984 + viTriNam(namAm), gioSinh,
+                                          gioiTinh)
+        laSo = laSoTheoMa(ma)
+        assert laSo.diaBan == lapDiaBan(diaBan, ngayAm, thangAm, namAm,
+                                        gioSinh, gioiTinh, False)
+        tb = lapThienBan(ngayAm, thangAm, namAm, gioSinh, gioiTinh,
+                         diaBan=laSo.diaBan, duongLich=False)
+        assert (laSo.canNamTen, laSo.chiNamTen, laSo.banMenh,
+                laSo.tenCuc) == (tb.canNamTen, tb.chiNamTen, tb.banMenh,
+                                 tb.tenCuc)
+
+
+@pytest.mark.parametrize("ma", ["", "1NY", "1NYR0", "1NYI", "U000", "1-YR",
+                                "ZZZZ", None])
+def test_ma_la_so_khong_hop_le(ma):
+    with pytest.raises(Exception):
+        giaiMaLaSo(ma)
+    with pytest.raises(Exception):
+        laSoTheoMa(ma)
+
+
+@pytest.mark.parametrize("ngaySinh", [(31, 1, 2000, 1, 1), (1, 13, 2000, 1, 1),
+                                      (1, 1, 2000, 0, 1), (1, 1, 2000, 1, 0)])
+def test_ma_la_so_ngoai_kho(ngaySinh):
+    with pytest.raises(Exception):
+        maLaSo(*ngaySinh)
+
+
+def test_la_so_nhi_phan_struct():
+    rng = random.Random(124)
+    for _ in range(300):
+        ns = _ngaySinhNgauNhien(rng)
+        db = lapDiaBan(diaBan, ns)
+        duLieu = laSoNhiPhan(db, dungMsgpack=False)
+        assert docLaSoNhiPhan(duLieu) == dict(laSoDict(db),
+                                              phienBan=PHIEN_BAN_LUOC_DO)
+        # Dạng struct không giữ thiên bàn
+        assert laSoNhiPhan(db, lapThienBan(ns, diaBan=db),
+                           dungMsgpack=False) == duLieu
+    for duLieu in (b"", b"S", duLieu[:-1], b"X" + duLieu[1:]):
+        with pytest.raises(Exception):
+            docLaSoNhiPhan(duLieu)
+
+
+def test_la_so_nhi_phan_msgpack():
+    pytest.importorskip("msgpack")
+    rng = random.Random(224)
+    for _ in range(100):
+        ns = _ngaySinhNgauNhien(rng)
+        db = lapDiaBan(diaBan, ns)
+        tb = lapThienBan(ns, diaBan=db)
+        assert docLaSoNhiPhan(laSoNhiPhan(db, tb, dungMsgpack=True)) == \
+            laSoChuan(db, tb)
+
+
+def test_la_so_chuan_khong_chia_se_cache():
+    # Sửa lá số laSoChuan trả về không làm đổi lần gọi sau (lấy từ cache)
+    ns = NgaySinh(15, 6, 1990, 5, 1)
+    db = lapDiaBan(diaBan, ns)
+    tb = lapThienBan(ns, diaBan=db)
+    mongDoi = dict(laSoDict(db, tb), phienBan=PHIEN_BAN_LUOC_DO,
+                   vanTay=vanTayLaSo(db, tb))
+    laSo = laSoChuan(db, tb)
+    assert laSo == mongDoi
+    laSo["thapNhiCung"][0]["cungSao"][0]["saoTen"] = "?"
+    laSo["thapNhiCung"][0]["cungSao"].append({"saoID": 0})
+    laSo["thapNhiCung"][1]["cungTen"] = "?"
+    laSo["thapNhiCung"].pop()
+    laSo["cungMenh"] = 0
+    soLanTrung = cacheXuatLaSo.hits
+    assert laSoChuan(db, tb) == mongDoi
+    assert cacheXuatLaSo.hits == soLanTrung + 1
+
+
+# ------------------------------------------------------------------
+# CachCuc.timCachCuc
+# ------------------------------------------------------------------
+# Các điều kiện danhSachCachCuc không dùng: sao lặp lại, khongCo ở tam
+# phương, giáp bởi hai sao bất kỳ, it lớn hơn 1
+cacCachCucThu = danhSachCachCuc + (
+    cachCuc("Tử Vi lặp", "bình", taiMenh(saoTuVi, saoTuVi)),
+    cachCuc("Tam phương vô Kình", "bình", khongCo(TAM_PHUONG, saoKinhDuong)),
+    cachCuc("Lộc Xương giáp", "bình", giap(saoLocTon, saoVanXuong)),
+    cachCuc("Hai trong ba", "bình",
+            tamPhuong(saoThienMa, saoHoaKhoa, saoThaiDuong, it=2)),
+    cachCuc("Nhật sáng, Mệnh có Lộc", "bình", sang(saoThaiDuong),
+            taiMenh(saoLocTon)),
+)
+
+
+def _timCachCucTungCung(db, cacCachCuc):
+    # Xét trực tiếp cungSao của từng cung, không qua saoBits
+    def cacSao(cungSo):
+        return {sao["saoID"]: sao["saoDacTinh"]
+                for sao in db.thapNhiCung[cungSo].cungSao}
+
+    cungMenh = db.cungMenh
+    menh = cacSao(cungMenh)
+    tamPhuongMenh = {}
+    for khoang in (0, 4, 8, 6):
+        tamPhuongMenh.update(cacSao(dichCung(cungMenh, khoang)))
+    caLaSo = {}
+    for cungSo in range(1, 13):
+        caLaSo.update(cacSao(cungSo))
+    trai = cacSao(dichCung(cungMenh, -1))
+    phai = cacSao(dichCung(cungMenh, 1))
+    ketQua = []
+    for cc in cacCachCuc:
+        thoaMan = True
+        for dieuKien in cc.cacDieuKien:
+            saoIDs = [sao.saoID for sao in dieuKien.cacSao]
+            if dieuKien.vung == GIAP:
+                a, b = saoIDs
+                thoaMan &= (a in trai and b in phai) or \
+                    (b in trai and a in phai)
+            elif dieuKien.vung == SANG:
+                thoaMan &= all(caLaSo.get(saoID) in DAC_TINH_SANG
+                               for saoID in saoIDs)
+            else:
+                vung = menh if dieuKien.vung == MENH else tamPhuongMenh
+                soSao = len({saoID for saoID in saoIDs if saoID in vung})
+                if dieuKien.soToiThieu == 0:
+                    thoaMan &= soSao == 0
+                else:
+                    thoaMan &= soSao >= (dieuKien.soToiThieu or
+                                         len(set(saoIDs)))
+        if thoaMan:
+            ketQua.append(cc)
+    return ketQua
+
+
+def test_tim_cach_cuc():
+    rng = random.Random(25)
+    daGap = set()
+    for _ in range(SO_LA_SO):
+        db = lapDiaBan(diaBan, _ngaySinhNgauNhien(rng))
+        assert timCachCuc(db) == _timCachCucTungCung(db, danhSachCachCuc)
+        ketQua = timCachCuc(db, cacCachCucThu)
+        assert ketQua == _timCachCucTungCung(db, cacCachCucThu)
+        daGap.update(cc.ten for cc in ketQua)
+    # Mẫu đủ lớn để mỗi cách cục đều có lúc thỏa mãn
+    assert daGap == {cc.ten for cc in cacCachCucThu}
+
+
+def test_tim_cach_cuc_la_so_rut_gon():
+    # Lá số chỉ an chính tinh và các sao của cách cục (theoNhom theo từng
+    # sao) cho cùng cách cục với lá số đầy đủ
+    nhomSao = ("chinhTinh",) + SAO_CACH_CUC
+    boLuat = boLuatMacDinh.theoNhom(*nhomSao)
+    mask = sum(1 << sao.saoID for sao in set(boLuat.cacSao))
+    assert set(boLuat.cacSao) == \
+        set(SAO_CACH_CUC) | set(boLuatMacDinh.theoNhom("chinhTinh").cacSao)
+    rng = random.Random(125)
+    for _ in range(SO_LA_SO):
+        ns = _ngaySinhNgauNhien(rng)
+        db = lapDiaBan(diaBan, ns)
+        rutGon = lapDiaBan(diaBan, ns, nhomSao=nhomSao)
+        assert rutGon.saoBits == [bits & mask for bits in db.saoBits]
+        assert timCachCuc(rutGon) == timCachCuc(db)